@@ -0,0 +1,44 @@
+'''
+Generates labfreed/well_known_keys/unece/unece_units_compact.py from UneceUnits.json.
+
+The generated module only holds the fields LabFREED uses. Importing it (from the cached bytecode) is much faster than
+parsing the full JSON, which remains in the package for completeness.
+Run after UneceUnits.json was updated:
+
+    python build_tools/generate_unece_units_module.py
+'''
+
+import json
+from pathlib import Path
+
+
+unece_dir = Path(__file__).resolve().parents[1] / 'labfreed' / 'well_known_keys' / 'unece'
+
+
+def compact_units(units:list[dict]) -> list[tuple]:
+    '''(commonCode, state, name, symbol, conversion factor) per unit'''
+    return [(u['commonCode'], u.get('state'), u.get('name'), u.get('symbol'), (u.get('conversionFactor') or {}).get('factor'))
+            for u in units]
+
+
+def main():
+    with open(unece_dir / 'UneceUnits.json', encoding='utf-8') as f:
+        units = json.load(f)
+
+    lines = [
+        '# Generated by build_tools/generate_unece_units_module.py from UneceUnits.json. Do not edit.',
+        '# (commonCode, state, name, symbol, conversion factor)',
+        '',
+        'units = (',
+    ]
+    lines.extend(f'    {row!r},' for row in compact_units(units))
+    lines.append(')')
+    lines.append('')
+
+    target = unece_dir / 'unece_units_compact.py'
+    target.write_text('\n'.join(lines), encoding='utf-8')
+    print(f'Wrote {len(units)} units to {target}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,52 @@
-''' 
+'''
 Python implementation of LabFREED building blocks
 '''
 
 __version__ = "0.2.12"
 
-from labfreed.pac_id import *  # noqa: F403
-from labfreed.pac_cat import * # noqa: F403
-from labfreed.pac_id_resolver import * # noqa: F403
-from labfreed.trex import * # noqa: F403
-from labfreed.labfreed_infrastructure import *  # noqa: F403
+import importlib
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    # only imported during type checking
+    from labfreed.pac_id import *  # noqa: F403
+    from labfreed.pac_cat import * # noqa: F403
+    from labfreed.pac_id_resolver import PAC_ID_Resolver, load_cit, ServiceGroup  # noqa: F401
+    from labfreed.trex import * # noqa: F403
+    from labfreed.labfreed_infrastructure import *  # noqa: F403
+
+
+# The public classes are loaded on first access, so that e.g. parsing a PAC-ID does not load the resolver (requests, yaml, ..).
+
+_lazy_attributes = {
+    **dict.fromkeys(["PAC_ID", "IDSegment", "Extension", "PAC_ID_Record", "PAC_ID_Spans"], 'labfreed.pac_id'),
+    **dict.fromkeys(["PAC_CAT", "Category", "Material_Device", "Material_Substance", "Material_Consumable", "Material_Misc",
+                     "Data_Method", "Data_Result", "Data_Progress", "Data_Calibration", "Data_Abstract"], 'labfreed.pac_cat'),
+    **dict.fromkeys(["PAC_ID_Resolver", "load_cit", "ServiceGroup"], 'labfreed.pac_id_resolver'),
+    **dict.fromkeys(["TREX", "NumericSegment", "DateSegment", "BoolSegment", "AlphanumericSegment", "TextSegment", "ErrorSegment",
+                     "TableSegment", "ColumnHeader", "TableRow", "ColumnarTableSegment"], 'labfreed.trex'),
+    **dict.fromkeys(["LabFREED_BaseModel", "ValidationMessage", "ValidationRecord", "ValidationMsgLevel", "LabFREED_ValidationError"], 'labfreed.labfreed_infrastructure'),
+}
+_submodules = {
+    **{name: f'labfreed.{name}' for name in ["pac_id", "pac_cat", "pac_id_resolver", "trex", "well_known_extensions", "well_known_keys", 
+                                             "utilities", "bulk", "labfreed_infrastructure"]},
+    # were attributes of labfreed, when all subpackages were imported with the package
+    **{name: f'labfreed.pac_id_resolver.{name}' for name in ["cit_common", "cit_v1", "cit_v2", "resolver", "services"]},
+}
+
+__all__ = list(_lazy_attributes) + list(_submodules)
+
+
+def __getattr__(name):
+    if name in _lazy_attributes:
+        value = getattr(importlib.import_module(_lazy_attributes[name]), name)
+    elif name in _submodules:
+        value = importlib.import_module(_submodules[name])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes) | set(_submodules))
+
@@ -0,0 +1,264 @@
+'''
+Processing of large numbers of PAC-IDs.
+
+Parsing and validation is pure python and therefore bound to one core. `parse_many` distributes the work
+over a pool of processes and returns compact, picklable results instead of the full models.
+
+`read_pac_ids` streams PAC-IDs from newline delimited files. `write_jsonl` and `write_urls` write the results back out.
+'''
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+import mmap
+import os
+from pathlib import Path
+import sys
+from typing import IO, Iterable, Iterator, NamedTuple
+
+from labfreed.labfreed_infrastructure import LabFREED_ValidationError, ValidationMsgLevel
+
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    # only imported during type checking
+    from labfreed.pac_id import PAC_ID
+    from labfreed.pac_id.pac_id_record import PAC_ID_Record
+
+
+__all__ = ["parse_many", "ParseResult", "read_pac_ids", "write_jsonl", "write_urls"]
+
+
+class ParseResult(NamedTuple):
+    '''Compact result of parsing one PAC-ID.
+    It only consists of tuples and strings, which makes it cheap to pickle and to keep in memory.
+    '''
+    url:str
+    '''The url as it was passed in'''
+    issuer:str|None
+    '''Issuer of the PAC-ID. None if the url could not be parsed'''
+    identifier:tuple[tuple[str|None, str], ...]
+    '''The identifier segments as (key, value) pairs'''
+    extensions:tuple[tuple[str, str, str], ...]
+    '''The extensions as (name, type, data)'''
+    messages:tuple[tuple[str, str, str], ...]
+    '''Validation messages as (level, source, msg). Level is the name of the ValidationMsgLevel'''
+    is_pac_cat:bool = False
+    '''True if the identifier could be interpreted as PAC-CAT'''
+
+    @property
+    def is_valid(self) -> bool:
+        return not any(level == ValidationMsgLevel.ERROR.name for level, _, _ in self.messages)
+
+    def errors(self) -> list[tuple[str, str, str]]:
+        return [m for m in self.messages if m[0] == ValidationMsgLevel.ERROR.name]
+
+    @property
+    def record(self) -> "PAC_ID_Record|None":
+        '''The PAC-ID as PAC_ID_Record. None if the url could not be parsed'''
+        from labfreed.pac_id.pac_id_record import PAC_ID_Record
+        if self.issuer is None:
+            return None
+        return PAC_ID_Record(self.issuer, self.identifier, self.extensions)
+
+    def to_pac_id(self, **kwargs):
+        '''Parses the url again to get the full PAC-ID (or PAC-CAT) model. kwargs are passed to PAC_ID.from_url'''
+        from labfreed.pac_id import PAC_ID
+        kwargs.setdefault('suppress_validation_errors', True)
+        return PAC_ID.from_url(self.url, **kwargs)
+
+
+
+def parse_many(urls:Iterable[str],
+               *,
+               workers:int|None=None,
+               chunk_size:int=1000,
+               try_pac_cat=True,
+               extension_interpreters='default'
+               ) -> Iterator[ParseResult]:
+    """Parses and validates many PAC-IDs using a pool of worker processes.
+
+    The input is consumed lazily in chunks of chunk_size. Only a limited number of chunks is in flight at any time,
+    so this works for inputs which do not fit in memory.
+
+    Args:
+        urls (Iterable[str]): pac ids with optional extensions
+        workers (int | None, optional): Number of worker processes. Defaults to the number of CPUs.
+                                        With 1 (or less) everything is done in the calling process.
+        chunk_size (int, optional): Number of urls sent to a worker at once.
+        try_pac_cat (bool, optional): Interpret the identifier as PAC-CAT if possible.
+        extension_interpreters (optional): As in PAC_ID.from_url. Must be picklable.
+
+    Yields:
+        ParseResult: one per url, in the order of the input
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    chunks = _chunked(urls, chunk_size)
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _parse_chunk(chunk, try_pac_cat=try_pac_cat, extension_interpreters=extension_interpreters)
+        return
+
+    max_in_flight = 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = deque()
+        for chunk in chunks:
+            in_flight.append(executor.submit(_parse_chunk, chunk, try_pac_cat=try_pac_cat, extension_interpreters=extension_interpreters))
+            if len(in_flight) >= max_in_flight:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+
+def read_pac_ids(source:str|Path|IO|mmap.mmap,
+                 *,
+                 try_pac_cat=True,
+                 extension_interpreters='default',
+                 suppress_validation_errors=False
+                 ) -> Iterator[tuple[int, "PAC_ID|LabFREED_ValidationError"]]:
+    """Reads PAC-IDs from newline delimited input. 
+    
+    Lines are read and parsed one at a time, so memory consumption does not depend on the size of the input.
+    Empty lines are skipped.
+
+    Args:
+        source: A path, '-' for stdin, a file object (text or binary) or a memory-mapped file.
+        try_pac_cat, extension_interpreters, suppress_validation_errors: as in PAC_ID.from_url
+
+    Yields:
+        (line_no, PAC_ID | LabFREED_ValidationError): line_no starts at 1. 
+        Instead of raising, the error is yielded for invalid PAC-IDs.
+    """
+    from labfreed.pac_id.url_parser import PAC_Parser
+    from labfreed.well_known_extensions import default_extension_interpreters
+    
+    if extension_interpreters == 'default':
+        extension_interpreters = default_extension_interpreters
+        
+    with _open_lines(source) as lines:
+        for line_no, line in enumerate(lines, start=1):
+            line = line.strip() # bytes lines are passed on as they are, the parser accepts bytes
+            if not line:
+                continue
+            yield line_no, PAC_Parser._try_from_url(line,
+                                                    extension_interpreters=extension_interpreters,
+                                                    try_pac_cat=try_pac_cat,
+                                                    suppress_validation_errors=suppress_validation_errors)
+
+
+def write_jsonl(results:Iterable[tuple[int, "PAC_ID|LabFREED_ValidationError"]], target:str|Path|IO) -> int:
+    """Writes the output of read_pac_ids as JSON lines. 
+    PAC-IDs are written as JSON of their to_dict(), errors as {"line_no": .., "errors": [..]}.
+    
+    Returns:
+        int: number of PAC-IDs written
+    """
+    import json
+    
+    n = 0
+    with _open_target(target) as f:
+        for line_no, pac_id in results:
+            if isinstance(pac_id, LabFREED_ValidationError):
+                msgs = [m.msg for m in pac_id.validation_msgs] if pac_id.validation_msgs else [str(pac_id)]
+                f.write(json.dumps({'line_no': line_no, 'errors': msgs}) + '\n')
+                continue
+            f.write(pac_id.to_json() + '\n')
+            n += 1
+    return n
+
+
+def write_urls(results:Iterable[tuple[int, "PAC_ID|LabFREED_ValidationError"]], 
+               target:str|Path|IO, 
+               use_short_notation:bool|None=None, 
+               uppercase_only=False) -> int:
+    """Writes the output of read_pac_ids as canonical urls, one per line. Errors are skipped.
+    use_short_notation and uppercase_only are as in PAC_ID.to_url.
+    
+    Returns:
+        int: number of PAC-IDs written
+    """
+    from labfreed.pac_id.url_serializer import PACID_Serializer
+    
+    n = 0
+    with _open_target(target) as f:
+        for _, pac_id in results:
+            if isinstance(pac_id, LabFREED_ValidationError):
+                continue
+            f.write(PACID_Serializer.to_url(pac_id, use_short_notation=use_short_notation, uppercase_only=uppercase_only) + '\n')
+            n += 1
+    return n
+    
+
+
+@contextmanager
+def _open_lines(source):
+    if isinstance(source, mmap.mmap):
+        source.seek(0)
+        yield iter(source.readline, b'')
+    elif source == '-':
+        yield sys.stdin
+    elif isinstance(source, (str, Path)):
+        with open(source, 'r', encoding='utf-8') as f:
+            yield f
+    else:
+        yield source
+        
+        
+@contextmanager
+def _open_target(target):
+    if target == '-':
+        yield sys.stdout
+    elif isinstance(target, (str, Path)):
+        with open(target, 'w', encoding='utf-8') as f:
+            yield f
+    else:
+        yield target
+
+
+def _chunked(iterable:Iterable, n:int) -> Iterator[list]:
+    it = iter(iterable)
+    while chunk := list(islice(it, n)):
+        yield chunk
+
+
+def _parse_chunk(urls:list[str], *, try_pac_cat, extension_interpreters) -> list[ParseResult]:
+    '''@private runs in the worker process'''
+    from labfreed.pac_cat import PAC_CAT
+    from labfreed.pac_id.url_parser import PAC_Parser
+    from labfreed.well_known_extensions import default_extension_interpreters
+
+    if extension_interpreters == 'default':
+        extension_interpreters = default_extension_interpreters
+
+    results = list()
+    for url in urls:
+        pac_id = PAC_Parser._try_from_url(url,
+                                          extension_interpreters=extension_interpreters,
+                                          try_pac_cat=try_pac_cat,
+                                          suppress_validation_errors=True)
+        if isinstance(pac_id, LabFREED_ValidationError):
+            results.append(ParseResult(url=url,
+                                       issuer=None,
+                                       identifier=(),
+                                       extensions=(),
+                                       messages=((ValidationMsgLevel.ERROR.name, 'PAC-ID', str(pac_id)),)
+                                       )
+                           )
+            continue
+
+        results.append(ParseResult(url=url,
+                                   issuer=pac_id.issuer,
+                                   identifier=tuple((s.key, s.value) for s in pac_id.identifier),
+                                   extensions=tuple((e.name, e.type, e.data) for e in pac_id.extensions),
+                                   messages=tuple((m.level.name, m.source, m.msg) for m in pac_id.validation_messages()),
+                                   is_pac_cat=isinstance(pac_id, PAC_CAT)
+                                   )
+                       )
+    return results
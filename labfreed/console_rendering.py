@@ -0,0 +1,77 @@
+'''@private
+Rendering of LabFREED objects on the console with rich.
+
+This module is only imported by the print methods (print_validation_messages, print_categories, ServiceGroup.print),
+so parsing and validation neither load rich nor do any formatting.
+'''
+
+import logging
+
+from rich import print
+from rich.table import Table
+from rich.text import Text
+
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    # only imported during type checking
+    from labfreed.labfreed_infrastructure import LabFREED_BaseModel
+    from labfreed.pac_cat import PAC_CAT
+    from labfreed.pac_id_resolver.services import ServiceGroup
+
+
+def print_validation_messages(model:"LabFREED_BaseModel", target='console') -> Table|None:
+    msgs = model.format_validation_messages(target=target)
+
+    table = Table(title="Validation Results", show_header=False, title_justify='left')
+
+    def col(s):
+        return table.add_column(s, vertical='top')
+    col("-")
+
+    if not msgs:
+        table.add_row('All clear!', end_section=True)
+        return
+
+    for m in msgs:
+        table.add_row(m)
+        table.add_section()
+
+    logging.info(table)
+    print(table)
+    return table
+
+
+def print_categories(pac_cat:"PAC_CAT"):
+    table = Table(title=f'Categories in {str(pac_cat)}', show_header=False)
+    table.add_column('0')
+    table.add_column('1')
+    for i, c in enumerate(pac_cat.categories):
+        if i == 0:
+            title = Text('Main Category', style='bold')
+        else:
+            title = Text('Category', style='bold')
+
+        table.add_row(title)
+
+        for field_name, field_info in type(c).model_fields.items():
+            if not getattr(c, field_name):
+                continue
+            table.add_row(f"{field_name} ({field_info.alias or ''})",
+                          f" {getattr(c, field_name)}"
+                          )
+        table.add_section()
+    print(table)
+
+
+def print_service_group(service_group:"ServiceGroup"):
+    table = Table(title=f"Services from origin '{service_group.origin}")
+
+    table.add_column("Service Name")
+    table.add_column("URL")
+    table.add_column('Reachable')
+
+    for s in service_group.services:
+        table.add_row(s.service_name, s.url, s.status.name)
+
+    print(table)
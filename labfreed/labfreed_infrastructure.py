@@ -1,14 +1,15 @@
 from enum import Enum, auto
-import logging
 import re
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
-from typing import Any, List, Set
-
-from rich import print
-from rich.table import Table
+import string
+import sys
+import weakref
+from copy import deepcopy
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, RootModel, field_validator
+from pydantic_core import PydanticUndefined
+from typing import Any, Callable, ClassVar, Iterator, List, Self, Set
 
 ''' Configure pdoc'''
-__all__ = ["LabFREED_BaseModel", "ValidationMessage", "ValidationMsgLevel", "LabFREED_ValidationError"]
+__all__ = ["LabFREED_BaseModel", "ValidationMessage", "ValidationRecord", "ValidationMsgLevel", "LabFREED_ValidationError"]
 
 class PDOC_Workaround_Base(BaseModel):
     '''@private
@@ -56,6 +57,81 @@ class ValidationMessage(PDOC_Workaround_Base):
         return v
 
 
+
+class _MessageFormatter(string.Formatter):
+    '''@private str.format with the additional format spec "quoted", which formats a collection of texts like 'a','b' '''
+    def format_field(self, value, format_spec):
+        if format_spec == 'quoted':
+            return _quote_texts(value)
+        return super().format_field(value, format_spec)
+
+_message_formatter = _MessageFormatter()
+
+
+class ValidationRecord():
+    '''
+    Represents one problem in the model. 
+    
+    Lightweight alternative to ValidationMessage with the same attributes, in which the validators store their messages. 
+    The message text can be given as template with arguments and is only formatted when msg is read.
+    Records are hashable and must not be modified. validation_messages() converts them with to_validation_message().
+    '''
+    __slots__ = ('source_id', 'source', 'level', 'template', 'args', 'highlight', 'highlight_sub', '_msg', '_key', '_message')
+
+    def __init__(self, *, source_id:int, source:str, level:ValidationMsgLevel, msg:str, msg_args:tuple=(), highlight:str="", highlight_sub=()):
+        '''
+        Args:
+            msg (str): the message or, if msg_args are given, the template of the message for str.format. 
+                       The format spec "quoted" formats a collection of texts like 'a','b'.
+            msg_args (tuple, optional): hashable arguments of the template. 
+            highlight_sub: str or collection of str
+        '''
+        if isinstance(highlight_sub, str):
+            highlight_sub = (highlight_sub,)
+        elif not isinstance(highlight_sub, tuple):
+            highlight_sub = tuple(highlight_sub) if highlight_sub else ()
+        self.source_id = source_id
+        self.source = source
+        self.level = level
+        self.template = sys.intern(msg) if msg_args else msg
+        self.args = msg_args
+        self.highlight = highlight
+        self.highlight_sub = highlight_sub
+        self._msg = None if msg_args else msg
+        self._key = (source_id, source, level, self.template, msg_args, highlight, highlight_sub)
+        self._message = None
+
+    @property
+    def msg(self) -> str:
+        '''The message text'''
+        if self._msg is None:
+            self._msg = _message_formatter.format(self.template, *self.args)
+        return self._msg
+
+    @property
+    def highlight_sub_patterns(self) -> list[str]:
+        '''Sub patterns to highlight. Same as in ValidationMessage'''
+        return list(self.highlight_sub)
+
+    def to_validation_message(self) -> ValidationMessage:
+        '''The record as ValidationMessage. It is created on the first call and the same message is returned afterwards.'''
+        if self._message is None:
+            self._message = ValidationMessage.model_construct(source_id=self.source_id, source=self.source, level=self.level, msg=self.msg,
+                                                              highlight=self.highlight, highlight_sub_patterns=list(self.highlight_sub))
+        return self._message
+
+    def __eq__(self, other):
+        if not isinstance(other, ValidationRecord):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __repr__(self):
+        return f"ValidationRecord(level={self.level.name}, source={self.source!r}, msg={self.msg!r})"
+
+
     
 class LabFREED_ValidationError(ValueError):
     '''Error which is raised, when LabFREED validation fails, i.e. when the model contains at least one error.'''
@@ -73,113 +149,286 @@ class LabFREED_ValidationError(ValueError):
     
 
 
+_IMMUTABLE_DEFAULT_TYPES = frozenset({type(None), str, int, float, bool, tuple, frozenset})
+
 class LabFREED_BaseModel(PDOC_Workaround_Base):
     """ Extension of Pydantic BaseModel, so that validator can issue warnings.
     The purpose of that is to allow only minimal validation but on top check for stricter recommendations"""
     
-    _validation_messages: list[ValidationMessage] = PrivateAttr(default_factory=list)
-    """Validation messages for this model"""
+    _validation_messages: list[ValidationRecord|ValidationMessage] = PrivateAttr(default_factory=list)
+    """Validation messages for this model. The validators add ValidationRecords."""
+    _validation_message_set: set[ValidationRecord]|None = PrivateAttr(default=None)
+    """The records in _validation_messages for deduplication. Created with the first message and dropped when the list is replaced."""
+    _validation_skipped: bool = PrivateAttr(default=False)
+    """True if the model was constructed in trusted mode, i.e. without running the validators. 
+    Validation is then done when validation results are requested the first time."""
+    _validation_cache: list[ValidationRecord]|None = PrivateAttr(default=None)
+    """Nested validation messages. Dropped when this model or a nested model changes (see _invalidate_validation_cache)."""
+    _validation_parents: dict[int, weakref.ref]|None = PrivateAttr(default=None)
+    """The models, which collected the nested validation messages of this model, by id. Their caches are dropped together with the own."""
     
-    @property
-    def is_valid(self) -> bool:
-        return len(self.errors()) == 0
+    _derived_computed_fields: ClassVar[frozenset[str]] = frozenset()
+    """Computed fields which are mere views derived from other fields and contain no models with own validation messages. 
+    They are skipped when collecting the nested validation messages."""
+    
+    _trusted_field_defaults: ClassVar[tuple[tuple[str, str|None, Callable|None, Any], ...]] = ()
+    """(name, alias, default factory, default) of each field for _construct_trusted"""
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        '''@private'''
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._trusted_field_defaults = tuple((name, info.alias, info.default_factory, info.default) for name, info in cls.model_fields.items())
+    
+    def model_post_init(self, context: Any) -> None:
+        '''@private'''
+        super().model_post_init(context)
+        self._track_lists()
+    
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == '_validation_messages':
+            self._validation_message_set = None
+            self._invalidate_validation_cache()
+        elif name in type(self).model_fields:
+            self._track_lists()
+            self._on_field_change()
+    
+    def _track_lists(self):
+        '''@private replaces the lists in the fields by _TrackedLists, which report in place modifications to this model'''
+        fields = self.__dict__
+        for name, value in fields.items():
+            if type(value) is list:
+                fields[name] = _TrackedList(value, self)
+            elif type(value) is _TrackedList:
+                value._add_owner(self)
+    
+    def _on_field_change(self):
+        '''@private called when a field was assigned or a list in a field was modified in place'''
+        self._invalidate_validation_cache()
+    
+    def _invalidate_validation_cache(self):
+        '''@private drops the cached nested validation messages of this model and of the models, which contain it'''
+        private = self.__pydantic_private__
+        if private is None or private.get('_validation_cache') is None:
+            # the models, which contain this one, have no cache either, since they were collected after this one
+            return
+        private['_validation_cache'] = None
+        parents = private['_validation_parents']
+        if parents:
+            for ref in list(parents.values()):
+                parent = ref()
+                if parent is not None:
+                    parent._invalidate_validation_cache()
+    
+    def _add_validation_parent(self, parent:'LabFREED_BaseModel'):
+        '''@private registers parent as containing this model'''
+        private = self.__pydantic_private__
+        parents = private['_validation_parents']
+        if parents is None:
+            parents = private['_validation_parents'] = dict()
+        ref = parents.get(id(parent))
+        if ref is None or ref() is not parent:
+            parents[id(parent)] = weakref.ref(parent)
+    
+    def _reset_after_copy(self) -> Self:
+        '''@private a copy does not share the cache and the parents of the original'''
+        private = self.__pydantic_private__
+        if private is not None:
+            private['_validation_cache'] = None
+            private['_validation_parents'] = None
+        self._track_lists()
+        return self
+    
+    def __copy__(self) -> Self:
+        return super().__copy__()._reset_after_copy()
+    
+    def __deepcopy__(self, memo=None) -> Self:
+        return super().__deepcopy__(memo)._reset_after_copy()
+    
+    def model_copy(self, *, update=None, deep: bool = False) -> Self:
+        '''@private'''
+        return super().model_copy(update=update, deep=deep)._reset_after_copy()
+    
+    def __getstate__(self):
+        # the parents are weak references, which can not be pickled
+        state = super().__getstate__()
+        if state['__pydantic_private__']:
+            state['__pydantic_private__'] = {**state['__pydantic_private__'], '_validation_cache': None, '_validation_parents': None}
+        return state
+    
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._track_lists()
+    
+    @classmethod
+    def _construct_trusted(cls, **data) -> Self:
+        '''@private
+        Constructs the model without running any validators. Use only with data which is known to be valid. 
+        The validators run when validation results are requested the first time.
+        '''
+        # all fields are passed, since model_construct is slow in filling in the defaults (e.g. it inspects the default factory each time)
+        fields_set = set()
+        for name, alias, default_factory, default in cls._trusted_field_defaults:
+            if name in data or (alias is not None and alias in data):
+                fields_set.add(name)
+            elif default_factory is not None:
+                data[name] = default_factory()
+            elif default is not PydanticUndefined:
+                data[name] = default if type(default) in _IMMUTABLE_DEFAULT_TYPES else deepcopy(default)
+        m = cls.model_construct(fields_set, **data)
+        m.__pydantic_private__['_validation_skipped'] = True
+        return m
+    
+    
+    def validate(self) -> Self:
+        '''Runs the LabFREED validation of this model and its nested models (again). 
+        Field validators and (after) model validators run, like when the model is constructed with validation.
+        This is needed for models which were created without validation, e.g. with from_url(..., validate=False).
+        
+        Returns:
+            the model itself
+        Raises:
+            ValueError: if a field validator rejects a value, like it would on construction
+        '''
+        fields = self.__dict__
+        for name in type(self).model_fields:
+            _validate_nested(getattr(self, name))
+        
+        self._validation_messages = list()
+        decorators = self.__pydantic_decorators__
+        for decorator in decorators.field_validators.values():
+            names = type(self).model_fields if '*' in decorator.info.fields else decorator.info.fields
+            for name in names:
+                if decorator.info.mode == 'wrap':
+                    value = decorator.func(fields[name], lambda v: v)
+                else:
+                    value = decorator.func(fields[name])
+                if value is not fields[name]:
+                    setattr(self, name, value)
+        
+        for decorator in decorators.model_validators.values():
+            if decorator.info.mode == 'after':
+                getattr(self, decorator.cls_var_name)()
+        self._validation_skipped = False
+        return self
     
 
     def validation_messages(self, nested=True) -> list[ValidationMessage]:
-        if nested:
-            msgs = self._get_nested_validation_messages()
-        else:
-            msgs = self._validation_messages
-        return msgs
+        '''Validation messages of this model and (with nested) of the models it contains.
+        Models created without validation are validated on the first call.
+        The nested messages are cached until a field of this model or of a nested model is assigned or a list in a field is modified in place. 
+        Note that validators only run on construction and with validate(). Call validate() after modifying a model.
+        '''
+        return _as_validation_messages(self._validation_records(nested=nested))
     
     def errors(self, nested=True) -> list[ValidationMessage]: 
-        return _filter_errors(self.validation_messages(nested=nested))
+        return _as_validation_messages(_filter_errors(self._validation_records(nested=nested)))
     
     def warnings(self, nested=True) -> list[ValidationMessage]: 
-        return _filter_warnings(self.validation_messages(nested=nested))
+        return _as_validation_messages(_filter_warnings(self._validation_records(nested=nested)))
+    
+    @property
+    def is_valid(self) -> bool:
+        return not any(m.level is ValidationMsgLevel.ERROR for m in self._validation_records())
+    
+    def _validation_records(self, nested=True) -> list[ValidationRecord]:
+        '''@private The messages as stored by the validators. Do not modify the returned list.'''
+        private = self.__pydantic_private__
+        if nested and private['_validation_cache'] is not None:
+            return private['_validation_cache']
+        if private['_validation_skipped']:
+            self.validate()
+        if not nested:
+            return private['_validation_messages']
+        return self._nested_validation_messages()
     
 
-    def _add_validation_message(self, *, msg: str, level:ValidationMsgLevel, source:str="", highlight_pattern="", highlight_sub=None):
-        if not highlight_sub:
-            highlight_sub = []
-        w = ValidationMessage(msg=msg, source=source, level=level, highlight=highlight_pattern, highlight_sub_patterns=highlight_sub, source_id=id(self))
-
-        if w not in self._validation_messages:
-            self._validation_messages.append(w)
+    def _add_validation_message(self, *, msg: str, level:ValidationMsgLevel, source:str="", highlight_pattern="", highlight_sub=None, msg_args:tuple=()):
+        '''Adds a message, unless the same message is already present.
+        If msg_args are given, msg is a template, which is only formatted when the message text is read (see ValidationRecord).
+        '''
+        w = ValidationRecord(msg=msg, msg_args=msg_args, source=source, level=level, highlight=highlight_pattern, highlight_sub=highlight_sub, source_id=id(self))
+
+        private = self.__pydantic_private__
+        known = private['_validation_message_set']
+        if known is None:
+            known = {m for m in private['_validation_messages'] if isinstance(m, ValidationRecord)}
+            private['_validation_message_set'] = known
+        if w in known:
+            return
+        known.add(w)
+        private['_validation_messages'].append(w)
+        self._invalidate_validation_cache()
 
     # Function to extract warnings from a model and its nested models
     def _get_nested_validation_messages(self, parent_name: str = "", visited: Set[int] = None) -> List['ValidationMessage']:
         """
-        Recursively extract warnings from a Pydantic model and its nested fields, including computed fields.
+        Extract validation messages from this model and its nested models, including computed fields.
 
-        :param parent_name: The name of the parent model to track the path.
+        :param parent_name: Not used anymore. Kept for compatibility.
         :param visited: Set of visited object IDs to prevent infinite loops.
         :return: List of ValidationMessages from this and nested models.
         """
+        return _as_validation_messages(self._nested_validation_messages(visited))
+    
+    
+    def _nested_validation_messages(self, visited: Set[int] = None) -> List['ValidationRecord']:
+        """
+        Recursively extract validation messages from a Pydantic model and its nested fields, including computed fields.
+        The messages are memoized per model. The nested models register this model as parent, so that a change of
+        a nested model drops the memo (see _invalidate_validation_cache). Do not modify the returned list.
+        
+        :param visited: Set of object IDs on the current path to prevent infinite loops.
+        :return: List of ValidationRecords from this and nested models.
+        """
+        private = self.__pydantic_private__
+        if private['_validation_cache'] is not None:
+            return private['_validation_cache']
+        
         if visited is None:
             visited = set()
-
         model_id = id(self)
         if model_id in visited:
             return []
         visited.add(model_id)
 
-        warnings_list = [warning for warning in self.validation_messages(nested=False)]
-
-        # Traverse regular fields
-        for field_name, field in self.__fields__.items():
-            full_path = f"{parent_name}.{field_name}" if parent_name else field_name
-            value = getattr(self, field_name)
-
-            if isinstance(value, LabFREED_BaseModel):
-                warnings_list.extend(value._get_nested_validation_messages(full_path, visited))
-            elif isinstance(value, list):
-                for index, item in enumerate(value):
-                    if isinstance(item, LabFREED_BaseModel):
-                        list_path = f"{full_path}[{index}]"
-                        warnings_list.extend(item._get_nested_validation_messages(list_path, visited))
+        msgs = list(self._validation_records(nested=False))
+        # the same model can be reachable more than once, e.g. through a field and a computed field. Report its messages only once.
+        seen = {id(m) for m in msgs}
+        for child in self._nested_validation_children():
+            child._add_validation_parent(self)
+            for m in child._nested_validation_messages(visited):
+                if id(m) not in seen:
+                    seen.add(id(m))
+                    msgs.append(m)
+        
+        visited.discard(model_id)
+        private['_validation_cache'] = msgs
+        return msgs
+    
+    
+    def _nested_validation_children(self) -> Iterator['LabFREED_BaseModel']:
+        '''@private The LabFREED models in fields and computed fields. Computed fields in _derived_computed_fields are skipped.'''
+        for field_name in type(self).model_fields:
+            yield from _models_in(getattr(self, field_name))
 
-        # Traverse computed fields
         computed_fields = getattr(self, '__pydantic_decorators__', {}).computed_fields or {}
         for field_name in computed_fields:
-            full_path = f"{parent_name}.{field_name}" if parent_name else field_name
+            if field_name in self._derived_computed_fields:
+                continue
             try:
                 value = getattr(self, field_name)
             except Exception:
                 continue  # Safely skip computed properties that raise errors
-
-            if isinstance(value, LabFREED_BaseModel):
-                warnings_list.extend(value._get_nested_validation_messages(full_path, visited))
-            elif isinstance(value, list):
-                for index, item in enumerate(value):
-                    if isinstance(item, LabFREED_BaseModel):
-                        list_path = f"{full_path}[{index}]"
-                        warnings_list.extend(item._get_nested_validation_messages(list_path, visited))
-
-        return warnings_list
+            yield from _models_in(value)
         
 
     
     def print_validation_messages(self, target='console'):
-        msgs = self.format_validation_messages(target=target)
-        
-        table = Table(title="Validation Results", show_header=False, title_justify='left')
-
-        def col(s):
-            return table.add_column(s, vertical='top')
-        col("-")
-        
-        if not msgs:
-            table.add_row('All clear!', end_section=True)
-            return
-
-        for m in msgs:
-            table.add_row(m)
-            table.add_section()
-
-        logging.info(table)
-        print(table)
-        return table
+        '''Prints the validation messages as table on the console (requires rich)'''
+        from labfreed.console_rendering import print_validation_messages
+        return print_validation_messages(self, target=target)
         
         
     def format_validation_messages(self, target='console') -> list[str]:
@@ -245,11 +494,72 @@ class LabFREED_BaseModel(PDOC_Workaround_Base):
         return out
             
 
+
+def _models_in(value) -> Iterator[LabFREED_BaseModel]:
+    '''@private yields value, if it is a LabFREED model, or the LabFREED models in a list'''
+    if isinstance(value, LabFREED_BaseModel):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            if isinstance(item, LabFREED_BaseModel):
+                yield item
+    
+
+class _TrackedList(list):
+    '''@private List in a field of a LabFREED model. It reports in place modifications to the models, which hold it in a field.
+    Pickles and copies are plain lists.'''
+    __slots__ = ('_owners',)
+    
+    def __init__(self, items, owner:LabFREED_BaseModel):
+        super().__init__(items)
+        self._owners = [weakref.ref(owner)]
+        
+    def _add_owner(self, owner:LabFREED_BaseModel):
+        if not any(ref() is owner for ref in self._owners):
+            self._owners.append(weakref.ref(owner))
+            
+    def _changed(self):
+        for ref in self._owners:
+            owner = ref()
+            if owner is not None:
+                owner._on_field_change()
+                
+    def __reduce__(self):
+        return (list, (list(self),))
+    
+    
+def _reporting_change(method_name):
+    method = getattr(list, method_name)
+    def modify(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._changed()
+        return result
+    modify.__name__ = method_name
+    return modify
+
+for _method_name in ('append', 'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse', '__setitem__', '__delitem__', '__iadd__', '__imul__'):
+    setattr(_TrackedList, _method_name, _reporting_change(_method_name))
+
+
+def _validate_nested(value):
+    '''@private validates the LabFREED models in value. Lists and root models (e.g. table rows) are traversed and the root models are validated as well'''
+    if isinstance(value, LabFREED_BaseModel):
+        value.validate()
+    elif isinstance(value, RootModel):
+        _validate_nested(value.root)
+        value.__pydantic_validator__.validate_python(value.root, self_instance=value)
+    elif isinstance(value, list):
+        for item in value:
+            _validate_nested(item)
+
+    
+def _as_validation_messages(val_msg:list[ValidationRecord|ValidationMessage]) -> list[ValidationMessage]:
+    return [m.to_validation_message() if isinstance(m, ValidationRecord) else m for m in val_msg]
     
-def _filter_errors(val_msg:list[ValidationMessage]) -> list[ValidationMessage]:
+def _filter_errors(val_msg:list[ValidationRecord]) -> list[ValidationRecord]:
     return [ m for m in val_msg if m.level == ValidationMsgLevel.ERROR ]
 
-def _filter_warnings(val_msg:list[ValidationMessage]) -> list[ValidationMessage]:
+def _filter_warnings(val_msg:list[ValidationRecord]) -> list[ValidationRecord]:
     return [ m for m in val_msg if m.level != ValidationMsgLevel.ERROR  ]     
 
 def _quote_texts(texts:list[str]):
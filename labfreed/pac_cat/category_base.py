@@ -1,5 +1,5 @@
                
-from typing import Any
+from typing import Any, Self
 from pydantic import PrivateAttr, computed_field, model_validator
 from labfreed.labfreed_infrastructure import LabFREED_BaseModel, ValidationMsgLevel
 from labfreed.pac_id.id_segment import IDSegment
@@ -26,6 +26,14 @@ class Category(LabFREED_BaseModel):
         input_segments = data.pop("segments", None)
         super().__init__(**data)
         self._segments = input_segments
+        
+    @classmethod
+    def _construct_trusted(cls, **data) -> Self:
+        '''@private'''
+        input_segments = data.pop("segments", None)
+        m = super()._construct_trusted(**data)
+        m._segments = input_segments
+        return m
     
     @model_validator(mode='after')
     def _warn_unusual_category_key(self):
@@ -1,16 +1,13 @@
 from __future__ import annotations  # optional in 3.11, but recommended for consistency
 
-from typing import Self
-from pydantic import computed_field, model_validator
+from typing import Iterable, Self
+from pydantic import PrivateAttr, computed_field, model_validator
 
-from rich import print
-from rich.text import Text
-from rich.table import Table
 
 from labfreed.labfreed_infrastructure import ValidationMsgLevel
 
 from labfreed.pac_cat.category_base import Category
-from labfreed.pac_cat.predefined_categories import category_key_to_class_map
+from labfreed.pac_cat.predefined_categories import PredefinedCategory, category_key_to_class_map
 from labfreed.pac_id.id_segment import IDSegment
 from labfreed.pac_id.pac_id import PAC_ID
 
@@ -21,15 +18,23 @@ class PAC_CAT(PAC_ID):
     ''' 
     Extends a PAC-ID with interpretation of the identifier as categories
     '''
+    _categories_cache: tuple[tuple, list[Category]]|None = PrivateAttr(default=None)
+    
     @computed_field
     @property
     def categories(self) -> list[Category]: 
-        '''The categories present in the PAC-ID's identifier'''
+        '''The categories present in the PAC-ID's identifier. 
+        They are built on first access and rebuilt only if the identifier changes.'''
+        cache_key = (self._validation_skipped, tuple((id(s), s.key, s.value) for s in self.identifier))
+        if self._categories_cache is not None and self._categories_cache[0] == cache_key:
+            return list(self._categories_cache[1])
+        
         category_segments = self._split_segments_by_category(self.identifier)
         categories = list()
         for c in category_segments:
-            categories.append(self._cat_from_cat_segments(c))
-        return categories
+            categories.append(self._cat_from_cat_segments(c, validate=not self._validation_skipped))
+        self._categories_cache = (cache_key, categories)
+        return list(categories)
     
     
 
@@ -52,18 +57,40 @@ class PAC_CAT(PAC_ID):
     
     
     @classmethod
-    def from_pac_id(cls, pac_id:PAC_ID) -> Self:
-        '''Constructs a PAC-CAT from a PAC-ID'''
+    def from_pac_id(cls, pac_id:PAC_ID, validate=True) -> Self:
+        '''Constructs a PAC-CAT from a PAC-ID. With validate=False the validation is deferred until validation results are requested (trusted mode)'''
+        if not validate:
+            return PAC_CAT._construct_trusted(issuer=pac_id.issuer, identifier=pac_id.identifier)
         return PAC_CAT(issuer=pac_id.issuer, identifier=pac_id.identifier)
     
 
     
     def to_pac_id(self) -> PAC_ID:
         return PAC_ID(issuer=self.issuer, identifier=self.identifier)
+    
+    
+    def _canonical_segments(self) -> Iterable[tuple[str|None, str]]:
+        '''@private categories in long notation, so that short and long notation give the same canonical key'''
+        return self._long_notation_segments(self.identifier, self.categories)
+    
+    @classmethod
+    def _long_notation_segments(cls, identifier:list[IDSegment], categories:list[Category]|None=None) -> Iterable[tuple[str|None, str]]:
+        '''@private (key, value) of the identifier segments with the categories in long notation. Segments before the first category are taken as they are.
+        If categories is None, they are built from the identifier without validation.'''
+        for s in identifier:
+            if s.value[:1] == '-':
+                break
+            yield (s.key, s.value)
+        if categories is None:
+            categories = [cls._cat_from_cat_segments(c, validate=False) for c in cls._split_segments_by_category(identifier)]
+        for c in categories:
+            yield (None, c.key)
+            for s in c.segments:
+                yield (s.key, s.value)
         
             
     @classmethod
-    def _cat_from_cat_segments(cls, segments:list[IDSegment]) -> Category:
+    def _cat_from_cat_segments(cls, segments:list[IDSegment], validate=True) -> Category:
         segments = segments.copy()
         category_key = segments[0].value         
         segments.pop(0)
@@ -71,10 +98,12 @@ class PAC_CAT(PAC_ID):
         known_cat = category_key_to_class_map.get(category_key)
         
         if not known_cat:
+            if not validate:
+                return Category._construct_trusted(key=category_key, segments=segments)
             return Category(key=category_key, segments=segments)
 
         # implicit segment keys
-        model_dict = {v.alias: None for k, v in known_cat.model_fields.items() if v.alias and k not in ['key','additional_segments']}
+        model_dict = dict.fromkeys(known_cat._segment_aliases)
         for k, seg in zip(model_dict.keys(), segments.copy()):
             if seg.key:
                 break
@@ -89,6 +118,8 @@ class PAC_CAT(PAC_ID):
             
         model_dict['additional_segments'] = segments
         model_dict['key'] = category_key
+        if not validate:
+            return known_cat._construct_trusted(**model_dict)
         cat= known_cat(**model_dict)
         return cat
     
@@ -98,7 +129,7 @@ class PAC_CAT(PAC_ID):
         c = list()
         for s in segments:
             # new category starts with "-"
-            if s.value[0] == '-':
+            if s.value[:1] == '-':
                 c = [s]
                 category_segments.append(c)
             else:
@@ -133,25 +164,6 @@ class PAC_CAT(PAC_ID):
     
         
     def print_categories(self):
-        table = Table(title=f'Categories in {str(self)}', show_header=False)
-        table.add_column('0')
-        table.add_column('1')
-        for i, c in enumerate(self.categories):
-            if i == 0:
-                title = Text('Main Category', style='bold')
-            else:
-                title = Text('Category', style='bold')
-            
-            table.add_row(title)
-            
-            for field_name, field_info in c.model_fields.items():
-                if not getattr(c, field_name):
-                    continue
-                table.add_row(f"{field_name} ({field_info.alias or ''})",
-                              f" {getattr(c, field_name)}"
-                              )      
-            table.add_section()        
-        print(table)
-        
-
-        
+        '''Prints the categories as table on the console (requires rich)'''
+        from labfreed.console_rendering import print_categories
+        print_categories(self)
@@ -1,6 +1,7 @@
 ## Materials
 from abc import ABC
-from pydantic import Field, computed_field, model_validator
+from typing import ClassVar
+from pydantic import Field, PrivateAttr, computed_field, model_validator
 
 from labfreed.labfreed_infrastructure import ValidationMsgLevel
 from labfreed.pac_cat.category_base import Category
@@ -13,22 +14,39 @@ class PredefinedCategory(Category, ABC):
     additional_segments: list[IDSegment] = Field(default_factory=list, exclude=True)
     ''' Category segments, which are not defined in the specification'''
     
+    _segment_fields: ClassVar[tuple[tuple[str, str], ...]] = ()
+    '''@private (field name, alias) of the fields which are serialized as segments, in the order of the specification.'''
+    _segment_aliases: ClassVar[tuple[str, ...]] = ()
+    '''@private the aliases (segment keys) of _segment_fields'''
+    _segments_cache: tuple[tuple, list[IDSegment]]|None = PrivateAttr(default=None)
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        '''@private precomputes the segment fields once per category, instead of going through model_fields on every parse'''
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._segment_fields = tuple((name, info.alias) for name, info in cls.model_fields.items() if name not in ('key', 'additional_segments'))
+        cls._segment_aliases = tuple(alias for _, alias in cls._segment_fields if alias)
+    
     @computed_field
     @property
     def segments(self) -> list[IDSegment]:
-        return self._get_segments(use_short_notation=False)
+        '''The segments in long notation. They are built on first access and rebuilt only if a field changes.'''
+        cache_key = tuple(getattr(self, field_name) for field_name, _ in self._segment_fields) + tuple(id(s) for s in self.additional_segments)
+        if self._segments_cache is not None and self._segments_cache[0] == cache_key:
+            return list(self._segments_cache[1])
+        segments = self._get_segments(use_short_notation=False)
+        self._segments_cache = (cache_key, segments)
+        return list(segments)
     
     def _get_segments(self, use_short_notation=False) -> list[IDSegment]:
         segments = []
         can_omit_keys = use_short_notation # keeps track of whether keys can still be omitted. That is the case when the segment recommendation is followed
-        for field_name, field_info in self.model_fields.items():
-            if field_name in ['key', 'additional_segments']:
-                continue
+        for field_name, alias in self._segment_fields:
             if value := getattr(self, field_name):
                 if can_omit_keys:
                     key = None
                 else:
-                    key = field_info.alias
+                    key = alias
                 segments.append(IDSegment(key= key, value= value)  )
             else:
                 can_omit_keys = False
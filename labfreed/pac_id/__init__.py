@@ -1,6 +1,8 @@
 from .pac_id import PAC_ID
 from .id_segment import IDSegment
 from .extension import Extension
+from .pac_id_record import PAC_ID_Record
+from .pac_id_spans import PAC_ID_Spans
 
 '''@private
 From a SW engineering perspective it would be best to have no dependencies from other modules to pac_id.
@@ -13,7 +15,9 @@ However from a Python users convenience perspective it is better to have one pla
 __all__ = [
     "PAC_ID",
     "IDSegment",
-    "Extension"
+    "Extension",
+    "PAC_ID_Record",
+    "PAC_ID_Spans"
 ]
 
 
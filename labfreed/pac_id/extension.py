@@ -31,7 +31,9 @@ class Extension(LabFREED_BaseModel,ExtensionBase):
         return self.data_
        
     @staticmethod
-    def create(*, name, type, data):
+    def create(*, name, type, data, validate=True):
+        if not validate:
+            return Extension._construct_trusted(name=name, type=type, data_=data)
         return Extension(name=name, type=type, data=data)
     
     @model_validator(mode='before')
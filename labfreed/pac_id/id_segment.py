@@ -1,11 +1,10 @@
-import re
-from pydantic import model_validator
-from labfreed.labfreed_infrastructure import LabFREED_BaseModel, ValidationMsgLevel, _quote_texts
-from labfreed.well_known_keys.labfreed.well_known_keys import WellKnownKeys
+from functools import lru_cache
+from pydantic import ConfigDict, model_validator
+from labfreed.labfreed_infrastructure import LabFREED_BaseModel, ValidationMsgLevel
+from labfreed.utilities.char_class import hsegment_chars, recommended_segment_chars
+from labfreed.well_known_keys.labfreed.well_known_keys import is_well_known_key
 
 
-_hsegment_pattern = r"[A-Za-z0-9_\-\.~!$&'()+,:;=@]|%[0-9A-Fa-f]{2}"
-
 class IDSegment(LabFREED_BaseModel):
     """ Represents an id segment of a PAC-ID. It can be a value or a key value pair.
     """
@@ -21,51 +20,56 @@ class IDSegment(LabFREED_BaseModel):
 
         # MUST be a valid hsegment according to RFC 1738, but without * (see PAC-ID Extension)
         # This means it must be true for both, key and value
-        if not_allowed_chars := set(re.sub(_hsegment_pattern, '', key)):
+        if not_allowed_chars := hsegment_chars.invalid_chars(key):
             self._add_validation_message(
                     source=f"id segment key {key}",
                     level = ValidationMsgLevel.ERROR,
-                    msg=f"{_quote_texts(not_allowed_chars)} must not be used. The segment key must be a valid hsegment",
+                    msg="{0:quoted} must not be used. The segment key must be a valid hsegment",
+                    msg_args=(not_allowed_chars,),
                     highlight_pattern = key,
                     highlight_sub = not_allowed_chars
             )
 
-        if not_allowed_chars := set(re.sub(_hsegment_pattern, '', value)):
+        if not_allowed_chars := hsegment_chars.invalid_chars(value):
             self._add_validation_message(
                     source=f"id segment key {value}",
                     level = ValidationMsgLevel.ERROR,
-                    msg=f"{_quote_texts(not_allowed_chars)} must not be used. The segment key must be a valid hsegment",
+                    msg="{0:quoted} must not be used. The segment key must be a valid hsegment",
+                    msg_args=(not_allowed_chars,),
                     highlight_pattern = value,
                     highlight_sub = not_allowed_chars
             )
 
         # Segment key SHOULD be limited to A-Z, 0-9, and -+..
-        if not_recommended_chars := set(re.sub(r'[A-Z0-9-:+]', '', key)):
+        if not_recommended_chars := recommended_segment_chars.invalid_chars(key):
             self._add_validation_message(
                     source=f"id segment key {key}",
                     level = ValidationMsgLevel.RECOMMENDATION,
-                    msg=f"{_quote_texts(not_recommended_chars)} should not be used. Characters SHOULD be limited to upper case letters (A-Z), numbers (0-9), '-' and '+' ",
+                    msg="{0:quoted} should not be used. Characters SHOULD be limited to upper case letters (A-Z), numbers (0-9), '-' and '+' ",
+                    msg_args=(not_recommended_chars,),
                     highlight_pattern = key,
                     highlight_sub = not_recommended_chars
                 )
 
         # Segment key should be in Well know keys
-        if key and key not in [k.value for k in WellKnownKeys]:
+        if key and not is_well_known_key(key):
             self._add_validation_message(
                     source=f"id segment key {key}",
                     level = ValidationMsgLevel.RECOMMENDATION,
-                    msg=f"{key} is not a well known segment key. It is RECOMMENDED to use well-known keys.",
+                    msg="{0} is not a well known segment key. It is RECOMMENDED to use well-known keys.",
+                    msg_args=(key,),
                     highlight_pattern = key,
                     highlight_sub=[key]
                 )
 
 
         # Segment value SHOULD be limited to A-Z, 0-9, and -+..
-        if not_recommended_chars := set(re.sub(r'[A-Z0-9-:+]', '', value)):
+        if not_recommended_chars := recommended_segment_chars.invalid_chars(value):
             self._add_validation_message(
                     source=f"id segment value {value}",
                     level = ValidationMsgLevel.RECOMMENDATION,
-                    msg=f"Characters {_quote_texts(not_recommended_chars)} should not be used., Characters SHOULD be limited to upper case letters (A-Z), numbers (0-9), '-' and '+' ",
+                    msg="Characters {0:quoted} should not be used., Characters SHOULD be limited to upper case letters (A-Z), numbers (0-9), '-' and '+' ",
+                    msg_args=(not_recommended_chars,),
                     highlight_pattern = value,
                     highlight_sub = not_recommended_chars
                 )
@@ -87,4 +91,23 @@ class IDSegment(LabFREED_BaseModel):
                     highlight_pattern = value
                 )
 
-        return self
\ No newline at end of file
+        return self
+
+
+
+class FrozenIDSegment(IDSegment):
+    '''@private
+    IDSegment which cannot be modified. Instances are shared between PAC-IDs, see interned_id_segment.
+    '''
+    model_config = ConfigDict(frozen=True)
+    
+
+@lru_cache(maxsize=2**16)
+def interned_id_segment(key:str|None, value:str, validate:bool=True) -> FrozenIDSegment:
+    '''Returns a shared and immutable IDSegment with key and value as split by the tokenizer, e.g. ("240", "BAL500") or (None, "-MD").
+    Identical key and value give the same instance. The most recently used segments are kept.
+    With validate=False the segment is constructed in trusted mode, i.e. validated when validation results are requested.
+    '''
+    if validate:
+        return FrozenIDSegment(key=key, value=value)
+    return FrozenIDSegment._construct_trusted(key=key, value=value)
@@ -1,18 +1,20 @@
 import re
+from typing import Iterable
 from typing_extensions import Self
 from pydantic import Field, conlist, model_validator
 
-from labfreed.labfreed_infrastructure import LabFREED_BaseModel, ValidationMsgLevel
+from labfreed.labfreed_infrastructure import LabFREED_BaseModel, LabFREED_ValidationError, ValidationMsgLevel
 from labfreed.pac_id.id_segment import IDSegment
 from labfreed.pac_id.extension import Extension
+from labfreed.utilities.char_class import alphanumeric_chars
 
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
-    pass
+    from labfreed.pac_id.pac_id_record import PAC_ID_Record
 
 
-_domain_name_pattern = r"(?!-)([A-Za-z0-9-]{1,63}(?<!-)\.)+[A-Za-z]{2,63}"
+_domain_name_pattern = re.compile(r"(?!-)([A-Za-z0-9-]{1,63}(?<!-)\.)+[A-Za-z]{2,63}")
 
 class PAC_ID(LabFREED_BaseModel):
     '''Represents a PAC-ID. 
@@ -41,14 +43,33 @@ class PAC_ID(LabFREED_BaseModel):
     @classmethod
     def from_url(cls, url, *, extension_interpreters='default', 
                  try_pac_cat=True,
-                 suppress_validation_errors=False) -> Self:
+                 suppress_validation_errors=False,
+                 validate=True,
+                 intern_segments=False) -> Self:
+        '''Parses a PAC-ID url. The url can be str or bytes-like (e.g. the raw payload of a QR code).
+        With validate=False the validation is deferred until validation results are requested (trusted mode).'''
         from labfreed.pac_id.url_parser import PAC_Parser
-        return PAC_Parser.from_url(url, try_pac_cat=try_pac_cat, suppress_validation_errors=suppress_validation_errors, extension_interpreters=extension_interpreters)
+        return PAC_Parser.from_url(url, try_pac_cat=try_pac_cat, suppress_validation_errors=suppress_validation_errors, extension_interpreters=extension_interpreters, validate=validate, intern_segments=intern_segments)
+    
+    @classmethod
+    def from_urls(cls, urls, *, extension_interpreters='default', 
+                  try_pac_cat=True,
+                  suppress_validation_errors=False,
+                  intern_segments=False) -> list[Self|LabFREED_ValidationError]:
+        '''Parses many PAC-IDs (str or bytes-like). Results are in the order of the input. 
+        Instead of raising, the LabFREED_ValidationError is returned for PAC-IDs which are invalid.'''
+        from labfreed.pac_id.url_parser import PAC_Parser
+        return PAC_Parser.from_urls(urls, try_pac_cat=try_pac_cat, suppress_validation_errors=suppress_validation_errors, extension_interpreters=extension_interpreters, intern_segments=intern_segments)
     
     def to_url(self, use_short_notation:None|bool=None, uppercase_only=False) -> str:
         from labfreed.pac_id.url_serializer import PACID_Serializer
         return PACID_Serializer.to_url(self, use_short_notation=use_short_notation, uppercase_only=uppercase_only)
     
+    def to_record(self) -> "PAC_ID_Record":
+        '''Compact, immutable and hashable representation of the PAC-ID'''
+        from labfreed.pac_id.pac_id_record import PAC_ID_Record
+        return PAC_ID_Record.from_pac_id(self)
+    
     def to_json(self, indent=None) -> str:
         if not indent:
             return self.model_dump_json()
@@ -60,6 +81,32 @@ class PAC_ID(LabFREED_BaseModel):
     
     def __str__(self):
         return self.to_url()
+    
+    
+    @property
+    def canonical_key(self) -> tuple:
+        '''Identity of the PAC-ID, including extensions. 
+        It does not depend on upper or lower case, nor on short or long notation of categories and extensions. PAC-IDs with the same key are equal,
+        regardless of whether they were parsed as PAC-ID or PAC-CAT.
+        The key is computed on each access. Do not modify a PAC-ID, which is in a set or a dict.
+        '''
+        return (self.issuer.upper(),
+                tuple((key.upper() if key else None, value.upper()) for key, value in self._canonical_segments()),
+                tuple((e.name.upper(), e.type.upper(), e.data.upper()) for e in self.extensions)
+                )
+    
+    def _canonical_segments(self) -> Iterable[tuple[str|None, str]]:
+        '''@private identifier segments as (key, value) in the form used for the canonical key. Categories are in long notation like in PAC_CAT'''
+        from labfreed.pac_cat.pac_cat import PAC_CAT
+        return PAC_CAT._long_notation_segments(self.identifier)
+    
+    def __eq__(self, other):
+        if not isinstance(other, PAC_ID):
+            return NotImplemented
+        return self.canonical_key == other.canonical_key
+    
+    def __hash__(self):
+        return hash(self.canonical_key)
           
          
     @model_validator(mode='after')
@@ -95,7 +142,7 @@ class PAC_ID(LabFREED_BaseModel):
     
     @model_validator(mode="after")
     def _validate_issuer(self):
-        if not re.fullmatch(_domain_name_pattern, self.issuer):
+        if not _domain_name_pattern.fullmatch(self.issuer):
             self._add_validation_message(
                     source="PAC-ID",
                     level = ValidationMsgLevel.ERROR,
@@ -104,7 +151,7 @@ class PAC_ID(LabFREED_BaseModel):
                 )
          
         # recommendation that A-Z, 0-9, -, and . should be used
-        if not_recommended_chars := set(re.sub(r'[A-Z0-9\.-]', '', self.issuer)):
+        if not_recommended_chars := alphanumeric_chars.invalid_chars(self.issuer):
             self._add_validation_message(
                     source="PAC-ID",
                     level = ValidationMsgLevel.RECOMMENDATION,
@@ -0,0 +1,87 @@
+from typing import NamedTuple, Self
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    # only imported during type checking
+    from labfreed.pac_id.pac_id import PAC_ID
+
+
+class PAC_ID_Record(NamedTuple):
+    '''Compact, immutable and hashable representation of a PAC-ID.
+    It consists only of strings and tuples, which makes it much smaller than a PAC_ID model. Use it to keep large numbers of PAC-IDs in memory, e.g. in sets for deduplication.
+    There is no validation. Convert to PAC_ID with to_pac_id() for that.
+    '''
+    issuer:str
+    '''The issuer of the PAC-ID.'''
+    identifier:tuple[tuple[str|None, str], ...]
+    '''The identifier segments as (key, value). key is None for segments without key.'''
+    extensions:tuple[tuple[str, str, str], ...] = ()
+    '''The extensions as (name, type, data). data is the raw string as in the url.'''
+
+    @classmethod
+    def from_url(cls, url:str|bytes) -> Self:
+        '''Splits a PAC-ID url (str or bytes-like) into a record. No models are created and nothing is validated.'''
+        from labfreed.pac_id.url_parser import PAC_Parser
+        issuer, identifier, extensions = PAC_Parser._split_url(url)
+        return cls(issuer, tuple(identifier), tuple(extensions))
+
+    @classmethod
+    def from_pac_id(cls, pac:"PAC_ID") -> Self:
+        '''Creates a record from a PAC_ID or PAC_CAT'''
+        return cls(pac.issuer,
+                   tuple((s.key, s.value) for s in pac.identifier),
+                   tuple((e.name, e.type, e.data) for e in pac.extensions))
+
+    def to_pac_id(self, *, extension_interpreters='default', try_pac_cat=True, validate=True) -> "PAC_ID":
+        '''Creates the PAC_ID (or PAC_CAT, if possible) model. Validation errors are not raised, check is_valid of the result.
+        With validate=False the validation is deferred until validation results are requested (trusted mode).'''
+        from labfreed.pac_cat import PAC_CAT
+        from labfreed.pac_id.id_segment import IDSegment
+        from labfreed.pac_id.extension import Extension
+        from labfreed.pac_id.pac_id import PAC_ID
+        from labfreed.well_known_extensions import default_extension_interpreters
+
+        if extension_interpreters == 'default':
+            extension_interpreters = default_extension_interpreters
+
+        make_segment = IDSegment if validate else IDSegment._construct_trusted
+        identifier = [make_segment(key=key, value=value) for key, value in self.identifier]
+        if validate:
+            pac = PAC_ID(issuer=self.issuer, identifier=identifier)
+        else:
+            pac = PAC_ID._construct_trusted(issuer=self.issuer, identifier=identifier)
+        if try_pac_cat:
+            pac_cat = PAC_CAT.from_pac_id(pac, validate=validate)
+            if pac_cat.categories:
+                pac = pac_cat
+
+        extensions = list()
+        for name, type, data in self.extensions:
+            e = Extension.create(name=name, type=type, data=data, validate=validate)
+            if extension_interpreters and (interpreter := extension_interpreters.get(type)):
+                e = interpreter.from_extension(e) if validate else interpreter.from_extension(e, validate=False)
+            extensions.append(e)
+        pac.extensions = extensions
+        return pac
+
+    def to_url(self, use_short_notation:None|bool=None, uppercase_only=False) -> str:
+        '''Serializes the PAC-ID. Arguments as in PAC_ID.to_url.
+        With use_short_notation=True or False the PAC-ID needs to be interpreted as PAC-CAT, which is considerably slower'''
+        from labfreed.pac_id.url_serializer import PACID_Serializer
+
+        if use_short_notation is None:
+            identifier_str = PACID_Serializer._serialize_segments(self.identifier)
+        else:
+            pac = self.to_pac_id(extension_interpreters=None, validate=False)
+            identifier_str = PACID_Serializer._serialize_identifier(pac, use_short_notation=use_short_notation)
+
+        use_short_notation_for_extensions = True if use_short_notation is None else use_short_notation
+        extensions_str = PACID_Serializer._serialize_extension_tuples(self.extensions, use_short_notation=use_short_notation_for_extensions)
+        out = f"HTTPS://PAC.{self.issuer}{identifier_str}{extensions_str}"
+
+        if uppercase_only:
+            out = out.upper()
+        return out
+
+    def __str__(self):
+        return self.to_url()
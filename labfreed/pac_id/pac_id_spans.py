@@ -0,0 +1,145 @@
+from typing import Self
+
+from labfreed.pac_id.url_tokenizer import _default_extension_names, scan
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    # only imported during type checking
+    from labfreed.pac_id.pac_id import PAC_ID
+    from labfreed.pac_id.pac_id_record import PAC_ID_Record
+
+
+class PAC_ID_Spans():
+    '''Positions of issuer, segments and extensions in a PAC-ID url.
+
+    Creating it only determines offsets, no substrings and no models are created. Strings are only created when asked for,
+    comparisons like issuer_equals() or has_category() work directly on the url. Use it to filter large numbers of PAC-IDs,
+    e.g. "all PAC-IDs with issuer X and category -MD", and create the PAC_ID only for those which are of interest.
+
+    The url can be str or bytes-like. A memoryview is copied to bytes. For bytes view() returns a memoryview, which does not copy the data.
+    There is no validation beyond the structure of the url.
+
+    Spans are (start, end) offsets into the url.
+    '''
+    __slots__ = ('url', '_issuer_span', '_segments', '_extensions')
+
+    def __init__(self, url:str|bytes|bytearray|memoryview):
+        '''Raises PAC_SyntaxError (a ValueError) if the url does not have the structure of a PAC-ID'''
+        if isinstance(url, memoryview):
+            # the scanner needs the str methods (find, startswith) of bytes
+            url = bytes(url)
+        self.url = url
+        '''The url as it was passed in'''
+        issuer_start, issuer_end, self._segments, self._extensions = scan(url)
+        self._issuer_span = (issuer_start, issuer_end)
+
+    @classmethod
+    def from_url(cls, url:str|bytes|bytearray|memoryview) -> Self:
+        return cls(url)
+
+
+    @property
+    def issuer_span(self) -> tuple[int, int]:
+        return self._issuer_span
+
+    @property
+    def segment_spans(self) -> list[tuple[tuple[int, int]|None, tuple[int, int]]]:
+        '''(key span, value span) of each segment. The key span is None for segments without key'''
+        return [((start, colon), (colon + 1, end)) if colon != -1 else (None, (start, end))
+                for start, colon, end in self._segments]
+
+    @property
+    def extension_spans(self) -> list[tuple[tuple[int, int]|None, tuple[int, int]|None, tuple[int, int]]]:
+        '''(name span, type span, data span) of each extension. Name and type span are None for extensions in short notation'''
+        return [((start, dollar), (dollar + 1, slash), (slash + 1, end)) if dollar != -1 else (None, None, (start, end))
+                for _, start, dollar, slash, end in self._extensions]
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    @property
+    def extension_count(self) -> int:
+        return len(self._extensions)
+
+
+    # Comparisons. These do not create substrings
+
+    def issuer_equals(self, issuer:str|bytes) -> bool:
+        return self._equals(*self._issuer_span, issuer)
+
+    def segment_value_equals(self, i:int, value:str|bytes) -> bool:
+        start, colon, end = self._segments[i]
+        return self._equals(colon + 1 if colon != -1 else start, end, value)
+
+    def segment_key_equals(self, i:int, key:str|bytes|None) -> bool:
+        start, colon, _ = self._segments[i]
+        if colon == -1:
+            return key is None
+        return key is not None and self._equals(start, colon, key)
+
+    def has_segment(self, value:str|bytes, key:str|bytes|None=None) -> bool:
+        '''True if there is a segment with this key and value'''
+        return any(self.segment_key_equals(i, key) and self.segment_value_equals(i, value) for i in range(len(self._segments)))
+
+    def has_category(self, key:str|bytes) -> bool:
+        '''True if there is a segment without key with the category key (e.g. "-MD").
+        Whether the identifier is a valid PAC-CAT is not checked.'''
+        return self.has_segment(key)
+
+    def _equals(self, start:int, end:int, value:str|bytes) -> bool:
+        if isinstance(value, str) != isinstance(self.url, str):
+            value = value.encode('utf-8') if isinstance(value, str) else value.decode('utf-8')
+        return end - start == len(value) and self.url.startswith(value, start)
+
+
+    # Accessors. These create strings
+
+    @property
+    def issuer(self) -> str:
+        return self.text(self._issuer_span)
+
+    def segment(self, i:int) -> tuple[str|None, str]:
+        '''(key, value) of the i-th segment'''
+        start, colon, end = self._segments[i]
+        if colon == -1:
+            return None, self.text((start, end))
+        return self.text((start, colon)), self.text((colon + 1, end))
+
+    def extension(self, i:int) -> tuple[str, str, str]:
+        '''(name, type, data) of the i-th extension. For extensions in short notation name and type are the defaults'''
+        index, start, dollar, slash, end = self._extensions[i]
+        if dollar == -1:
+            name, type = _default_extension_names[index]
+            return name, type, self.text((start, end))
+        return self.text((start, dollar)), self.text((dollar + 1, slash)), self.text((slash + 1, end))
+
+    def text(self, span:tuple[int, int]) -> str:
+        '''The part of the url as str'''
+        start, end = span
+        if isinstance(self.url, str):
+            return self.url[start:end]
+        return str(memoryview(self.url)[start:end], 'utf-8')
+
+    def view(self, span:tuple[int, int]) -> str|memoryview:
+        '''The part of the url. For bytes this is a memoryview, which shares the memory with the url. For str it is a str.'''
+        start, end = span
+        if isinstance(self.url, str):
+            return self.url[start:end]
+        return memoryview(self.url)[start:end]
+
+
+    def to_record(self) -> "PAC_ID_Record":
+        from labfreed.pac_id.pac_id_record import PAC_ID_Record
+        return PAC_ID_Record(self.issuer,
+                             tuple(self.segment(i) for i in range(len(self._segments))),
+                             tuple(self.extension(i) for i in range(len(self._extensions))))
+
+    def to_pac_id(self, **kwargs) -> "PAC_ID":
+        '''Parses the url to the PAC_ID (or PAC_CAT) model. kwargs are passed to PAC_ID.from_url'''
+        from labfreed.pac_id.pac_id import PAC_ID
+        url = self.url if isinstance(self.url, str) else self.text((0, len(self.url)))
+        return PAC_ID.from_url(url, **kwargs)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.url!r})'
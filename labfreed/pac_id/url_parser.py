@@ -1,13 +1,12 @@
 
 
-import logging
-import re
-from types import MappingProxyType
+from typing import Iterable
 
 from labfreed.labfreed_infrastructure import LabFREED_ValidationError
 
-from labfreed.pac_id.id_segment import IDSegment
+from labfreed.pac_id.id_segment import IDSegment, interned_id_segment
 from labfreed.pac_id.extension import Extension
+from labfreed.pac_id.url_tokenizer import PAC_Tokens, tokenize
 
 from labfreed.pac_cat import PAC_CAT
 from labfreed.well_known_extensions import default_extension_interpreters
@@ -19,6 +18,7 @@ if TYPE_CHECKING:
     from labfreed.pac_id import PAC_ID
     from labfreed.pac_cat import PAC_CAT
 
+
 class PAC_Parser():
     '''@private
     Knows how to parse a PAC-ID. 
@@ -29,16 +29,24 @@ class PAC_Parser():
    '''
       
     @classmethod
-    def from_url(cls, pac_url:str, 
+    def from_url(cls, pac_url:str|bytes|bytearray|memoryview, 
                  *, 
                  extension_interpreters = 'default', 
                  try_pac_cat = True,
-                 suppress_validation_errors=False
+                 suppress_validation_errors=False,
+                 validate = True,
+                 intern_segments = False
                  ) -> "PAC_ID":
         """Parses a PAC-ID with extensions
 
         Args:
-            pac_url (str): pac id with optional extensions: e.g. HTTPS://PAC.METTORIUS.COM/-MD/BAL500/1234*N$N/ABC*SUM$TREX/A$T.A:ABC
+            pac_url (str | bytes-like): pac id with optional extensions: e.g. HTTPS://PAC.METTORIUS.COM/-MD/BAL500/1234*N$N/ABC*SUM$TREX/A$T.A:ABC
+                                        Bytes are decoded as UTF-8 (PAC-IDs consist of ASCII characters only).
+            validate (bool, optional): With False the models are constructed without running the validators (trusted mode). 
+                                       Validation is deferred until validation results (is_valid, errors(), ...) are requested or validate() is called.
+                                       Use for PAC-IDs known to be valid.
+            intern_segments (bool, optional): With True identical segments of all PAC-IDs parsed this way share one immutable instance. 
+                                              This saves memory when many PAC-IDs are kept.
 
         Raises:
             LabFREED_ValidationError: When validation fails. Note,that with suppress_errors no such error is raises
@@ -49,108 +57,130 @@ class PAC_Parser():
         if extension_interpreters == 'default':
             extension_interpreters = default_extension_interpreters
         
-        if '*' in pac_url:
-            id_str, ext_str = pac_url.split('*', 1)
-        else:
-            id_str = pac_url
-            ext_str = ""
-                    
-        pac_id = cls._parse_pac_id(id_str)
+        pac_id = cls._pac_id_from_url(pac_url, extension_interpreters=extension_interpreters, try_pac_cat=try_pac_cat, validate=validate, intern_segments=intern_segments)
+        if not validate:
+            return pac_id
+            
+        if not pac_id.is_valid and not suppress_validation_errors:
+            # no formatting here. The messages are in the error, print_validation_messages() of the PAC-ID renders them if needed
+            raise LabFREED_ValidationError(validation_msgs = pac_id._get_nested_validation_messages())
+        
+        return pac_id
+    
+    
+    @classmethod
+    def from_urls(cls, pac_urls:Iterable[str|bytes], 
+                  *, 
+                  extension_interpreters = 'default', 
+                  try_pac_cat = True,
+                  suppress_validation_errors=False,
+                  intern_segments=False
+                  ) -> list["PAC_ID|LabFREED_ValidationError"]:
+        """Parses many PAC-IDs with extensions in one go.
+        
+        Compiled patterns and the extension interpreters are resolved once for the whole batch. 
+        An invalid PAC-ID does not abort the batch, instead the error is returned in its place.
+
+        Args:
+            pac_urls (Iterable[str | bytes-like]): pac ids with optional extensions
+            intern_segments (bool, optional): With True identical segments share one immutable instance (see from_url)
+            
+        Returns:
+            list of PAC-ID (or PAC-CAT) in the order of the input. Where parsing or validation failed the LabFREED_ValidationError is returned instead.
+            With suppress_validation_errors invalid PAC-IDs are returned as they are, only PAC-IDs which cannot be parsed at all are returned as error. 
+        """
+        if extension_interpreters == 'default':
+            extension_interpreters = default_extension_interpreters
+            
+        results = list()
+        for pac_url in pac_urls:
+            results.append(cls._try_from_url(pac_url, 
+                                             extension_interpreters=extension_interpreters, 
+                                             try_pac_cat=try_pac_cat, 
+                                             suppress_validation_errors=suppress_validation_errors,
+                                             intern_segments=intern_segments)
+                           )
+        return results
+    
+    
+    @classmethod
+    def _try_from_url(cls, pac_url:str|bytes, *, extension_interpreters, try_pac_cat, suppress_validation_errors, intern_segments=False) -> "PAC_ID|LabFREED_ValidationError":
+        '''Like from_url, but returns the error instead of raising it. extension_interpreters must already be resolved.'''
+        try:
+            pac_id = cls._pac_id_from_url(pac_url, extension_interpreters=extension_interpreters, try_pac_cat=try_pac_cat, intern_segments=intern_segments)
+        except LabFREED_ValidationError as e:
+            return e
+        except ValueError as e:
+            error = LabFREED_ValidationError(str(e), validation_msgs=[])
+            error.__cause__ = e
+            return error
+        
+        if not pac_id.is_valid and not suppress_validation_errors:
+            return LabFREED_ValidationError(validation_msgs = pac_id._get_nested_validation_messages())
+        return pac_id
+    
+    
+    @classmethod
+    def _pac_id_from_url(cls, pac_url:str|bytes, *, extension_interpreters, try_pac_cat, validate=True, intern_segments=False) -> "PAC_ID":
+        '''Parses the PAC-ID without checking validity. extension_interpreters must already be resolved.'''
+        pac_url = _as_str(pac_url)
+        tokens = tokenize(pac_url)
+        pac_id = cls._pac_id_from_tokens(pac_url, tokens, validate=validate, intern_segments=intern_segments)
         
         # try converting to PAC-CAT. This can fail, in which case a regular PAC-ID is returned
         if try_pac_cat:
             try:
-                pac_cat = PAC_CAT.from_pac_id(pac_id)
+                pac_cat = PAC_CAT.from_pac_id(pac_id, validate=validate)
                 if pac_cat.categories:
                     pac_id = pac_cat
             except LabFREED_ValidationError:
                 pass 
               
-        extensions = cls._parse_extensions(ext_str)
+        extensions = [Extension.create(name=name, type=type, data=data, validate=validate) for name, type, data, *_ in tokens.extensions]
         if extensions and extension_interpreters:
             for i, e in enumerate(extensions):
                 if interpreter := extension_interpreters.get(e.type):
-                    extensions[i] = interpreter.from_extension(e)
+                    if validate:
+                        extensions[i] = interpreter.from_extension(e)
+                    else:
+                        # only interpreters used in trusted mode need to know the validate argument
+                        extensions[i] = interpreter.from_extension(e, validate=False)
         pac_id.extensions = extensions
-            
-        if not pac_id.is_valid and not suppress_validation_errors:
-            logging.error(pac_id.print_validation_messages())
-            raise LabFREED_ValidationError(validation_msgs = pac_id._get_nested_validation_messages())
-        
         return pac_id
             
     @classmethod
-    def _parse_pac_id(cls,id_str:str) -> "PAC_ID":
-        # m = re.match('(HTTPS://)?(PAC.)?(?P<issuer>.+?\..+?)/(?P<identifier>.*)', id_str)
-        m = re.match('(HTTPS://)?(PAC.)?(?P<issuer>.+?)/(?P<identifier>.*)', id_str)
-        d = m.groupdict()
-        
-        id_segments = list()
-        id_segments = cls._parse_id_segments(d.get('identifier'))
+    def _pac_id_from_tokens(cls, pac_url:str, tokens:PAC_Tokens, validate=True, intern_segments=False) -> "PAC_ID":
+        if intern_segments:
+            id_segments = [interned_id_segment(key, value, validate) for key, value, _, _ in tokens.segments]
+        else:
+            make_segment = IDSegment if validate else IDSegment._construct_trusted
+            id_segments = [make_segment(key=key, value=value) for key, value, _, _ in tokens.segments]
         
         from labfreed.pac_id import PAC_ID
-        pac = PAC_ID(issuer= d.get('issuer'),
-                     identifier=id_segments
-        )
+        if validate:
+            pac = PAC_ID(issuer= tokens.issuer,
+                        identifier=id_segments
+            )
+        else:
+            pac = PAC_ID._construct_trusted(issuer= tokens.issuer, identifier=id_segments)
         
         return pac
     
-    @classmethod
-    def _parse_id_segments(cls, identifier:str):
-        if not identifier:
-            return []    
-        
-        id_segments = list()  
-        if len(identifier) > 0 and identifier[0] == '/':
-            identifier = identifier[1:]
-        for s in identifier.split('/'):
-            tmp = s.split(':')
-            
-            if len(tmp) == 1:
-                segment = IDSegment(value=tmp[0])
-            elif len(tmp) == 2:
-                segment = IDSegment(key=tmp[0], value=tmp[1])
-            else:
-                raise ValueError(f'invalid segment: {s}')
-                
-            id_segments.append(segment)
-        return id_segments
     
+    @staticmethod
+    def _split_url(pac_url:str|bytes) -> tuple[str, list[tuple[str|None, str]], list[tuple[str, str, str]]]:
+        '''Splits a PAC-ID url in issuer, identifier segments as (key, value) and extensions as (name, type, data) without creating any models'''
+        tokens = tokenize(_as_str(pac_url))
+        return (tokens.issuer, 
+                [(key, value) for key, value, _, _ in tokens.segments], 
+                [(name, type, data) for name, type, data, *_ in tokens.extensions])
+
 
-    @classmethod
-    def _parse_extensions(cls, extensions_str:str|None) -> list["Extension"]:    
-        
-        extensions = list()
-        
-        if not extensions_str:
-            return extensions
-        
-        defaults =  MappingProxyType(
-                                {
-                                    0: { 'name': 'N', 'type': 'N'},
-                                    1: { 'name': 'SUM', 'type': 'TREX'}
-                                }
-        )
-        for i, e in enumerate(extensions_str.split('*')):
-            if e == '': #this will happen if first extension starts with *
-                continue
-            d = re.match('((?P<name>.+)\$(?P<type>.+)/)?(?P<data>.+)', e).groupdict()
-            
-            name = d.get('name')
-            type = d.get('type') 
-            data = d.get('data')
-    
-            if name:
-                defaults = None # once a name was specified no longer assign defaults
-            else:
-                if defaults:
-                    name = defaults.get(i).get('name')
-                    type = defaults.get(i).get('type')
-                else:
-                    raise ValueError('extension number {i}, must have name and type')
-            
-            #convert to subtype if they were given
-            e = Extension.create(name=name, type=type, data=data)
-            extensions.append(e)
 
-        return extensions
\ No newline at end of file
+def _as_str(pac_url:str|bytes|bytearray|memoryview) -> str:
+    '''@private 
+    The models hold str. Bytes-like input is decoded once for the whole url, which is cheaper than decoding the parts.
+    A UnicodeDecodeError is a ValueError and ends up as LabFREED_ValidationError in from_urls.'''
+    if isinstance(pac_url, str):
+        return pac_url
+    return str(pac_url, 'utf-8')
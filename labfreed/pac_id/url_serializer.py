@@ -1,3 +1,5 @@
+from typing import Iterable
+
 from labfreed.pac_cat.pac_cat import PAC_CAT
 from labfreed.pac_cat.predefined_categories import PredefinedCategory
 from labfreed.pac_id.id_segment import IDSegment
@@ -47,36 +49,47 @@ class PACID_Serializer():
         else:
             segments = pac.identifier
         
+        return cls._serialize_segments((s.key, s.value) for s in segments)
+    
+    
+    @staticmethod
+    def _serialize_segments(segments:Iterable[tuple[str|None, str]]) -> str:
+        '''serializes identifier segments given as (key, value)'''
         identifier_str = ''
-        for s in segments:
-            s:IDSegment = s
-            if s.key:
-                identifier_str += f'/{s.key}:{s.value}'
+        for key, value in segments:
+            if key:
+                identifier_str += f'/{key}:{value}'
             else:
-                identifier_str += f'/{s.value}'
+                identifier_str += f'/{value}'
         return identifier_str
           
 
     @classmethod
     def _serialize_extensions(cls, extensions:list[Extension], use_short_notation):
+        return cls._serialize_extension_tuples(((e.name, e.type, e.data) for e in extensions), use_short_notation=use_short_notation)
+    
+    
+    @staticmethod
+    def _serialize_extension_tuples(extensions:Iterable[tuple[str, str, str]], use_short_notation):
+        '''serializes extensions given as (name, type, data)'''
         out = ''
         short_notation = use_short_notation
-        for i, e in enumerate(extensions):
+        for i, (name, type, data) in enumerate(extensions):
             
             if short_notation and i==0:
-                if e.name=='N':
-                    out += f'*{e.data}'
+                if name=='N':
+                    out += f'*{data}'
                     continue
                 else: 
                     short_notation = False
             if short_notation and i==1:
-                if e.name=='SUM':
-                    out += f'*{e.data}'
+                if name=='SUM':
+                    out += f'*{data}'
                     continue
                 else: 
                     short_notation = False
                 
-            out += f'*{e.name}${e.type}/{e.data}'
+            out += f'*{name}${type}/{data}'
         return out
         
 
@@ -0,0 +1,186 @@
+'''@private
+Single pass tokenizer for PAC-ID urls.
+
+The url is scanned once from left to right by scan. Delimiters are located with str methods implemented in C (find, rfind),
+no regular expressions are involved. All tokens carry their offsets in the url, which allows to point at the exact position of a problem.
+Tokens are plain tuples, since creating named tuples would cost more than the scanning itself.
+
+The result is the same as the one of the regular expressions used before:
+* `HTTPS://` and `PAC.` are optional prefixes. If the issuer cannot be found with a prefix removed, the prefix is part of the issuer.
+* The issuer ends at the first `/`, the identifier at the first `*`. Segments are separated by `/`, key and value by `:`
+* Extensions are separated by `*`. `<name>$<type>/<data>` is split at the last `$` and the last `/`, which leave name, type and data not empty.
+* Nothing extends beyond a line break.
+'''
+
+from types import MappingProxyType
+from typing import NamedTuple
+
+
+_default_extension_names = MappingProxyType(
+                                {
+                                    0: ('N', 'N'),
+                                    1: ('SUM', 'TREX')
+                                }
+)
+
+
+class PAC_SyntaxError(ValueError):
+    '''Raised when a PAC-ID url cannot be split into its parts'''
+    def __init__(self, message:str, *, url:str, position:int):
+        super().__init__(f'{message} (at position {position})')
+        self.url = url
+        '''the url which was tokenized'''
+        self.position = position
+        '''offset in the url, where the problem was found'''
+
+
+class PAC_Tokens(NamedTuple):
+    issuer:str
+    issuer_start:int
+    '''offset of the first character of the issuer in the url'''
+    segments:tuple[tuple[str|None, str, int, int], ...]
+    '''(key, value, start, end) per segment. key is None for segments without key. start and end are the offsets of the segment in the url'''
+    extensions:tuple[tuple[str, str, str, int, int, int], ...]
+    '''(name, type, data, start, data_start, end) per extension. For extensions in short notation name and type are the defaults. 
+    start, data_start and end are the offsets of the extension, of its data and of the end of the extension in the url'''
+
+
+def tokenize(url:str) -> PAC_Tokens:
+    '''Splits a PAC-ID url into issuer, identifier segments and extensions. The substrings are cut at the offsets found by scan.
+
+    Raises:
+        PAC_SyntaxError: if the url does not have the structure of a PAC-ID.
+    '''
+    issuer_start, issuer_end, segment_offsets, extension_offsets = scan(url)
+    segments = tuple([
+        (None, url[start:end], start, end) if colon == -1 else (url[start:colon], url[colon + 1:end], start, end)
+        for start, colon, end in segment_offsets
+    ])
+    extensions = list()
+    for i, start, dollar, slash, end in extension_offsets:
+        if dollar == -1:
+            name, type = _default_extension_names[i]
+            extensions.append((name, type, url[start:end], start, start, end))
+        else:
+            extensions.append((url[start:dollar], url[dollar + 1:slash], url[slash + 1:end], start, slash + 1, end))
+    return PAC_Tokens(url[issuer_start:issuer_end], issuer_start, segments, tuple(extensions))
+
+
+def _find_issuer(url, line_end:int, HTTPS='HTTPS://', PAC='PAC', SLASH='/') -> tuple[int, int]:
+    '''returns start and end of the issuer. The end is the position of the "/" separating issuer and identifier. (-1, -1) if there is no issuer'''
+    bases = (8, 0) if url.startswith(HTTPS, 0, line_end) else (0,)
+    for base in bases:
+        if base + 3 < line_end and url.startswith(PAC, base, line_end):
+            starts = (base + 4, base)
+        else:
+            starts = (base,)
+        for start in starts:
+            # the issuer has at least one character
+            slash = url.find(SLASH, start + 1, line_end)
+            if slash != -1:
+                return start, slash
+    return -1, -1
+
+
+_str_delimiters = ('*', '\n', '/', ':', '$', 'HTTPS://', 'PAC', 'HTTPS://PAC.')
+_bytes_delimiters = tuple(d.encode('ascii') for d in _str_delimiters)
+
+
+def scan(url:str|bytes|bytearray) -> tuple[int, int, list[tuple[int, int, int]], list[tuple[int, int, int, int, int]]]:
+    '''Determines the offsets of the parts of a PAC-ID url, without creating any substrings. Works on str and bytes alike.
+    This is the only implementation of the PAC-ID grammar. tokenize cuts the substrings at these offsets.
+
+    Returns:
+        issuer_start, issuer_end, 
+        segments as (start, colon, end). colon is -1 for segments without key,
+        extensions as (index, start, dollar, slash, end). dollar and slash are -1 for extensions in short notation, 
+        index is the position in the list of extensions (counting empty ones), which determines the default name and type.
+    
+    Raises:
+        PAC_SyntaxError: if the url does not have the structure of a PAC-ID.
+        TypeError: if the url is neither str, bytes nor bytearray. Convert other bytes-like objects (e.g. memoryview) with bytes() first.
+    '''
+    if isinstance(url, str):
+        STAR, NL, SLASH, COLON, DOLLAR, HTTPS, PAC, HTTPS_PAC = _str_delimiters
+    elif isinstance(url, (bytes, bytearray)):
+        STAR, NL, SLASH, COLON, DOLLAR, HTTPS, PAC, HTTPS_PAC = _bytes_delimiters
+    else:
+        raise TypeError(f'url must be str, bytes or bytearray, not {type(url).__name__}')
+    
+    n = len(url)
+    id_end = url.find(STAR)
+    if id_end == -1:
+        id_end = n
+    line_end = url.find(NL, 0, id_end)
+    if line_end == -1:
+        line_end = id_end
+    
+    issuer_end = url.find(SLASH, 13, line_end) if url.startswith(HTTPS_PAC, 0, line_end) else -1
+    if issuer_end != -1:
+        issuer_start = 12
+    else:
+        issuer_start, issuer_end = _find_issuer(url, line_end, HTTPS, PAC, SLASH)
+    if issuer_start < 0:
+        raise PAC_SyntaxError(f'{_text(url[:id_end])} is not a valid PAC-ID. Issuer and identifier must be separated by "/"', url=url, position=line_end)
+    
+    segments = list()
+    pos = issuer_end + 1
+    if pos < line_end:
+        if url.startswith(SLASH, pos):
+            pos += 1
+        while True:
+            end = url.find(SLASH, pos, line_end)
+            if end == -1:
+                end = line_end
+            colon = url.find(COLON, pos, end)
+            if colon != -1 and (second_colon := url.find(COLON, colon + 1, end)) != -1:
+                raise PAC_SyntaxError(f'invalid segment: {_text(url[pos:end])}', url=url, position=second_colon)
+            segments.append((pos, colon, end))
+            if end == line_end:
+                break
+            pos = end + 1
+    
+    extensions = list()
+    if id_end < n:
+        defaults = _default_extension_names
+        pos = id_end + 1
+        i = 0
+        while True:
+            ext_end = url.find(STAR, pos)
+            if ext_end == -1:
+                ext_end = n
+            if ext_end > pos: # empty extensions are skipped, but counted
+                end = url.find(NL, pos, ext_end)
+                if end == -1:
+                    end = ext_end
+                if end == pos:
+                    raise PAC_SyntaxError(f'extension number {i} has no data', url=url, position=pos)
+                dollar, slash = _find_name_and_type(url, pos, end, DOLLAR, SLASH)
+                if dollar != -1:
+                    defaults = None # once a name was specified no longer assign defaults
+                elif not (defaults and i in defaults):
+                    raise PAC_SyntaxError(f'extension number {i}, must have name and type', url=url, position=pos)
+                extensions.append((i, pos, dollar, slash, end))
+            if ext_end == n:
+                break
+            pos = ext_end + 1
+            i += 1
+            
+    return issuer_start, issuer_end, segments, extensions
+
+
+def _text(s:str|bytes|bytearray) -> str:
+    '''@private part of the url for error messages'''
+    return s if isinstance(s, str) else bytes(s).decode('utf-8', errors='replace')
+
+
+def _find_name_and_type(url, start:int, end:int, DOLLAR, SLASH) -> tuple[int, int]:
+    '''returns the positions of "$" and "/" in <name>$<type>/<data>. (-1, -1) if the extension has no name and type'''
+    # name, type and data have at least one character. The last "$" and the last "/" win.
+    dollar = url.rfind(DOLLAR, start + 1, end)
+    while dollar != -1:
+        slash = url.rfind(SLASH, dollar + 2, end - 1)
+        if slash != -1:
+            return dollar, slash
+        dollar = url.rfind(DOLLAR, start + 1, dollar)
+    return -1, -1
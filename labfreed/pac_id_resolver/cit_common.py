@@ -1,6 +1,7 @@
 from enum import Enum
 import re
 from labfreed.labfreed_infrastructure import LabFREED_BaseModel, ValidationMsgLevel, _quote_texts
+from labfreed.utilities.char_class import application_intent_chars, service_name_chars
 
 
 
@@ -11,7 +12,7 @@ class ServiceType(Enum):
 
 def _validate_service_name(service_name):
     msg_dict = []
-    if not_allowed_chars := set(re.sub(r'[A-Za-z0-9\-\x20]', '', service_name)):
+    if not_allowed_chars := service_name_chars.invalid_chars(service_name):
         msg_dict.append( {
                 "level": ValidationMsgLevel.ERROR,
                 "msg": f'Service name ontains invalid characters {_quote_texts(not_allowed_chars)}',
@@ -38,7 +39,7 @@ def _validate_application_intent(intent):
             }
         )
 
-    if not_allowed_chars := set(re.sub(r'[A-Za-z0-9\-]', '', intent)):
+    if not_allowed_chars := application_intent_chars.invalid_chars(intent):
         msg_dict.append( {
                 "level": ValidationMsgLevel.ERROR,
                 "msg": f'Application intent contains invalid characters {_quote_texts(not_allowed_chars)}',
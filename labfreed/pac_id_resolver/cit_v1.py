@@ -141,7 +141,7 @@ class CIT_v1(LabFREED_BaseModel):
                                 highlight_sub_patterns=''
                           )
             )
-        cit._validation_messages.extend(errors)
+        cit._validation_messages = cit._validation_messages + errors
         cit._csv_original = csv
         return cit
     
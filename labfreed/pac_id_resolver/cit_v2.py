@@ -9,6 +9,7 @@ import jsonpath_ng.ext as jsonpath
 
 from labfreed.pac_id_resolver.services import Service, ServiceGroup
 from labfreed.labfreed_infrastructure import LabFREED_BaseModel, ValidationMsgLevel, _quote_texts
+from labfreed.utilities.char_class import application_intent_chars, service_name_chars
 from labfreed.pac_id_resolver.cit_common import ( _add_msg_to_cit_entry_model, 
                                                  _validate_service_name, 
                                                  _validate_application_intent, 
@@ -33,7 +34,7 @@ class CITEntry_v2(LabFREED_BaseModel):
     @model_validator(mode='after')
     def _validate_service_name(self):
         # service_name
-        if not_allowed_chars := set(re.sub(r'[A-Za-z0-9\-\x20]', '', self.service_name)):
+        if not_allowed_chars := service_name_chars.invalid_chars(self.service_name):
             self._add_validation_message(
                 level=ValidationMsgLevel.ERROR,
                 source=f'Service {self.service_name}',
@@ -61,7 +62,7 @@ class CITEntry_v2(LabFREED_BaseModel):
                 highlight_sub=[intent]
                 )
 
-            if not_allowed_chars := set(re.sub(r'[A-Za-z0-9\-]', '', intent)):
+            if not_allowed_chars := application_intent_chars.invalid_chars(intent):
                 self._add_validation_message(
                     level=ValidationMsgLevel.ERROR,
                     source=f'Application intent {self.service_name}',
@@ -7,8 +7,6 @@ import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
-from rich import print
-from rich.table import Table
 
 from labfreed.labfreed_infrastructure import LabFREED_BaseModel
 
@@ -63,16 +61,9 @@ class ServiceGroup(LabFREED_BaseModel):
         return '\n'.join(out)
     
     def print(self):
-        table = Table(title=f"Services from origin '{self.origin}")
-
-        table.add_column("Service Name")
-        table.add_column("URL")
-        table.add_column('Reachable')
-        
-        for s in self.services:
-            table.add_row(s.service_name, s.url, s.status.name)
-
-        print(table)
+        '''Prints the services as table on the console (requires rich)'''
+        from labfreed.console_rendering import print_service_group
+        print_service_group(self)
         
         
 def _has_internet_connection():
@@ -12,5 +12,14 @@ __all__ = [
     "ErrorSegment",
     "TableSegment",
     "ColumnHeader",
-    "TableRow"
+    "TableRow",
+    "ColumnarTableSegment"
 ]
+
+
+def __getattr__(name):
+    # ColumnarTableSegment needs numpy, which is therefore only imported when the columnar table is used
+    if name == 'ColumnarTableSegment':
+        from .columnar_table import ColumnarTableSegment
+        return ColumnarTableSegment
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,459 @@
+'''
+Columnar representation of TREX tables.
+
+A TableSegment holds a pydantic model for every cell. A ColumnarTableSegment holds one TableColumn per column instead.
+The TREX text of all cells of a column is packed in one str and the values are converted to one typed numpy array:
+
+| Column type         | Values                                                                  |
+|---------------------|-------------------------------------------------------------------------|
+| UNECE unit          | int64 if all values are integers, float64 otherwise                     |
+| T.D                 | datetime64 (datetime64[D] for dates), timedelta64[ms] for times of day  |
+|                     | object array of datetime, date and time, if times of day and dates mix  |
+| T.B                 | bool                                                                    |
+| T.A, T.T, T.X, E    | PackedStrings with the TREX text                                        |
+
+Validation checks a column with one regular expression over the packed text. Only the cells of columns which do not
+pass this check are validated one by one (in order to report them).
+'''
+
+from datetime import date, datetime, time
+import re
+from typing import Iterator, Self
+
+import numpy as np
+from pydantic import PrivateAttr, model_validator
+
+from labfreed.labfreed_infrastructure import ValidationMsgLevel
+from labfreed.trex.table_segment import ColumnHeader, TableRow, TableSegment, _cell_patterns, _deserialize_table_segment_from_trex_segment_str, _split_table_segment_str, _str_to_value_type
+from labfreed.trex.trex_base_models import TREX_Segment, Value, _date_time_dict_from_str
+from labfreed.trex.trex_writer import _join_numbers, write_table
+
+
+_no_offsets = np.zeros(1, dtype=np.int64)
+_no_offsets.flags.writeable = False
+
+
+class PackedStrings():
+    '''Sequence of strings, which are stored in one str, separated by ":".
+    Used for the TREX text of table columns. The values must not contain ":".
+    '''
+    __slots__ = ('buffer', 'offsets')
+
+    def __init__(self, buffer:str, offsets:np.ndarray):
+        '''@private Use from_list or from_joined'''
+        self.buffer = buffer
+        '''the values joined with ":"'''
+        self.offsets = offsets
+        '''start of each value in buffer and, as last element, len(buffer) + 1'''
+
+    @classmethod
+    def from_list(cls, values:list[str]) -> Self:
+        return cls.from_joined(':'.join(values), count=len(values))
+
+    @classmethod
+    def from_joined(cls, buffer:str, count:int|None=None) -> Self:
+        '''From values joined with ":". Since "" can be no value or one empty value, count is needed in that case.'''
+        if count == 0 or (count is None and not buffer):
+            return cls('', _no_offsets)
+        lengths = np.fromiter(map(len, buffer.split(':')), dtype=np.int64)
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths + 1, out=offsets[1:])
+        offsets.flags.writeable = False
+        return cls(buffer, offsets)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i:int) -> str:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('index out of range')
+        return self.buffer[self.offsets[i]:self.offsets[i + 1] - 1]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tolist())
+
+    def tolist(self) -> list[str]:
+        if not len(self):
+            return []
+        return self.buffer.split(':')
+
+    def __eq__(self, other):
+        if isinstance(other, PackedStrings):
+            return len(self) == len(other) and self.buffer == other.buffer
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f'PackedStrings({self.tolist()!r})'
+
+
+
+def _column_kind(type_:str) -> str:
+    '''@private'''
+    match type_:
+        case 'T.D' | 'T.B':
+            return type_
+        case 'T.A' | 'T.T' | 'T.X' | 'E':
+            return 'text'
+        case _:
+            return 'number'
+
+
+def _column_pattern(value_pattern:str):
+    '''@private pattern of a column text, i.e. values separated by ":"'''
+    return re.compile(f'(?:{value_pattern})(?::(?:{value_pattern}))*').fullmatch
+
+_column_matchers = {k: _column_pattern(p) for k, p in _cell_patterns.items()}
+
+def _column_matcher(type_:str):
+    '''@private'''
+    return _column_matchers.get(type_) or _column_matchers['number']
+
+
+_number_cell = re.compile(_cell_patterns['number']).fullmatch
+_more_than_int64_digits = re.compile(r'\d{19}', re.ASCII)
+_time_parts = re.compile(r'T(\d\d)(\d\d)(\d\d)?(?:\.(\d{3}))?', re.ASCII)
+_iso_date = (re.compile(r'(\d{4})(\d{2})(\d{2})', re.ASCII), r'\1-\2-\3')
+_iso_hour_minute = (re.compile(r'T(\d{2})(\d{2})', re.ASCII), r'T\1:\2')
+_iso_second = (re.compile(r'(T\d{2}:\d{2})(\d{2})', re.ASCII), r'\1:\2')
+
+
+def _numbers_from_text(text:PackedStrings, valid:bool) -> np.ndarray|None:
+    '''@private None if valid, but a value can not be converted'''
+    b = text.buffer
+    if valid:
+        is_int = '.' not in b and 'E' not in b and not _more_than_int64_digits.search(b)
+        try:
+            return np.fromiter(map(int if is_int else float, b.split(':')), dtype=np.int64 if is_int else np.float64, count=len(text))
+        except ValueError:
+            return None
+    # one by one. Invalid values are NaN
+    out = np.full(len(text), np.nan)
+    for i, v in enumerate(text):
+        if _number_cell(v):
+            out[i] = float(v)
+    return out
+
+
+def _bools_from_text(text:PackedStrings, valid:bool) -> np.ndarray:
+    '''@private'''
+    if valid:
+        return np.frombuffer(text.buffer.replace(':', '').encode('ascii'), dtype=np.uint8) == ord('T')
+    return np.array([v == 'T' for v in text], dtype=bool)
+
+
+def _dates_from_text(text:PackedStrings, valid:bool) -> np.ndarray|None:
+    '''@private Times of day (all values start with T) give timedelta64[ms], dates datetime64.
+    If times of day and dates are mixed, an object array of python values is returned.
+    None if valid, but numpy cannot convert the values in bulk.'''
+    values = text.tolist()
+    n_times = sum(v[:1] == 'T' for v in values)
+    if 0 < n_times < len(values):
+        out = _python_dates_from_text(values)
+        return None if valid and any(v is None for v in out) else out
+    is_time = bool(values) and n_times == len(values)
+    if valid and is_time:
+        parts = np.array(_time_parts.findall(text.buffer), dtype=str).reshape(-1, 4)
+        h, m, s, ms = np.where(parts == '', '0', parts).astype(np.int64).T
+        if len(h) == len(values) and (h < 24).all() and (m < 60).all() and (s < 60).all():
+            return (((h * 60 + m) * 60 + s) * 1000 + ms).astype('timedelta64[ms]')
+        return None
+    if valid:
+        iso = text.buffer.replace(':', ' ')
+        for pattern, replacement in (_iso_date, _iso_hour_minute, _iso_second):
+            iso = pattern.sub(replacement, iso)
+        try:
+            out = np.array(iso.split(' ') if values else [], dtype='datetime64[ms]')
+        except ValueError:
+            return None
+        return out if 'T' in text.buffer else out.astype('datetime64[D]')
+    # one by one. Invalid values are NaT
+    nat = np.timedelta64('NaT', 'ms') if is_time else np.datetime64('NaT', 'ms')
+    out = np.full(len(values), nat)
+    for i, v in enumerate(values):
+        d = _date_time_dict_from_str(v)
+        if d is None:
+            continue
+        try:
+            if is_time:
+                t = time(**d)
+                out[i] = np.timedelta64(((t.hour * 60 + t.minute) * 60 + t.second) * 1000 + t.microsecond // 1000, 'ms')
+            elif d.get('year'):
+                out[i] = np.datetime64(datetime(**d), 'ms')
+        except (TypeError, ValueError):
+            pass
+    return out
+
+
+def _python_dates_from_text(values:list[str]) -> np.ndarray:
+    '''@private datetime, date or time for each value, like pyTREX. Invalid values are None'''
+    out = np.empty(len(values), dtype=object)
+    for i, v in enumerate(values):
+        d = _date_time_dict_from_str(v)
+        if d is None:
+            continue
+        try:
+            if d.get('year') and 'hour' in d:
+                out[i] = datetime(**d)
+            elif d.get('year'):
+                out[i] = date(**d)
+            else:
+                out[i] = time(**d)
+        except (TypeError, ValueError):
+            pass
+    return out
+
+
+def _text_from_numbers(values:np.ndarray) -> str:
+    '''@private'''
+    return _join_numbers(values.tolist())
+
+
+def _text_from_dates(values:np.ndarray) -> str:
+    '''@private dates as YYYYMMDD, times with the shortest of THHMM, THHMMSS, THHMMSS.SSS which represents all values'''
+    if values.dtype.kind == 'm':
+        ms = values.astype('timedelta64[ms]').astype(np.int64).tolist()
+        if all(t % 60_000 == 0 for t in ms):
+            return ':'.join(f'T{t // 3_600_000:02d}{t // 60_000 % 60:02d}' for t in ms)
+        if all(t % 1000 == 0 for t in ms):
+            return ':'.join(f'T{t // 3_600_000:02d}{t // 60_000 % 60:02d}{t // 1000 % 60:02d}' for t in ms)
+        return ':'.join(f'T{t // 3_600_000:02d}{t // 60_000 % 60:02d}{t // 1000 % 60:02d}.{t % 1000:03d}' for t in ms)
+
+    unit, _ = np.datetime_data(values.dtype)
+    if unit in ('Y', 'M', 'W', 'D'):
+        unit = 'D'
+    else:
+        ms = values.astype('datetime64[ms]').astype(np.int64)
+        unit = 'm' if (ms % 60_000 == 0).all() else 's' if (ms % 1000 == 0).all() else 'ms'
+    iso = ' '.join(np.datetime_as_string(values, unit=unit).tolist())
+    return iso.replace('-', '').replace(':', '').replace(' ', ':')
+
+
+
+class TableColumn():
+    '''@private One column of a ColumnarTableSegment: The TREX text of the cells and the values as typed array'''
+    __slots__ = ('type', 'text', '_values', '_matches')
+
+    def __init__(self, type:str, text:PackedStrings, values:np.ndarray|None=None):
+        self.type = type
+        self.text = text
+        self._values = values
+        self._matches = None
+
+    @classmethod
+    def from_values(cls, type:str, values) -> Self:
+        '''Column from python or numpy values. The TREX text is formatted from the values.'''
+        match _column_kind(type):
+            case 'number':
+                arr = np.array(values)
+                if arr.dtype.kind not in 'iuf':
+                    raise ValueError(f'Values of column with type {type} must be numeric')
+                text = _text_from_numbers(arr)
+            case 'T.B':
+                arr = np.array(values, dtype=bool)
+                text = ':'.join(np.where(arr, 'T', 'F').tolist())
+            case 'T.D':
+                arr = values.copy() if isinstance(values, np.ndarray) else np.array(values, dtype='datetime64')
+                if arr.dtype.kind not in 'Mm':
+                    raise ValueError(f'Values of column with type {type} must be datetime64 or timedelta64')
+                text = _text_from_dates(arr)
+            case 'text':
+                return cls(type, values if isinstance(values, PackedStrings) else PackedStrings.from_list(list(values)))
+        arr.flags.writeable = False
+        return cls(type, PackedStrings.from_joined(text, count=len(arr)), arr)
+
+    def __len__(self):
+        return len(self.text)
+
+    @property
+    def matches_type(self) -> bool:
+        '''True if all cells are valid for the column type (checked with one regular expression)'''
+        if self._matches is None:
+            self._matches = not len(self.text) or _column_matcher(self.type)(self.text.buffer) is not None
+        return self._matches
+
+    @property
+    def values(self) -> np.ndarray|PackedStrings:
+        '''The values as read only array (PackedStrings for text columns)'''
+        if self._values is None:
+            valid = self.matches_type
+            match _column_kind(self.type):
+                case 'number':
+                    values = _numbers_from_text(self.text, valid)
+                    if values is None:
+                        self._matches = False
+                        values = _numbers_from_text(self.text, False)
+                case 'T.B':
+                    values = _bools_from_text(self.text, valid)
+                case 'T.D':
+                    values = _dates_from_text(self.text, valid)
+                    if values is None:
+                        self._matches = False  # e.g. 20250230. Validate cell by cell
+                        values = _dates_from_text(self.text, False)
+                case 'text':
+                    self._values = self.text
+                    return self.text
+            values.flags.writeable = False
+            self._values = values
+        return self._values
+
+    def invalid_cells(self) -> list[tuple[int, Value]]:
+        '''The indices and validated Value models of the invalid cells'''
+        if _column_kind(self.type) == 'T.D':
+            self.values  # dates can fail the conversion, even though the text matches
+        if self.matches_type:
+            return []
+        cells = ((i, _str_to_value_type(self.type, v)) for i, v in enumerate(self.text))
+        return [(i, cell) for i, cell in cells if cell.errors()]
+
+    def __eq__(self, other):
+        if not isinstance(other, TableColumn):
+            return NotImplemented
+        return self.type == other.type and self.text == other.text
+
+    def __repr__(self):
+        return f'TableColumn({self.type!r}, {self.text!r})'
+
+
+
+class ColumnarTableSegment(TREX_Segment):
+    '''TREX Segment which represents tabular data column by column, with the values of a column in one numpy array.
+    Use this instead of TableSegment for large tables. Create it with from_columns or from_table_segment.
+    '''
+    key:str
+    column_headers: list[ColumnHeader]
+    _columns: list[TableColumn] = PrivateAttr(default_factory=list)
+
+    @classmethod
+    def from_columns(cls, key:str, column_headers:list[ColumnHeader], columns:list, validate=True) -> Self:
+        '''Creates a table from the values of each column.
+
+        Args:
+            key (str): key of the segment
+            column_headers (list[ColumnHeader]): the headers
+            columns (list): one numpy array or sequence of values per column. Numbers for columns with UNECE unit,
+                            datetime64 or timedelta64 (time of day) for T.D, bool for T.B and str for the others.
+            validate (bool, optional): With validate=False the validation is deferred until validation results are requested.
+        '''
+        return cls._from_table_columns(key, column_headers,
+                                       [TableColumn.from_values(h.type, c) for h, c in zip(column_headers, columns, strict=True)],
+                                       validate=validate)
+
+    @classmethod
+    def from_table_segment(cls, table:TableSegment, validate=True) -> Self:
+        '''Creates a columnar table with the same content as table. All rows must have the same length.'''
+        if any(len(row) != len(table.column_headers) for row in table.data):
+            raise ValueError(f'Table {table.key} has rows of different length. Use TableSegment for it')
+        texts = [PackedStrings.from_list([row.root[i].value for row in table.data]) for i in range(len(table.column_headers))]
+        headers = [ColumnHeader._construct_trusted(key=h.key, type=h.type) for h in table.column_headers]
+        return cls._from_table_columns(table.key, headers, [TableColumn(h.type, t) for h, t in zip(headers, texts)], validate=validate)
+
+    @classmethod
+    def _from_table_columns(cls, key:str, column_headers:list[ColumnHeader], columns:list[TableColumn], validate=True) -> Self:
+        '''@private'''
+        if len(column_headers) != len(columns):
+            raise ValueError(f'Table {key} has {len(column_headers)} column headers, but {len(columns)} columns')
+        if len({len(c) for c in columns}) > 1:
+            raise ValueError(f'Columns of table {key} differ in length')
+        t = cls._construct_trusted(key=key, column_headers=column_headers)
+        t._columns = columns
+        if validate:
+            t.validate()
+        return t
+
+    def to_table_segment(self, validate=True) -> TableSegment:
+        '''Converts to TableSegment, i.e. creates a model for each cell'''
+        rows = [TableRow.model_construct([_str_to_value_type(c.type, v, validate=validate) for c, v in zip(self._columns, r)])
+                for r in zip(*[c.text.tolist() for c in self._columns])]
+        headers = [ColumnHeader._construct_trusted(key=h.key, type=h.type) for h in self.column_headers]
+        if not validate:
+            return TableSegment._construct_trusted(key=self.key, column_headers=headers, data=rows)
+        return TableSegment(key=self.key, column_headers=headers, data=rows)
+
+    @property
+    def column_names(self):
+        return [h.key for h in self.column_headers]
+
+    @property
+    def column_types(self):
+        return [h.type for h in self.column_headers]
+
+    @model_validator(mode='after')
+    def _validate_columns(self):
+        for c in self._columns:
+            for i, cell in c.invalid_cells():
+                for m in cell.errors():
+                    self._add_validation_message(
+                        source=f"Table {self.key}",
+                        level= ValidationMsgLevel.ERROR,
+                        msg=m.msg,
+                        highlight_pattern = self._row_text(i),
+                        highlight_sub=[ch for ch in cell.value]
+                    )
+        return self
+
+    def _get_col_index(self, col:str|int):
+        if isinstance(col, str):
+            col_index = self.column_names.index(col)
+        elif isinstance(col, int):
+            col_index = col
+        else:
+            raise TypeError(f"Column must be specified as string or int: {col.__name__}")
+        return col_index
+
+    def _row_text(self, row:int) -> str:
+        return ':'.join(c.text[row] for c in self._columns)
+
+    def serialize(self):
+        header = ':'.join([f'{h.key}${h.type}' for h in self.column_headers])
+        data = '::'.join(map(':'.join, zip(*[c.text.tolist() for c in self._columns])))
+        return f'{self.key}$${header}::{data}'
+
+    def serialize_to(self, sink):
+        '''Writes the serialized table to sink (text stream, binary stream or bytearray) in chunks of rows'''
+        write_table(sink, self.key, self.column_names, self.column_types, [c.text for c in self._columns])
+
+    def n_rows(self) -> int:
+        return len(self._columns[0]) if self._columns else 0
+
+    def n_cols(self) -> int:
+        return len(self.column_headers)
+
+    def row_data(self, row:int) -> list:
+        '''The values of a row'''
+        return [c.values[row] for c in self._columns]
+
+    def column_data(self, col:str|int) -> np.ndarray|PackedStrings:
+        '''The values of a column as read only array (not a copy). Text columns are PackedStrings.'''
+        return self._columns[self._get_col_index(col)].values
+
+    def column_text(self, col:str|int) -> PackedStrings:
+        '''The TREX text of the cells of a column'''
+        return self._columns[self._get_col_index(col)].text
+
+    def cell_data(self, row:int, col:str|int):
+        return self._columns[self._get_col_index(col)].values[row]
+
+
+
+
+def _deserialize_columnar_table_segment_from_trex_segment_str(trex_segment_str, validate=True) -> ColumnarTableSegment|TableSegment|None:
+    '''@private Like _deserialize_table_segment_from_trex_segment_str, but without a model per cell.
+    The body is split once and each column is checked and converted as a whole.
+    Tables with rows of different length can only be represented by TableSegment and are returned as such.
+    '''
+    parts = _split_table_segment_str(trex_segment_str, validate=validate)
+    if not parts:
+        return None
+    name, headers, body = parts
+
+    n_cols = len(headers)
+    rows = body.split('::')
+    if any(r.count(':') != n_cols - 1 for r in rows):
+        return _deserialize_table_segment_from_trex_segment_str(trex_segment_str, validate=validate)
+    cells = ':'.join(rows).split(':') if n_cols > 1 else rows
+    columns = [TableColumn(h.type, PackedStrings.from_list(cells[i::n_cols])) for i, h in enumerate(headers)]
+    return ColumnarTableSegment._from_table_columns(name, headers, columns, validate=validate)
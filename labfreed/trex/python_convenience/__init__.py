@@ -1,3 +1,4 @@
 from .pyTREX import pyTREX  # noqa: F401
 from .data_table import DataTable  # noqa: F401
 from .quantity import Quantity  # noqa: F401
+from .table_builder import TableBuilder  # noqa: F401
@@ -1,18 +1,19 @@
 
 from datetime import date, datetime, time
 import logging
-import re
 from typing import Self
 
 from pydantic import RootModel
-from labfreed.well_known_keys.unece.unece_units import unece_unit
+from labfreed.well_known_keys.unece.unece_units import unece_unit_index
 from labfreed.trex.python_convenience.data_table import DataTable
 from labfreed.utilities.base36 import from_base36, base36, to_base36
+from labfreed.utilities.char_class import alphanumeric_chars
 
 from labfreed.trex.python_convenience.quantity import Quantity, unece_unit_code_from_quantity
 from labfreed.trex.table_segment import ColumnHeader, TableSegment
 from labfreed.trex.trex import TREX
-from labfreed.trex.trex_base_models import AlphanumericValue, BinaryValue, BoolValue, DateValue, ErrorValue, NumericValue, TextValue
+from labfreed.trex.trex_writer import _join_numbers, _writer_for, write_table
+from labfreed.trex.trex_base_models import TREX_Segment, AlphanumericValue, BinaryValue, BoolValue, DateValue, ErrorValue, NumericValue, TextValue
 from labfreed.trex.value_segments import BoolSegment, ErrorSegment, TextSegment, NumericSegment, AlphanumericSegment, DateSegment, ValueSegment
 
 
@@ -30,84 +31,32 @@ class pyTREX(RootModel[dict[str, Quantity | datetime | time | date | bool | str
         return {seg.key: _trex_segment_to_python_type(seg) for seg in trex.segments}
              
              
-    def to_trex(self) -> TREX:
-        '''Creates a TREX'''
+    def to_trex(self, columnar_tables=False) -> TREX:
+        '''Creates a TREX. With columnar_tables=True DataTables become ColumnarTableSegments, without a model per cell.'''
         segments = list()
         for k, v in self.root.items():
-            if v is None:
-                value = _error_value_from_python_type(v)
-                segments.append(ErrorSegment(key=k, value=value.value))
-            elif isinstance(v, bool):
-                value = _bool_value_from_python_type(v)
-                segments.append(BoolSegment(key=k, value=value.value))
-            elif isinstance(v, Quantity):
-                unece_code = unece_unit_code_from_quantity(v)
-                value = _numeric_value_from_python_type(v.value)
-                segments.append(NumericSegment(key=k, value=value.value, type=unece_code))
-            elif isinstance(v, (int, float)):
-                value = _numeric_value_from_python_type(v)
-                segments.append(NumericSegment(key=k, value=value.value, type='C63'))  # unitless
-            elif isinstance(v, (datetime, time, date)):
-                value = _date_value_from_python_type(v)
-                segments.append(DateSegment(key=k, value=value.value))
-            elif isinstance(v, str):
-                if re.fullmatch(r'[A-Z0-9\-\.]*', v):
-                    value = _alphanumeric_value_from_python_type(v)
-                    segments.append(AlphanumericSegment(key=k, value=value.value))
-                else:
-                    v = to_base36(v)
-                    value = _text_value_from_python_type(v)
-                    segments.append(TextSegment(key=k, value=value.value))
-            elif isinstance(v, base36):
-                value = _text_value_from_python_type(v)
-                segments.append(TextSegment(key=k, value=value.value))
-                
-            elif isinstance(v, DataTable):
-                v:DataTable = v
-                headers = list()
-                for nm, rt in zip(v.col_names, v.row_template):
-                    if isinstance(rt, bool): # must come first otherwise int matches the bool
-                        t = 'T.B'
-                    elif isinstance(rt, Quantity):
-                        unece_code = unece_unit_code_from_quantity(rt)
-                        t = unece_code
-                    elif isinstance(rt, (datetime, time, date)):
-                        t = 'T.D'     
-                    elif isinstance(rt, str):
-                        if re.fullmatch(r'[A-Z0-9\-\.]*', rt):
-                            t = 'T.A'
-                        else:
-                            t = 'T.T'
-                    elif isinstance(rt, base36):
-                        t = 'T.T'
-                    
-                    headers.append(ColumnHeader(key=nm, type=t))
-                data = []
-                for row in v.data:
-                    r = []
-                    for e in row:
-                        if e is None:
-                            r.append(_error_value_from_python_type(e))
-                        elif isinstance(e, bool): # must come first otherwise int matches the bool
-                            r.append(_bool_value_from_python_type(e))
-                        elif isinstance(e, Quantity):
-                            r.append(_numeric_value_from_python_type(e.value))
-                        elif isinstance(e, (int, float)):
-                            r.append(_numeric_value_from_python_type(e))
-                        elif isinstance(e, (datetime, time, date)):
-                            r.append(_date_value_from_python_type(e))
-                        elif isinstance(e, str):
-                            if re.fullmatch(r'[A-Z0-9\-\.]*', e):
-                                r.append(_alphanumeric_value_from_python_type(e))
-                            else:
-                                e = to_base36(e)
-                                r.append(_text_value_from_python_type(e))
-                        elif isinstance(e, base36):
-                            r.append(_text_value_from_python_type(e))
-                    data.append(r)
-                segments.append(TableSegment(key=k, column_headers=headers, data=data))
+            if isinstance(v, DataTable) and columnar_tables:
+                segments.append(_columnar_table_from_data_table(k, v))
+            else:
+                segments.append(_trex_segment_from_python_type(k, v))
         return TREX(segments=segments)
     
+    
+    def serialize_to(self, sink):
+        '''Writes the TREX string to sink (text stream like io.StringIO, binary stream or bytearray).
+        The rows of DataTables are written straight from the python values, without creating models for the cells.
+        Therefore the table cells are not validated. Use to_trex() to validate.
+        '''
+        write = _writer_for(sink)
+        for i, (k, v) in enumerate(self.root.items()):
+            if i:
+                write('+')
+            if isinstance(v, DataTable):
+                column_types, column_texts = _column_texts_from_data_table(v)
+                write_table(write, k, v.col_names, column_types, column_texts)
+            else:
+                write(_trex_segment_from_python_type(k, v).serialize())
+    
     # make the usual dict methods available, for convenience
     def __getitem__(self, key): return self.root[key]
     def __setitem__(self, key, value): self.root[key] = value
@@ -124,11 +73,125 @@ class pyTREX(RootModel[dict[str, Quantity | datetime | time | date | bool | str
   
 # Helper functions to convert python types to TREX types    
 
+def _trex_segment_from_python_type(k:str, v) -> TREX_Segment:
+    if v is None:
+        value = _error_value_from_python_type(v)
+        return ErrorSegment(key=k, value=value.value)
+    elif isinstance(v, bool):
+        value = _bool_value_from_python_type(v)
+        return BoolSegment(key=k, value=value.value)
+    elif isinstance(v, Quantity):
+        unece_code = unece_unit_code_from_quantity(v)
+        value = _numeric_value_from_python_type(v.value)
+        return NumericSegment(key=k, value=value.value, type=unece_code)
+    elif isinstance(v, (int, float)):
+        value = _numeric_value_from_python_type(v)
+        return NumericSegment(key=k, value=value.value, type='C63')  # unitless
+    elif isinstance(v, (datetime, time, date)):
+        value = _date_value_from_python_type(v)
+        return DateSegment(key=k, value=value.value)
+    elif isinstance(v, str):
+        if alphanumeric_chars.is_valid(v):
+            value = _alphanumeric_value_from_python_type(v)
+            return AlphanumericSegment(key=k, value=value.value)
+        else:
+            v = to_base36(v)
+            value = _text_value_from_python_type(v)
+            return TextSegment(key=k, value=value.value)
+    elif isinstance(v, base36):
+        value = _text_value_from_python_type(v)
+        return TextSegment(key=k, value=value.value)
+        
+    elif isinstance(v, DataTable):
+        v:DataTable = v
+        headers = [ColumnHeader(key=nm, type=_column_type_from_python_type(rt)) for nm, rt in zip(v.col_names, v.row_template)]
+        data = []
+        for row in v.data:
+            r = []
+            for e in row:
+                if e is None:
+                    r.append(_error_value_from_python_type(e))
+                elif isinstance(e, bool): # must come first otherwise int matches the bool
+                    r.append(_bool_value_from_python_type(e))
+                elif isinstance(e, Quantity):
+                    r.append(_numeric_value_from_python_type(e.value))
+                elif isinstance(e, (int, float)):
+                    r.append(_numeric_value_from_python_type(e))
+                elif isinstance(e, (datetime, time, date)):
+                    r.append(_date_value_from_python_type(e))
+                elif isinstance(e, str):
+                    if alphanumeric_chars.is_valid(e):
+                        r.append(_alphanumeric_value_from_python_type(e))
+                    else:
+                        e = to_base36(e)
+                        r.append(_text_value_from_python_type(e))
+                elif isinstance(e, base36):
+                    r.append(_text_value_from_python_type(e))
+            data.append(r)
+        return TableSegment(key=k, column_headers=headers, data=data)
+
+
+def _column_type_from_python_type(rt) -> str:
+    '''TREX type of a table column, derived from the value in the row template'''
+    if isinstance(rt, bool): # must come first otherwise int matches the bool
+        return 'T.B'
+    elif isinstance(rt, Quantity):
+        return unece_unit_code_from_quantity(rt)
+    elif isinstance(rt, (int, float)):
+        return 'C63'  # unitless
+    elif isinstance(rt, (datetime, time, date)):
+        return 'T.D'     
+    elif isinstance(rt, str):
+        if alphanumeric_chars.is_valid(rt):
+            return 'T.A'
+        else:
+            return 'T.T'
+    elif isinstance(rt, base36):
+        return 'T.T'
+    raise TypeError(f'Invalid type {type(rt)} of table value')
+
+
+def _column_texts_from_data_table(table:DataTable) -> tuple[list[str], list[list[str]]]:
+    '''The TREX types and the TREX text of the cells of each column. No models are created.'''
+    column_types = [_column_type_from_python_type(rt) for rt in table.row_template]
+    column_texts = []
+    for i, t in enumerate(column_types):
+        col = [row[i] for row in table.data]
+        match t:
+            case 'T.B':
+                texts = ['-' if e is None else 'T' if e else 'F' for e in col]
+            case 'T.D':
+                texts = ['-' if e is None else _date_str_from_python_type(e) for e in col]
+            case 'T.A' | 'T.T':
+                texts = ['-' if e is None 
+                         else e.root if isinstance(e, base36) 
+                         else e if alphanumeric_chars.is_valid(e) 
+                         else to_base36(e).root 
+                         for e in col]
+            case _:
+                texts = _join_numbers('-' if e is None else e.value if isinstance(e, Quantity) else e for e in col).split(':') if col else []
+        column_texts.append(texts)
+    return column_types, column_texts
+
+
+def _columnar_table_from_data_table(k:str, table:DataTable):
+    '''ColumnarTableSegment from a DataTable. Imported here, since it needs numpy'''
+    from labfreed.trex.columnar_table import ColumnarTableSegment, PackedStrings, TableColumn
+    column_types, column_texts = _column_texts_from_data_table(table)
+    headers = [ColumnHeader(key=nm, type=t) for nm, t in zip(table.col_names, column_types)]
+    columns = [TableColumn(t, PackedStrings.from_list(texts)) for t, texts in zip(column_types, column_texts)]
+    return ColumnarTableSegment._from_table_columns(k, headers, columns)
+
+
 def _numeric_value_from_python_type(v:int|float):
-    return NumericValue(value = str(v))
+    return NumericValue(value = _join_numbers((v,)))
 
 
 def _date_value_from_python_type(v:date|time|datetime):    
+    return DateValue(value = _date_str_from_python_type(v))
+
+
+def _date_str_from_python_type(v:date|time|datetime) -> str:
     sd = ""
     st = ""
     if isinstance(v, date) or isinstance(v, datetime):
@@ -141,7 +204,7 @@ def _date_value_from_python_type(v:date|time|datetime):
         else:
             st = v.strftime("T%H%M")
                         
-    return DateValue(value = sd + st)
+    return sd + st
     
     
 def _bool_value_from_python_type(v:bool):
@@ -181,7 +244,7 @@ def _trex_segment_to_python_type(v):
     '''Converts a TREX segment to a python value. Note the segment key must be handles outside.'''
     if isinstance(v, NumericSegment):
         num_val = _trex_value_to_python_type(v)
-        u = unece_unit(v.type)
+        u = unece_unit_index().by_code.get(v.type)
         unit = u.get('symbol')
         return Quantity(value=num_val, unit=unit)
     
@@ -195,13 +258,16 @@ def _trex_segment_to_python_type(v):
             r = []
             for e, h in zip(row, v.column_headers):
                 if isinstance(e, NumericValue):
-                    u = unece_unit(h.type)
+                    u = unece_unit_index().by_code.get(h.type)
                     unit = u.get('symbol')
                     r.append(Quantity(value=e.value, unit=unit))
                 else:
                     r.append(_trex_value_to_python_type(e))
             table.append(r)
         return table
+    
+    elif hasattr(v, 'to_table_segment'): # ColumnarTableSegment. Not imported here, since it needs numpy
+        return _trex_segment_to_python_type(v.to_table_segment(validate=False))
         
 
 
@@ -214,7 +280,7 @@ def _trex_value_to_python_type(v):
             return float(v.value)  
         
     elif isinstance(v,DateValue):
-        d = v._date_time_dict
+        d = v.date_time_dict
         if d.get('year') and d.get('hour'): # input is only a time
             return datetime(**d)
         elif d.get('year'):
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, model_validator
-from labfreed.well_known_keys.unece.unece_units import unece_units
+from labfreed.well_known_keys.unece.unece_units import unece_unit_index
 
 
 class Quantity(BaseModel):
@@ -55,10 +55,7 @@ class Quantity(BaseModel):
 def unece_unit_code_from_quantity(q:Quantity):
         if not q.unit:
             return 'C62' # dimensionless
-        by_name =   [ u['commonCode'] for u in unece_units() if u.get('name','') == q.unit] 
-        by_symbol = [ u['commonCode'] for u in unece_units() if u.get('symbol','') == q.unit]
-        by_code = [ u['commonCode'] for u in unece_units() if u.get('commonCode','') == q.unit]
-        code = list(set(by_name) | set(by_symbol) | set(by_code))
+        code = list(unece_unit_index().codes_for(q.unit))
         if len(code) != 1:
             raise ValueError(f'No UNECE unit code found for Quantity {q}' ) 
         return code[0]
@@ -0,0 +1,147 @@
+from datetime import date, datetime, time
+import re
+from typing import Iterable
+
+from labfreed.labfreed_infrastructure import LabFREED_ValidationError
+from labfreed.utilities.base36 import base36, to_base36
+from labfreed.utilities.char_class import alphanumeric_chars
+from labfreed.trex.python_convenience.pyTREX import _column_type_from_python_type, _date_str_from_python_type
+from labfreed.trex.python_convenience.quantity import Quantity, unece_unit_code_from_quantity
+from labfreed.trex.table_segment import ColumnHeader, _cell_patterns
+from labfreed.trex.trex import TREX
+from labfreed.trex.trex_writer import _join_numbers, _writer_for
+
+
+class _ColumnSchema():
+    '''@private Converts and checks the python values of one column'''
+    __slots__ = ('name', 'type', '_fullmatch', '_unit_ok')
+
+    def __init__(self, name:str, type:str):
+        self.name = name
+        self.type = type
+        self._fullmatch = re.compile(_cell_patterns.get(type, _cell_patterns['number'])).fullmatch
+        self._unit_ok = dict()  # unit of a Quantity > True if it corresponds to the column type
+
+    def to_text(self, v) -> str:
+        '''The TREX text of v. Raises ValueError if v does not fit the column'''
+        match self.type:
+            case 'T.B':
+                ok = isinstance(v, bool)
+                text = 'T' if v else 'F'
+            case 'T.D':
+                ok = isinstance(v, (datetime, time, date))
+                text = _date_str_from_python_type(v) if ok else ''
+            case 'T.A':
+                ok = isinstance(v, str) and alphanumeric_chars.is_valid(v)
+                text = v
+            case 'T.T':
+                if isinstance(v, str) and v:
+                    v = to_base36(v)
+                ok = isinstance(v, base36)  # an empty str has no unambiguous encoding and is rejected
+                text = v.root if ok else ''
+            case 'T.X':
+                ok = isinstance(v, (str, base36))
+                text = v.root if isinstance(v, base36) else v
+            case 'E':
+                ok = isinstance(v, str)
+                text = v
+            case _:
+                if isinstance(v, Quantity):
+                    ok = self._unit_ok.get(v.unit)
+                    if ok is None:
+                        ok = self._unit_ok[v.unit] = _unit_code_or_none(v) == self.type
+                    v = v.value
+                else:
+                    ok = isinstance(v, (int, float)) and not isinstance(v, bool)
+                text = _join_numbers((v,)) if ok else ''
+        if not ok or not self._fullmatch(text):
+            raise ValueError(f'{v!r} is not a valid value of column {self.name} with type {self.type}')
+        return text
+
+
+def _unit_code_or_none(q:Quantity) -> str|None:
+    try:
+        return unece_unit_code_from_quantity(q)
+    except ValueError:
+        return None
+
+
+
+class TableBuilder():
+    '''Builds a TREX table row by row, e.g. for data which is streamed from an instrument.
+
+    Each row is checked against the column types and converted to TREX when it is appended.
+    Earlier rows are not touched again, so appending is O(1) and serialize() or to_trex() can be called at any time.
+    Invalid rows raise a ValueError and are not appended. None (missing values) are not allowed, since they give an invalid table.
+    Empty strings are not allowed in T.T columns, since they have no unambiguous encoding.
+    '''
+    def __init__(self, key:str, col_names:list[str], column_types:list[str]):
+        '''
+        Args:
+            key (str): key of the table segment
+            col_names (list[str]): names of the columns
+            column_types (list[str]): TREX types of the columns ('T.D', 'T.B', 'T.A', 'T.T', 'T.X', 'E' or a UNECE unit code)
+        '''
+        if len(col_names) != len(column_types):
+            raise ValueError('col_names and column_types must have the same length')
+        self._headers = [ColumnHeader(key=nm, type=t) for nm, t in zip(col_names, column_types)]
+        invalid = [m for h in self._headers for m in h.errors()]
+        if not alphanumeric_chars.is_valid(key):
+            raise ValueError(f'Invalid table key {key}')
+        if invalid:
+            raise LabFREED_ValidationError(message='Invalid column headers', validation_msgs=invalid)
+        self.key = key
+        self._columns = [_ColumnSchema(nm, t) for nm, t in zip(col_names, column_types)]
+        self._header_text = ':'.join(f'{nm}${t}' for nm, t in zip(col_names, column_types))
+        self._rows:list[str] = []
+
+    @classmethod
+    def from_row_template(cls, key:str, col_names:list[str], row_template:list) -> 'TableBuilder':
+        '''Builder with the column types derived from the values of row_template, like for DataTable. The row is not appended.'''
+        return cls(key, col_names, [_column_type_from_python_type(v) for v in row_template])
+
+    @property
+    def col_names(self) -> list[str]:
+        return [c.name for c in self._columns]
+
+    @property
+    def column_types(self) -> list[str]:
+        return [c.type for c in self._columns]
+
+    def __len__(self):
+        return len(self._rows)
+
+    def append(self, row:list):
+        '''Checks the row and appends its TREX text. Raises ValueError if the row is invalid.'''
+        if len(row) != len(self._columns):
+            raise ValueError(f'row has {len(row)} values, but the table has {len(self._columns)} columns')
+        self._rows.append(':'.join([c.to_text(v) for c, v in zip(self._columns, row)]))
+
+    def extend(self, rows:Iterable[list]):
+        '''Appends the rows. If a row is invalid, the rows before it are appended.'''
+        for row in rows:
+            self.append(row)
+
+    def serialize(self) -> str:
+        return f'{self.key}$${self._header_text}::' + '::'.join(self._rows)
+
+    def serialize_to(self, sink):
+        '''Writes the table segment to sink (text stream like io.StringIO, binary stream or bytearray)'''
+        write = _writer_for(sink)
+        write(f'{self.key}$${self._header_text}::')
+        write('::'.join(self._rows))
+
+    def to_table_segment(self):
+        '''Snapshot of the current rows as ColumnarTableSegment. The rows are not validated again.'''
+        from labfreed.trex.columnar_table import ColumnarTableSegment, PackedStrings, TableColumn
+        n_cols = len(self._columns)
+        cells = ':'.join(self._rows).split(':') if self._rows else []
+        columns = [TableColumn(c.type, PackedStrings.from_list(cells[i::n_cols])) for i, c in enumerate(self._columns)]
+        headers = [ColumnHeader._construct_trusted(key=h.key, type=h.type) for h in self._headers]
+        t = ColumnarTableSegment._from_table_columns(self.key, headers, columns, validate=False)
+        t._validation_skipped = False  # the rows were checked when appended, the headers on construction
+        return t
+
+    def to_trex(self) -> TREX:
+        '''Snapshot of the current rows as TREX with one table segment'''
+        return TREX(segments=[self.to_table_segment()])
@@ -6,9 +6,9 @@ import re
 
 from pydantic import RootModel, model_validator
 from labfreed.trex.trex_base_models import Value
-from labfreed.well_known_keys.unece.unece_units import unece_unit_codes
-from labfreed.labfreed_infrastructure import LabFREED_BaseModel, ValidationMsgLevel, _quote_texts
-from labfreed.trex.trex_base_models import AlphanumericValue, BinaryValue, BoolValue, DateValue, ErrorValue, NumericValue, TREX_Segment, TextValue
+from labfreed.labfreed_infrastructure import LabFREED_BaseModel, ValidationMsgLevel
+from labfreed.utilities.char_class import alphanumeric_chars
+from labfreed.trex.trex_base_models import AlphanumericValue, BinaryValue, BoolValue, DateValue, ErrorValue, NumericValue, TREX_Segment, TextValue, _is_valid_type
 
 
 class ColumnHeader(LabFREED_BaseModel):
@@ -18,11 +18,12 @@ class ColumnHeader(LabFREED_BaseModel):
                
     @model_validator(mode='after')     
     def _validate_key(self):
-        if not_allowed_chars := set(re.sub(r'[A-Z0-9\.-]', '', self.key)):
+        if not_allowed_chars := alphanumeric_chars.invalid_chars(self.key):
             self._add_validation_message(
                 source=f"TREX table column {self.key}",
                 level= ValidationMsgLevel.ERROR,
-                msg=f"Column header key contains invalid characters: {_quote_texts(not_allowed_chars)}",
+                msg="Column header key contains invalid characters: {0:quoted}",
+                msg_args=(not_allowed_chars,),
                 highlight_pattern = f'{self.key}$',
                 highlight_sub=not_allowed_chars
             )
@@ -30,8 +31,7 @@ class ColumnHeader(LabFREED_BaseModel):
     
     @model_validator(mode='after')
     def _validate_type(self):
-        valid_types = unece_unit_codes() + ['T.D', 'T.B', 'T.A', 'T.T', 'T.X', 'E']
-        if self.type not in valid_types:
+        if not _is_valid_type(self.type):
             self._add_validation_message(
                     source=f"TREX table column {self.key}",
                     level= ValidationMsgLevel.ERROR,
@@ -198,48 +198,74 @@ class TableSegment(TREX_Segment):
 
  
 
-def _deserialize_table_segment_from_trex_segment_str(trex_segment_str) -> TableSegment:
-    # re_table_pattern = re.compile(f"(?P<tablename>[\w\.-]*?)\$\$(?P<header>[\w\.,\$:]*?)::(?P<body>.*)")
-    # re_col_head_pattern = re.compile(f"(?P<name>[\w\.-]*?)\$(?P<unit>[\w\.]*)")
-    re_table_pattern = re.compile(r"(?P<tablename>.+?)\$\$(?P<header>.+?)::(?P<body>.+)")
-    
-    matches = re_table_pattern.match(trex_segment_str) 
+_table_pattern = re.compile(r"(?P<tablename>.+?)\$\$(?P<header>.+?)::(?P<body>.+)")
+
+def _split_table_segment_str(trex_segment_str, validate=True) -> tuple[str, list[ColumnHeader], str]|None:
+    '''@private name, column headers and body of a table segment. None if it is no table'''
+    matches = _table_pattern.match(trex_segment_str) 
     if not matches:
         return None
     name, header, body = matches.groups()
     
-    column_headers_str = header.split(':')
-    
+    make_header = ColumnHeader if validate else ColumnHeader._construct_trusted
     headers = []
-    for colum_header in column_headers_str:
+    for colum_header in header.split(':'):
          ch = colum_header.split('$')
          col_key = ch[0]
          col_type = ch[1] if len(ch) > 1 else ''
-         headers.append(ColumnHeader(key=col_key, type=col_type))
+         headers.append(make_header(key=col_key, type=col_type))
+    return name, headers, body
+
+
+def _deserialize_table_segment_from_trex_segment_str(trex_segment_str, validate=True) -> TableSegment:
+    parts = _split_table_segment_str(trex_segment_str, validate=validate)
+    if not parts:
+        return None
+    name, headers, body = parts
     
     data = [row.split(':') for row in body.split('::') ]
     # convert to correct value types
-    data_with_types = [[_str_to_value_type(h.type, cv) for cv, h in zip(r, headers)] for r in data]
+    data_with_types = [[_str_to_value_type(h.type, cv, validate=validate) for cv, h in zip(r, headers)] for r in data]
+    
+    if not validate:
+        data = [ TableRow.model_construct(r) for r in data_with_types]
+        return TableSegment._construct_trusted(column_headers=headers, data=data, key=name)
+    
     data = [ TableRow(r) for r in data_with_types]
-             
     out = TableSegment(column_headers=headers, data=data, key=name)
     return out
 
-def _str_to_value_type(type_, s):
+# Patterns of the cell values, which the Value models of the column types accept
+_cell_patterns = {
+    'number': r'-?[0-9]+(?:\.[0-9]+)?(?:E-?[0-9]+)?',
+    'T.D':    r'(?:[0-9]{8})?(?:T[0-9]{4}(?:[0-9]{2})?(?:\.[0-9]{3})?)?',
+    'T.B':    r'[TF]',
+    'T.A':    r'[A-Z0-9.\-]*',
+    'T.T':    r'[A-Z0-9]*',
+    'T.X':    r'[A-Z0-9]*',
+    'E':      r'[A-Z0-9.\-]*',
+}
+'''@private Types which are not in here are UNECE units, i.e. numbers. 
+The patterns do not check whether a date exists, e.g. 20250230 matches. Digits are ASCII only ([0-9], not \\d).'''
+
+
+def _str_to_value_type(type_, s, validate=True):
     match type_:
         case 'T.D':
-            out = DateValue(value=s)
+            value_type = DateValue
         case 'T.B':
-            out = BoolValue(value=s)
+            value_type = BoolValue
         case 'T.A':
-            out = AlphanumericValue(value=s)
+            value_type = AlphanumericValue
         case 'T.T':
-            out = TextValue(value=s)
+            value_type = TextValue
         case 'T.X':
-            out = BinaryValue(value=s)
+            value_type = BinaryValue
         case 'E':
-            out = ErrorValue(value=s)
+            value_type = ErrorValue
         case _:
-            out = NumericValue(value=s)
-    return out
+            value_type = NumericValue
+    if not validate:
+        return value_type._construct_trusted(value=s)
+    return value_type(value=s)
         
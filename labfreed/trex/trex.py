@@ -1,51 +1,134 @@
 from collections import Counter
 from typing import Self
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator, model_serializer
 
-from labfreed.labfreed_infrastructure import LabFREED_BaseModel
+from labfreed.labfreed_infrastructure import LabFREED_BaseModel, _TrackedList
 from labfreed.trex.table_segment import _deserialize_table_segment_from_trex_segment_str
 from labfreed.trex.trex_base_models import TREX_Segment
 from labfreed.trex.value_segments import _deserialize_value_segment_from_trex_segment_str
+from labfreed.trex.trex_writer import _writer_for
 
 
 class TREX(LabFREED_BaseModel):
     '''Represents a T-REX extension'''
     segments: list[TREX_Segment] = Field(default_factory=list)
+    _lazy_segments: '_LazySegments|None' = PrivateAttr(default=None)
+    """The segment strings of a lazily deserialized TREX. As long as segments was not accessed, it is not in __dict__"""
+    _segment_positions: dict[str, int]|None = PrivateAttr(default=None)
+    """Position of each key in segments. Built by get_segment and dropped when segments is assigned or modified in place"""
        
     @classmethod
-    def deserialize(cls, data) -> Self:
+    def deserialize(cls, data, validate=True, columnar_tables=False, lazy=False) -> Self:
+        '''Parses a TREX string. With validate=False the validation is deferred until validation results are requested (trusted mode).
+        With columnar_tables=True tables are parsed to ColumnarTableSegment, which is much faster for large tables.
+        With lazy=True only the keys of the segments are read. A segment is parsed when it is accessed the first time with get_segment. 
+        All segments are parsed, when segments is accessed or the TREX is validated.
+        '''
+        if lazy:
+            return cls._deserialize_lazy(data, validate=validate, columnar_tables=columnar_tables)
         segment_strings = data.split('+')
-        segments = list()
-        for s in segment_strings:
-            # there are only two valid options. The segment is a scalar or a table. 
-            # Constructors do the parsing anyways and raise exceptions if invalid data
-            # try both options and then let it fail
-            segment = _deserialize_table_segment_from_trex_segment_str(s)
-            if not segment:
-                segment = _deserialize_value_segment_from_trex_segment_str(s)
-            if not segment:
-                raise ValueError('TREX contains neither valid value segment nor table')
-                
-            segments.append(segment)
+        segments = [_deserialize_segment(s, validate=validate, columnar_tables=columnar_tables) for s in segment_strings]
+        if not validate:
+            return TREX._construct_trusted(segments=segments)
         trex = TREX(segments=segments)
         return trex
+    
+    
+    @classmethod
+    def _deserialize_lazy(cls, data, validate=True, columnar_tables=False) -> Self:
+        strings = data.split('+')
+        positions = dict()
+        for i, s in enumerate(strings):
+            # value segments are key$type:value, tables key$$header::body
+            key_end = s.find('$', 1)
+            if key_end < 0:
+                raise ValueError('TREX contains neither valid value segment nor table')
+            key = s[:key_end]
+            if key in positions:
+                if validate:
+                    raise ValueError(f"Duplicate segment keys: {key}")
+                continue
+            positions[key] = i
+        
+        trex = TREX._construct_trusted()
+        del trex.__dict__['segments']
+        trex._lazy_segments = _LazySegments(strings, positions, validate=validate, columnar_tables=columnar_tables)
+        trex._validation_skipped = False  # TREX has no own validators. The segments are validated when they are parsed
+        return trex
+    
+    
+    def __getattr__(self, name):
+        if name == 'segments' and self._lazy_segments is not None:
+            segments = _TrackedList(self._lazy_segments.all(), self)
+            self.__dict__['segments'] = segments
+            self._lazy_segments = None
+            return segments
+        return super().__getattr__(name)
+    
+    # pydantic reads the fields from __dict__. Make sure the segments of a lazy TREX are there
+    @model_serializer(mode='wrap')
+    def _serialize_segments(self, handler):
+        self.segments
+        return handler(self)
+    
+    def __repr_args__(self):
+        self.segments
+        return super().__repr_args__()
+    
+    def __eq__(self, other):
+        if isinstance(other, TREX):
+            self.segments
+            other.segments
+        return super().__eq__(other)
         
     
     def serialize(self):
+        if 'segments' not in self.__dict__:
+            return self._lazy_segments.serialize()
         seg_strings = list()
         for s in self.segments:
             seg_strings.append(s.serialize())
         s_out = '+'.join(seg_strings)
         return s_out
     
+    def serialize_to(self, sink):
+        '''Writes the serialized TREX to sink (text stream like io.StringIO, binary stream or bytearray). 
+        Columnar tables are written in chunks of rows.'''
+        write = _writer_for(sink)
+        if 'segments' not in self.__dict__:
+            write(self._lazy_segments.serialize())
+            return
+        for i, s in enumerate(self.segments):
+            if i:
+                write('+')
+            if hasattr(s, 'serialize_to'):
+                s.serialize_to(write)
+            else:
+                write(s.serialize())
+    
        
     def get_segment(self, segment_key:str) -> TREX_Segment:
-        '''Get a segment by key'''
-        s = [s for s in self.segments if s.key == segment_key]
-        if s:
-            return s[0]
-        else:
+        '''Get a segment by key. The keys are indexed on the first call and indexed again after segments was assigned or modified in place.'''
+        if 'segments' not in self.__dict__:
+            return self._lazy_segments.segment(segment_key)
+        
+        segments = self.segments
+        positions = self._segment_positions
+        if positions is None:
+            positions = self._segment_positions = _segment_positions(segments)
+        i = positions.get(segment_key)
+        if i is None:
             return None
+        if segments[i].key != segment_key:
+            # the key of the segment was changed in place
+            self._segment_positions = None
+            return next((s for s in segments if s.key == segment_key), None)
+        return segments[i]
+    
+    def _on_field_change(self):
+        '''@private'''
+        self.__pydantic_private__['_segment_positions'] = None
+        super()._on_field_change()
         
     
     def __str__(self):
@@ -64,6 +147,57 @@ class TREX(LabFREED_BaseModel):
         return segments
       
     
-        
 
+def _segment_positions(segments:list[TREX_Segment]) -> dict[str, int]:
+    '''@private position of each key. If a key occurs more than once, the first one'''
+    positions = dict()
+    for i, s in enumerate(segments):
+        positions.setdefault(s.key, i)
+    return positions
+
+
+def _deserialize_segment(s:str, validate=True, columnar_tables=False) -> TREX_Segment:
+    '''@private'''
+    # there are only two valid options. The segment is a scalar or a table. 
+    # Constructors do the parsing anyways and raise exceptions if invalid data
+    # try both options and then let it fail
+    if columnar_tables:
+        from labfreed.trex.columnar_table import _deserialize_columnar_table_segment_from_trex_segment_str as deserialize_table
+    else:
+        deserialize_table = _deserialize_table_segment_from_trex_segment_str
+    segment = deserialize_table(s, validate=validate)
+    if not segment:
+        segment = _deserialize_value_segment_from_trex_segment_str(s, validate=validate)
+    if not segment:
+        raise ValueError('TREX contains neither valid value segment nor table')
+    return segment
+
+
+class _LazySegments():
+    '''@private The segment strings of a lazily deserialized TREX. A segment is parsed when it is accessed the first time.'''
+    __slots__ = ('strings', 'positions', 'parsed', 'validate', 'columnar_tables')
+    
+    def __init__(self, strings:list[str], positions:dict[str, int], validate=True, columnar_tables=False):
+        self.strings = strings
+        self.positions = positions
+        self.parsed:list[TREX_Segment|None] = [None] * len(strings)
+        self.validate = validate
+        self.columnar_tables = columnar_tables
+        
+    def _parse(self, i:int) -> TREX_Segment:
+        segment = self.parsed[i]
+        if segment is None:
+            segment = _deserialize_segment(self.strings[i], validate=self.validate, columnar_tables=self.columnar_tables)
+            self.parsed[i] = segment
+        return segment
+        
+    def segment(self, key:str) -> TREX_Segment|None:
+        i = self.positions.get(key)
+        return self._parse(i) if i is not None else None
+    
+    def all(self) -> list[TREX_Segment]:
+        return [self._parse(i) for i in range(len(self.strings))]
     
+    def serialize(self) -> str:
+        '''Segments, which were not parsed, are taken over as they are'''
+        return '+'.join(p.serialize() if p is not None else s for p, s in zip(self.parsed, self.strings))
@@ -4,7 +4,9 @@ import re
 
 
 from pydantic import PrivateAttr, model_validator
-from labfreed.labfreed_infrastructure import LabFREED_BaseModel, ValidationMsgLevel, _quote_texts
+from labfreed.labfreed_infrastructure import LabFREED_BaseModel, ValidationMsgLevel
+from labfreed.utilities.char_class import alphanumeric_chars, base36_chars, numeric_chars
+from labfreed.well_known_keys.unece.unece_units import unece_unit_index
 from abc import ABC, abstractmethod
 
 
@@ -32,20 +34,24 @@ class Value(LabFREED_BaseModel, ABC):
         
         
         
+_number_pattern = re.compile(r'-?\d+(\.\d+)?(E-?\d+)?')
+_lower_case_start = re.compile(r'[a-z]')
+
 class NumericValue(Value):
         
     @model_validator(mode='after')
     def _validate(self):
         value = self.value
-        if not_allowed_chars := set(re.sub(r'[0-9\.\-E]', '', value)):
+        if not_allowed_chars := numeric_chars.invalid_chars(value):
             self._add_validation_message(
                 source=f"TREX numeric value {value}",
                 level=ValidationMsgLevel.ERROR,
-                msg=f"Characters {_quote_texts(not_allowed_chars)} are not allowed in quantity segment. Must be a number.",
+                msg="Characters {0:quoted} are not allowed in quantity segment. Must be a number.",
+                msg_args=(not_allowed_chars,),
                 highlight_pattern = f'{value}',
                 highlight_sub=not_allowed_chars
             )
-        if not re.fullmatch(r'-?\d+(\.\d+)?(E-?\d+)?', value):
+        if not _number_pattern.fullmatch(value):
             self._add_validation_message(
                 source=f"TREX numeric value {value}",
                 level=ValidationMsgLevel.ERROR,
@@ -54,14 +60,36 @@ class NumericValue(Value):
             )
         return self
 
+_date_pattern = re.compile(r'((?P<year>\d{4})(?P<month>\d{2})(?P<day>\d{2}))?(T(?P<hour>\d{2})(?P<minute>\d{2})(?P<second>\d{2})?(\.(?P<millisecond>\d{3}))?)?')
+
+def _date_time_dict_from_str(value:str) -> dict|None:
+    '''@private Splits a TREX date into the arguments of datetime/time. None if the format is invalid'''
+    matches = _date_pattern.fullmatch(value)
+    if not matches:
+        return None
+    d = matches.groupdict()  
+    d = {k: int(v) for k,v in d.items() if v }
+    if 'millisecond' in d.keys():
+        ms = d.pop('millisecond')
+        d.update({'microsecond': ms * 1000})
+    return d
+
+
 class DateValue(Value):
     _date_time_dict:dict|None = PrivateAttr(default=None)
     
+    @property
+    def date_time_dict(self) -> dict|None:
+        '''@private The date split in the arguments of datetime/time'''
+        if self._date_time_dict is None:
+            self._date_time_dict = _date_time_dict_from_str(self.value)
+        return self._date_time_dict
+    
     @model_validator(mode='after')
     def _validate(self):
-        pattern:str = r'((?P<year>\d{4})(?P<month>\d{2})(?P<day>\d{2}))?(T(?P<hour>\d{2})(?P<minute>\d{2})(?P<second>\d{2})?(\.(?P<millisecond>\d{3}))?)?'
         value=self.value
-        if not re.fullmatch(pattern, value):
+        d = _date_time_dict_from_str(value)
+        if d is None:
             self._add_validation_message(
                 source=f"TREX date value {value}",
                 level=ValidationMsgLevel.ERROR,
@@ -70,12 +98,6 @@ class DateValue(Value):
             )
             return self
             
-        matches = re.match(pattern, value)       
-        d = matches.groupdict()  
-        d = {k: int(v) for k,v in d.items() if v }
-        if 'millisecond' in d.keys():
-            ms = d.pop('millisecond')
-            d.update({'microsecond': ms * 1000})
         try:
             if d.get('year'): # input is only a time
                 datetime(**d)
@@ -112,7 +134,7 @@ class AlphanumericValue(Value):
         
     @model_validator(mode='after')
     def _validate(self):
-        if re.match(r'[a-z]', self.value):
+        if _lower_case_start.match(self.value):
             self._add_validation_message(
                     source=f"TREX value {self.value}",
                     level= ValidationMsgLevel.ERROR,
@@ -120,11 +142,12 @@ class AlphanumericValue(Value):
                     highlight_pattern = self.value
             )
             
-        if not_allowed_chars := set(re.sub(r'[A-Z0-9\.-]', '', self.value)):
+        if not_allowed_chars := alphanumeric_chars.invalid_chars(self.value):
             self._add_validation_message(
                     source=f"TREX value {self.value}",
                     level= ValidationMsgLevel.ERROR,
-                    msg=f"Characters {_quote_texts(not_allowed_chars)} are not allowed in alphanumeric segment",
+                    msg="Characters {0:quoted} are not allowed in alphanumeric segment",
+                    msg_args=(not_allowed_chars,),
                     highlight_pattern = self.value,
                     highlight_sub=not_allowed_chars
             )
@@ -135,11 +158,12 @@ class TextValue(Value):
         
     @model_validator(mode='after')
     def _validate(self):
-        if not_allowed_chars := set(re.sub(r'[A-Z0-9]', '', self.value)):
+        if not_allowed_chars := base36_chars.invalid_chars(self.value):
             self._add_validation_message(
                     source=f"TREX value {self.value}",
                     level= ValidationMsgLevel.ERROR,
-                    msg=f"Characters {_quote_texts(not_allowed_chars)} are not allowed in text segment. Base36 encoding only allows A-Z0-9",
+                    msg="Characters {0:quoted} are not allowed in text segment. Base36 encoding only allows A-Z0-9",
+                    msg_args=(not_allowed_chars,),
                     highlight_pattern = self.value,
                     highlight_sub=not_allowed_chars
             )
@@ -150,11 +174,12 @@ class BinaryValue(Value):
         
     @model_validator(mode='after')
     def _validate(self):
-        if not_allowed_chars := set(re.sub(r'[A-Z0-9]', '', self.value)):
+        if not_allowed_chars := base36_chars.invalid_chars(self.value):
            self._add_validation_message(
                     source=f"TREX value {self.value}",
                     level= ValidationMsgLevel.ERROR,
-                    msg=f"Characters {_quote_texts(not_allowed_chars)} are not allowed in text segment. Base36 encoding only allows A-Z0-9",
+                    msg="Characters {0:quoted} are not allowed in text segment. Base36 encoding only allows A-Z0-9",
+                    msg_args=(not_allowed_chars,),
                     highlight_pattern = self.value,
                     highlight_sub=not_allowed_chars
             )
@@ -165,17 +190,26 @@ class ErrorValue(Value):
     
     @model_validator(mode='after')
     def _validate(self):
-        if not_allowed_chars := set(re.sub(r'[A-Z0-9\.-]', '', self.value)):
+        if not_allowed_chars := alphanumeric_chars.invalid_chars(self.value):
             self._add_validation_message(
                     source=f"TREX value {self.value}",
                     level= ValidationMsgLevel.ERROR,
-                    msg=f"Characters {_quote_texts(not_allowed_chars)} are not allowed in error segment",
+                    msg="Characters {0:quoted} are not allowed in error segment",
+                    msg_args=(not_allowed_chars,),
                     highlight_pattern = self.value,
                     highlight_sub=not_allowed_chars
             )
         return self
 
 
+_non_unit_types = frozenset(['T.D', 'T.B', 'T.A', 'T.T', 'T.X', 'E'])
+'''@private TREX types, which are not a UNECE unit'''
+
+def _is_valid_type(type:str) -> bool:
+    '''@private True for the TREX types and active UNECE unit codes'''
+    return type in _non_unit_types or type in unece_unit_index().active_codes
+
+
 class TREX_Segment(LabFREED_BaseModel, ABC):
     '''@private
     Abstract class representing a TREX_Segment
@@ -189,11 +223,12 @@ class TREX_Segment(LabFREED_BaseModel, ABC):
     
     @model_validator(mode='after')
     def _validate_key(self):
-        if not_allowed_chars := set(re.sub(r'[A-Z0-9\.-]', '', self.key)):
+        if not_allowed_chars := alphanumeric_chars.invalid_chars(self.key):
             self._add_validation_message(
                 source=f"TREX segment key {self.key}",
                 level=ValidationMsgLevel.ERROR,
-                msg=f"Segment key contains invalid characters: {_quote_texts(not_allowed_chars)}",
+                msg="Segment key contains invalid characters: {0:quoted}",
+                msg_args=(not_allowed_chars,),
                 highlight_pattern = f'{self.key}$',
                 highlight_sub=not_allowed_chars
             )
@@ -0,0 +1,37 @@
+'''@private
+Writing of TREX strings to a sink, without creating a model for each table cell.
+'''
+
+import io
+from typing import Callable, Iterable, Sequence
+
+
+def _writer_for(sink) -> Callable[[str], object]:
+    '''@private The write function for sink: a text stream (e.g. io.StringIO), a binary stream, a bytearray or a write function'''
+    if isinstance(sink, bytearray):
+        return lambda s: sink.extend(s.encode('utf-8'))
+    if isinstance(sink, (io.RawIOBase, io.BufferedIOBase)):
+        return lambda s: sink.write(s.encode('utf-8'))
+    if callable(sink):
+        return sink
+    return sink.write
+
+
+def _join_numbers(values:Iterable) -> str:
+    '''@private Numbers formatted as TREX and joined with ":". The exponent is fixed in the joined string, not per value.'''
+    return ':'.join(map(str, values)).replace('e+', 'E').replace('e', 'E')
+
+
+def write_table(sink, key:str, column_names:Sequence[str], column_types:Sequence[str], column_texts:Sequence[Sequence[str]], chunk_rows=4096):
+    '''@private Writes a table segment from the TREX text of each column. The rows are joined and written in chunks of chunk_rows.'''
+    write = _writer_for(sink)
+    write(f'{key}$$')
+    write(':'.join([f'{k}${t}' for k, t in zip(column_names, column_types)]))
+    write('::')
+    columns = [c if isinstance(c, list) else list(c) for c in column_texts]
+    n_rows = len(columns[0]) if columns else 0
+    for start in range(0, n_rows, chunk_rows):
+        if start:
+            write('::')
+        chunk = [c[start:start + chunk_rows] for c in columns]
+        write('::'.join(map(':'.join, zip(*chunk))))
@@ -2,9 +2,8 @@ from abc import ABC
 import re
 from typing import Literal
 from pydantic import Field, model_validator
-from labfreed.well_known_keys.unece.unece_units import unece_unit_codes
 from labfreed.labfreed_infrastructure import ValidationMsgLevel
-from labfreed.trex.trex_base_models import AlphanumericValue, BinaryValue, BoolValue, DateValue, ErrorValue, NumericValue, TREX_Segment, TextValue, Value
+from labfreed.trex.trex_base_models import AlphanumericValue, BinaryValue, BoolValue, DateValue, ErrorValue, NumericValue, TREX_Segment, TextValue, Value, _is_valid_type
 
 
 
@@ -14,8 +13,7 @@ class ValueSegment(TREX_Segment, Value, ABC):
     
     @model_validator(mode='after')
     def _validate_type(self):
-        valid_types = valid_types = unece_unit_codes() + ['T.D', 'T.B', 'T.A', 'T.T', 'T.X', 'E']
-        if self.type not in valid_types:
+        if not _is_valid_type(self.type):
             self._add_validation_message(
                     source=f"TREX value segment {self.key}",
                     level= ValidationMsgLevel.ERROR,
@@ -70,7 +68,7 @@ class ErrorSegment(ValueSegment, ErrorValue):
     value:str
                      
 
-def _deserialize_value_segment_from_trex_segment_str(trex_segment_str) -> ValueSegment:
+def _deserialize_value_segment_from_trex_segment_str(trex_segment_str, validate=True) -> ValueSegment:
     #re_scalar_pattern = re.compile(f"(?P<name>[\w\.-]*?)\$(?P<unit>[\w\.]*?):(?P<value>.*)")
     re_scalar_pattern = re.compile("(?P<name>.+?)\$(?P<unit>.+?):(?P<value>.+)")
     matches = re_scalar_pattern.match(trex_segment_str)
@@ -81,19 +79,22 @@ def _deserialize_value_segment_from_trex_segment_str(trex_segment_str) -> ValueS
     
     match type_:
         case 'T.D':
-            out = DateSegment(key=key, value=value, type=type_)
+            segment_type = DateSegment
         case 'T.B':
-            out = BoolSegment(key=key, value=value, type=type_)
+            segment_type = BoolSegment
         case 'T.A':
-            out = AlphanumericSegment(key=key, value=value, type=type_)
+            segment_type = AlphanumericSegment
         case 'T.T':
-            out = TextSegment(key=key, value=value, type=type_)  
+            segment_type = TextSegment
         case 'T.X':
-            out = BinarySegment(key=key, value=value, type=type_) 
+            segment_type = BinarySegment
         case 'E':
-            out = ErrorSegment(key=key, value=value, type=type_)
+            segment_type = ErrorSegment
         case _:
-            out = NumericSegment(value=value, key=key, type=type_)
-                    
+            segment_type = NumericSegment
+    
+    if not validate:
+        return segment_type._construct_trusted(key=key, value=value, type=type_)
+    out = segment_type(key=key, value=value, type=type_)
     return out    
     
@@ -1,13 +1,14 @@
-import re
 import string
 
 from pydantic import field_validator, RootModel
 
+from labfreed.utilities import char_class
+
 class base36(RootModel[str]):
     @field_validator('root')
     @classmethod
     def validate_format(cls, v: str) -> str:
-        if not re.fullmatch(r'[A-Z0-9]*', v):
+        if not char_class.base36_chars.is_valid(v):
             raise ValueError("Value must only contain uppercase letters and digits (A-Z, 0-9)")
         return v
     
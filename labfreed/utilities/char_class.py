@@ -0,0 +1,71 @@
+'''
+Character classes for validation.
+
+Validators check that strings consist only of certain characters. Almost all values are valid, so `is_valid` and
+`invalid_chars` are a single compiled fullmatch in that case. Only if this fails the characters which are not allowed are
+determined (with a str.translate table, which deletes all allowed characters).
+'''
+
+import re
+import string
+
+
+_no_chars = frozenset()
+
+
+class CharClass():
+    '''A set of allowed characters, optionally with allowed escape sequences (like %XX in urls)'''
+    __slots__ = ('chars', '_fullmatch', '_delete_table', '_escape_pattern')
+
+    def __init__(self, chars:str, *, escape_pattern:str|None=None):
+        '''
+        Args:
+            chars (str): the allowed characters
+            escape_pattern (str, optional): regex of sequences, which are allowed in addition to chars.
+                                            It must not match anything starting with one of chars.
+        '''
+        self.chars = frozenset(chars)
+        alternatives = f'[{re.escape(chars)}]'
+        if escape_pattern:
+            alternatives += f'|{escape_pattern}'
+        self._fullmatch = re.compile(f'(?:{alternatives})*').fullmatch
+        self._delete_table = str.maketrans('', '', chars)
+        self._escape_pattern = re.compile(escape_pattern) if escape_pattern else None
+
+    def is_valid(self, s:str) -> bool:
+        '''True if s consists only of allowed characters (and escape sequences)'''
+        return self._fullmatch(s) is not None
+
+    def invalid_chars(self, s:str) -> frozenset[str]:
+        '''The characters of s which are not allowed. Empty if s is valid.'''
+        if self._fullmatch(s) is not None:
+            return _no_chars
+        if self._escape_pattern:
+            s = self._escape_pattern.sub('', s)
+        return frozenset(s.translate(self._delete_table))
+
+    def __repr__(self):
+        return f"CharClass({''.join(sorted(self.chars))!r})"
+
+
+
+hsegment_chars = CharClass(string.ascii_letters + string.digits + "_-.~!$&'()+,:;=@", escape_pattern=r'%[0-9A-Fa-f]{2}')
+'''Characters allowed in an hsegment according to RFC 1738, but without * (see PAC-ID Extension). Used for id segments'''
+
+recommended_segment_chars = CharClass(string.ascii_uppercase + string.digits + '-:+')
+'''Characters, which SHOULD be used in id segments'''
+
+alphanumeric_chars = CharClass(string.ascii_uppercase + string.digits + '.-')
+'''A-Z, 0-9, "." and "-". Used for issuer (recommendation), TREX keys and alphanumeric TREX values'''
+
+base36_chars = CharClass(string.ascii_uppercase + string.digits)
+'''A-Z and 0-9'''
+
+numeric_chars = CharClass(string.digits + '.-E')
+'''Characters of TREX numeric values'''
+
+service_name_chars = CharClass(string.ascii_letters + string.digits + '- ')
+'''Characters allowed in CIT service names'''
+
+application_intent_chars = CharClass(string.ascii_letters + string.digits + '-')
+'''Characters allowed in CIT application intents'''
@@ -11,6 +11,9 @@ class DisplayNameExtension(ExtensionBase, LabFREED_BaseModel):
     type:Literal['N'] = 'N'
     display_name: str       
     
+    _derived_computed_fields = frozenset({'data'})
+    '''@private data is the serialized form of the fields. It is not needed for validation'''
+    
     @computed_field
     @property
     def data(self)->str:
@@ -18,7 +21,8 @@ class DisplayNameExtension(ExtensionBase, LabFREED_BaseModel):
         return to_base36(self.display_name).root
     
     @staticmethod
-    def from_extension(ext:ExtensionBase) -> Self:
+    def from_extension(ext:ExtensionBase, validate=True) -> Self:
+        '''validate is accepted for compatibility with the other interpreters. There is nothing to validate'''
         return DisplayNameExtension.create(name=ext.name,
                                   type=ext.type,
                                   data=ext.data)
@@ -11,6 +11,9 @@ class TREX_Extension(ExtensionBase, LabFREED_BaseModel):
     type:Literal['TREX'] = 'TREX'
     trex:TREX
            
+    _derived_computed_fields = frozenset({'data'})
+    '''@private data is the serialized form of the fields. It is not needed for validation'''
+    
     @computed_field
     @property
     def data(self)->str:
@@ -18,13 +21,16 @@ class TREX_Extension(ExtensionBase, LabFREED_BaseModel):
         return trex_str
         
     @staticmethod
-    def from_extension(ext:ExtensionBase) -> Self:
+    def from_extension(ext:ExtensionBase, validate=True) -> Self:
         return TREX_Extension.create(name=ext.name,
                                     type=ext.type,
-                                    data=ext.data)
+                                    data=ext.data,
+                                    validate=validate)
     
     @staticmethod
-    def create(*, name, data, type='TREX'):
+    def create(*, name, data, type='TREX', validate=True):
+        if not validate:
+            return TREX_Extension._construct_trusted(name= name, trex = TREX.deserialize(data, validate=False))
         trex_extension = TREX_Extension(name= name, trex = TREX.deserialize(data))
         return trex_extension
     
@@ -15,4 +15,30 @@ class WellKnownKeys(Enum):
     METHOD_ID = 'MTD'
     REPORT_ID = 'RPT'
     TIMESTAMP = 'TS'
-    VERSION = 'V'
\ No newline at end of file
+    VERSION = 'V'
+
+
+_well_known_keys:frozenset[str] = frozenset(k.value for k in WellKnownKeys)
+
+
+def is_well_known_key(key:str) -> bool:
+    '''True if key is one of WellKnownKeys or was registered with register_well_known_keys'''
+    return key in _well_known_keys
+
+
+def well_known_keys() -> frozenset[str]:
+    '''All well known segment keys, including registered ones'''
+    return _well_known_keys
+
+
+def register_well_known_keys(*keys:str):
+    '''Registers additional segment keys (e.g. in-house keys) as well known. 
+    Segments with these keys no longer get the recommendation to use well known keys. 
+    This affects segments validated after the registration, so register the keys before parsing.
+    '''
+    global _well_known_keys
+    _well_known_keys = _well_known_keys.union(keys)
+    
+    # interned segments are validated only once, so they would keep the old result
+    from labfreed.pac_id.id_segment import interned_id_segment
+    interned_id_segment.cache_clear()
@@ -1,12 +1,17 @@
 from functools import cache
 import json
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
 
 
 
 
 @cache
 def unece_units() -> list[dict]:
+    '''All units with all fields as in UneceUnits.json. The json is loaded on the first call, which takes time. 
+    For lookups of code, name, symbol and factor use unece_unit_index(), which is based on the compact table in unece_units_compact.py.
+    unece_unit() looks up the full record from this json.'''
     p = Path(__file__).parent / 'UneceUnits.json'
     with open(p) as f:
         l = json.load(f)  # noqa: E741
@@ -14,16 +19,67 @@ def unece_units() -> list[dict]:
 
 @cache
 def unece_unit_codes():
-    codes= [u.get('commonCode') for u in unece_units() if u.get('state') == 'ACTIVE']
+    '''Common codes of the units in state ACTIVE, from the compact table in unece_units_compact.py'''
+    from labfreed.well_known_keys.unece.unece_units_compact import units
+    codes= [code for code, state, *_ in units if state == 'ACTIVE']
     return codes
 
 
+class UneceUnitIndex(NamedTuple):
+    '''Lookup tables for UNECE units. Get it with unece_unit_index()'''
+    by_code: Mapping[str, Mapping[str, str]]
+    '''unit by common code. The units are read only mappings with the fields commonCode, state, name, symbol and factor (the conversion factor).'''
+    codes_by_symbol: Mapping[str, tuple[str, ...]]
+    '''common codes of the units with this symbol. Several units can have the same symbol'''
+    codes_by_name: Mapping[str, tuple[str, ...]]
+    '''common codes of the units with this name'''
+    active_codes: frozenset[str]
+    '''common codes of the units in state ACTIVE'''
+    
+    def codes_for(self, unit:str) -> frozenset[str]:
+        '''common codes of all units, which have unit as name, symbol or code'''
+        codes = set(self.codes_by_name.get(unit, ()))
+        codes.update(self.codes_by_symbol.get(unit, ()))
+        if unit in self.by_code:
+            codes.add(unit)
+        return frozenset(codes)
+
+
+@cache
+def unece_unit_index() -> UneceUnitIndex:
+    '''The index is built on first use. It is based on the compact table in unece_units_compact.py, 
+    which is generated from UneceUnits.json by build_tools/generate_unece_units_module.py'''
+    from labfreed.well_known_keys.unece.unece_units_compact import units
+    
+    by_code = dict()
+    codes_by_symbol = dict()
+    codes_by_name = dict()
+    for code, state, name, symbol, factor in units:
+        if code not in by_code:
+            by_code[code] = MappingProxyType({'commonCode': code, 'state': state, 'name': name, 'symbol': symbol, 'factor': factor})
+        if symbol:
+            codes_by_symbol.setdefault(symbol, []).append(code)
+        if name:
+            codes_by_name.setdefault(name, []).append(code)
+    return UneceUnitIndex(by_code=MappingProxyType(by_code),
+                          codes_by_symbol=MappingProxyType({k: tuple(v) for k, v in codes_by_symbol.items()}),
+                          codes_by_name=MappingProxyType({k: tuple(v) for k, v in codes_by_name.items()}),
+                          active_codes=frozenset(unece_unit_codes())
+                          )
+
+
 def unece_unit(unit_code):
-    unit =  [u for u in unece_units() if u['commonCode'] == unit_code]
-    if len(unit) == 0:
-        return None
-    else:
-        return unit[0]
+    '''The unit with all fields as in UneceUnits.json. None if there is no unit with this code.
+    This loads the json. If name, symbol or factor are sufficient use unece_unit_index().by_code'''
+    return _unece_units_by_code().get(unit_code)
+
+@cache
+def _unece_units_by_code() -> dict[str, dict]:
+    '''@private the records of unece_units() (UneceUnits.json) by common code'''
+    by_code = dict()
+    for u in unece_units():
+        by_code.setdefault(u['commonCode'], u)
+    return by_code
     
 def unit_symbol(unit:dict) ->str:
     return unit.get('symbol')
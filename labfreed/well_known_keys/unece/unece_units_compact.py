@@ -0,0 +1,2547 @@
+# Generated by build_tools/generate_unece_units_module.py from UneceUnits.json. Do not edit.
+# (commonCode, state, name, symbol, conversion factor)
+
+units = (
+    ('05', 'MARKED_AS_DELETED', 'lift', None, None),
+    ('06', 'MARKED_AS_DELETED', 'small spray', None, None),
+    ('08', 'MARKED_AS_DELETED', 'heat lot', None, None),
+    ('10', 'ACTIVE', 'group', None, None),
+    ('11', 'ACTIVE', 'outfit', None, None),
+    ('13', 'ACTIVE', 'ration', None, None),
+    ('14', 'ACTIVE', 'shot', None, None),
+    ('15', 'ACTIVE', 'stick, military', None, None),
+    ('16', 'MARKED_AS_DELETED', 'hundred fifteen kg drum', None, None),
+    ('17', 'MARKED_AS_DELETED', 'hundred lb drum', None, None),
+    ('18', 'MARKED_AS_DELETED', 'fiftyfive gallon (US) drum', None, None),
+    ('19', 'MARKED_AS_DELETED', 'tank truck', None, None),
+    ('20', 'ACTIVE', 'twenty foot container', None, None),
+    ('21', 'ACTIVE', 'forty foot container', None, None),
+    ('22', 'ACTIVE', 'decilitre per gram', 'dl/g', 0.1),
+    ('23', 'ACTIVE', 'gram per cubic centimetre', 'g/cm³', 1000.0),
+    ('24', 'ACTIVE', 'theoretical pound', None, None),
+    ('25', 'ACTIVE', 'gram per square centimetre', 'g/cm²', 10.0),
+    ('26', 'MARKED_AS_DELETED', 'actual ton', None, None),
+    ('27', 'ACTIVE', 'theoretical ton', None, None),
+    ('28', 'ACTIVE', 'kilogram per square metre', 'kg/m²', 1.0),
+    ('29', 'MARKED_AS_DELETED', 'pound per thousand square foot', 'lb/kft²', None),
+    ('30', 'MARKED_AS_DELETED', 'horse power day per air dry metric ton', None, None),
+    ('31', 'MARKED_AS_DELETED', 'catch weight', None, None),
+    ('32', 'MARKED_AS_DELETED', 'kilogram per air dry metric ton', None, None),
+    ('33', 'ACTIVE', 'kilopascal square metre per gram', 'kPa·m²/g', 1000000.0),
+    ('34', 'ACTIVE', 'kilopascal per millimetre', 'kPa/mm', 1000000.0),
+    ('35', 'ACTIVE', 'millilitre per square centimetre second', 'ml/(cm²·s)', 0.01),
+    ('36', 'MARKED_AS_DELETED', 'cubic foot per minute per square foot', 'ft³/(min/ft²)', None),
+    ('37', 'ACTIVE', 'ounce per square foot', 'oz/ft²', 0.3051517),
+    ('38', 'ACTIVE', 'ounce per square foot per 0,01inch', 'oz/(ft²/cin)', None),
+    ('40', 'ACTIVE', 'millilitre per second', 'ml/s', 1e-06),
+    ('41', 'ACTIVE', 'millilitre per minute', 'ml/min', 1.66667e-08),
+    ('43', 'MARKED_AS_DELETED', 'super bulk bag', None, None),
+    ('44', 'MARKED_AS_DELETED', 'fivehundred kg bulk bag', None, None),
+    ('45', 'MARKED_AS_DELETED', 'threehundred kg bulk bag', None, None),
+    ('46', 'MARKED_AS_DELETED', 'fifty lb bulk bag', None, None),
+    ('47', 'MARKED_AS_DELETED', 'fifty lb bag', None, None),
+    ('48', 'MARKED_AS_DELETED', 'bulk car load', None, None),
+    ('53', 'MARKED_AS_DELETED', 'theoretical kilogram', None, None),
+    ('54', 'MARKED_AS_DELETED', 'theoretical tonne', None, None),
+    ('56', 'ACTIVE', 'sitas', None, None),
+    ('57', 'ACTIVE', 'mesh', None, None),
+    ('58', 'ACTIVE', 'net kilogram', None, None),
+    ('59', 'ACTIVE', 'part per million', 'ppm', 1e-06),
+    ('60', 'ACTIVE', 'percent weight', None, 0.01),
+    ('61', 'ACTIVE', 'part per billion (US)', 'ppb', 1e-09),
+    ('62', 'MARKED_AS_DELETED', 'percent per 1000 hour', None, None),
+    ('63', 'MARKED_AS_DELETED', 'failure rate in time', None, None),
+    ('64', 'DEPRECATED', 'pound per square inch, gauge', None, 703.0696),
+    ('66', 'DEPRECATED', 'oersted', 'Oe', 79.57747),
+    ('69', 'MARKED_AS_DELETED', 'test specific scale', None, None),
+    ('71', 'MARKED_AS_DELETED', 'volt ampere per pound', None, None),
+    ('72', 'MARKED_AS_DELETED', 'watt per pound', None, None),
+    ('73', 'MARKED_AS_DELETED', 'ampere tum per centimetre', None, None),
+    ('74', 'ACTIVE', 'millipascal', 'mPa', 0.001),
+    ('76', 'DEPRECATED', 'gauss', 'Gs', 0.0001),
+    ('77', 'ACTIVE', 'milliinch', 'mil', 2.5399999999999997e-05),
+    ('78', 'DEPRECATED', 'kilogauss', 'kGs', 0.1),
+    ('80', 'ACTIVE', 'pound per square inch absolute', 'lb/in²', 703.0696),
+    ('81', 'ACTIVE', 'henry', 'H', 1),
+    ('84', 'DEPRECATED', 'kilopoundforce per square inch', 'klbf/in²', 6894757.0),
+    ('85', 'ACTIVE', 'foot poundforce', 'ft·lbf', 1.355818),
+    ('87', 'ACTIVE', 'pound per cubic foot', 'lb/ft³', 16.01846),
+    ('89', 'ACTIVE', 'poise', 'P', 0.1),
+    ('90', 'MARKED_AS_DELETED', 'Saybold universal second', None, None),
+    ('91', 'ACTIVE', 'stokes', 'St', 0.0001),
+    ('92', 'MARKED_AS_DELETED', 'calorie per cubic centimetre', None, None),
+    ('93', 'MARKED_AS_DELETED', 'calorie per gram', 'cal/g', 4186.8),
+    ('94', 'MARKED_AS_DELETED', 'curl unit', None, None),
+    ('95', 'MARKED_AS_DELETED', 'twenty thousand gallon (US) tankcar', None, None),
+    ('96', 'MARKED_AS_DELETED', 'ten thousand gallon (US) tankcar', None, None),
+    ('97', 'MARKED_AS_DELETED', 'ten kg drum', None, None),
+    ('98', 'MARKED_AS_DELETED', 'fifteen kg drum', None, None),
+    ('1A', 'MARKED_AS_DELETED', 'car mile', None, None),
+    ('1B', 'MARKED_AS_DELETED', 'car count', None, None),
+    ('1C', 'MARKED_AS_DELETED', 'locomotive count', None, None),
+    ('1D', 'MARKED_AS_DELETED', 'caboose count', None, None),
+    ('1E', 'MARKED_AS_DELETED', 'empty car', None, None),
+    ('1F', 'MARKED_AS_DELETED', 'train mile', None, None),
+    ('1G', 'MARKED_AS_DELETED', 'fuel usage gallon (US)', None, None),
+    ('1H', 'MARKED_AS_DELETED', 'caboose mile', None, None),
+    ('1I', 'ACTIVE', 'fixed rate', None, None),
+    ('1J', 'MARKED_AS_DELETED', 'ton mile', None, None),
+    ('1K', 'MARKED_AS_DELETED', 'locomotive mile', None, None),
+    ('1L', 'MARKED_AS_DELETED', 'total car count', None, None),
+    ('1M', 'MARKED_AS_DELETED', 'total car mile', None, None),
+    ('1X', 'MARKED_AS_DELETED', 'quarter mile', None, None),
+    ('2A', 'ACTIVE', 'radian per second', 'rad/s', 1.0),
+    ('2B', 'ACTIVE', 'radian per second squared', 'rad/s²', 1.0),
+    ('2C', 'ACTIVE', 'roentgen', 'R', 0.00025800000000000004),
+    ('2G', 'ACTIVE', 'volt AC', 'V', 1),
+    ('2H', 'ACTIVE', 'volt DC', 'V', 1),
+    ('2I', 'ACTIVE', 'British thermal unit (international table) per hour', 'BtuIT/h', 0.29307110000000003),
+    ('2J', 'ACTIVE', 'cubic centimetre per second', 'cm³/s', 1e-06),
+    ('2K', 'ACTIVE', 'cubic foot per hour', 'ft³/h', 7.86579e-06),
+    ('2L', 'ACTIVE', 'cubic foot per minute', 'ft³/min', 0.00047194740000000004),
+    ('2M', 'ACTIVE', 'centimetre per second', 'cm/s', 0.01),
+    ('2N', 'ACTIVE', 'decibel', 'dB', None),
+    ('2P', 'ACTIVE', 'kilobyte', 'kbyte', None),
+    ('2Q', 'ACTIVE', 'kilobecquerel', 'kBq', 1000),
+    ('2R', 'ACTIVE', 'kilocurie', 'kCi', 37000000000000.0),
+    ('2U', 'ACTIVE', 'megagram', 'Mg', 1000),
+    ('2V', 'MARKED_AS_DELETED', 'megagram per hour', 'Mg/h', None),
+    ('2W', 'MARKED_AS_DELETED', 'bin', None, None),
+    ('2X', 'ACTIVE', 'metre per minute', 'm/min', 0.016666),
+    ('2Y', 'ACTIVE', 'milliroentgen', 'mR', 2.58e-07),
+    ('2Z', 'ACTIVE', 'millivolt', 'mV', 0.001),
+    ('3B', 'ACTIVE', 'megajoule', 'MJ', 1000000),
+    ('3C', 'ACTIVE', 'manmonth', None, None),
+    ('3E', 'MARKED_AS_DELETED', 'pound per pound of product', None, None),
+    ('3G', 'MARKED_AS_DELETED', 'pound per piece of product', None, None),
+    ('3H', 'MARKED_AS_DELETED', 'kilogram per kilogram of product', None, None),
+    ('3I', 'MARKED_AS_DELETED', 'kilogram per piece of product', None, None),
+    ('4A', 'MARKED_AS_DELETED', 'bobbin', None, None),
+    ('4B', 'MARKED_AS_DELETED', 'cap', None, None),
+    ('4C', 'ACTIVE', 'centistokes', 'cSt', 1e-06),
+    ('4E', 'MARKED_AS_DELETED', 'twenty pack', None, None),
+    ('4G', 'ACTIVE', 'microlitre', 'µl', 1e-09),
+    ('4H', 'ACTIVE', 'micrometre (micron)', 'µm', 1e-06),
+    ('4K', 'ACTIVE', 'milliampere', 'mA', 0.001),
+    ('4L', 'ACTIVE', 'megabyte', 'Mbyte', None),
+    ('4M', 'ACTIVE', 'milligram per hour', 'mg/h', 2.77778e-10),
+    ('4N', 'ACTIVE', 'megabecquerel', 'MBq', 1000000),
+    ('4O', 'ACTIVE', 'microfarad', 'µF', 1e-06),
+    ('4P', 'ACTIVE', 'newton per metre', 'N/m', 1.0),
+    ('4Q', 'ACTIVE', 'ounce inch', 'oz·in', 0.0007200778),
+    ('4R', 'ACTIVE', 'ounce foot', 'oz·ft', 0.008640934),
+    ('4T', 'ACTIVE', 'picofarad', 'pF', 1e-12),
+    ('4U', 'ACTIVE', 'pound per hour', 'lb/h', 0.00012599790000000002),
+    ('4W', 'ACTIVE', 'ton (US) per hour', 'ton (US) /h', 0.2519958),
+    ('4X', 'ACTIVE', 'kilolitre per hour', 'kl/h', 0.000277778),
+    ('5A', 'ACTIVE', 'barrel (US) per minute', 'barrel (US)/min', 0.00264979),
+    ('5B', 'ACTIVE', 'batch', None, None),
+    ('5C', 'MARKED_AS_DELETED', 'gallon(US) per thousand', None, None),
+    ('5E', 'ACTIVE', 'MMSCF/day', None, None),
+    ('5F', 'MARKED_AS_DELETED', 'pound per thousand', None, None),
+    ('5G', 'MARKED_AS_DELETED', 'pump', None, None),
+    ('5H', 'MARKED_AS_DELETED', 'stage', None, None),
+    ('5I', 'MARKED_AS_DELETED', 'standard cubic foot', 'std', 4.672),
+    ('5J', 'ACTIVE', 'hydraulic horse power', None, None),
+    ('5K', 'MARKED_AS_DELETED', 'count per minute', None, None),
+    ('5P', 'MARKED_AS_DELETED', 'seismic level', None, None),
+    ('5Q', 'MARKED_AS_DELETED', 'seismic line', None, None),
+    ('A1', 'DEPRECATED', '15 °C calorie', 'cal₁₅', 4.18846),
+    ('A10', 'ACTIVE', 'ampere square metre per joule second', 'A·m²/(J·s)', 1.0),
+    ('A11', 'ACTIVE', 'angstrom', 'Å', 1e-10),
+    ('A12', 'ACTIVE', 'astronomical unit', 'ua', 149597870000.0),
+    ('A13', 'ACTIVE', 'attojoule', 'aJ', 1e-18),
+    ('A14', 'ACTIVE', 'barn', 'b', 1e-28),
+    ('A15', 'ACTIVE', 'barn per electronvolt', 'b/eV', 6.24151e-10),
+    ('A16', 'ACTIVE', 'barn per steradian electronvolt', 'b/(sr·eV)', 6.24151e-10),
+    ('A17', 'ACTIVE', 'barn per steradian', 'b/sr', 1e-28),
+    ('A18', 'ACTIVE', 'becquerel per kilogram', 'Bq/kg', 2.7027e-11),
+    ('A19', 'ACTIVE', 'becquerel per cubic metre', 'Bq/m³', 1.0),
+    ('A2', 'ACTIVE', 'ampere per centimetre', 'A/cm', 100.0),
+    ('A20', 'ACTIVE', 'British thermal unit (international table) per second square foot degree Rankine', 'BtuIT/(s·ft²·°R)', 20441.7),
+    ('A21', 'ACTIVE', 'British thermal unit (international table) per pound degree Rankine', 'BtuIT/(lb·°R)', 4186.8),
+    ('A22', 'ACTIVE', 'British thermal unit (international table) per second foot degree Rankine', 'BtuIT/(s·ft·°R)', 6230.64),
+    ('A23', 'ACTIVE', 'British thermal unit (international table) per hour square foot degree Rankine', 'BtuIT/(h·ft²·°R)', 5.67826),
+    ('A24', 'ACTIVE', 'candela per square metre', 'cd/m²', 1.0),
+    ('A25', 'DEPRECATED', 'cheval vapeur', 'CV', 735.4988),
+    ('A26', 'ACTIVE', 'coulomb metre', 'C·m', 1),
+    ('A27', 'ACTIVE', 'coulomb metre squared per volt', 'C·m²/V', 1.0),
+    ('A28', 'ACTIVE', 'coulomb per cubic centimetre', 'C/cm³', 1000000.0),
+    ('A29', 'ACTIVE', 'coulomb per cubic metre', 'C/m³', 1.0),
+    ('A3', 'ACTIVE', 'ampere per millimetre', 'A/mm', 1000.0),
+    ('A30', 'ACTIVE', 'coulomb per cubic millimetre', 'C/mm³', 1000000000.0),
+    ('A31', 'ACTIVE', 'coulomb per kilogram second', 'C/(kg·s)', 1.0),
+    ('A32', 'ACTIVE', 'coulomb per mole', 'C/mol', 1.0),
+    ('A33', 'ACTIVE', 'coulomb per square centimetre', 'C/cm²', 10000.0),
+    ('A34', 'ACTIVE', 'coulomb per square metre', 'C/m²', 1.0),
+    ('A35', 'ACTIVE', 'coulomb per square millimetre', 'C/mm²', 1000000.0),
+    ('A36', 'ACTIVE', 'cubic centimetre per mole', 'cm³/mol', 1e-06),
+    ('A37', 'ACTIVE', 'cubic decimetre per mole', 'dm³/mol', 0.001),
+    ('A38', 'ACTIVE', 'cubic metre per coulomb', 'm³/C', 1.0),
+    ('A39', 'ACTIVE', 'cubic metre per kilogram', 'm³/kg', 1.0),
+    ('A4', 'ACTIVE', 'ampere per square centimetre', 'A/cm²', 10000.0),
+    ('A40', 'ACTIVE', 'cubic metre per mole', 'm³/mol', 1.0),
+    ('A41', 'ACTIVE', 'ampere per square metre', 'A/m²', 1.0),
+    ('A42', 'ACTIVE', 'curie per kilogram', 'Ci/kg', 37000000000.0),
+    ('A43', 'ACTIVE', 'deadweight tonnage', 'dwt', None),
+    ('A44', 'ACTIVE', 'decalitre', 'dal', 0.01),
+    ('A45', 'ACTIVE', 'decametre', 'dam', 10),
+    ('A47', 'ACTIVE', 'decitex', 'dtex (g/10km)', None),
+    ('A48', 'ACTIVE', 'degree Rankine', '°R', 0.5555555555555556),
+    ('A49', 'ACTIVE', 'denier', 'den (g/9 km)', None),
+    ('A5', 'ACTIVE', 'ampere square metre', 'A·m²', 1),
+    ('A50', 'DEPRECATED', 'dyne second per cubic centimetre', 'dyn·s/cm³', 10.0),
+    ('A51', 'DEPRECATED', 'dyne second per centimetre', 'dyn·s/cm', 0.001),
+    ('A52', 'DEPRECATED', 'dyne second per centimetre to the fifth power', 'dyn·s/cm⁵', 100000.0),
+    ('A53', 'ACTIVE', 'electronvolt', 'eV', 1.6021764869999998e-19),
+    ('A54', 'ACTIVE', 'electronvolt per metre', 'eV/m', 1.6021764869999998e-19),
+    ('A55', 'ACTIVE', 'electronvolt square metre', 'eV·m²', 1.6021764869999998e-19),
+    ('A56', 'ACTIVE', 'electronvolt square metre per kilogram', 'eV·m²/kg', 1.6021764869999998e-19),
+    ('A57', 'DEPRECATED', 'erg', 'erg', 1e-07),
+    ('A58', 'DEPRECATED', 'erg per centimetre', 'erg/cm', 1e-05),
+    ('A59', 'ACTIVE', '8part cloud cover', None, None),
+    ('A6', 'ACTIVE', 'ampere per square metre kelvin squared', 'A/(m²·K²)', 1.0),
+    ('A60', 'DEPRECATED', 'erg per cubic centimetre', 'erg/cm³', 0.1),
+    ('A61', 'DEPRECATED', 'erg per gram', 'erg/g', 0.0001),
+    ('A62', 'DEPRECATED', 'erg per gram second', 'erg/g·s', 0.0001),
+    ('A63', 'DEPRECATED', 'erg per second', 'erg/s', 1e-07),
+    ('A64', 'DEPRECATED', 'erg per second square centimetre', 'erg/(s·cm²)', 0.001),
+    ('A65', 'DEPRECATED', 'erg per square centimetre second', 'erg/(cm²·s)', 0.001),
+    ('A66', 'DEPRECATED', 'erg square centimetre', 'erg·cm²', 1e-11),
+    ('A67', 'DEPRECATED', 'erg square centimetre per gram', 'erg·cm²/g', 1e-08),
+    ('A68', 'ACTIVE', 'exajoule', 'EJ', 1000000000000000000),
+    ('A69', 'ACTIVE', 'farad per metre', 'F/m', 1.0),
+    ('A7', 'ACTIVE', 'ampere per square millimetre', 'A/mm²', 1000000.0),
+    ('A70', 'ACTIVE', 'femtojoule', 'fJ', 1e-15),
+    ('A71', 'ACTIVE', 'femtometre', 'fm', 1e-15),
+    ('A73', 'ACTIVE', 'foot per second squared', 'ft/s²', 0.3048),
+    ('A74', 'ACTIVE', 'foot poundforce per second', 'ft·lbf/s', 1.355818),
+    ('A75', 'ACTIVE', 'freight ton', None, None),
+    ('A76', 'ACTIVE', 'gal', 'Gal', 0.01),
+    ('A77', 'DEPRECATED', 'Gaussian CGS (CentimetreGramSecond system) unit of displacement', None, None),
+    ('A78', 'DEPRECATED', 'Gaussian CGS (CentimetreGramSecond system) unit of electric current', None, None),
+    ('A79', 'DEPRECATED', 'Gaussian CGS (CentimetreGramSecond system) unit of electric charge', None, None),
+    ('A8', 'ACTIVE', 'ampere second', 'A·s', 1),
+    ('A80', 'DEPRECATED', 'Gaussian CGS (CentimetreGramSecond system) unit of electric field strength', None, None),
+    ('A81', 'DEPRECATED', 'Gaussian CGS (CentimetreGramSecond system) unit of electric polarization', None, None),
+    ('A82', 'DEPRECATED', 'Gaussian CGS (CentimetreGramSecond system) unit of electric potential', None, None),
+    ('A83', 'DEPRECATED', 'Gaussian CGS (CentimetreGramSecond system) unit of magnetization', None, None),
+    ('A84', 'ACTIVE', 'gigacoulomb per cubic metre', 'GC/m³', 1000000000.0),
+    ('A85', 'ACTIVE', 'gigaelectronvolt', 'GeV', 1000000000),
+    ('A86', 'ACTIVE', 'gigahertz', 'GHz', 1000000000),
+    ('A87', 'ACTIVE', 'gigaohm', 'GΩ', 1000000000),
+    ('A88', 'ACTIVE', 'gigaohm metre', 'GΩ·m', 1000000000),
+    ('A89', 'ACTIVE', 'gigapascal', 'GPa', 1000000000),
+    ('A9', 'ACTIVE', 'rate', None, None),
+    ('A90', 'ACTIVE', 'gigawatt', 'GW', 1000000000),
+    ('A91', 'ACTIVE', 'gon', 'gon', 0.01570796),
+    ('A93', 'ACTIVE', 'gram per cubic metre', 'g/m³', 0.001),
+    ('A94', 'ACTIVE', 'gram per mole', 'g/mol', 0.001),
+    ('A95', 'ACTIVE', 'gray', 'Gy', 1.0),
+    ('A96', 'ACTIVE', 'gray per second', 'Gy/s', 1.0),
+    ('A97', 'ACTIVE', 'hectopascal', 'hPa', 100),
+    ('A98', 'ACTIVE', 'henry per metre', 'H/m', 1.0),
+    ('A99', 'ACTIVE', 'bit', 'bit', None),
+    ('AA', 'ACTIVE', 'ball', None, None),
+    ('AB', 'ACTIVE', 'bulk pack', 'pk', None),
+    ('ACR', 'ACTIVE', 'acre', 'acre', 4046.873),
+    ('ACT', 'ACTIVE', 'activity', None, None),
+    ('AD', 'ACTIVE', 'byte', 'byte', None),
+    ('AE', 'ACTIVE', 'ampere per metre', 'A/m', 1.0),
+    ('AH', 'ACTIVE', 'additional minute', None, None),
+    ('AI', 'ACTIVE', 'average minute per call', None, None),
+    ('AJ', 'MARKED_AS_DELETED', 'cop', None, None),
+    ('AK', 'ACTIVE', 'fathom', 'fth', 1.8288),
+    ('AL', 'ACTIVE', 'access line', None, None),
+    ('AM', 'MARKED_AS_DELETED', 'ampoule', None, None),
+    ('AMH', 'ACTIVE', 'ampere hour', 'A·h', 3600.0),
+    ('AMP', 'ACTIVE', 'ampere', 'A', 1),
+    ('ANN', 'ACTIVE', 'year', 'y', 31557600.0),
+    ('AP', 'MARKED_AS_DELETED', 'aluminium pound only', None, None),
+    ('APZ', 'ACTIVE', 'troy ounce or apothecary ounce', 'tr oz', 0.003110348),
+    ('AQ', 'ACTIVE', 'antihemophilic factor (AHF) unit', None, None),
+    ('AR', 'MARKED_AS_DELETED', 'suppository', None, None),
+    ('ARE', 'DEPRECATED', 'are', 'a', 100),
+    ('AS', 'ACTIVE', 'assortment', None, None),
+    ('ASM', 'ACTIVE', 'alcoholic strength by mass', None, None),
+    ('ASU', 'ACTIVE', 'alcoholic strength by volume', None, None),
+    ('ATM', 'ACTIVE', 'standard atmosphere', 'atm', 101325),
+    ('ATT', 'DEPRECATED', 'technical atmosphere', 'at', 98066.5),
+    ('AV', 'MARKED_AS_DELETED', 'capsule', None, None),
+    ('AW', 'MARKED_AS_DELETED', 'powder filled vial', None, None),
+    ('AWG', 'ACTIVE', 'american wire gauge', 'AWG', None),
+    ('AY', 'ACTIVE', 'assembly', None, None),
+    ('AZ', 'ACTIVE', 'British thermal unit (international table) per pound', 'BtuIT/lb', 2326.0),
+    ('B0', 'MARKED_AS_DELETED', 'Btu per cubic foot', 'BTU/ft³', None),
+    ('B1', 'ACTIVE', 'barrel (US) per day', 'barrel\xa0(US)/d', 1.84013e-06),
+    ('B10', 'ACTIVE', 'bit per second', 'bit/s', None),
+    ('B11', 'ACTIVE', 'joule per kilogram kelvin', 'J/(kg·K)', 1.0),
+    ('B12', 'ACTIVE', 'joule per metre', 'J/m', 1.0),
+    ('B13', 'ACTIVE', 'joule per square metre', 'J/m²', 1.0),
+    ('B14', 'ACTIVE', 'joule per metre to the fourth power', 'J/m⁴', 1.0),
+    ('B15', 'ACTIVE', 'joule per mole', 'J/mol', 1.0),
+    ('B16', 'ACTIVE', 'joule per mole kelvin', 'J/(mol·K)', 1.0),
+    ('B17', 'ACTIVE', 'credit', None, None),
+    ('B18', 'ACTIVE', 'joule second', 'J·s', 1),
+    ('B19', 'ACTIVE', 'digit', None, None),
+    ('B2', 'MARKED_AS_DELETED', 'bunk', None, None),
+    ('B20', 'ACTIVE', 'joule square metre per kilogram', 'J·m²/kg', 1.0),
+    ('B21', 'ACTIVE', 'kelvin per watt', 'K/W', 1.0),
+    ('B22', 'ACTIVE', 'kiloampere', 'kA', 1000),
+    ('B23', 'ACTIVE', 'kiloampere per square metre', 'kA/m²', 1000.0),
+    ('B24', 'ACTIVE', 'kiloampere per metre', 'kA/m', 1000.0),
+    ('B25', 'ACTIVE', 'kilobecquerel per kilogram', 'kBq/kg', 1000.0),
+    ('B26', 'ACTIVE', 'kilocoulomb', 'kC', 1000),
+    ('B27', 'ACTIVE', 'kilocoulomb per cubic metre', 'kC/m³', 1000.0),
+    ('B28', 'ACTIVE', 'kilocoulomb per square metre', 'kC/m²', 1000.0),
+    ('B29', 'ACTIVE', 'kiloelectronvolt', 'keV', 1000),
+    ('B3', 'ACTIVE', 'batting pound', None, None),
+    ('B30', 'ACTIVE', 'gibibit', 'Gibit', None),
+    ('B31', 'ACTIVE', 'kilogram metre per second', 'kg·m/s', 1.0),
+    ('B32', 'ACTIVE', 'kilogram metre squared', 'kg·m²', 1),
+    ('B33', 'ACTIVE', 'kilogram metre squared per second', 'kg·m²/s', 1.0),
+    ('B34', 'ACTIVE', 'kilogram per cubic decimetre', 'kg/dm³', 1000.0),
+    ('B35', 'ACTIVE', 'kilogram per litre', 'kg/l or kg/L', 1000.0),
+    ('B36', 'DEPRECATED', 'calorie (thermochemical) per gram', 'calth/g', 4184.0),
+    ('B37', 'DEPRECATED', 'kilogramforce', 'kgf', 9.80665),
+    ('B38', 'DEPRECATED', 'kilogramforce metre', 'kgf·m', 9.80665),
+    ('B39', 'DEPRECATED', 'kilogramforce metre per second', 'kgf·m/s', 9.80665),
+    ('B4', 'ACTIVE', 'barrel, imperial', None, None),
+    ('B40', 'DEPRECATED', 'kilogramforce per square metre', 'kgf/m²', 9.80665),
+    ('B41', 'ACTIVE', 'kilojoule per kelvin', 'kJ/K', 1000.0),
+    ('B42', 'ACTIVE', 'kilojoule per kilogram', 'kJ/kg', 1000.0),
+    ('B43', 'ACTIVE', 'kilojoule per kilogram kelvin', 'kJ/(kg·K)', 1000.0),
+    ('B44', 'ACTIVE', 'kilojoule per mole', 'kJ/mol', 1000.0),
+    ('B45', 'ACTIVE', 'kilomole', 'kmol', 1000),
+    ('B46', 'ACTIVE', 'kilomole per cubic metre', 'kmol/m³', 1000.0),
+    ('B47', 'ACTIVE', 'kilonewton', 'kN', 1000),
+    ('B48', 'ACTIVE', 'kilonewton metre', 'kN·m', 1000),
+    ('B49', 'ACTIVE', 'kiloohm', 'kΩ', 1000),
+    ('B5', 'MARKED_AS_DELETED', 'billet', None, None),
+    ('B50', 'ACTIVE', 'kiloohm metre', 'kΩ·m', 1000),
+    ('B51', 'DEPRECATED', 'kilopond', 'kp', 9.80665),
+    ('B52', 'ACTIVE', 'kilosecond', 'ks', 1000),
+    ('B53', 'ACTIVE', 'kilosiemens', 'kS', 1000),
+    ('B54', 'ACTIVE', 'kilosiemens per metre', 'kS/m', 1000.0),
+    ('B55', 'ACTIVE', 'kilovolt per metre', 'kV/m', 1000.0),
+    ('B56', 'ACTIVE', 'kiloweber per metre', 'kWb/m', 1000.0),
+    ('B57', 'ACTIVE', 'light year', 'ly', 9460730000000000.0),
+    ('B58', 'ACTIVE', 'litre per mole', 'l/mol', 0.001),
+    ('B59', 'ACTIVE', 'lumen hour', 'lm·h', 3600.0),
+    ('B6', 'MARKED_AS_DELETED', 'bun', None, None),
+    ('B60', 'ACTIVE', 'lumen per square metre', 'lm/m²', 1.0),
+    ('B61', 'ACTIVE', 'lumen per watt', 'lm/W', 1.0),
+    ('B62', 'ACTIVE', 'lumen second', 'lm·s', 1),
+    ('B63', 'ACTIVE', 'lux hour', 'lx·h', 3600.0),
+    ('B64', 'ACTIVE', 'lux second', 'lx·s', 1.0),
+    ('B65', 'DEPRECATED', 'maxwell', 'Mx', 1e-08),
+    ('B66', 'ACTIVE', 'megaampere per square metre', 'MA/m²', 1000000.0),
+    ('B67', 'ACTIVE', 'megabecquerel per kilogram', 'MBq/kg', 1000000.0),
+    ('B68', 'ACTIVE', 'gigabit', 'Gbit', None),
+    ('B69', 'ACTIVE', 'megacoulomb per cubic metre', 'MC/m³', 1000000.0),
+    ('B7', 'ACTIVE', 'cycle', None, None),
+    ('B70', 'ACTIVE', 'megacoulomb per square metre', 'MC/m²', 1000000.0),
+    ('B71', 'ACTIVE', 'megaelectronvolt', 'MeV', 1000000),
+    ('B72', 'ACTIVE', 'megagram per cubic metre', 'Mg/m³', 1000.0),
+    ('B73', 'ACTIVE', 'meganewton', 'MN', 1000000),
+    ('B74', 'ACTIVE', 'meganewton metre', 'MN·m', 1000000),
+    ('B75', 'ACTIVE', 'megaohm', 'MΩ', 1000000),
+    ('B76', 'ACTIVE', 'megaohm metre', 'MΩ·m', 1000000),
+    ('B77', 'ACTIVE', 'megasiemens per metre', 'MS/m', 1000000.0),
+    ('B78', 'ACTIVE', 'megavolt', 'MV', 1000000),
+    ('B79', 'ACTIVE', 'megavolt per metre', 'MV/m', 1000000.0),
+    ('B8', 'ACTIVE', 'joule per cubic metre', 'J/m³', 1.0),
+    ('B80', 'ACTIVE', 'gigabit per second', 'Gbit/s', None),
+    ('B81', 'ACTIVE', 'reciprocal metre squared reciprocal second', 'm⁻²/s', 1.0),
+    ('B82', 'ACTIVE', 'inch per linear foot', None, None),
+    ('B83', 'ACTIVE', 'metre to the fourth power', 'm⁴', 1),
+    ('B84', 'ACTIVE', 'microampere', 'µA', 1e-06),
+    ('B85', 'ACTIVE', 'microbar', 'µbar', 0.1),
+    ('B86', 'ACTIVE', 'microcoulomb', 'µC', 1e-06),
+    ('B87', 'ACTIVE', 'microcoulomb per cubic metre', 'µC/m³', 1e-06),
+    ('B88', 'ACTIVE', 'microcoulomb per square metre', 'µC/m²', 1e-06),
+    ('B89', 'ACTIVE', 'microfarad per metre', 'µF/m', 1e-06),
+    ('B9', 'MARKED_AS_DELETED', 'batt', None, None),
+    ('B90', 'ACTIVE', 'microhenry', 'µH', 1e-06),
+    ('B91', 'ACTIVE', 'microhenry per metre', 'µH/m', 1e-06),
+    ('B92', 'ACTIVE', 'micronewton', 'µN', 1e-06),
+    ('B93', 'ACTIVE', 'micronewton metre', 'µN·m', 1e-06),
+    ('B94', 'ACTIVE', 'microohm', 'µΩ', 1e-06),
+    ('B95', 'ACTIVE', 'microohm metre', 'µΩ·m', 1e-06),
+    ('B96', 'ACTIVE', 'micropascal', 'µPa', 1e-06),
+    ('B97', 'ACTIVE', 'microradian', 'µrad', 1e-06),
+    ('B98', 'ACTIVE', 'microsecond', 'µs', 1e-06),
+    ('B99', 'ACTIVE', 'microsiemens', 'µS', 1e-06),
+    ('BAR', 'ACTIVE', 'bar [unit of pressure]', 'bar', 100000),
+    ('BB', 'ACTIVE', 'base box', None, None),
+    ('BD', 'MARKED_AS_DELETED', 'board', None, None),
+    ('BE', 'MARKED_AS_DELETED', 'bundle', None, None),
+    ('BFT', 'ACTIVE', 'board foot', 'fbm', None),
+    ('BG', 'MARKED_AS_DELETED', 'bag', None, None),
+    ('BH', 'MARKED_AS_DELETED', 'brush', None, None),
+    ('BHP', 'ACTIVE', 'brake horse power', 'BHP', 745.6999999999999),
+    ('BIL', 'ACTIVE', 'billion (EUR)', None, 1000000000000),
+    ('BJ', 'MARKED_AS_DELETED', 'bucket', None, None),
+    ('BK', 'MARKED_AS_DELETED', 'basket', None, None),
+    ('BL', 'MARKED_AS_DELETED', 'bale', None, None),
+    ('BLD', 'ACTIVE', 'dry barrel (US)', 'bbl (US)', 0.115627),
+    ('BLL', 'ACTIVE', 'barrel (US)', 'barrel (US)', 0.1589873),
+    ('BO', 'MARKED_AS_DELETED', 'bottle', None, None),
+    ('BP', 'ACTIVE', 'hundred board foot', None, None),
+    ('BPM', 'ACTIVE', 'beats per minute', 'BPM', 0.01667),
+    ('BQL', 'ACTIVE', 'becquerel', 'Bq', 2.7027e-11),
+    ('BR', 'MARKED_AS_DELETED', 'bar [unit of packaging]', None, None),
+    ('BT', 'MARKED_AS_DELETED', 'bolt', None, None),
+    ('BTU', 'ACTIVE', 'British thermal unit (international table)', 'BtuIT', 1055.056),
+    ('BUA', 'ACTIVE', 'bushel (US)', 'bu (US)', 0.03523907),
+    ('BUI', 'ACTIVE', 'bushel (UK)', 'bushel (UK)', 0.03636872),
+    ('BW', 'MARKED_AS_DELETED', 'base weight', None, None),
+    ('BX', 'MARKED_AS_DELETED', 'box', None, None),
+    ('BZ', 'MARKED_AS_DELETED', 'million BTUs', None, None),
+    ('C0', 'ACTIVE', 'call', None, None),
+    ('C1', 'MARKED_AS_DELETED', 'composite product pound (total weight)', None, None),
+    ('C10', 'ACTIVE', 'millifarad', 'mF', 0.001),
+    ('C11', 'ACTIVE', 'milligal', 'mGal', 1e-05),
+    ('C12', 'ACTIVE', 'milligram per metre', 'mg/m', 1e-06),
+    ('C13', 'ACTIVE', 'milligray', 'mGy', 0.001),
+    ('C14', 'ACTIVE', 'millihenry', 'mH', 0.001),
+    ('C15', 'ACTIVE', 'millijoule', 'mJ', 0.001),
+    ('C16', 'ACTIVE', 'millimetre per second', 'mm/s', 0.001),
+    ('C17', 'ACTIVE', 'millimetre squared per second', 'mm²/s', 1e-06),
+    ('C18', 'ACTIVE', 'millimole', 'mmol', 0.001),
+    ('C19', 'ACTIVE', 'mole per kilogram', 'mol/kg', 1.0),
+    ('C2', 'MARKED_AS_DELETED', 'carset', None, None),
+    ('C20', 'ACTIVE', 'millinewton', 'mN', 0.001),
+    ('C21', 'ACTIVE', 'kibibit', 'Kibit', None),
+    ('C22', 'ACTIVE', 'millinewton per metre', 'mN/m', 0.001),
+    ('C23', 'ACTIVE', 'milliohm metre', 'mΩ·m', 0.001),
+    ('C24', 'ACTIVE', 'millipascal second', 'mPa·s', 0.001),
+    ('C25', 'ACTIVE', 'milliradian', 'mrad', 0.001),
+    ('C26', 'ACTIVE', 'millisecond', 'ms', 0.001),
+    ('C27', 'ACTIVE', 'millisiemens', 'mS', 0.001),
+    ('C28', 'ACTIVE', 'millisievert', 'mSv', 0.001),
+    ('C29', 'ACTIVE', 'millitesla', 'mT', 0.001),
+    ('C3', 'ACTIVE', 'microvolt per metre', 'µV/m', 1e-06),
+    ('C30', 'ACTIVE', 'millivolt per metre', 'mV/m', 0.001),
+    ('C31', 'ACTIVE', 'milliwatt', 'mW', 0.001),
+    ('C32', 'ACTIVE', 'milliwatt per square metre', 'mW/m²', 0.001),
+    ('C33', 'ACTIVE', 'milliweber', 'mWb', 0.001),
+    ('C34', 'ACTIVE', 'mole', 'mol', 1),
+    ('C35', 'ACTIVE', 'mole per cubic decimetre', 'mol/dm³', 1000.0),
+    ('C36', 'ACTIVE', 'mole per cubic metre', 'mol/m³', 1.0),
+    ('C37', 'ACTIVE', 'kilobit', 'kbit', None),
+    ('C38', 'ACTIVE', 'mole per litre', 'mol/l', 1000.0),
+    ('C39', 'ACTIVE', 'nanoampere', 'nA', 1e-09),
+    ('C4', 'MARKED_AS_DELETED', 'carload', None, None),
+    ('C40', 'ACTIVE', 'nanocoulomb', 'nC', 1e-09),
+    ('C41', 'ACTIVE', 'nanofarad', 'nF', 1e-09),
+    ('C42', 'ACTIVE', 'nanofarad per metre', 'nF/m', 1e-09),
+    ('C43', 'ACTIVE', 'nanohenry', 'nH', 1e-09),
+    ('C44', 'ACTIVE', 'nanohenry per metre', 'nH/m', 1e-09),
+    ('C45', 'ACTIVE', 'nanometre', 'nm', 1e-09),
+    ('C46', 'ACTIVE', 'nanoohm metre', 'nΩ·m', 1e-09),
+    ('C47', 'ACTIVE', 'nanosecond', 'ns', 1e-09),
+    ('C48', 'ACTIVE', 'nanotesla', 'nT', 1e-09),
+    ('C49', 'ACTIVE', 'nanowatt', 'nW', 1e-09),
+    ('C5', 'MARKED_AS_DELETED', 'cost', None, None),
+    ('C50', 'ACTIVE', 'neper', 'Np', 1),
+    ('C51', 'ACTIVE', 'neper per second', 'Np/s', None),
+    ('C52', 'ACTIVE', 'picometre', 'pm', 1e-12),
+    ('C53', 'ACTIVE', 'newton metre second', 'N·m·s', 1),
+    ('C54', 'ACTIVE', 'newton metre squared per kilogram squared', 'N·m²/kg²', 1.0),
+    ('C55', 'ACTIVE', 'newton per square metre', 'N/m²', 1),
+    ('C56', 'ACTIVE', 'newton per square millimetre', 'N/mm²', 1000000),
+    ('C57', 'ACTIVE', 'newton second', 'N·s', 1),
+    ('C58', 'ACTIVE', 'newton second per metre', 'N·s/m', 1.0),
+    ('C59', 'ACTIVE', 'octave', None, None),
+    ('C6', 'MARKED_AS_DELETED', 'cell', None, None),
+    ('C60', 'ACTIVE', 'ohm centimetre', 'Ω·cm', 0.01),
+    ('C61', 'ACTIVE', 'ohm metre', 'Ω·m', 1),
+    ('C62', 'ACTIVE', 'one', '1', 1),
+    ('C63', 'ACTIVE', 'parsec', 'pc', 3.085678e+16),
+    ('C64', 'ACTIVE', 'pascal per kelvin', 'Pa/K', 1.0),
+    ('C65', 'ACTIVE', 'pascal second', 'Pa·s', 1),
+    ('C66', 'ACTIVE', 'pascal second per cubic metre', 'Pa·s/m³', 1.0),
+    ('C67', 'ACTIVE', 'pascal second per metre', 'Pa· s/m', 1.0),
+    ('C68', 'ACTIVE', 'petajoule', 'PJ', 1000000000000000),
+    ('C69', 'ACTIVE', 'phon', None, None),
+    ('C7', 'ACTIVE', 'centipoise', 'cP', 0.001),
+    ('C70', 'ACTIVE', 'picoampere', 'pA', 1e-12),
+    ('C71', 'ACTIVE', 'picocoulomb', 'pC', 1e-12),
+    ('C72', 'ACTIVE', 'picofarad per metre', 'pF/m', 1e-12),
+    ('C73', 'ACTIVE', 'picohenry', 'pH', 1e-12),
+    ('C74', 'ACTIVE', 'kilobit per second', 'kbit/s', 1000.0),
+    ('C75', 'ACTIVE', 'picowatt', 'pW', 1e-12),
+    ('C76', 'ACTIVE', 'picowatt per square metre', 'pW/m²', 1e-12),
+    ('C77', 'MARKED_AS_DELETED', 'pound gage', None, None),
+    ('C78', 'ACTIVE', 'poundforce', 'lbf', 4.448222),
+    ('C79', 'ACTIVE', 'kilovolt ampere hour', 'kVAh', None),
+    ('C8', 'ACTIVE', 'millicoulomb per kilogram', 'mC/kg', 0.001),
+    ('C80', 'ACTIVE', 'rad', 'rad', 0.01),
+    ('C81', 'ACTIVE', 'radian', 'rad', 1),
+    ('C82', 'ACTIVE', 'radian square metre per mole', 'rad·m²/mol', 1.0),
+    ('C83', 'ACTIVE', 'radian square metre per kilogram', 'rad·m²/kg', 1.0),
+    ('C84', 'ACTIVE', 'radian per metre', 'rad/m', 1.0),
+    ('C85', 'ACTIVE', 'reciprocal angstrom', 'Å⁻¹', 10000000000.0),
+    ('C86', 'ACTIVE', 'reciprocal cubic metre', 'm⁻³', 1.0),
+    ('C87', 'ACTIVE', 'reciprocal cubic metre per second', 'm⁻³/s', 1.0),
+    ('C88', 'ACTIVE', 'reciprocal electron volt per cubic metre', 'eV⁻¹/m³', 6.24146e+18),
+    ('C89', 'ACTIVE', 'reciprocal henry', 'H⁻¹', 1.0),
+    ('C9', 'ACTIVE', 'coil group', None, None),
+    ('C90', 'ACTIVE', 'reciprocal joule per cubic metre', 'J⁻¹/m³', 1.0),
+    ('C91', 'ACTIVE', 'reciprocal kelvin or kelvin to the power minus one', 'K⁻¹', 1.0),
+    ('C92', 'ACTIVE', 'reciprocal metre', 'm⁻¹', 1.0),
+    ('C93', 'ACTIVE', 'reciprocal square metre', 'm⁻²', 1.0),
+    ('C94', 'ACTIVE', 'reciprocal minute', 'min⁻¹', 0.016666669999999998),
+    ('C95', 'ACTIVE', 'reciprocal mole', 'mol⁻¹', 1.0),
+    ('C96', 'ACTIVE', 'reciprocal pascal or pascal to the power minus one', 'Pa⁻¹', 1.0),
+    ('C97', 'ACTIVE', 'reciprocal second', 's⁻¹', 1.0),
+    ('C98', 'MARKED_AS_DELETED', 'reciprocal second per cubic metre', 's⁻¹/m³', 1.0),
+    ('C99', 'ACTIVE', 'reciprocal second per metre squared', 's⁻¹/m²', 1.0),
+    ('CA', 'MARKED_AS_DELETED', 'can', None, None),
+    ('CCT', 'ACTIVE', 'carrying capacity in metric ton', None, None),
+    ('CDL', 'ACTIVE', 'candela', 'cd', 1),
+    ('CEL', 'ACTIVE', 'degree Celsius', '°C', 1),
+    ('CEN', 'ACTIVE', 'hundred', None, 100),
+    ('CG', 'ACTIVE', 'card', None, None),
+    ('CGM', 'ACTIVE', 'centigram', 'cg', 1e-05),
+    ('CH', 'MARKED_AS_DELETED', 'container', None, None),
+    ('CJ', 'MARKED_AS_DELETED', 'cone', None, None),
+    ('CK', 'MARKED_AS_DELETED', 'connector', None, None),
+    ('CKG', 'ACTIVE', 'coulomb per kilogram', 'C/kg', 1.0),
+    ('CL', 'MARKED_AS_DELETED', 'coil', None, None),
+    ('CLF', 'ACTIVE', 'hundred leave', None, None),
+    ('CLT', 'ACTIVE', 'centilitre', 'cl', 1e-05),
+    ('CMK', 'ACTIVE', 'square centimetre', 'cm²', 0.0001),
+    ('CMQ', 'ACTIVE', 'cubic centimetre', 'cm³', 1e-06),
+    ('CMT', 'ACTIVE', 'centimetre', 'cm', 0.01),
+    ('CNP', 'ACTIVE', 'hundred pack', None, None),
+    ('CNT', 'ACTIVE', 'cental (UK)', None, 45.359237),
+    ('CO', 'MARKED_AS_DELETED', 'carboy', None, None),
+    ('COU', 'ACTIVE', 'coulomb', 'C', 1),
+    ('CQ', 'MARKED_AS_DELETED', 'cartridge', None, None),
+    ('CR', 'MARKED_AS_DELETED', 'crate', None, None),
+    ('CS', 'MARKED_AS_DELETED', 'case', None, None),
+    ('CT', 'MARKED_AS_DELETED', 'carton', None, None),
+    ('CTG', 'ACTIVE', 'content gram', None, None),
+    ('CTM', 'ACTIVE', 'metric carat', None, 200),
+    ('CTN', 'ACTIVE', 'content ton (metric)', None, None),
+    ('CU', 'MARKED_AS_DELETED', 'cup', None, None),
+    ('CUR', 'ACTIVE', 'curie', 'Ci', 37000000000.0),
+    ('CV', 'MARKED_AS_DELETED', 'cover', None, None),
+    ('CWA', 'ACTIVE', 'hundred pound (cwt) / hundred weight (US)', 'cwt (US)', 45.3592),
+    ('CWI', 'ACTIVE', 'hundred weight (UK)', 'cwt (UK)', 50.80235),
+    ('CY', 'MARKED_AS_DELETED', 'cylinder', None, None),
+    ('CZ', 'MARKED_AS_DELETED', 'combo', None, None),
+    ('D03', 'ACTIVE', 'kilowatt hour per hour', 'kW·h/h', None),
+    ('D04', 'ACTIVE', 'lot [unit of weight]', None, None),
+    ('D1', 'ACTIVE', 'reciprocal second per steradian', 's⁻¹/sr', 1.0),
+    ('D10', 'ACTIVE', 'siemens per metre', 'S/m', 1.0),
+    ('D11', 'ACTIVE', 'mebibit', 'Mibit', None),
+    ('D12', 'ACTIVE', 'siemens square metre per mole', 'S·m²/mol', 1.0),
+    ('D13', 'ACTIVE', 'sievert', 'Sv', 1.0),
+    ('D14', 'MARKED_AS_DELETED', 'thousand linear yard', None, None),
+    ('D15', 'ACTIVE', 'sone', None, None),
+    ('D16', 'ACTIVE', 'square centimetre per erg', 'cm²/erg', 1000.0),
+    ('D17', 'ACTIVE', 'square centimetre per steradian erg', 'cm²/(sr·erg)', 1000.0),
+    ('D18', 'ACTIVE', 'metre kelvin', 'm·K', 1),
+    ('D19', 'ACTIVE', 'square metre kelvin per watt', 'm²·K/W', 1.0),
+    ('D2', 'ACTIVE', 'reciprocal second per steradian metre squared', 's⁻¹/(sr·m²)', 1.0),
+    ('D20', 'ACTIVE', 'square metre per joule', 'm²/J', 1.0),
+    ('D21', 'ACTIVE', 'square metre per kilogram', 'm²/kg', 1.0),
+    ('D22', 'ACTIVE', 'square metre per mole', 'm²/mol', 1.0),
+    ('D23', 'ACTIVE', 'pen gram (protein)', None, None),
+    ('D24', 'ACTIVE', 'square metre per steradian', 'm²/sr', 1.0),
+    ('D25', 'ACTIVE', 'square metre per steradian joule', 'm²/(sr·J)', 1.0),
+    ('D26', 'ACTIVE', 'square metre per volt second', 'm²/(V·s)', 1.0),
+    ('D27', 'ACTIVE', 'steradian', 'sr', 1),
+    ('D28', 'MARKED_AS_DELETED', 'syphon', None, None),
+    ('D29', 'ACTIVE', 'terahertz', 'THz', 1000000000000),
+    ('D30', 'ACTIVE', 'terajoule', 'TJ', 1000000000000),
+    ('D31', 'ACTIVE', 'terawatt', 'TW', 1000000000000),
+    ('D32', 'ACTIVE', 'terawatt hour', 'TW·h', 3600000000000000.0),
+    ('D33', 'ACTIVE', 'tesla', 'T', 1),
+    ('D34', 'ACTIVE', 'tex', 'tex (g/km)', 1e-06),
+    ('D35', 'DEPRECATED', 'calorie (thermochemical)', 'calth', 4.184),
+    ('D36', 'ACTIVE', 'megabit', 'Mbit', None),
+    ('D37', 'DEPRECATED', 'calorie (thermochemical) per gram kelvin', 'calth/(g·K)', 4184.0),
+    ('D38', 'DEPRECATED', 'calorie (thermochemical) per second centimetre kelvin', 'calth/(s·cm·K)', 418.4),
+    ('D39', 'DEPRECATED', 'calorie (thermochemical) per second square centimetre kelvin', 'calth/(s·cm²·K)', 41840.0),
+    ('D40', 'MARKED_AS_DELETED', 'thousand litre', None, 1),
+    ('D41', 'ACTIVE', 'tonne per cubic metre', 't/m³', 1000.0),
+    ('D42', 'ACTIVE', 'tropical year', 'y (tropical)', 31556924.999999996),
+    ('D43', 'ACTIVE', 'unified atomic mass unit', 'u', 1.660538782e-27),
+    ('D44', 'ACTIVE', 'var', 'var', 1),
+    ('D45', 'ACTIVE', 'volt squared per kelvin squared', 'V²/K²', 1.0),
+    ('D46', 'ACTIVE', 'volt  ampere', 'V·A', 1),
+    ('D47', 'ACTIVE', 'volt per centimetre', 'V/cm', 100.0),
+    ('D48', 'ACTIVE', 'volt per kelvin', 'V/K', 1.0),
+    ('D49', 'ACTIVE', 'millivolt per kelvin', 'mV/K', 0.001),
+    ('D5', 'ACTIVE', 'kilogram per square centimetre', 'kg/cm²', 10000.0),
+    ('D50', 'ACTIVE', 'volt per metre', 'V/m', 1.0),
+    ('D51', 'ACTIVE', 'volt per millimetre', 'V/mm', 1000.0),
+    ('D52', 'ACTIVE', 'watt per kelvin', 'W/K', 1.0),
+    ('D53', 'ACTIVE', 'watt per metre kelvin', 'W/(m·K)', 1.0),
+    ('D54', 'ACTIVE', 'watt per square metre', 'W/m²', 1.0),
+    ('D55', 'ACTIVE', 'watt per square metre kelvin', 'W/(m²·K)', 1.0),
+    ('D56', 'ACTIVE', 'watt per square metre kelvin to the fourth power', 'W/(m²·K⁴)', 1.0),
+    ('D57', 'ACTIVE', 'watt per steradian', 'W/sr', 1.0),
+    ('D58', 'ACTIVE', 'watt per steradian square metre', 'W/(sr·m²)', 1.0),
+    ('D59', 'ACTIVE', 'weber per metre', 'Wb/m', 1.0),
+    ('D6', 'ACTIVE', 'roentgen per second', 'R/s', 0.00025800000000000004),
+    ('D60', 'ACTIVE', 'weber per millimetre', 'Wb/mm', 1000.0),
+    ('D61', 'ACTIVE', 'minute [unit of angle]', "'", 0.0002908882),
+    ('D62', 'ACTIVE', 'second [unit of angle]', '"', 4.848137e-06),
+    ('D63', 'ACTIVE', 'book', None, None),
+    ('D64', 'MARKED_AS_DELETED', 'block', None, None),
+    ('D65', 'ACTIVE', 'round', None, None),
+    ('D66', 'MARKED_AS_DELETED', 'cassette', None, None),
+    ('D67', 'MARKED_AS_DELETED', 'dollar per hour', None, None),
+    ('D68', 'ACTIVE', 'number of words', None, None),
+    ('D69', 'ACTIVE', 'inch to the fourth power', 'in⁴', 4.162314e-07),
+    ('D7', 'MARKED_AS_DELETED', 'sandwich', None, None),
+    ('D70', 'DEPRECATED', 'calorie (international table)', 'calIT', 4.1868),
+    ('D71', 'DEPRECATED', 'calorie (international table) per second centimetre kelvin', 'calIT/(s·cm·K)', 418.68),
+    ('D72', 'DEPRECATED', 'calorie (international table) per second square centimetre kelvin', 'calIT/(s·cm²·K)', 41868.0),
+    ('D73', 'ACTIVE', 'joule square metre', 'J·m²', 1),
+    ('D74', 'ACTIVE', 'kilogram per mole', 'kg/mol', 1.0),
+    ('D75', 'DEPRECATED', 'calorie (international table) per gram', 'calIT/g', 4186.8),
+    ('D76', 'DEPRECATED', 'calorie (international table) per gram kelvin', 'calIT/(g·K)', 4186.8),
+    ('D77', 'ACTIVE', 'megacoulomb', 'MC', 1000000),
+    ('D78', 'ACTIVE', 'megajoule per second', 'MJ/s', None),
+    ('D79', 'MARKED_AS_DELETED', 'beam', None, None),
+    ('D8', 'MARKED_AS_DELETED', 'draize score', None, None),
+    ('D80', 'ACTIVE', 'microwatt', 'µW', 1e-06),
+    ('D81', 'ACTIVE', 'microtesla', 'µT', 1e-06),
+    ('D82', 'ACTIVE', 'microvolt', 'µV', 1e-06),
+    ('D83', 'ACTIVE', 'millinewton metre', 'mN·m', 0.001),
+    ('D85', 'ACTIVE', 'microwatt per square metre', 'µW/m²', 1e-06),
+    ('D86', 'ACTIVE', 'millicoulomb', 'mC', 0.001),
+    ('D87', 'ACTIVE', 'millimole per kilogram', 'mmol/kg', 0.001),
+    ('D88', 'ACTIVE', 'millicoulomb per cubic metre', 'mC/m³', 0.001),
+    ('D89', 'ACTIVE', 'millicoulomb per square metre', 'mC/m²', 0.001),
+    ('D9', 'DEPRECATED', 'dyne per square centimetre', 'dyn/cm²', 0.1),
+    ('D90', 'MARKED_AS_DELETED', 'cubic metre (net)', None, None),
+    ('D91', 'ACTIVE', 'rem', 'rem', 0.01),
+    ('D92', 'MARKED_AS_DELETED', 'band', None, None),
+    ('D93', 'ACTIVE', 'second per cubic metre', 's/m³', 1.0),
+    ('D94', 'ACTIVE', 'second per cubic metre radian', 's/(rad·m³)', 1.0),
+    ('D95', 'ACTIVE', 'joule per gram', 'J/g', 1000.0),
+    ('D96', 'MARKED_AS_DELETED', 'pound gross', None, None),
+    ('D97', 'MARKED_AS_DELETED', 'pallet/unit load', None, None),
+    ('D98', 'MARKED_AS_DELETED', 'mass pound', None, None),
+    ('D99', 'MARKED_AS_DELETED', 'sleeve', None, None),
+    ('DAA', 'ACTIVE', 'decare', 'daa', 1000),
+    ('DAD', 'ACTIVE', 'ten day', None, None),
+    ('DAY', 'ACTIVE', 'day', 'd', 86400),
+    ('DB', 'ACTIVE', 'dry pound', None, None),
+    ('DC', 'MARKED_AS_DELETED', 'disk (disc)', None, None),
+    ('DD', 'ACTIVE', 'degree [unit of angle]', '°', 0.01745329),
+    ('DE', 'MARKED_AS_DELETED', 'deal', None, None),
+    ('DEC', 'ACTIVE', 'decade', None, None),
+    ('DG', 'ACTIVE', 'decigram', 'dg', 0.0001),
+    ('DI', 'MARKED_AS_DELETED', 'dispenser', None, None),
+    ('DJ', 'ACTIVE', 'decagram', 'dag', 0.01),
+    ('DLT', 'ACTIVE', 'decilitre', 'dl', 0.0001),
+    ('DMA', 'ACTIVE', 'cubic decametre', 'dam³', 1000),
+    ('DMK', 'ACTIVE', 'square decimetre', 'dm²', 0.01),
+    ('DMO', 'ACTIVE', 'standard kilolitre', None, None),
+    ('DMQ', 'ACTIVE', 'cubic decimetre', 'dm³', 0.001),
+    ('DMT', 'ACTIVE', 'decimetre', 'dm', 0.1),
+    ('DN', 'ACTIVE', 'decinewton metre', 'dN·m', 0.1),
+    ('DPC', 'ACTIVE', 'dozen piece', None, None),
+    ('DPR', 'ACTIVE', 'dozen pair', None, None),
+    ('DPT', 'ACTIVE', 'displacement tonnage', None, None),
+    ('DQ', 'MARKED_AS_DELETED', 'data record', None, None),
+    ('DR', 'MARKED_AS_DELETED', 'drum', None, None),
+    ('DRA', 'ACTIVE', 'dram (US)', None, 3.887935),
+    ('DRI', 'ACTIVE', 'dram (UK)', None, 1.771745),
+    ('DRL', 'ACTIVE', 'dozen roll', None, None),
+    ('DRM', 'MARKED_AS_DELETED', 'drachm (UK)', None, 3.887935),
+    ('DS', 'MARKED_AS_DELETED', 'display', None, None),
+    ('DT', 'ACTIVE', 'dry ton', None, None),
+    ('DTN', 'ACTIVE', 'decitonne', 'dt or dtn', 100),
+    ('DU', 'DEPRECATED', 'dyne', 'dyn', 1e-05),
+    ('DWT', 'ACTIVE', 'pennyweight', None, 1.555174),
+    ('DX', 'DEPRECATED', 'dyne per centimetre', 'dyn/cm', 0.001),
+    ('DY', 'MARKED_AS_DELETED', 'directory book', None, None),
+    ('DZN', 'ACTIVE', 'dozen', 'DOZ', 12),
+    ('DZP', 'ACTIVE', 'dozen pack', None, None),
+    ('E01', 'ACTIVE', 'newton per square centimetre', 'N/cm²', 10000),
+    ('E07', 'ACTIVE', 'megawatt hour per hour', 'MW·h/h', None),
+    ('E08', 'ACTIVE', 'megawatt per hertz', 'MW/Hz', None),
+    ('E09', 'ACTIVE', 'milliampere hour', 'mA·h', 3.6),
+    ('E10', 'ACTIVE', 'degree day', 'deg da', None),
+    ('E11', 'DEPRECATED', 'gigacalorie', None, 1000000000),
+    ('E12', 'ACTIVE', 'mille', None, None),
+    ('E14', 'ACTIVE', 'kilocalorie (international table)', 'kcalIT', 4186.8),
+    ('E15', 'ACTIVE', 'kilocalorie (thermochemical) per hour', 'kcalth/h', 1.16222),
+    ('E16', 'ACTIVE', 'million Btu(IT) per hour', 'BtuIT/h', 293071.1),
+    ('E17', 'ACTIVE', 'cubic foot per second', 'ft³/s', 0.028316849999999998),
+    ('E18', 'ACTIVE', 'tonne per hour', 't/h', 0.277778),
+    ('E19', 'ACTIVE', 'ping', None, 3.305),
+    ('E2', 'MARKED_AS_DELETED', 'belt', None, None),
+    ('E20', 'ACTIVE', 'megabit per second', 'Mbit/s', None),
+    ('E21', 'ACTIVE', 'shares', None, None),
+    ('E22', 'ACTIVE', 'TEU', None, None),
+    ('E23', 'ACTIVE', 'tyre', None, None),
+    ('E25', 'ACTIVE', 'active unit', None, None),
+    ('E27', 'ACTIVE', 'dose', None, None),
+    ('E28', 'ACTIVE', 'air dry ton', None, None),
+    ('E3', 'MARKED_AS_DELETED', 'trailer', None, None),
+    ('E30', 'ACTIVE', 'strand', None, None),
+    ('E31', 'ACTIVE', 'square metre per litre', 'm²/l', None),
+    ('E32', 'ACTIVE', 'litre per hour', 'l/h', 2.77778e-07),
+    ('E33', 'ACTIVE', 'foot per thousand', None, 0.00030480000000000004),
+    ('E34', 'ACTIVE', 'gigabyte', 'Gbyte', None),
+    ('E35', 'ACTIVE', 'terabyte', 'Tbyte', None),
+    ('E36', 'ACTIVE', 'petabyte', 'Pbyte', None),
+    ('E37', 'ACTIVE', 'pixel', None, None),
+    ('E38', 'ACTIVE', 'megapixel', None, None),
+    ('E39', 'ACTIVE', 'dots per inch', 'dpi', None),
+    ('E4', 'ACTIVE', 'gross kilogram', None, None),
+    ('E40', 'ACTIVE', 'part per hundred thousand', 'ppht', 1e-05),
+    ('E41', 'ACTIVE', 'kilogramforce per square millimetre', 'kgf/mm²', 9806650.0),
+    ('E42', 'ACTIVE', 'kilogramforce per square centimetre', 'kgf/cm²', 98066.5),
+    ('E43', 'ACTIVE', 'joule per square centimetre', 'J/cm²', 10000.0),
+    ('E44', 'ACTIVE', 'kilogramforce metre per square centimetre', 'kgf·m/cm²', None),
+    ('E45', 'ACTIVE', 'milliohm', 'mΩ', 0.001),
+    ('E46', 'ACTIVE', 'kilowatt hour per cubic metre', 'kW·h/m³', 3600000.0),
+    ('E47', 'ACTIVE', 'kilowatt hour per kelvin', 'kW·h/K', 3600000.0),
+    ('E48', 'ACTIVE', 'service unit', None, None),
+    ('E49', 'ACTIVE', 'working day', None, None),
+    ('E5', 'MARKED_AS_DELETED', 'metric long ton', None, None),
+    ('E50', 'ACTIVE', 'accounting unit', None, None),
+    ('E51', 'ACTIVE', 'job', None, None),
+    ('E52', 'ACTIVE', 'run foot', None, None),
+    ('E53', 'ACTIVE', 'test', None, None),
+    ('E54', 'ACTIVE', 'trip', None, None),
+    ('E55', 'ACTIVE', 'use', None, None),
+    ('E56', 'ACTIVE', 'well', None, None),
+    ('E57', 'ACTIVE', 'zone', None, None),
+    ('E58', 'ACTIVE', 'exabit per second', 'Ebit/s', None),
+    ('E59', 'ACTIVE', 'exbibyte', 'Eibyte', None),
+    ('E60', 'ACTIVE', 'pebibyte', 'Pibyte', None),
+    ('E61', 'ACTIVE', 'tebibyte', 'Tibyte', None),
+    ('E62', 'ACTIVE', 'gibibyte', 'Gibyte', None),
+    ('E63', 'ACTIVE', 'mebibyte', 'Mibyte', None),
+    ('E64', 'ACTIVE', 'kibibyte', 'Kibyte', None),
+    ('E65', 'ACTIVE', 'exbibit per metre', 'Eibit/m', None),
+    ('E66', 'ACTIVE', 'exbibit per square metre', 'Eibit/m²', None),
+    ('E67', 'ACTIVE', 'exbibit per cubic metre', 'Eibit/m³', None),
+    ('E68', 'ACTIVE', 'gigabyte per second', 'Gbyte/s', None),
+    ('E69', 'ACTIVE', 'gibibit per metre', 'Gibit/m', None),
+    ('E70', 'ACTIVE', 'gibibit per square metre', 'Gibit/m²', None),
+    ('E71', 'ACTIVE', 'gibibit per cubic metre', 'Gibit/m³', None),
+    ('E72', 'ACTIVE', 'kibibit per metre', 'Kibit/m', None),
+    ('E73', 'ACTIVE', 'kibibit per square metre', 'Kibit/m²', None),
+    ('E74', 'ACTIVE', 'kibibit per cubic metre', 'Kibit/m³', None),
+    ('E75', 'ACTIVE', 'mebibit per metre', 'Mibit/m', None),
+    ('E76', 'ACTIVE', 'mebibit per square metre', 'Mibit/m²', None),
+    ('E77', 'ACTIVE', 'mebibit per cubic metre', 'Mibit/m³', None),
+    ('E78', 'ACTIVE', 'petabit', 'Pbit', None),
+    ('E79', 'ACTIVE', 'petabit per second', 'Pbit/s', None),
+    ('E80', 'ACTIVE', 'pebibit per metre', 'Pibit/m', None),
+    ('E81', 'ACTIVE', 'pebibit per square metre', 'Pibit/m²', None),
+    ('E82', 'ACTIVE', 'pebibit per cubic metre', 'Pibit/m³', None),
+    ('E83', 'ACTIVE', 'terabit', 'Tbit', None),
+    ('E84', 'ACTIVE', 'terabit per second', 'Tbit/s', None),
+    ('E85', 'ACTIVE', 'tebibit per metre', 'Tibit/m', None),
+    ('E86', 'ACTIVE', 'tebibit per cubic metre', 'Tibit/m³', None),
+    ('E87', 'ACTIVE', 'tebibit per square metre', 'Tibit/m²', None),
+    ('E88', 'ACTIVE', 'bit per metre', 'bit/m', None),
+    ('E89', 'ACTIVE', 'bit per square metre', 'bit/m²', None),
+    ('E90', 'ACTIVE', 'reciprocal centimetre', 'cm⁻¹', 100.0),
+    ('E91', 'ACTIVE', 'reciprocal day', 'd⁻¹', 1.1574100000000002e-05),
+    ('E92', 'ACTIVE', 'cubic decimetre per hour', 'dm³/h', 2.77778e-07),
+    ('E93', 'ACTIVE', 'kilogram per hour', 'kg/h', 0.000277778),
+    ('E94', 'ACTIVE', 'kilomole per second', 'kmol/s', 1000.0),
+    ('E95', 'ACTIVE', 'mole per second', 'mol/s', 1.0),
+    ('E96', 'ACTIVE', 'degree per second', '°/s', 0.01745329),
+    ('E97', 'ACTIVE', 'millimetre per degree Celcius metre', 'mm/(°C·m)', 0.001),
+    ('E98', 'ACTIVE', 'degree Celsius per kelvin', '°C/K', 1),
+    ('E99', 'ACTIVE', 'hectopascal per bar', 'hPa/bar', 0.001),
+    ('EA', 'ACTIVE', 'each', None, None),
+    ('EB', 'ACTIVE', 'electronic mail box', None, None),
+    ('EC', 'MARKED_AS_DELETED', 'each per month', None, None),
+    ('EP', 'MARKED_AS_DELETED', 'eleven pack', None, None),
+    ('EQ', 'ACTIVE', 'equivalent gallon', None, None),
+    ('EV', 'MARKED_AS_DELETED', 'envelope', None, None),
+    ('F01', 'ACTIVE', 'bit per cubic metre', 'bit/m³', None),
+    ('F02', 'ACTIVE', 'kelvin per kelvin', 'K/K', 1),
+    ('F03', 'ACTIVE', 'kilopascal per bar', 'kPa/bar', 0.01),
+    ('F04', 'ACTIVE', 'millibar per bar', 'mbar/bar', 0.001),
+    ('F05', 'ACTIVE', 'megapascal per bar', 'MPa/bar', 10),
+    ('F06', 'ACTIVE', 'poise per bar', 'P/bar', 1e-06),
+    ('F07', 'ACTIVE', 'pascal per bar', 'Pa/bar', 1e-05),
+    ('F08', 'ACTIVE', 'milliampere per inch', 'mA/in', 0.0393700787401575),
+    ('F1', 'MARKED_AS_DELETED', 'thousand cubic foot per day', None, None),
+    ('F10', 'ACTIVE', 'kelvin per hour', 'K/h', 0.000277778),
+    ('F11', 'ACTIVE', 'kelvin per minute', 'K/min', 0.016666700000000003),
+    ('F12', 'ACTIVE', 'kelvin per second', 'K/s', 1.0),
+    ('F13', 'ACTIVE', 'slug', 'slug', 14.5939),
+    ('F14', 'ACTIVE', 'gram per kelvin', 'g/K', 0.001),
+    ('F15', 'ACTIVE', 'kilogram per kelvin', 'kg/K', 1.0),
+    ('F16', 'ACTIVE', 'milligram per kelvin', 'mg/K', 1e-06),
+    ('F17', 'ACTIVE', 'poundforce per foot', 'lbf/ft', 14.5939),
+    ('F18', 'ACTIVE', 'kilogram square centimetre', 'kg·cm²', 0.0001),
+    ('F19', 'ACTIVE', 'kilogram square millimetre', 'kg·mm²', 1e-06),
+    ('F20', 'ACTIVE', 'pound inch squared', 'lb·in²', 0.00029263970000000005),
+    ('F21', 'ACTIVE', 'poundforce inch', 'lbf·in', 0.112985),
+    ('F22', 'ACTIVE', 'poundforce foot per ampere', 'lbf·ft/A', 1.35582),
+    ('F23', 'ACTIVE', 'gram per cubic decimetre', 'g/dm³', 1.0),
+    ('F24', 'ACTIVE', 'kilogram per kilomol', 'kg/kmol', 0.001),
+    ('F25', 'ACTIVE', 'gram per hertz', 'g/Hz', 0.001),
+    ('F26', 'ACTIVE', 'gram per day', 'g/d', 1.15741e-08),
+    ('F27', 'ACTIVE', 'gram per hour', 'g/h', 2.77778e-07),
+    ('F28', 'ACTIVE', 'gram per minute', 'g/min', 1.66667e-05),
+    ('F29', 'ACTIVE', 'gram per second', 'g/s', 0.001),
+    ('F30', 'ACTIVE', 'kilogram per day', 'kg/d', 1.1574100000000002e-05),
+    ('F31', 'ACTIVE', 'kilogram per minute', 'kg/min', 0.016666700000000003),
+    ('F32', 'ACTIVE', 'milligram per day', 'mg/d', 1.15741e-11),
+    ('F33', 'ACTIVE', 'milligram per minute', 'mg/min', 1.66667e-08),
+    ('F34', 'ACTIVE', 'milligram per second', 'mg/s', 1e-06),
+    ('F35', 'ACTIVE', 'gram per day kelvin', 'g/(d·K)', 1.15741e-08),
+    ('F36', 'ACTIVE', 'gram per hour kelvin', 'g/(h·K)', 2.77778e-07),
+    ('F37', 'ACTIVE', 'gram per minute kelvin', 'g/(min·K)', 1.66667e-05),
+    ('F38', 'ACTIVE', 'gram per second kelvin', 'g/(s·K)', 0.001),
+    ('F39', 'ACTIVE', 'kilogram per day kelvin', 'kg/(d·K)', 1.1574100000000002e-05),
+    ('F40', 'ACTIVE', 'kilogram per hour kelvin', 'kg/(h·K)', 0.000277778),
+    ('F41', 'ACTIVE', 'kilogram per minute kelvin', 'kg/(min·K)', 0.016666700000000003),
+    ('F42', 'ACTIVE', 'kilogram per second kelvin', 'kg/(s·K)', 1.0),
+    ('F43', 'ACTIVE', 'milligram per day kelvin', 'mg/(d·K)', 1.15741e-11),
+    ('F44', 'ACTIVE', 'milligram per hour kelvin', 'mg/(h·K)', 2.77778e-10),
+    ('F45', 'ACTIVE', 'milligram per minute kelvin', 'mg/(min·K)', 1.66667e-08),
+    ('F46', 'ACTIVE', 'milligram per second kelvin', 'mg/(s·K)', 1e-06),
+    ('F47', 'ACTIVE', 'newton per millimetre', 'N/mm', 1000.0),
+    ('F48', 'ACTIVE', 'poundforce per inch', 'lbf/in', 175.127),
+    ('F49', 'ACTIVE', 'rod [unit of distance]', 'rd (US)', 5.02921),
+    ('F50', 'ACTIVE', 'micrometre per kelvin', 'µm/K', 1e-06),
+    ('F51', 'ACTIVE', 'centimetre per kelvin', 'cm/K', 0.01),
+    ('F52', 'ACTIVE', 'metre per kelvin', 'm/K', 1.0),
+    ('F53', 'ACTIVE', 'millimetre per kelvin', 'mm/K', 0.001),
+    ('F54', 'ACTIVE', 'milliohm per metre', 'mΩ/m', 0.001),
+    ('F55', 'ACTIVE', 'ohm per mile (statute mile)', 'Ω/mi', 0.000621371),
+    ('F56', 'ACTIVE', 'ohm per kilometre', 'Ω/km', 0.001),
+    ('F57', 'ACTIVE', 'milliampere per poundforce per square inch', 'mA/(lbf/in²)', 1.45038e-07),
+    ('F58', 'ACTIVE', 'reciprocal bar', '1/bar', 1.0),
+    ('F59', 'ACTIVE', 'milliampere per bar', 'mA/bar', 1e-08),
+    ('F60', 'ACTIVE', 'degree Celsius per bar', '°C/bar', 1e-05),
+    ('F61', 'ACTIVE', 'kelvin per bar', 'K/bar', 1e-05),
+    ('F62', 'ACTIVE', 'gram per day bar', 'g/(d·bar)', 1.1574100000000002e-13),
+    ('F63', 'ACTIVE', 'gram per hour bar', 'g/(h·bar)', 2.77778e-12),
+    ('F64', 'ACTIVE', 'gram per minute bar', 'g/(min·bar)', 1.66667e-10),
+    ('F65', 'ACTIVE', 'gram per second bar', 'g/(s·bar)', 1e-08),
+    ('F66', 'ACTIVE', 'kilogram per day bar', 'kg/(d·bar)', 1.1574100000000001e-10),
+    ('F67', 'ACTIVE', 'kilogram per hour bar', 'kg/(h·bar)', 2.77778e-09),
+    ('F68', 'ACTIVE', 'kilogram per minute bar', 'kg/(min·bar)', 1.66667e-07),
+    ('F69', 'ACTIVE', 'kilogram per second bar', 'kg/(s·bar)', 1e-05),
+    ('F70', 'ACTIVE', 'milligram per day bar', 'mg/(d·bar)', 1.15741e-16),
+    ('F71', 'ACTIVE', 'milligram per hour bar', 'mg/(h·bar)', 2.77778e-15),
+    ('F72', 'ACTIVE', 'milligram per minute bar', 'mg/(min·bar)', 1.6666700000000002e-13),
+    ('F73', 'ACTIVE', 'milligram per second bar', 'mg/(s·bar)', 1e-11),
+    ('F74', 'ACTIVE', 'gram per bar', 'g/bar', 1e-08),
+    ('F75', 'ACTIVE', 'milligram per bar', 'mg/bar', 1e-11),
+    ('F76', 'ACTIVE', 'milliampere per millimetre', 'mA/mm', 1.0),
+    ('F77', 'ACTIVE', 'pascal second per kelvin', 'Pa.s/K', 1.0),
+    ('F78', 'ACTIVE', 'inch of water', 'inH₂O', 249.08899999999997),
+    ('F79', 'ACTIVE', 'inch of mercury', 'inHg', 3386.39),
+    ('F80', 'ACTIVE', 'water horse power', None, 746.043),
+    ('F81', 'ACTIVE', 'bar per kelvin', 'bar/K', 100000.0),
+    ('F82', 'ACTIVE', 'hectopascal per kelvin', 'hPa/K', 100.0),
+    ('F83', 'ACTIVE', 'kilopascal per kelvin', 'kPa/K', 1000.0),
+    ('F84', 'ACTIVE', 'millibar per kelvin', 'mbar/K', 100.0),
+    ('F85', 'ACTIVE', 'megapascal per kelvin', 'MPa/K', 1000000.0),
+    ('F86', 'ACTIVE', 'poise per kelvin', 'P/K', 0.1),
+    ('F87', 'ACTIVE', 'volt per litre minute', 'V/(l·min)', 16.666700000000002),
+    ('F88', 'ACTIVE', 'newton centimetre', 'N·cm', 0.01),
+    ('F89', 'ACTIVE', 'newton metre per degree', 'Nm/°', 57.295788),
+    ('F9', 'MARKED_AS_DELETED', 'fibre per cubic centimetre of air', None, None),
+    ('F90', 'ACTIVE', 'newton metre per ampere', 'N·m/A', 1.0),
+    ('F91', 'ACTIVE', 'bar litre per second', 'bar·l/s', 100.0),
+    ('F92', 'ACTIVE', 'bar cubic metre per second', 'bar·m³/s', 100000.0),
+    ('F93', 'ACTIVE', 'hectopascal litre per second', 'hPa·l/s', 0.1),
+    ('F94', 'ACTIVE', 'hectopascal cubic metre per second', 'hPa·m³/s', 100.0),
+    ('F95', 'ACTIVE', 'millibar litre per second', 'mbar·l/s', 0.1),
+    ('F96', 'ACTIVE', 'millibar cubic metre per second', 'mbar·m³/s', 100.0),
+    ('F97', 'ACTIVE', 'megapascal litre per second', 'MPa·l/s', 1000.0),
+    ('F98', 'ACTIVE', 'megapascal cubic metre per second', 'MPa·m³/s', 1000000.0),
+    ('F99', 'ACTIVE', 'pascal litre per second', 'Pa·l/s', 0.001),
+    ('FAH', 'ACTIVE', 'degree Fahrenheit', '°F', 0.5555555555555556),
+    ('FAR', 'ACTIVE', 'farad', 'F', 1),
+    ('FB', 'MARKED_AS_DELETED', 'field', None, None),
+    ('FBM', 'ACTIVE', 'fibre metre', None, None),
+    ('FC', 'ACTIVE', 'thousand cubic foot', 'kft³', None),
+    ('FD', 'MARKED_AS_DELETED', 'million particle per cubic foot', None, None),
+    ('FE', 'MARKED_AS_DELETED', 'track foot', None, None),
+    ('FF', 'ACTIVE', 'hundred cubic metre', None, None),
+    ('FG', 'MARKED_AS_DELETED', 'transdermal patch', None, None),
+    ('FH', 'ACTIVE', 'micromole', 'µmol', 1e-06),
+    ('FIT', 'ACTIVE', 'failures in time', 'FIT', 2.77778e-13),
+    ('FL', 'ACTIVE', 'flake ton', None, None),
+    ('FM', 'MARKED_AS_DELETED', 'million cubic foot', 'Mft³', None),
+    ('FOT', 'ACTIVE', 'foot', 'ft', 0.3048),
+    ('FP', 'ACTIVE', 'pound per square foot', 'lb/ft²', 4.882428),
+    ('FR', 'ACTIVE', 'foot per minute', 'ft/min', 0.00508),
+    ('FS', 'ACTIVE', 'foot per second', 'ft/s', 0.3048),
+    ('FTK', 'ACTIVE', 'square foot', 'ft²', 0.09290304),
+    ('FTQ', 'ACTIVE', 'cubic foot', 'ft³', 0.028316849999999998),
+    ('G01', 'ACTIVE', 'pascal cubic metre per second', 'Pa·m³/s', 1.0),
+    ('G04', 'ACTIVE', 'centimetre per bar', 'cm/bar', 1e-07),
+    ('G05', 'ACTIVE', 'metre per bar', 'm/bar', 1e-05),
+    ('G06', 'ACTIVE', 'millimetre per bar', 'mm/bar', 1e-08),
+    ('G08', 'ACTIVE', 'square inch per second', 'in²/s', 0.00064516),
+    ('G09', 'ACTIVE', 'square metre per second kelvin', 'm²/(s·K)', 1.0),
+    ('G10', 'ACTIVE', 'stokes per kelvin', 'St/K', 0.0001),
+    ('G11', 'ACTIVE', 'gram per cubic centimetre bar', 'g/(cm³·bar)', 0.01),
+    ('G12', 'ACTIVE', 'gram per cubic decimetre bar', 'g/(dm³·bar)', 1e-05),
+    ('G13', 'ACTIVE', 'gram per litre bar', 'g/(l·bar)', 1e-05),
+    ('G14', 'ACTIVE', 'gram per cubic metre bar', 'g/(m³·bar)', 1e-08),
+    ('G15', 'ACTIVE', 'gram per millilitre bar', 'g/(ml·bar)', 0.01),
+    ('G16', 'ACTIVE', 'kilogram per cubic centimetre bar', 'kg/(cm³·bar)', 10.0),
+    ('G17', 'ACTIVE', 'kilogram per litre bar', 'kg/(l·bar)', 0.01),
+    ('G18', 'ACTIVE', 'kilogram per cubic metre bar', 'kg/(m³·bar)', 1e-05),
+    ('G19', 'ACTIVE', 'newton metre per kilogram', 'N·m/kg', 1.0),
+    ('G2', 'ACTIVE', 'US gallon per minute', 'gal (US) /min', 6.309020000000001e-05),
+    ('G20', 'ACTIVE', 'poundforce foot per pound', 'lbf·ft/lb', 2.98907),
+    ('G21', 'ACTIVE', 'cup [unit of volume]', 'cup (US)', 0.00023658820000000002),
+    ('G23', 'ACTIVE', 'peck', 'pk (US)', 0.008809768),
+    ('G24', 'ACTIVE', 'tablespoon (US)', 'tablespoon (US)', 1.4786760000000003e-05),
+    ('G25', 'ACTIVE', 'teaspoon (US)', 'teaspoon (US)', 4.928922e-06),
+    ('G26', 'ACTIVE', 'stere', 'st', 1),
+    ('G27', 'ACTIVE', 'cubic centimetre per kelvin', 'cm³/K', 1e-06),
+    ('G28', 'ACTIVE', 'litre per kelvin', 'l/K', 0.001),
+    ('G29', 'ACTIVE', 'cubic metre per kelvin', 'm³/K', 1.0),
+    ('G3', 'ACTIVE', 'Imperial gallon per minute', 'gal (UK) /min', 7.57682e-05),
+    ('G30', 'ACTIVE', 'millilitre per kelvin', 'ml/K', 1e-06),
+    ('G31', 'ACTIVE', 'kilogram per cubic centimetre', 'kg/cm³', 1000000.0),
+    ('G32', 'ACTIVE', 'ounce (avoirdupois) per cubic yard', 'oz/yd³', 0.0370798),
+    ('G33', 'ACTIVE', 'gram per cubic centimetre kelvin', 'g/(cm³·K)', 1000.0),
+    ('G34', 'ACTIVE', 'gram per cubic decimetre kelvin', 'g/(dm³·K)', 1.0),
+    ('G35', 'ACTIVE', 'gram per litre kelvin', 'g/(l·K)', 1.0),
+    ('G36', 'ACTIVE', 'gram per cubic metre kelvin', 'g/(m³·K)', 0.001),
+    ('G37', 'ACTIVE', 'gram per millilitre kelvin', 'g/(ml·K)', 1000.0),
+    ('G38', 'ACTIVE', 'kilogram per cubic centimetre kelvin', 'kg/(cm³·K)', 1000000.0),
+    ('G39', 'ACTIVE', 'kilogram per litre kelvin', 'kg/(l·K)', 1000.0),
+    ('G40', 'ACTIVE', 'kilogram per cubic metre kelvin', 'kg/(m³·K)', 1.0),
+    ('G41', 'ACTIVE', 'square metre per second bar', 'm²/(s·bar)', 1e-05),
+    ('G42', 'ACTIVE', 'microsiemens per centimetre', 'µS/cm', 0.0001),
+    ('G43', 'ACTIVE', 'microsiemens per metre', 'µS/m', 1e-06),
+    ('G44', 'ACTIVE', 'nanosiemens per centimetre', 'nS/cm', 1e-07),
+    ('G45', 'ACTIVE', 'nanosiemens per metre', 'nS/m', 1e-09),
+    ('G46', 'ACTIVE', 'stokes per bar', 'St/bar', 1e-09),
+    ('G47', 'ACTIVE', 'cubic centimetre per day', 'cm³/d', 1.15741e-11),
+    ('G48', 'ACTIVE', 'cubic centimetre per hour', 'cm³/h', 2.77778e-10),
+    ('G49', 'ACTIVE', 'cubic centimetre per minute', 'cm³/min', 1.66667e-08),
+    ('G50', 'ACTIVE', 'gallon (US) per hour', 'gal/h', 1.0515e-06),
+    ('G51', 'ACTIVE', 'litre per second', 'l/s', 0.001),
+    ('G52', 'ACTIVE', 'cubic metre per day', 'm³/d', 1.1574100000000002e-05),
+    ('G53', 'ACTIVE', 'cubic metre per minute', 'm³/min', 0.016666700000000003),
+    ('G54', 'ACTIVE', 'millilitre per day', 'ml/d', 1.15741e-11),
+    ('G55', 'ACTIVE', 'millilitre per hour', 'ml/h', 2.77778e-10),
+    ('G56', 'ACTIVE', 'cubic inch per hour', 'in³/h', 4.5519600000000005e-09),
+    ('G57', 'ACTIVE', 'cubic inch per minute', 'in³/min', 2.73118e-07),
+    ('G58', 'ACTIVE', 'cubic inch per second', 'in³/s', 1.63871e-05),
+    ('G59', 'ACTIVE', 'milliampere per litre minute', 'mA/(l·min)', 0.016666700000000003),
+    ('G60', 'ACTIVE', 'volt per bar', 'V/bar', 1e-05),
+    ('G61', 'ACTIVE', 'cubic centimetre per day kelvin', 'cm³/(d·K)', 1.15741e-11),
+    ('G62', 'ACTIVE', 'cubic centimetre per hour kelvin', 'cm³/(h·K)', 2.77778e-10),
+    ('G63', 'ACTIVE', 'cubic centimetre per minute kelvin', 'cm³/(min·K)', 1.66667e-08),
+    ('G64', 'ACTIVE', 'cubic centimetre per second kelvin', 'cm³/(s·K)', 1e-06),
+    ('G65', 'ACTIVE', 'litre per day kelvin', 'l/(d·K)', 1.15741e-08),
+    ('G66', 'ACTIVE', 'litre per hour kelvin', 'l/(h·K)', 2.77778e-07),
+    ('G67', 'ACTIVE', 'litre per minute kelvin', 'l/(min·K)', 1.66667e-05),
+    ('G68', 'ACTIVE', 'litre per second kelvin', 'l/(s·K)', 0.001),
+    ('G69', 'ACTIVE', 'cubic metre per day kelvin', 'm³/(d·K)', 1.1574100000000002e-05),
+    ('G7', 'MARKED_AS_DELETED', 'microfiche sheet', None, None),
+    ('G70', 'ACTIVE', 'cubic metre per hour kelvin', 'm³/(h·K)', 0.000277778),
+    ('G71', 'ACTIVE', 'cubic metre per minute kelvin', 'm³/(min·K)', 0.016666700000000003),
+    ('G72', 'ACTIVE', 'cubic metre per second kelvin', 'm³/(s·K)', 1.0),
+    ('G73', 'ACTIVE', 'millilitre per day kelvin', 'ml/(d·K)', 1.15741e-11),
+    ('G74', 'ACTIVE', 'millilitre per hour kelvin', 'ml/(h·K)', 2.77778e-10),
+    ('G75', 'ACTIVE', 'millilitre per minute kelvin', 'ml/(min·K)', 1.66667e-08),
+    ('G76', 'ACTIVE', 'millilitre per second kelvin', 'ml/(s·K)', 1e-06),
+    ('G77', 'ACTIVE', 'millimetre to the fourth power', 'mm⁴', 1e-12),
+    ('G78', 'ACTIVE', 'cubic centimetre per day bar', 'cm³/(d·bar)', 1.15741e-16),
+    ('G79', 'ACTIVE', 'cubic centimetre per hour bar', 'cm³/(h·bar)', 2.77778e-15),
+    ('G80', 'ACTIVE', 'cubic centimetre per minute bar', 'cm³/(min·bar)', 1.6666700000000002e-13),
+    ('G81', 'ACTIVE', 'cubic centimetre per second bar', 'cm³/(s·bar)', 1e-11),
+    ('G82', 'ACTIVE', 'litre per day bar', 'l/(d·bar)', 1.1574100000000002e-13),
+    ('G83', 'ACTIVE', 'litre per hour bar', 'l/(h·bar)', 2.77778e-12),
+    ('G84', 'ACTIVE', 'litre per minute bar', 'l/(min·bar)', 1.66667e-10),
+    ('G85', 'ACTIVE', 'litre per second bar', 'l/(s·bar)', 1e-08),
+    ('G86', 'ACTIVE', 'cubic metre per day bar', 'm³/(d·bar)', 1.1574100000000001e-10),
+    ('G87', 'ACTIVE', 'cubic metre per hour bar', 'm³/(h·bar)', 2.77778e-09),
+    ('G88', 'ACTIVE', 'cubic metre per minute bar', 'm³/(min·bar)', 1.66667e-07),
+    ('G89', 'ACTIVE', 'cubic metre per second bar', 'm³/(s·bar)', 1e-05),
+    ('G90', 'ACTIVE', 'millilitre per day bar', 'ml/(d·bar)', 1.15741e-16),
+    ('G91', 'ACTIVE', 'millilitre per hour bar', 'ml/(h·bar)', 2.77778e-15),
+    ('G92', 'ACTIVE', 'millilitre per minute bar', 'ml/(min·bar)', 1.6666700000000002e-13),
+    ('G93', 'ACTIVE', 'millilitre per second bar', 'ml/(s·bar)', 1e-11),
+    ('G94', 'ACTIVE', 'cubic centimetre per bar', 'cm³/bar', 1e-11),
+    ('G95', 'ACTIVE', 'litre per bar', 'l/bar', 1e-08),
+    ('G96', 'ACTIVE', 'cubic metre per bar', 'm³/bar', 1e-05),
+    ('G97', 'ACTIVE', 'millilitre per bar', 'ml/bar', 1e-11),
+    ('G98', 'ACTIVE', 'microhenry per kiloohm', 'µH/kΩ', 1e-09),
+    ('G99', 'ACTIVE', 'microhenry per ohm', 'µH/Ω', 1e-06),
+    ('GB', 'ACTIVE', 'gallon (US) per day', 'gal (US)/d', 4.381264e-08),
+    ('GBQ', 'ACTIVE', 'gigabecquerel', 'GBq', 1000000000),
+    ('GC', 'MARKED_AS_DELETED', 'gram per 100 gram', None, None),
+    ('GD', 'MARKED_AS_DELETED', 'gross barrel', None, None),
+    ('GDW', 'ACTIVE', 'gram, dry weight', None, None),
+    ('GE', 'ACTIVE', 'pound per gallon (US)', 'lb/gal (US)', 119.8264),
+    ('GF', 'ACTIVE', 'gram per metre (gram per 100 centimetres)', 'g/m', 0.001),
+    ('GFI', 'ACTIVE', 'gram of fissile isotope', 'gi F/S', None),
+    ('GGR', 'ACTIVE', 'great gross', None, 1728),
+    ('GH', 'MARKED_AS_DELETED', 'half gallon (US)', None, None),
+    ('GIA', 'ACTIVE', 'gill (US)', 'gi (US)', 0.00011829410000000001),
+    ('GIC', 'ACTIVE', 'gram, including container', None, None),
+    ('GII', 'ACTIVE', 'gill (UK)', 'gi (UK)', 0.0001420653),
+    ('GIP', 'ACTIVE', 'gram, including inner packaging', None, None),
+    ('GJ', 'ACTIVE', 'gram per millilitre', 'g/ml', 1000.0),
+    ('GK', 'MARKED_AS_DELETED', 'gram per kilogram', None, None),
+    ('GL', 'ACTIVE', 'gram per litre', 'g/l', 1.0),
+    ('GLD', 'ACTIVE', 'dry gallon (US)', 'dry gal (US)', 0.004404884),
+    ('GLI', 'ACTIVE', 'gallon (UK)', 'gal (UK)', 0.004546092),
+    ('GLL', 'ACTIVE', 'gallon (US)', 'gal (US)', 0.003785412),
+    ('GM', 'ACTIVE', 'gram per square metre', 'g/m²', 0.001),
+    ('GN', 'MARKED_AS_DELETED', 'gross gallon', None, None),
+    ('GO', 'ACTIVE', 'milligram per square metre', 'mg/m²', 1e-06),
+    ('GP', 'ACTIVE', 'milligram per cubic metre', 'mg/m³', 1e-06),
+    ('GQ', 'ACTIVE', 'microgram per cubic metre', 'µg/m³', 1e-09),
+    ('GRM', 'ACTIVE', 'gram', 'g', 0.001),
+    ('GRN', 'ACTIVE', 'grain', 'gr', 6.479891000000001e-05),
+    ('GRO', 'ACTIVE', 'gross', 'gr', 144),
+    ('GRT', 'DEPRECATED', 'gross register ton', None, None),
+    ('GT', 'DEPRECATED', 'gross ton', None, None),
+    ('GV', 'ACTIVE', 'gigajoule', 'GJ', 1000000000),
+    ('GW', 'MARKED_AS_DELETED', 'gallon per thousand cubic foot', None, None),
+    ('GWH', 'ACTIVE', 'gigawatt hour', 'GW·h', 3600000000000.0),
+    ('GY', 'MARKED_AS_DELETED', 'gross yard', None, None),
+    ('GZ', 'MARKED_AS_DELETED', 'gage system', None, None),
+    ('H03', 'ACTIVE', 'henry per kiloohm', 'H/kΩ', 0.001),
+    ('H04', 'ACTIVE', 'henry per ohm', 'H/Ω', 1),
+    ('H05', 'ACTIVE', 'millihenry per kiloohm', 'mH/kΩ', 1e-06),
+    ('H06', 'ACTIVE', 'millihenry per ohm', 'mH/Ω', 0.001),
+    ('H07', 'ACTIVE', 'pascal second per bar', 'Pa·s/bar', 1e-05),
+    ('H08', 'ACTIVE', 'microbecquerel', 'µBq', 1e-06),
+    ('H09', 'ACTIVE', 'reciprocal year', '1/y', 3.1688100000000004e-08),
+    ('H1', 'MARKED_AS_DELETED', 'half page – electronic', None, None),
+    ('H10', 'ACTIVE', 'reciprocal hour', '1/h', 0.000277778),
+    ('H11', 'ACTIVE', 'reciprocal month', '1/mo', 3.8025699999999996e-07),
+    ('H12', 'ACTIVE', 'degree Celsius per hour', '°C/h', 0.000277778),
+    ('H13', 'ACTIVE', 'degree Celsius per minute', '°C/min', 0.016666700000000003),
+    ('H14', 'ACTIVE', 'degree Celsius per second', '°C/s', 1.0),
+    ('H15', 'ACTIVE', 'square centimetre per gram', 'cm²/g', 0.1),
+    ('H16', 'ACTIVE', 'square decametre', 'dam²', 100),
+    ('H18', 'ACTIVE', 'square hectometre', 'hm²', 10000),
+    ('H19', 'ACTIVE', 'cubic hectometre', 'hm³', 1000000),
+    ('H2', 'MARKED_AS_DELETED', 'half litre', None, None),
+    ('H20', 'ACTIVE', 'cubic kilometre', 'km³', 1000000000),
+    ('H21', 'ACTIVE', 'blank', None, None),
+    ('H22', 'ACTIVE', 'volt square inch per poundforce', 'V/(lbf/in²)', 0.00014503774398000002),
+    ('H23', 'ACTIVE', 'volt per inch', 'V/in', 39.37007874),
+    ('H24', 'ACTIVE', 'volt per microsecond', 'V/µs', 1000000.0),
+    ('H25', 'ACTIVE', 'percent per kelvin', '%/K', 0.01),
+    ('H26', 'ACTIVE', 'ohm per metre', 'Ω/m', 1.0),
+    ('H27', 'ACTIVE', 'degree per metre', '°/m', 0.01745329),
+    ('H28', 'ACTIVE', 'microfarad per kilometre', 'µF/km', 1e-09),
+    ('H29', 'ACTIVE', 'microgram per litre', 'µg/l', 1e-06),
+    ('H30', 'ACTIVE', 'square micrometre (square micron)', 'µm²', 1e-12),
+    ('H31', 'ACTIVE', 'ampere per kilogram', 'A/kg', 1.0),
+    ('H32', 'ACTIVE', 'ampere squared second', 'A²·s', 1),
+    ('H33', 'ACTIVE', 'farad per kilometre', 'F/km', 0.001),
+    ('H34', 'ACTIVE', 'hertz metre', 'Hz·m', 1),
+    ('H35', 'ACTIVE', 'kelvin metre per watt', 'K·m/W', 1.0),
+    ('H36', 'ACTIVE', 'megaohm per kilometre', 'MΩ/km', 1000.0),
+    ('H37', 'ACTIVE', 'megaohm per metre', 'MΩ/m', 1000000.0),
+    ('H38', 'ACTIVE', 'megaampere', 'MA', 1000000),
+    ('H39', 'ACTIVE', 'megahertz kilometre', 'MHz·km', 1000000000),
+    ('H40', 'ACTIVE', 'newton per ampere', 'N/A', 1.0),
+    ('H41', 'ACTIVE', 'newton metre watt to the power minus 0,5', 'N·m·W⁻⁰‧⁵', 1.0),
+    ('H42', 'ACTIVE', 'pascal per metre', 'Pa/m', 1.0),
+    ('H43', 'ACTIVE', 'siemens per centimetre', 'S/cm', 100.0),
+    ('H44', 'ACTIVE', 'teraohm', 'TΩ', 1000000000000),
+    ('H45', 'ACTIVE', 'volt second per metre', 'V·s/m', 1.0),
+    ('H46', 'ACTIVE', 'volt per second', 'V/s', 1.0),
+    ('H47', 'ACTIVE', 'watt per cubic metre', 'W/m³', 1.0),
+    ('H48', 'ACTIVE', 'attofarad', 'aF', 1e-18),
+    ('H49', 'ACTIVE', 'centimetre per hour', 'cm/h', 2.77777778e-07),
+    ('H50', 'ACTIVE', 'reciprocal cubic centimetre', 'cm⁻³', 1000000.0),
+    ('H51', 'ACTIVE', 'decibel per kilometre', 'dB/km', 0.0001),
+    ('H52', 'ACTIVE', 'decibel per metre', 'dB/m', 0.1),
+    ('H53', 'ACTIVE', 'kilogram per bar', 'kg/bar', 1e-05),
+    ('H54', 'ACTIVE', 'kilogram per cubic decimetre kelvin', '(kg/dm³)/K', 1000.0),
+    ('H55', 'ACTIVE', 'kilogram per cubic decimetre bar', '(kg/dm³)/bar', 0.01),
+    ('H56', 'ACTIVE', 'kilogram per square metre second', 'kg/(m²·s)', 1.0),
+    ('H57', 'ACTIVE', 'inch per two pi radiant', 'in/revolution', 0.012700000000000001),
+    ('H58', 'ACTIVE', 'metre per volt second', 'm/(V·s)', 1.0),
+    ('H59', 'ACTIVE', 'square metre per newton', 'm²/N', 1.0),
+    ('H60', 'ACTIVE', 'cubic metre per cubic metre', 'm³/m³', 1),
+    ('H61', 'ACTIVE', 'millisiemens per centimetre', 'mS/cm', 0.1),
+    ('H62', 'ACTIVE', 'millivolt per minute', 'mV/min', 1.6666666670000003e-05),
+    ('H63', 'ACTIVE', 'milligram per square centimetre', 'mg/cm²', 0.01),
+    ('H64', 'ACTIVE', 'milligram per gram', 'mg/g', 0.001),
+    ('H65', 'ACTIVE', 'millilitre per cubic metre', 'ml/m³', 1e-06),
+    ('H66', 'ACTIVE', 'millimetre per year', 'mm/y', 31557.6),
+    ('H67', 'ACTIVE', 'millimetre per hour', 'mm/h', 2.7777777799999998e-08),
+    ('H68', 'ACTIVE', 'millimole per gram', 'mmol/g', 1.0),
+    ('H69', 'ACTIVE', 'picopascal per kilometre', 'pPa/km', 1e-15),
+    ('H70', 'ACTIVE', 'picosecond', 'ps', 1e-12),
+    ('H71', 'ACTIVE', 'percent per month', '%/mo', None),
+    ('H72', 'ACTIVE', 'percent per hectobar', '%/hbar', None),
+    ('H73', 'ACTIVE', 'percent per decakelvin', '%/daK', 0.001),
+    ('H74', 'ACTIVE', 'watt per metre', 'W/m', 1.0),
+    ('H75', 'ACTIVE', 'decapascal', 'daPa', 10),
+    ('H76', 'ACTIVE', 'gram per millimetre', 'g/mm', 10.0),
+    ('H77', 'ACTIVE', 'module width', 'MW', None),
+    ('H78', 'DEPRECATED', 'conventional centimetre of water', 'cm H₂O', 98.06649999999999),
+    ('H79', 'ACTIVE', 'French gauge', 'Fg', 0.000333333333),
+    ('H80', 'ACTIVE', 'rack unit', 'U or RU', 0.04445),
+    ('H81', 'ACTIVE', 'millimetre per minute', 'mm/min', 1.6666666670000003e-05),
+    ('H82', 'ACTIVE', 'big point', 'bp', 0.0003527778),
+    ('H83', 'ACTIVE', 'litre per kilogram', 'l/kg', 0.001),
+    ('H84', 'ACTIVE', 'gram millimetre', 'g·mm', 1e-06),
+    ('H85', 'ACTIVE', 'reciprocal week', '1/wk', 1.6479894528679998e-06),
+    ('H87', 'ACTIVE', 'piece', None, None),
+    ('H88', 'ACTIVE', 'megaohm kilometre', 'MΩ·km', 1000000000),
+    ('H89', 'ACTIVE', 'percent per ohm', '%/Ω', 0.01),
+    ('H90', 'ACTIVE', 'percent per degree', '%/°', 0.5729578),
+    ('H91', 'ACTIVE', 'percent per ten thousand', '%/10000', 1e-06),
+    ('H92', 'ACTIVE', 'percent per one hundred thousand', '%/100000', 1e-07),
+    ('H93', 'ACTIVE', 'percent per hundred', '%/100', 0.0001),
+    ('H94', 'ACTIVE', 'percent per thousand', '%/1000', 1e-05),
+    ('H95', 'ACTIVE', 'percent per volt', '%/V', 0.01),
+    ('H96', 'ACTIVE', 'percent per bar', '%/bar', 1e-07),
+    ('H98', 'ACTIVE', 'percent per inch', '%/in', 0.3937008),
+    ('H99', 'ACTIVE', 'percent per metre', '%/m', 0.01),
+    ('HA', 'ACTIVE', 'hank', None, None),
+    ('HAR', 'DEPRECATED', 'hectare', 'ha', 10000),
+    ('HBA', 'ACTIVE', 'hectobar', 'hbar', 10000000),
+    ('HBX', 'ACTIVE', 'hundred boxes', None, None),
+    ('HC', 'ACTIVE', 'hundred count', None, None),
+    ('HD', 'MARKED_AS_DELETED', 'half dozen', None, 6),
+    ('HDW', 'ACTIVE', 'hundred kilogram, dry weight', None, None),
+    ('HE', 'MARKED_AS_DELETED', 'hundredth of a carat', None, None),
+    ('HEA', 'ACTIVE', 'head', None, None),
+    ('HF', 'MARKED_AS_DELETED', 'hundred foot', None, None),
+    ('HGM', 'ACTIVE', 'hectogram', 'hg', 0.1),
+    ('HH', 'ACTIVE', 'hundred cubic foot', None, None),
+    ('HI', 'MARKED_AS_DELETED', 'hundred sheet', None, None),
+    ('HIU', 'ACTIVE', 'hundred international unit', None, None),
+    ('HJ', 'DEPRECATED', 'metric horse power', 'metric hp', 735.49875),
+    ('HK', 'MARKED_AS_DELETED', 'hundred kilogram', None, None),
+    ('HKM', 'ACTIVE', 'hundred kilogram, net mass', None, None),
+    ('HL', 'MARKED_AS_DELETED', 'hundred foot (linear)', None, None),
+    ('HLT', 'ACTIVE', 'hectolitre', 'hl', 0.1),
+    ('HM', 'ACTIVE', 'mile per hour (statute mile)', 'mile/h', 0.44704),
+    ('HMQ', 'ACTIVE', 'million cubic metre', 'Mm³', None),
+    ('HMT', 'ACTIVE', 'hectometre', 'hm', 100),
+    ('HN', 'DEPRECATED', 'conventional millimetre of mercury', 'mm Hg', 133.3224),
+    ('HO', 'MARKED_AS_DELETED', 'hundred troy ounce', None, None),
+    ('HP', 'DEPRECATED', 'conventional millimetre of water', 'mm H₂O', 9.80665),
+    ('HPA', 'ACTIVE', 'hectolitre of pure alcohol', None, None),
+    ('HS', 'MARKED_AS_DELETED', 'hundred square foot', None, None),
+    ('HT', 'MARKED_AS_DELETED', 'half hour', None, None),
+    ('HTZ', 'ACTIVE', 'hertz', 'Hz', 1),
+    ('HUR', 'ACTIVE', 'hour', 'h', 3600),
+    ('HY', 'MARKED_AS_DELETED', 'hundred yard', None, None),
+    ('IA', 'ACTIVE', 'inch pound (pound inch)', 'in·lb', 0.0115212),
+    ('IC', 'MARKED_AS_DELETED', 'count per inch', None, None),
+    ('IE', 'ACTIVE', 'person', None, None),
+    ('IF', 'MARKED_AS_DELETED', 'inches of water', None, None),
+    ('II', 'MARKED_AS_DELETED', 'column inch', None, None),
+    ('IL', 'MARKED_AS_DELETED', 'inch per minute', None, None),
+    ('IM', 'MARKED_AS_DELETED', 'impression', None, None),
+    ('INH', 'ACTIVE', 'inch', 'in', 0.0254),
+    ('INK', 'ACTIVE', 'square inch', 'in²', 0.00064516),
+    ('INQ', 'ACTIVE', 'cubic inch', 'in³', 1.6387064e-05),
+    ('IP', 'MARKED_AS_DELETED', 'insurance policy', None, None),
+    ('ISD', 'ACTIVE', 'international sugar degree', None, None),
+    ('IT', 'MARKED_AS_DELETED', 'count per centimetre', None, None),
+    ('IU', 'ACTIVE', 'inch per second', 'in/s', 0.0254),
+    ('IUG', 'ACTIVE', 'international unit per gram', None, None),
+    ('IV', 'ACTIVE', 'inch per second squared', 'in/s²', 0.0254),
+    ('J10', 'ACTIVE', 'percent per millimetre', '%/mm', 10.0),
+    ('J12', 'ACTIVE', 'per mille per psi', '‰/psi', 1.450377e-07),
+    ('J13', 'ACTIVE', 'degree API', '°API', None),
+    ('J14', 'ACTIVE', 'degree Baume (origin scale)', '°Bé', None),
+    ('J15', 'ACTIVE', 'degree Baume (US heavy)', '°Bé (US heavy)', None),
+    ('J16', 'ACTIVE', 'degree Baume (US light)', '°Bé (US light)', None),
+    ('J17', 'ACTIVE', 'degree Balling', '°Balling', None),
+    ('J18', 'ACTIVE', 'degree Brix', '°Bx', None),
+    ('J19', 'ACTIVE', 'degree Fahrenheit hour square foot per British thermal unit (thermochemical)', '°F·h·ft²/Btuth', 0.176228),
+    ('J2', 'ACTIVE', 'joule per kilogram', 'J/kg', 1.0),
+    ('J20', 'ACTIVE', 'degree Fahrenheit per kelvin', '°F/K', 0.5555556),
+    ('J21', 'ACTIVE', 'degree Fahrenheit per bar', '°F/bar', 5.555556000000001e-06),
+    ('J22', 'ACTIVE', 'degree Fahrenheit hour square foot per British thermal unit (international table)', '°F·h·ft²/BtuIT', 0.1761102),
+    ('J23', 'ACTIVE', 'degree Fahrenheit per hour', '°F/h', 0.00015432100000000002),
+    ('J24', 'ACTIVE', 'degree Fahrenheit per minute', '°F/min', 0.009259259),
+    ('J25', 'ACTIVE', 'degree Fahrenheit per second', '°F/s', 0.5555556),
+    ('J26', 'ACTIVE', 'reciprocal degree Fahrenheit', '1/°F', 1.81),
+    ('J27', 'ACTIVE', 'degree Oechsle', '°Oechsle', None),
+    ('J28', 'ACTIVE', 'degree Rankine per hour', '°R/h', 0.00015432100000000002),
+    ('J29', 'ACTIVE', 'degree Rankine per minute', '°R/min', 0.009259259),
+    ('J30', 'ACTIVE', 'degree Rankine per second', '°R/s', 0.5555556),
+    ('J31', 'ACTIVE', 'degree Twaddell', '°Tw', None),
+    ('J32', 'ACTIVE', 'micropoise', 'µP', 1e-06),
+    ('J33', 'ACTIVE', 'microgram per kilogram', 'µg/kg', 1e-09),
+    ('J34', 'ACTIVE', 'microgram per cubic metre kelvin', '(µg/m³)/K', 1e-09),
+    ('J35', 'ACTIVE', 'microgram per cubic metre bar', '(µg/m³)/bar', 1e-14),
+    ('J36', 'ACTIVE', 'microlitre per litre', 'µl/l', 1e-06),
+    ('J38', 'ACTIVE', 'baud', 'Bd', None),
+    ('J39', 'ACTIVE', 'British thermal unit (mean)', 'Btu', 1055.8700000000001),
+    ('J40', 'ACTIVE', 'British thermal unit (international table) foot per hour\xa0square foot degree Fahrenheit', 'BtuIT·ft/(h·ft²·°F)', 1.730735),
+    ('J41', 'ACTIVE', 'British thermal unit (international table) inch per hour square\xa0foot degree Fahrenheit', 'BtuIT·in/(h·ft²·°F)', 0.1442279),
+    ('J42', 'ACTIVE', 'British thermal unit (international table) inch per second square\xa0foot degree Fahrenheit', 'BtuIT·in/(s·ft²·°F)', 519.2204),
+    ('J43', 'ACTIVE', 'British thermal unit (international table) per pound degree Fahrenheit', 'BtuIT/(lb·°F)', 4186.8),
+    ('J44', 'ACTIVE', 'British thermal unit (international table) per minute', 'BtuIT/min', 17.584266),
+    ('J45', 'ACTIVE', 'British thermal unit (international table) per second', 'BtuIT/s', 1055.056),
+    ('J46', 'ACTIVE', 'British thermal unit (thermochemical) foot per hour square\xa0foot degree Fahrenheit', 'Btuth·ft/(h·ft²·°F)', 1.729577),
+    ('J47', 'ACTIVE', 'British thermal unit (thermochemical) per hour', 'Btuth/h', 0.2928751),
+    ('J48', 'ACTIVE', 'British thermal unit (thermochemical) inch per hour square\xa0foot degree Fahrenheit', 'Btuth·in/(h·ft²·°F)', 0.1441314),
+    ('J49', 'ACTIVE', 'British thermal unit (thermochemical) inch per second\xa0square foot degree Fahrenheit', 'Btuth·in/(s·ft²·°F)', 518.8732),
+    ('J50', 'ACTIVE', 'British thermal unit (thermochemical) per pound degree Fahrenheit', 'Btuth/(lb·°F)', 4184.0),
+    ('J51', 'ACTIVE', 'British thermal unit (thermochemical) per minute', 'Btuth/min', 17.5725),
+    ('J52', 'ACTIVE', 'British thermal unit (thermochemical) per second', 'Btuth/s', 1054.35),
+    ('J53', 'ACTIVE', 'coulomb square metre per kilogram', 'C·m²/kg', 1.0),
+    ('J54', 'ACTIVE', 'megabaud', 'MBd', 1000000),
+    ('J55', 'ACTIVE', 'watt second', 'W·s', 1),
+    ('J56', 'ACTIVE', 'bar per bar', 'bar/bar', 1),
+    ('J57', 'ACTIVE', 'barrel (UK petroleum)', 'bbl (UK liq.)', 0.15911315),
+    ('J58', 'ACTIVE', 'barrel (UK petroleum) per minute', 'bbl (UK liq.)/min', 2.651886),
+    ('J59', 'ACTIVE', 'barrel (UK petroleum) per day', 'bbl (UK liq.)/d', 1.8415874000000001e-06),
+    ('J60', 'ACTIVE', 'barrel (UK petroleum) per hour', 'bbl (UK liq.)/h', 4.4198100000000006e-05),
+    ('J61', 'ACTIVE', 'barrel (UK petroleum) per second', 'bbl (UK liq.)/s', 0.15911315),
+    ('J62', 'ACTIVE', 'barrel (US petroleum) per hour', 'bbl (US)/h', 4.416314e-05),
+    ('J63', 'ACTIVE', 'barrel (US petroleum) per second', 'bbl (US)/s', 0.1589873),
+    ('J64', 'ACTIVE', 'bushel (UK) per day', 'bu (UK)/d', 4.209342999999999e-07),
+    ('J65', 'ACTIVE', 'bushel (UK) per hour', 'bu (UK)/h', 1.0102420000000001e-05),
+    ('J66', 'ACTIVE', 'bushel (UK) per minute', 'bu (UK)/min', 0.0006061453000000001),
+    ('J67', 'ACTIVE', 'bushel (UK) per second', 'bu (UK)/s', 0.03636872),
+    ('J68', 'ACTIVE', 'bushel (US dry) per day', 'bu (US dry)/d', 4.078596e-07),
+    ('J69', 'ACTIVE', 'bushel (US dry) per hour', 'bu (US dry)/h', 9.788631e-06),
+    ('J70', 'ACTIVE', 'bushel (US dry) per minute', 'bu (US dry)/min', 0.0005873178),
+    ('J71', 'ACTIVE', 'bushel (US dry) per second', 'bu (US dry)/s', 0.03523907),
+    ('J72', 'ACTIVE', 'centinewton metre', 'cN·m', 0.01),
+    ('J73', 'ACTIVE', 'centipoise per kelvin', 'cP/K', 0.001),
+    ('J74', 'ACTIVE', 'centipoise per bar', 'cP/bar', 1e-08),
+    ('J75', 'ACTIVE', 'calorie (mean)', 'cal', 4.19002),
+    ('J76', 'ACTIVE', 'calorie (international table) per gram degree Celsius', 'calIT/(g·°C)', 4186.8),
+    ('J78', 'ACTIVE', 'calorie (thermochemical) per centimetre second degree Celsius', 'calth/(cm·s·°C)', 418.40000000000003),
+    ('J79', 'ACTIVE', 'calorie (thermochemical) per gram degree Celsius', 'calth/(g·°C)', 4184.0),
+    ('J81', 'ACTIVE', 'calorie (thermochemical) per minute', 'calth/min', 0.06973333000000001),
+    ('J82', 'ACTIVE', 'calorie (thermochemical) per second', 'calth/s', 4.184),
+    ('J83', 'ACTIVE', 'clo', 'clo', 0.155),
+    ('J84', 'ACTIVE', 'centimetre per second kelvin', '(cm/s)/K', 0.01),
+    ('J85', 'ACTIVE', 'centimetre per second bar', '(cm/s)/bar', 1e-07),
+    ('J87', 'ACTIVE', 'cubic centimetre per cubic metre', 'cm³/m³', 1e-06),
+    ('J89', 'DEPRECATED', 'centimetre of mercury', 'cm Hg', 1333.224),
+    ('J90', 'ACTIVE', 'cubic decimetre per day', 'dm³/d', 1.15741e-08),
+    ('J91', 'ACTIVE', 'cubic decimetre per cubic metre', 'dm³/m³', 0.001),
+    ('J92', 'ACTIVE', 'cubic decimetre per minute', 'dm³/min', 1.66667e-05),
+    ('J93', 'ACTIVE', 'cubic decimetre per second', 'dm³/s', 0.001),
+    ('J94', 'DEPRECATED', 'dyne centimetre', 'dyn·cm', 1e-07),
+    ('J95', 'ACTIVE', 'ounce (UK fluid) per day', 'fl oz (UK)/d', 3.288549e-10),
+    ('J96', 'ACTIVE', 'ounce (UK fluid) per hour', 'fl oz (UK)/h', 7.892517e-09),
+    ('J97', 'ACTIVE', 'ounce (UK fluid) per minute', 'fl oz (UK)/min', 4.735509999999999e-07),
+    ('J98', 'ACTIVE', 'ounce (UK fluid) per second', 'fl oz (UK)/s', 2.841306e-05),
+    ('J99', 'ACTIVE', 'ounce (US fluid) per day', 'fl oz (US)/d', 3.422862e-10),
+    ('JB', 'MARKED_AS_DELETED', 'jumbo', None, None),
+    ('JE', 'ACTIVE', 'joule per kelvin', 'J/K', 1.0),
+    ('JG', 'MARKED_AS_DELETED', 'jug', None, None),
+    ('JK', 'ACTIVE', 'megajoule per kilogram', 'MJ/kg', 1000000.0),
+    ('JM', 'ACTIVE', 'megajoule per cubic metre', 'MJ/m³', 1000000.0),
+    ('JNT', 'ACTIVE', 'pipeline joint', None, None),
+    ('JO', 'MARKED_AS_DELETED', 'joint', None, None),
+    ('JOU', 'ACTIVE', 'joule', 'J', 1),
+    ('JPS', 'ACTIVE', 'hundred metre', None, None),
+    ('JR', 'MARKED_AS_DELETED', 'jar', None, None),
+    ('JWL', 'ACTIVE', 'number of jewels', None, None),
+    ('K1', 'ACTIVE', 'kilowatt demand', None, None),
+    ('K10', 'ACTIVE', 'ounce (US fluid) per hour', 'fl oz (US)/h', 8.214869e-09),
+    ('K11', 'ACTIVE', 'ounce (US fluid) per minute', 'fl oz (US)/min', 4.928922e-07),
+    ('K12', 'ACTIVE', 'ounce (US fluid) per second', 'fl oz (US)/s', 2.9573530000000003e-05),
+    ('K13', 'ACTIVE', 'foot per degree Fahrenheit', 'ft/°F', 0.54864),
+    ('K14', 'ACTIVE', 'foot per hour', 'ft/h', 8.466667e-05),
+    ('K15', 'ACTIVE', 'foot poundforce per hour', 'ft·lbf/h', 0.0003766161),
+    ('K16', 'ACTIVE', 'foot poundforce per minute', 'ft·lbf/min', 0.02259697),
+    ('K17', 'ACTIVE', 'foot per psi', 'ft/psi', 4.42075e-05),
+    ('K18', 'ACTIVE', 'foot per second degree Fahrenheit', '(ft/s)/°F', 0.54864),
+    ('K19', 'ACTIVE', 'foot per second psi', '(ft/s)/psi', 4.42075e-05),
+    ('K2', 'ACTIVE', 'kilovolt ampere reactive demand', None, None),
+    ('K20', 'ACTIVE', 'reciprocal cubic foot', '1/ft³', 35.31466),
+    ('K21', 'ACTIVE', 'cubic foot per degree Fahrenheit', 'ft³/°F', 0.05097033),
+    ('K22', 'ACTIVE', 'cubic foot per day', 'ft³/d', 3.277413e-07),
+    ('K23', 'ACTIVE', 'cubic foot per psi', 'ft³/psi', 4.107012e-06),
+    ('K24', 'DEPRECATED', 'foot of water', 'ft H₂O', 2989.067),
+    ('K25', 'DEPRECATED', 'foot of mercury', 'ft Hg', 40636.659999999996),
+    ('K26', 'ACTIVE', 'gallon (UK) per day', 'gal (UK)/d', 5.2616779999999997e-08),
+    ('K27', 'ACTIVE', 'gallon (UK) per hour', 'gal (UK)/h', 1.2628029999999999e-06),
+    ('K28', 'ACTIVE', 'gallon (UK) per second', 'gal (UK)/s', 0.004546090000000001),
+    ('K3', 'ACTIVE', 'kilovolt ampere reactive hour', 'kvar·h', None),
+    ('K30', 'ACTIVE', 'gallon (US liquid) per second', 'gal (US liq.)/s', 0.003785412),
+    ('K31', 'ACTIVE', 'gramforce per square centimetre', 'gf/cm²', 98.0665),
+    ('K32', 'ACTIVE', 'gill (UK) per day', 'gi (UK)/d', 1.644274e-05),
+    ('K33', 'ACTIVE', 'gill (UK) per hour', 'gi (UK)/h', 3.946258e-08),
+    ('K34', 'ACTIVE', 'gill (UK) per minute', 'gi (UK)/min', 0.02367755),
+    ('K35', 'ACTIVE', 'gill (UK) per second', 'gi (UK)/s', 0.0001420653),
+    ('K36', 'ACTIVE', 'gill (US) per day', 'gi (US)/d', 1.3691450000000002e-09),
+    ('K37', 'ACTIVE', 'gill (US) per hour', 'gi (US)/h', 3.285947e-08),
+    ('K38', 'ACTIVE', 'gill (US) per minute', 'gi (US)/min', 1.971568e-06),
+    ('K39', 'ACTIVE', 'gill (US) per second', 'gi (US)/s', 0.00011829410000000001),
+    ('K40', 'ACTIVE', 'standard acceleration of free fall', 'gn', 9.80665),
+    ('K41', 'ACTIVE', 'grain per gallon (US)', 'gr/gal (US)', 0.01711806),
+    ('K42', 'ACTIVE', 'horsepower (boiler)', 'boiler hp', 9809.5),
+    ('K43', 'ACTIVE', 'horsepower (electric)', 'electric hp', 746),
+    ('K45', 'ACTIVE', 'inch per degree Fahrenheit', 'in/°F', 0.045720000000000004),
+    ('K46', 'ACTIVE', 'inch per psi', 'in/psi', 3.683959e-06),
+    ('K47', 'ACTIVE', 'inch per second degree Fahrenheit', '(in/s)/°F', 0.045720000000000004),
+    ('K48', 'ACTIVE', 'inch per second psi', '(in/s)/psi', 3.683959e-06),
+    ('K49', 'ACTIVE', 'reciprocal cubic inch', '1/in³', 61023.759000000005),
+    ('K5', 'DEPRECATED', 'kilovolt ampere (reactive)', 'kvar', 1000),
+    ('K50', 'ACTIVE', 'kilobaud', 'kBd', 1000),
+    ('K51', 'ACTIVE', 'kilocalorie (mean)', 'kcal', 4190.0199999999995),
+    ('K52', 'ACTIVE', 'kilocalorie (international table) per hour metre degree Celsius', 'kcal/(m·h·°C)', 1.163),
+    ('K53', 'ACTIVE', 'kilocalorie (thermochemical)', 'kcalth', 4184.0),
+    ('K54', 'ACTIVE', 'kilocalorie (thermochemical) per minute', 'kcalth/min', 69.73333),
+    ('K55', 'ACTIVE', 'kilocalorie (thermochemical) per second', 'kcalth/s', 4184.0),
+    ('K58', 'ACTIVE', 'kilomole per hour', 'kmol/h', 0.277778),
+    ('K59', 'ACTIVE', 'kilomole per cubic metre kelvin', '(kmol/m³)/K', 1000.0),
+    ('K6', 'ACTIVE', 'kilolitre', 'kl', 1),
+    ('K60', 'ACTIVE', 'kilomole per cubic metre bar', '(kmol/m³)/bar', 0.01),
+    ('K61', 'ACTIVE', 'kilomole per minute', 'kmol/min', 16.6667),
+    ('K62', 'ACTIVE', 'litre per litre', 'l/l', 1),
+    ('K63', 'ACTIVE', 'reciprocal litre', '1/l', 1000.0),
+    ('K64', 'ACTIVE', 'pound (avoirdupois) per degree Fahrenheit', 'lb/°F', 0.8164663),
+    ('K65', 'ACTIVE', 'pound (avoirdupois) square foot', 'lb·ft²', 0.04214011),
+    ('K66', 'ACTIVE', 'pound (avoirdupois) per day', 'lb/d', 5.249912e-06),
+    ('K67', 'ACTIVE', 'pound per foot hour', 'lb/(ft·h)', 0.00041337890000000003),
+    ('K68', 'ACTIVE', 'pound per foot second', 'lb/(ft·s)', 1.488164),
+    ('K69', 'ACTIVE', 'pound (avoirdupois) per cubic foot degree Fahrenheit', '(lb/ft³)/°F', 28.83323),
+    ('K70', 'ACTIVE', 'pound (avoirdupois) per cubic foot psi', '(lb/ft³)/psi', 0.002323282),
+    ('K71', 'ACTIVE', 'pound (avoirdupois) per gallon (UK)', 'lb/gal (UK)', 99.77637),
+    ('K73', 'ACTIVE', 'pound (avoirdupois) per hour degree Fahrenheit', '(lb/h)/°F', 0.0002267962),
+    ('K74', 'ACTIVE', 'pound (avoirdupois) per hour psi', '(lb/h)/psi', 1.827445e-08),
+    ('K75', 'ACTIVE', 'pound (avoirdupois) per cubic inch degree Fahrenheit', '(lb/in³)/°F', 49823.84),
+    ('K76', 'ACTIVE', 'pound (avoirdupois) per cubic inch psi', '(lb/in³)/psi', 4.014632),
+    ('K77', 'ACTIVE', 'pound (avoirdupois) per psi', 'lb/psi', 6.578802e-05),
+    ('K78', 'ACTIVE', 'pound (avoirdupois) per minute', 'lb/min', 0.007559873),
+    ('K79', 'ACTIVE', 'pound (avoirdupois) per minute degree Fahrenheit', 'lb/(min·°F)', 0.01360777),
+    ('K80', 'ACTIVE', 'pound (avoirdupois) per minute psi', '(lb/min)/psi', 1.096467e-06),
+    ('K81', 'ACTIVE', 'pound (avoirdupois) per second', 'lb/s', 0.4535924),
+    ('K82', 'ACTIVE', 'pound (avoirdupois) per second degree Fahrenheit', '(lb/s)/°F', 0.8164663),
+    ('K83', 'ACTIVE', 'pound (avoirdupois) per second psi', '(lb/s)/psi', 6.578802e-05),
+    ('K84', 'ACTIVE', 'pound per cubic yard', 'lb/yd³', 0.5932764),
+    ('K85', 'ACTIVE', 'poundforce per square foot', 'lbf/ft²', 47.88026),
+    ('K86', 'ACTIVE', 'poundforce per square inch degree Fahrenheit', 'psi/°F', 12410.56),
+    ('K87', 'ACTIVE', 'psi cubic inch per second', 'psi·in³/s', 0.112985),
+    ('K88', 'ACTIVE', 'psi litre per second', 'psi·l/s', 6.894757),
+    ('K89', 'ACTIVE', 'psi cubic metre per second', 'psi·m³/s', 6894.7570000000005),
+    ('K90', 'ACTIVE', 'psi cubic yard per second', 'psi·yd³/s', 5271.42),
+    ('K91', 'ACTIVE', 'poundforce second per square foot', 'lbf·s/ft²', 47.88026),
+    ('K92', 'ACTIVE', 'poundforce second per square inch', 'lbf·s/in²', 6894.7570000000005),
+    ('K93', 'ACTIVE', 'reciprocal psi', '1/psi', 0.0001450377),
+    ('K94', 'ACTIVE', 'quart (UK liquid) per day', 'qt (UK liq.)/d', 1.31542e-08),
+    ('K95', 'ACTIVE', 'quart (UK liquid) per hour', 'qt (UK liq.)/h', 3.157008e-07),
+    ('K96', 'ACTIVE', 'quart (UK liquid) per minute', 'qt (UK liq.)/min', 1.894205e-05),
+    ('K97', 'ACTIVE', 'quart (UK liquid) per second', 'qt (UK liq.)/s', 0.001136523),
+    ('K98', 'ACTIVE', 'quart (US liquid) per day', 'qt (US liq.)/d', 1.095316e-08),
+    ('K99', 'ACTIVE', 'quart (US liquid) per hour', 'qt (US liq.)/h', 2.628758e-07),
+    ('KA', 'ACTIVE', 'cake', None, None),
+    ('KAT', 'ACTIVE', 'katal', 'kat', 1.0),
+    ('KB', 'ACTIVE', 'kilocharacter', None, None),
+    ('KBA', 'ACTIVE', 'kilobar', 'kbar', 100000000),
+    ('KCC', 'ACTIVE', 'kilogram of choline chloride', 'kg C₅ H₁₄ClNO', None),
+    ('KD', 'MARKED_AS_DELETED', 'kilogram decimal', None, None),
+    ('KDW', 'ACTIVE', 'kilogram drained net weight', 'kg/net eda', None),
+    ('KEL', 'ACTIVE', 'kelvin', 'K', 1),
+    ('KF', 'MARKED_AS_DELETED', 'kilopacket', None, None),
+    ('KG', 'MARKED_AS_DELETED', 'keg', None, None),
+    ('KGM', 'ACTIVE', 'kilogram', 'kg', 1),
+    ('KGS', 'ACTIVE', 'kilogram per second', 'kg/s', 1.0),
+    ('KHY', 'ACTIVE', 'kilogram of hydrogen peroxide', 'kg H₂O₂', None),
+    ('KHZ', 'ACTIVE', 'kilohertz', 'kHz', 1000),
+    ('KI', 'ACTIVE', 'kilogram per millimetre width', None, 1000.0),
+    ('KIC', 'ACTIVE', 'kilogram, including container', None, None),
+    ('KIP', 'ACTIVE', 'kilogram, including inner packaging', None, None),
+    ('KJ', 'ACTIVE', 'kilosegment', None, None),
+    ('KJO', 'ACTIVE', 'kilojoule', 'kJ', 1000),
+    ('KL', 'ACTIVE', 'kilogram per metre', 'kg/m', 1.0),
+    ('KLK', 'ACTIVE', 'lactic dry material percentage', None, None),
+    ('KLX', 'ACTIVE', 'kilolux', 'klx', 1000.0),
+    ('KMA', 'ACTIVE', 'kilogram of methylamine', 'kg met.am.', None),
+    ('KMH', 'ACTIVE', 'kilometre per hour', 'km/h', 0.277778),
+    ('KMK', 'ACTIVE', 'square kilometre', 'km²', 1000000),
+    ('KMQ', 'ACTIVE', 'kilogram per cubic metre', 'kg/m³', 1.0),
+    ('KMT', 'ACTIVE', 'kilometre', 'km', 1000),
+    ('KNI', 'ACTIVE', 'kilogram of nitrogen', 'kg N', None),
+    ('KNM', 'ACTIVE', 'kilonewton per square metre', 'kN/m2', 103),
+    ('KNS', 'ACTIVE', 'kilogram named substance', None, None),
+    ('KNT', 'ACTIVE', 'knot', 'kn', 0.514444),
+    ('KO', 'ACTIVE', 'milliequivalence caustic potash per gram of product', None, None),
+    ('KPA', 'ACTIVE', 'kilopascal', 'kPa', 1000),
+    ('KPH', 'ACTIVE', 'kilogram of potassium hydroxide (caustic potash)', 'kg KOH', None),
+    ('KPO', 'ACTIVE', 'kilogram of potassium oxide', 'kg K₂O', None),
+    ('KPP', 'ACTIVE', 'kilogram of phosphorus pentoxide (phosphoric anhydride)', None, None),
+    ('KR', 'ACTIVE', 'kiloroentgen', 'kR', 0.258),
+    ('KS', 'MARKED_AS_DELETED', 'thousand pound per square inch', None, None),
+    ('KSD', 'ACTIVE', 'kilogram of substance 90 % dry', 'kg 90 % sdt', None),
+    ('KSH', 'ACTIVE', 'kilogram of sodium hydroxide (caustic soda)', 'kg NaOH', None),
+    ('KT', 'ACTIVE', 'kit', None, None),
+    ('KTM', 'MARKED_AS_DELETED', 'kilometre', 'km', 1000),
+    ('KTN', 'ACTIVE', 'kilotonne', 'kt', 1000000),
+    ('KUR', 'ACTIVE', 'kilogram of uranium', 'kg U', None),
+    ('KVA', 'ACTIVE', 'kilovolt  ampere', 'kV·A', 1000),
+    ('KVR', 'ACTIVE', 'kilovar', 'kvar', 1000),
+    ('KVT', 'ACTIVE', 'kilovolt', 'kV', 1000),
+    ('KW', 'ACTIVE', 'kilogram per millimetre', 'kg/mm', 1000.0),
+    ('KWH', 'ACTIVE', 'kilowatt hour', 'kW·h', 3600000.0),
+    ('KWY', 'ACTIVE', 'kilowatt year', 'kW/year', None),
+    ('KWN', 'ACTIVE', 'Kilowatt hour per normalized cubic metre', None, None),
+    ('KWO', 'ACTIVE', 'kilogram of tungsten trioxide', 'kg WO₃', None),
+    ('KWS', 'ACTIVE', 'Kilowatt hour per standard cubic metre', None, None),
+    ('KWT', 'ACTIVE', 'kilowatt', 'kW', 1000),
+    ('KX', 'ACTIVE', 'millilitre per kilogram', 'ml/kg', 1e-06),
+    ('L10', 'ACTIVE', 'quart (US liquid) per minute', 'qt (US liq.)/min', 1.5772550000000002e-05),
+    ('L11', 'ACTIVE', 'quart (US liquid) per second', 'qt (US liq.)/s', 0.0009463529),
+    ('L12', 'ACTIVE', 'metre per second kelvin', '(m/s)/K', 1.0),
+    ('L13', 'ACTIVE', 'metre per second bar', '(m/s)/bar', 1e-05),
+    ('L14', 'ACTIVE', 'square metre hour degree Celsius per kilocalorie (international table)', 'm²·h·°C/kcal', 0.8598452),
+    ('L15', 'ACTIVE', 'millipascal second per kelvin', 'mPa·s/K', 0.001),
+    ('L16', 'ACTIVE', 'millipascal second per bar', 'mPa·s/bar', 1e-08),
+    ('L17', 'ACTIVE', 'milligram per cubic metre kelvin', '(mg/m³)/K', 1e-06),
+    ('L18', 'ACTIVE', 'milligram per cubic metre bar', '(mg/m³)/bar', 1e-11),
+    ('L19', 'ACTIVE', 'millilitre per litre', 'ml/l', 0.001),
+    ('L2', 'ACTIVE', 'litre per minute', 'l/min', 1.66667e-05),
+    ('L20', 'ACTIVE', 'reciprocal cubic millimetre', '1/mm³', 1000000000.0),
+    ('L21', 'ACTIVE', 'cubic millimetre per cubic metre', 'mm³/m³', 1000000000),
+    ('L23', 'ACTIVE', 'mole per hour', 'mol/h', 0.000277778),
+    ('L24', 'ACTIVE', 'mole per kilogram kelvin', '(mol/kg)/K', 1.0),
+    ('L25', 'ACTIVE', 'mole per kilogram bar', '(mol/kg)/bar', 1e-05),
+    ('L26', 'ACTIVE', 'mole per litre kelvin', '(mol/l)/K', 1000.0),
+    ('L27', 'ACTIVE', 'mole per litre bar', '(mol/l)/bar', 0.01),
+    ('L28', 'ACTIVE', 'mole per cubic metre kelvin', '(mol/m³)/K', 1.0),
+    ('L29', 'ACTIVE', 'mole per cubic metre bar', '(mol/m³)/bar', 1e-05),
+    ('L30', 'ACTIVE', 'mole per minute', 'mol/min', 0.016666700000000003),
+    ('L31', 'ACTIVE', 'milliroentgen aequivalent men', 'mrem', 1e-05),
+    ('L32', 'ACTIVE', 'nanogram per kilogram', 'ng/kg', 1e-12),
+    ('L33', 'ACTIVE', 'ounce (avoirdupois) per day', 'oz/d', 3.281194e-07),
+    ('L34', 'ACTIVE', 'ounce (avoirdupois) per hour', 'oz/h', 7.874867e-06),
+    ('L35', 'ACTIVE', 'ounce (avoirdupois) per minute', 'oz/min', 0.00047249200000000003),
+    ('L36', 'ACTIVE', 'ounce (avoirdupois) per second', 'oz/s', 0.02834952),
+    ('L37', 'ACTIVE', 'ounce (avoirdupois) per gallon (UK)', 'oz/gal (UK)', 6.236023),
+    ('L38', 'ACTIVE', 'ounce (avoirdupois) per gallon (US)', 'oz/gal (US)', 7.489152),
+    ('L39', 'ACTIVE', 'ounce (avoirdupois) per cubic inch', 'oz/in³', 1729.9940000000001),
+    ('L40', 'ACTIVE', 'ounce (avoirdupois)force', 'ozf', 0.2780139),
+    ('L41', 'ACTIVE', 'ounce (avoirdupois)force inch', 'ozf·in', 0.007061552),
+    ('L42', 'ACTIVE', 'picosiemens per metre', 'pS/m', 1e-12),
+    ('L43', 'ACTIVE', 'peck (UK)', 'pk (UK)', 0.009092181),
+    ('L44', 'ACTIVE', 'peck (UK) per day', 'pk (UK)/d', 1.0523359999999999e-07),
+    ('L45', 'ACTIVE', 'peck (UK) per hour', 'pk (UK)/h', 2.5256059999999998e-06),
+    ('L46', 'ACTIVE', 'peck (UK) per minute', 'pk (UK)/min', 0.00015153635),
+    ('L47', 'ACTIVE', 'peck (UK) per second', 'pk (UK)/s', 0.009092181),
+    ('L48', 'ACTIVE', 'peck (US dry) per day', 'pk (US dry)/d', 1.019649e-07),
+    ('L49', 'ACTIVE', 'peck (US dry) per hour', 'pk (US dry)/h', 2.4471579999999997e-06),
+    ('L50', 'ACTIVE', 'peck (US dry) per minute', 'pk (US dry)/min', 0.0001468295),
+    ('L51', 'ACTIVE', 'peck (US dry) per second', 'pk (US dry)/s', 0.008809768),
+    ('L52', 'ACTIVE', 'psi per psi', 'psi/psi', 1),
+    ('L53', 'ACTIVE', 'pint (UK) per day', 'pt (UK)/d', 6.5770980000000006e-09),
+    ('L54', 'ACTIVE', 'pint (UK) per hour', 'pt (UK)/h', 1.578504e-07),
+    ('L55', 'ACTIVE', 'pint (UK) per minute', 'pt (UK)/min', 9.471022e-06),
+    ('L56', 'ACTIVE', 'pint (UK) per second', 'pt (UK)/s', 0.0005682613),
+    ('L57', 'ACTIVE', 'pint (US liquid) per day', 'pt (US liq.)/d', 5.476580000000001e-09),
+    ('L58', 'ACTIVE', 'pint (US liquid) per hour', 'pt (US liq.)/h', 1.314379e-07),
+    ('L59', 'ACTIVE', 'pint (US liquid) per minute', 'pt (US liq.)/min', 7.886275e-06),
+    ('L60', 'ACTIVE', 'pint (US liquid) per second', 'pt (US liq.)/s', 0.0004731765),
+    ('L61', 'MARKED_AS_DELETED', 'pint (US dry)', 'pt (US dry)', 0.0005506105),
+    ('L62', 'MARKED_AS_DELETED', 'quart (US dry)', 'qt (US dry)', 0.001101221),
+    ('L63', 'ACTIVE', 'slug per day', 'slug/d', 0.00016891090000000002),
+    ('L64', 'ACTIVE', 'slug per foot second', 'slug/(ft·s)', 47.88026),
+    ('L65', 'ACTIVE', 'slug per cubic foot', 'slug/ft³', 515.3788),
+    ('L66', 'ACTIVE', 'slug per hour', 'slug/h', 0.004053861000000001),
+    ('L67', 'ACTIVE', 'slug per minute', 'slug/min', 0.2432317),
+    ('L68', 'ACTIVE', 'slug per second', 'slug/s', 14.5939),
+    ('L69', 'ACTIVE', 'tonne per kelvin', 't/K', 1000.0),
+    ('L70', 'ACTIVE', 'tonne per bar', 't/bar', 0.01),
+    ('L71', 'ACTIVE', 'tonne per day', 't/d', 0.0115741),
+    ('L72', 'ACTIVE', 'tonne per day kelvin', '(t/d)/K', 0.0115741),
+    ('L73', 'ACTIVE', 'tonne per day bar', '(t/d)/bar', 1.15741e-07),
+    ('L74', 'ACTIVE', 'tonne per hour kelvin', '(t/h)/K', 0.277778),
+    ('L75', 'ACTIVE', 'tonne per hour bar', '(t/h)/bar', 2.7777799999999998e-06),
+    ('L76', 'ACTIVE', 'tonne per cubic metre kelvin', '(t/m³)/K', 1000.0),
+    ('L77', 'ACTIVE', 'tonne per cubic metre bar', '(t/m³)/bar', 0.01),
+    ('L78', 'ACTIVE', 'tonne per minute', 't/min', 16.6667),
+    ('L79', 'ACTIVE', 'tonne per minute kelvin', '(t/min)/K', 16.6667),
+    ('L80', 'ACTIVE', 'tonne per minute bar', '(t/min)/bar', 0.000166667),
+    ('L81', 'ACTIVE', 'tonne per second', 't/s', 1000.0),
+    ('L82', 'ACTIVE', 'tonne per second kelvin', '(t/s)/K', 1000.0),
+    ('L83', 'ACTIVE', 'tonne per second bar', '(t/s)/bar', 0.01),
+    ('L84', 'ACTIVE', 'ton (UK shipping)', 'British shipping ton', 1.1893),
+    ('L85', 'ACTIVE', 'ton long per day', 'ton (UK)/d', 0.0117598),
+    ('L86', 'ACTIVE', 'ton (US shipping)', '(US) shipping ton', 1.1326),
+    ('L87', 'ACTIVE', 'ton short per degree Fahrenheit', 'ton (US)/°F', 1632.932),
+    ('L88', 'ACTIVE', 'ton short per day', 'ton (US)/d', 0.01049982),
+    ('L89', 'ACTIVE', 'ton short per hour degree Fahrenheit', 'ton (US)/(h·°F)', 0.4535922),
+    ('L90', 'ACTIVE', 'ton short per hour psi', '(ton (US)/h)/psi', 3.6548890000000004e-05),
+    ('L91', 'ACTIVE', 'ton short per psi', 'ton (US)/psi', 0.131576),
+    ('L92', 'ACTIVE', 'ton (UK long) per cubic yard', 'ton.l/yd³ (UK)', 1328.939),
+    ('L93', 'ACTIVE', 'ton (US short) per cubic yard', 'ton.s/yd³ (US)', 1186.5529999999999),
+    ('L94', 'ACTIVE', 'tonforce (US short)', 'ton.sh-force', 8896.443),
+    ('L95', 'ACTIVE', 'common year', 'y (365 days)', 31536000.0),
+    ('L96', 'ACTIVE', 'sidereal year', 'y (sidereal)', 31558150.0),
+    ('L98', 'ACTIVE', 'yard per degree Fahrenheit', 'yd/°F', 1.64592),
+    ('L99', 'ACTIVE', 'yard per psi', 'yd/psi', 0.0001326225),
+    ('LA', 'ACTIVE', 'pound per cubic inch', 'lb/in³', 27679.9),
+    ('LAC', 'ACTIVE', 'lactose excess percentage', None, None),
+    ('LBR', 'ACTIVE', 'pound', 'lb', 0.45359237),
+    ('LBT', 'ACTIVE', 'troy pound (US)', None, 373.2417),
+    ('LC', 'MARKED_AS_DELETED', 'linear centimetre', None, None),
+    ('LD', 'ACTIVE', 'litre per day', 'l/d', 1.15741e-08),
+    ('LE', 'MARKED_AS_DELETED', 'lite', None, None),
+    ('LEF', 'ACTIVE', 'leaf', None, None),
+    ('LF', 'ACTIVE', 'linear foot', None, None),
+    ('LH', 'ACTIVE', 'labour hour', None, None),
+    ('LI', 'MARKED_AS_DELETED', 'linear inch', None, None),
+    ('LJ', 'MARKED_AS_DELETED', 'large spray', None, None),
+    ('LK', 'ACTIVE', 'link', None, None),
+    ('LM', 'ACTIVE', 'linear metre', None, None),
+    ('LN', 'ACTIVE', 'length', None, None),
+    ('LO', 'ACTIVE', 'lot [unit of procurement]', None, None),
+    ('LP', 'ACTIVE', 'liquid pound', None, None),
+    ('LPA', 'ACTIVE', 'litre of pure alcohol', None, None),
+    ('LR', 'ACTIVE', 'layer', None, None),
+    ('LS', 'ACTIVE', 'lump sum', None, None),
+    ('LTN', 'ACTIVE', 'ton (UK) or long ton (US)', 'ton (UK)', 1016.0469999999999),
+    ('LTR', 'ACTIVE', 'litre', 'l', 0.001),
+    ('LUB', 'ACTIVE', 'metric ton, lubricating oil', None, None),
+    ('LUM', 'ACTIVE', 'lumen', 'lm', 1),
+    ('LUX', 'ACTIVE', 'lux', 'lx', 1.0),
+    ('LX', 'MARKED_AS_DELETED', 'linear yard per pound', None, None),
+    ('LY', 'ACTIVE', 'linear yard', None, None),
+    ('M0', 'MARKED_AS_DELETED', 'magnetic tape', None, None),
+    ('M1', 'ACTIVE', 'milligram per litre', 'mg/l', 0.001),
+    ('M10', 'ACTIVE', 'reciprocal cubic yard', '1/yd³', 1.307951),
+    ('M11', 'ACTIVE', 'cubic yard per degree Fahrenheit', 'yd³/°F', 1.376199),
+    ('M12', 'ACTIVE', 'cubic yard per day', 'yd³/d', 8.849014999999999e-06),
+    ('M13', 'ACTIVE', 'cubic yard per hour', 'yd³/h', 0.00021237640000000002),
+    ('M14', 'ACTIVE', 'cubic yard per psi', 'yd³/psi', 0.0001108893),
+    ('M15', 'ACTIVE', 'cubic yard per minute', 'yd³/min', 0.01274258),
+    ('M16', 'ACTIVE', 'cubic yard per second', 'yd³/s', 0.7645549),
+    ('M17', 'ACTIVE', 'kilohertz metre', 'kHz·m', 1000),
+    ('M18', 'ACTIVE', 'gigahertz metre', 'GHz·m', 1000000000),
+    ('M19', 'ACTIVE', 'Beaufort', 'Bft', None),
+    ('M20', 'ACTIVE', 'reciprocal megakelvin or megakelvin to the power minus one', '1/MK', 1e-06),
+    ('M21', 'ACTIVE', 'reciprocal kilovolt  ampere reciprocal hour', '1/kVAh', 2.777778e-07),
+    ('M22', 'ACTIVE', 'millilitre per square centimetre minute', '(ml/min)/cm²', 2.777778e-06),
+    ('M23', 'ACTIVE', 'newton per centimetre', 'N/cm', 100.0),
+    ('M24', 'ACTIVE', 'ohm kilometre', 'Ω·km', 1000),
+    ('M25', 'ACTIVE', 'percent per degree Celsius', '%/°C', None),
+    ('M26', 'ACTIVE', 'gigaohm per metre', 'GΩ/m', 1000000000.0),
+    ('M27', 'ACTIVE', 'megahertz metre', 'MHz·m', 1000000),
+    ('M29', 'ACTIVE', 'kilogram per kilogram', 'kg/kg', 1),
+    ('M30', 'ACTIVE', 'reciprocal volt  ampere reciprocal second', '1/(V·A·s)', 1.0),
+    ('M31', 'ACTIVE', 'kilogram per kilometre', 'kg/km', 0.001),
+    ('M32', 'ACTIVE', 'pascal second per litre', 'Pa·s/l', 1000.0),
+    ('M33', 'ACTIVE', 'millimole per litre', 'mmol/l', 1.0),
+    ('M34', 'ACTIVE', 'newton metre per square metre', 'N·m/m²', 1.0),
+    ('M35', 'ACTIVE', 'millivolt  ampere', 'mV·A', 0.001),
+    ('M36', 'ACTIVE', '30day month', 'mo (30 days)', 2592000.0),
+    ('M37', 'ACTIVE', 'actual/360', 'y (360 days)', 31104000.0),
+    ('M38', 'ACTIVE', 'kilometre per second squared', 'km/s²', 1000.0),
+    ('M39', 'ACTIVE', 'centimetre per second squared', 'cm/s²', 0.01),
+    ('M4', 'ACTIVE', 'monetary value', None, None),
+    ('M40', 'ACTIVE', 'yard per second squared', 'yd/s²', 0.9144000000000001),
+    ('M41', 'ACTIVE', 'millimetre per second squared', 'mm/s²', 0.001),
+    ('M42', 'ACTIVE', 'mile (statute mile) per second squared', 'mi/s²', 1609.344),
+    ('M43', 'ACTIVE', 'mil', 'mil', 0.0009817477),
+    ('M44', 'ACTIVE', 'revolution', 'rev', 6.283185),
+    ('M45', 'ACTIVE', 'degree [unit of angle] per second squared', '°/s²', 0.01745329),
+    ('M46', 'ACTIVE', 'revolution per minute', 'r/min', 0.1047198),
+    ('M47', 'ACTIVE', 'circular mil', 'cmil', 5.067075e-10),
+    ('M48', 'ACTIVE', 'square mile (based on U.S. survey foot)', 'mi² (US survey)', 2589998.0),
+    ('M49', 'ACTIVE', 'chain (based on U.S. survey foot)', 'ch (US survey)', 20.116839999999996),
+    ('M5', 'ACTIVE', 'microcurie', 'µCi', 37000.0),
+    ('M50', 'ACTIVE', 'furlong', 'fur', 201.168),
+    ('M51', 'ACTIVE', 'foot (U.S. survey)', 'ft (US survey)', 0.30480060000000003),
+    ('M52', 'ACTIVE', 'mile (based on U.S. survey foot)', 'mi (US survey)', 1609.347),
+    ('M53', 'ACTIVE', 'metre per pascal', 'm/Pa', 1.0),
+    ('M55', 'ACTIVE', 'metre per radiant', 'm/rad', 1.0),
+    ('M56', 'ACTIVE', 'shake', 'shake', 1e-08),
+    ('M57', 'ACTIVE', 'mile per minute', 'mi/min', 26.8224),
+    ('M58', 'ACTIVE', 'mile per second', 'mi/s', 1609.344),
+    ('M59', 'ACTIVE', 'metre per second pascal', '(m/s)/Pa', 1.0),
+    ('M60', 'ACTIVE', 'metre per hour', 'm/h', 0.000277778),
+    ('M61', 'ACTIVE', 'inch per year', 'in/y', 8.048774e-10),
+    ('M62', 'ACTIVE', 'kilometre per second', 'km/s', 1000.0),
+    ('M63', 'ACTIVE', 'inch per minute', 'in/min', 0.0004233333),
+    ('M64', 'ACTIVE', 'yard per second', 'yd/s', 0.9144000000000001),
+    ('M65', 'ACTIVE', 'yard per minute', 'yd/min', 0.01524),
+    ('M66', 'ACTIVE', 'yard per hour', 'yd/h', 0.000254),
+    ('M67', 'ACTIVE', 'acrefoot (based on U.S. survey foot)', 'acre-ft (US survey)', 1233.489),
+    ('M68', 'ACTIVE', 'cord (128 ft3)', 'cord', 3.624556),
+    ('M69', 'ACTIVE', 'cubic mile (UK statute)', 'mi³', 4168182000.0),
+    ('M7', 'ACTIVE', 'microinch', 'µin', 2.54e-08),
+    ('M70', 'ACTIVE', 'ton, register', 'RT', 2.831685),
+    ('M71', 'ACTIVE', 'cubic metre per pascal', 'm³/Pa', 1.0),
+    ('M72', 'ACTIVE', 'bel', 'B', 1),
+    ('M73', 'ACTIVE', 'kilogram per cubic metre pascal', '(kg/m³)/Pa', 1.0),
+    ('M74', 'ACTIVE', 'kilogram per pascal', 'kg/Pa', 1),
+    ('M75', 'ACTIVE', 'kilopoundforce', 'kip', 4448.222000000001),
+    ('M76', 'ACTIVE', 'poundal', 'pdl', 0.138255),
+    ('M77', 'ACTIVE', 'kilogram metre per second squared', 'kg·m/s²', 1.0),
+    ('M78', 'ACTIVE', 'pond', 'p', 0.00980665),
+    ('M79', 'ACTIVE', 'square foot per hour', 'ft²/h', 2.58064e-05),
+    ('M80', 'ACTIVE', 'stokes per pascal', 'St/Pa', 0.0001),
+    ('M81', 'ACTIVE', 'square centimetre per second', 'cm²/s', 0.0001),
+    ('M82', 'ACTIVE', 'square metre per second pascal', '(m²/s)/Pa', 1.0),
+    ('M83', 'ACTIVE', 'denier', 'den', 1.1111109999999999e-07),
+    ('M84', 'ACTIVE', 'pound per yard', 'lb/yd', 0.4960546),
+    ('M85', 'ACTIVE', 'ton, assay', None, 0.02916667),
+    ('M86', 'ACTIVE', 'pfund', 'pfd', 0.5),
+    ('M87', 'ACTIVE', 'kilogram per second pascal', '(kg/s)/Pa', 1),
+    ('M88', 'ACTIVE', 'tonne per month', 't/mo', 0.000380257053768),
+    ('M89', 'ACTIVE', 'tonne per year', 't/y', 3.1688087810000006e-05),
+    ('M9', 'ACTIVE', 'million Btu per 1000 cubic foot', 'MBTU/kft³', None),
+    ('M90', 'ACTIVE', 'kilopound per hour', 'klb/h', 0.125997889),
+    ('M91', 'ACTIVE', 'pound per pound', 'lb/lb', 1),
+    ('M92', 'ACTIVE', 'poundforce foot', 'lbf·ft', 1.355818),
+    ('M93', 'ACTIVE', 'newton metre per radian', 'N·m/rad', 1.0),
+    ('M94', 'ACTIVE', 'kilogram metre', 'kg·m', 1),
+    ('M95', 'ACTIVE', 'poundal foot', 'pdl·ft', 0.04214011),
+    ('M96', 'ACTIVE', 'poundal inch', 'pdl·in', 0.023091719500545033),
+    ('M97', 'ACTIVE', 'dyne metre', 'dyn·m', 1e-05),
+    ('M98', 'ACTIVE', 'kilogram centimetre per second', 'kg·(cm/s)', 0.01),
+    ('M99', 'ACTIVE', 'gram centimetre per second', 'g·(cm/s)', 1e-05),
+    ('MA', 'MARKED_AS_DELETED', 'machine per unit', None, None),
+    ('MAH', 'ACTIVE', 'megavolt ampere reactive hour', 'Mvar·h', None),
+    ('MAL', 'ACTIVE', 'megalitre', 'Ml', 1000),
+    ('MAM', 'ACTIVE', 'megametre', 'Mm', 1000000),
+    ('MAR', 'ACTIVE', 'megavar', 'Mvar', None),
+    ('MAW', 'ACTIVE', 'megawatt', 'MW', 1000000),
+    ('MBE', 'ACTIVE', 'thousand standard brick equivalent', None, None),
+    ('MBF', 'ACTIVE', 'thousand board foot', None, None),
+    ('MBR', 'ACTIVE', 'millibar', 'mbar', 100),
+    ('MC', 'ACTIVE', 'microgram', 'µg', 1e-09),
+    ('MCU', 'ACTIVE', 'millicurie', 'mCi', 37000000.0),
+    ('MD', 'ACTIVE', 'air dry metric ton', None, None),
+    ('MF', 'MARKED_AS_DELETED', 'milligram per square foot per side', None, None),
+    ('MGM', 'ACTIVE', 'milligram', 'mg', 1e-06),
+    ('MHZ', 'ACTIVE', 'megahertz', 'MHz', 1000000),
+    ('MIK', 'ACTIVE', 'square mile (statute mile)', 'mi²', 2.589988),
+    ('MIL', 'ACTIVE', 'thousand', None, 1000),
+    ('MIN', 'ACTIVE', 'minute [unit of time]', 'min', 60),
+    ('MIO', 'ACTIVE', 'million', None, 1000000),
+    ('MIU', 'ACTIVE', 'million international unit', None, None),
+    ('MK', 'MARKED_AS_DELETED', 'milligram per square inch', 'mg/in²', None),
+    ('MLD', 'ACTIVE', 'milliard', None, 1000000000),
+    ('MLT', 'ACTIVE', 'millilitre', 'ml', 1e-06),
+    ('MMK', 'ACTIVE', 'square millimetre', 'mm²', 1e-06),
+    ('MMQ', 'ACTIVE', 'cubic millimetre', 'mm³', 1e-09),
+    ('MMT', 'ACTIVE', 'millimetre', 'mm', 0.001),
+    ('MND', 'ACTIVE', 'kilogram, dry weight', None, None),
+    ('MON', 'ACTIVE', 'month', 'mo', 2629800.0),
+    ('MPA', 'ACTIVE', 'megapascal', 'MPa', 1000000),
+    ('MQ', 'MARKED_AS_DELETED', 'thousand metre', None, 1000),
+    ('MQH', 'ACTIVE', 'cubic metre per hour', 'm³/h', 0.000277778),
+    ('MQS', 'ACTIVE', 'cubic metre per second', 'm³/s', 1.0),
+    ('MSK', 'ACTIVE', 'metre per second squared', 'm/s²', 1.0),
+    ('MT', 'MARKED_AS_DELETED', 'mat', None, None),
+    ('MTK', 'ACTIVE', 'square metre', 'm²', 1),
+    ('MTQ', 'ACTIVE', 'cubic metre', 'm³', 1),
+    ('MTR', 'ACTIVE', 'metre', 'm', 1),
+    ('MTS', 'ACTIVE', 'metre per second', 'm/s', 1.0),
+    ('MV', 'MARKED_AS_DELETED', 'number of mults', None, None),
+    ('MVA', 'ACTIVE', 'megavolt  ampere', 'MV·A', 1000000),
+    ('MWH', 'ACTIVE', 'megawatt hour (1000\xa0kW.h)', 'MW·h', 3600000000.0),
+    ('N1', 'ACTIVE', 'pen calorie', None, None),
+    ('N10', 'ACTIVE', 'pound foot per second', 'lb·(ft/s)', 0.138255),
+    ('N11', 'ACTIVE', 'pound inch per second', 'lb·(in/s)', 0.01152125),
+    ('N12', 'ACTIVE', 'Pferdestaerke', 'PS', 735.4988),
+    ('N13', 'ACTIVE', 'centimetre of mercury (0 ºC)', 'cmHg (0 ºC)', 1333.22),
+    ('N14', 'ACTIVE', 'centimetre of water (4 ºC)', 'cmH₂O (4 °C)', 98.06380000000001),
+    ('N15', 'ACTIVE', 'foot of water (39.2 ºF)', 'ftH₂O (39,2 ºF)', 2988.98),
+    ('N16', 'ACTIVE', 'inch of mercury (32 ºF)', 'inHG (32 ºF)', 3386.38),
+    ('N17', 'ACTIVE', 'inch of mercury (60 ºF)', 'inHg (60 ºF)', 3376.85),
+    ('N18', 'ACTIVE', 'inch of water (39.2 ºF)', 'inH₂O (39,2 ºF)', 249.082),
+    ('N19', 'ACTIVE', 'inch of water (60 ºF)', 'inH₂O (60 ºF)', 248.84),
+    ('N2', 'MARKED_AS_DELETED', 'number of lines', None, None),
+    ('N20', 'ACTIVE', 'kip per square inch', 'ksi', 6894757.0),
+    ('N21', 'ACTIVE', 'poundal per square foot', 'pdl/ft²', 1.488164),
+    ('N22', 'ACTIVE', 'ounce (avoirdupois) per square inch', 'oz/in²', 43.94185),
+    ('N23', 'ACTIVE', 'conventional metre of water', 'mH₂O', 9806.65),
+    ('N24', 'ACTIVE', 'gram per square millimetre', 'g/mm²', 1000.0),
+    ('N25', 'ACTIVE', 'pound per square yard', 'lb/yd²', 0.5424919),
+    ('N26', 'ACTIVE', 'poundal per square inch', 'pdl/in²', 214.2957),
+    ('N27', 'ACTIVE', 'foot to the fourth power', 'ft⁴', 0.008630974999999999),
+    ('N28', 'ACTIVE', 'cubic decimetre per kilogram', 'dm³/kg', 0.001),
+    ('N29', 'ACTIVE', 'cubic foot per pound', 'ft³/lb', 0.062427960000000005),
+    ('N3', 'ACTIVE', 'print point', None, 0.0138),
+    ('N30', 'ACTIVE', 'cubic inch per pound', 'in³/lb', 3.612728000000001e-05),
+    ('N31', 'ACTIVE', 'kilonewton per metre', 'kN/m', 1000.0),
+    ('N32', 'ACTIVE', 'poundal per inch', 'pdl/in', 5.44311),
+    ('N33', 'ACTIVE', 'poundforce per yard', 'lbf/yd', 4.864635),
+    ('N34', 'ACTIVE', 'poundal second per square foot', '(pdl/ft²)·s', 1.488164),
+    ('N35', 'ACTIVE', 'poise per pascal', 'P/Pa', 0.1),
+    ('N36', 'ACTIVE', 'newton second per square metre', '(N/m²)·s', 1),
+    ('N37', 'ACTIVE', 'kilogram per metre second', 'kg/(m·s)', 1),
+    ('N38', 'ACTIVE', 'kilogram per metre minute', 'kg/(m·min)', 0.016666700000000003),
+    ('N39', 'ACTIVE', 'kilogram per metre day', 'kg/(m·d)', 1.1574100000000002e-05),
+    ('N40', 'ACTIVE', 'kilogram per metre hour', 'kg/(m·h)', 0.000277778),
+    ('N41', 'ACTIVE', 'gram per centimetre second', 'g/(cm·s)', 0.1),
+    ('N42', 'ACTIVE', 'poundal second per square inch', '(pdl/in²)·s', 214.2957),
+    ('N43', 'ACTIVE', 'pound per foot minute', 'lb/(ft·min)', 0.02480273),
+    ('N44', 'ACTIVE', 'pound per foot day', 'lb/(ft·d)', 1.722412e-05),
+    ('N45', 'ACTIVE', 'cubic metre per second pascal', '(m³/s)/Pa', 1.0),
+    ('N46', 'ACTIVE', 'foot poundal', 'ft·pdl', 0.04214011),
+    ('N47', 'ACTIVE', 'inch poundal', 'in·pdl', 0.0035116770000000004),
+    ('N48', 'ACTIVE', 'watt per square centimetre', 'W/cm²', 10000.0),
+    ('N49', 'ACTIVE', 'watt per square inch', 'W/in²', 1550.003),
+    ('N50', 'ACTIVE', 'British thermal unit (international table) per square foot hour', 'BtuIT/(ft²·h)', 3.154591),
+    ('N51', 'ACTIVE', 'British thermal unit (thermochemical) per square foot hour', 'Btuth/(ft²·h)', 3.152481),
+    ('N52', 'ACTIVE', 'British thermal unit (thermochemical) per square foot minute', 'Btuth/(ft²·min)', 189.1489),
+    ('N53', 'ACTIVE', 'British thermal unit (international table) per square foot second', 'BtuIT/(ft²·s)', 11356.53),
+    ('N54', 'ACTIVE', 'British thermal unit (thermochemical) per square foot second', 'Btuth/(ft²·s)', 11348.929999999998),
+    ('N55', 'ACTIVE', 'British thermal unit (international table) per square inch second', 'BtuIT/(in²·s)', 1634246.0),
+    ('N56', 'ACTIVE', 'calorie (thermochemical) per square centimetre minute', 'calth/(cm²·min)', 697.3333),
+    ('N57', 'ACTIVE', 'calorie (thermochemical) per square centimetre second', 'calth/(cm²·s)', 41840.0),
+    ('N58', 'ACTIVE', 'British thermal unit (international table) per cubic foot', 'BtuIT/ft³', 37258.95),
+    ('N59', 'ACTIVE', 'British thermal unit (thermochemical) per cubic foot', 'Btuth/ft³', 37234.03),
+    ('N60', 'ACTIVE', 'British thermal unit (international table) per degree Fahrenheit', 'BtuIT/ºF', 1899.1009999999999),
+    ('N61', 'ACTIVE', 'British thermal unit (thermochemical) per degree Fahrenheit', 'Btuth/ºF', 1897.83),
+    ('N62', 'ACTIVE', 'British thermal unit (international table) per degree Rankine', 'BtuIT/ºR', 1899.1009999999999),
+    ('N63', 'ACTIVE', 'British thermal unit (thermochemical) per degree Rankine', 'Btuth/ºR', 1897.83),
+    ('N64', 'ACTIVE', 'British thermal unit (thermochemical) per pound degree Rankine', '(Btuth/°R)/lb', 4184.0),
+    ('N65', 'ACTIVE', 'kilocalorie (international table) per gram kelvin', '(kcalIT/K)/g', 4186800.0),
+    ('N66', 'ACTIVE', 'British thermal unit (39 ºF)', 'Btu (39 ºF)', 1059.6699999999998),
+    ('N67', 'ACTIVE', 'British thermal unit (59 ºF)', 'Btu (59 ºF)', 1054.8),
+    ('N68', 'ACTIVE', 'British thermal unit (60 ºF)', 'Btu (60 ºF)', 1054.68),
+    ('N69', 'ACTIVE', 'calorie (20 ºC)', 'cal₂₀', 4.1819),
+    ('N70', 'ACTIVE', 'quad (1015 BtuIT)', 'quad', 1.055056e+18),
+    ('N71', 'ACTIVE', 'therm (EC)', 'thm (EC)', 105506000.00000001),
+    ('N72', 'ACTIVE', 'therm (U.S.)', 'thm (US)', 105480400.00000001),
+    ('N73', 'ACTIVE', 'British thermal unit (thermochemical) per pound', 'Btuth/lb', 2324.444),
+    ('N74', 'ACTIVE', 'British thermal unit (international table) per hour square foot degree Fahrenheit', 'BtuIT/(h·ft²·ºF)', 5.678263),
+    ('N75', 'ACTIVE', 'British thermal unit (thermochemical) per hour square foot degree Fahrenheit', 'Btuth/(h·ft²·ºF)', 5.674466),
+    ('N76', 'ACTIVE', 'British thermal unit (international table) per second square foot degree Fahrenheit', 'BtuIT/(s·ft²·ºF)', 20441.75),
+    ('N77', 'ACTIVE', 'British thermal unit (thermochemical) per second square foot degree Fahrenheit', 'Btuth/(s·ft²·ºF)', 20428.079999999998),
+    ('N78', 'ACTIVE', 'kilowatt per square metre kelvin', 'kW/(m²·K)', 1000.0),
+    ('N79', 'ACTIVE', 'kelvin per pascal', 'K/Pa', 1.0),
+    ('N80', 'ACTIVE', 'watt per metre degree Celsius', 'W/(m·°C)', 1.0),
+    ('N81', 'ACTIVE', 'kilowatt per metre kelvin', 'kW/(m·K)', 1000.0),
+    ('N82', 'ACTIVE', 'kilowatt per metre degree Celsius', 'kW/(m·°C)', 1000.0),
+    ('N83', 'ACTIVE', 'metre per degree Celcius metre', 'm/(°C·m)', 1.0),
+    ('N84', 'ACTIVE', 'degree Fahrenheit hour per British thermal unit (international table)', 'ºF/(BtuIT/h)', 1.895634),
+    ('N85', 'ACTIVE', 'degree Fahrenheit hour per British thermal unit (thermochemical)', 'ºF/(Btuth/h)', 1.896903),
+    ('N86', 'ACTIVE', 'degree Fahrenheit second per British thermal unit (international table)', 'ºF/(BtuIT/s)', 0.0005265651),
+    ('N87', 'ACTIVE', 'degree Fahrenheit second per British thermal unit (thermochemical)', 'ºF/(Btuth/s)', 0.0005269175),
+    ('N88', 'ACTIVE', 'degree Fahrenheit hour square foot per British thermal unit (international table) inch', 'ºF·h·ft²/(BtuIT·in)', 6.933472),
+    ('N89', 'ACTIVE', 'degree Fahrenheit hour square foot per British thermal unit (thermochemical) inch', 'ºF·h·ft²/(Btuth·in)', 6.938112),
+    ('N90', 'ACTIVE', 'kilofarad', 'kF', 1000),
+    ('N91', 'ACTIVE', 'reciprocal joule', '1/J', 1.0),
+    ('N92', 'ACTIVE', 'picosiemens', 'pS', 1e-12),
+    ('N93', 'ACTIVE', 'ampere per pascal', 'A/Pa', 1.0),
+    ('N94', 'ACTIVE', 'franklin', 'Fr', 3.335641e-10),
+    ('N95', 'ACTIVE', 'ampere minute', 'A·min', 60),
+    ('N96', 'ACTIVE', 'biot', 'Bi', 10),
+    ('N97', 'ACTIVE', 'gilbert', 'Gi', 0.7957747000000001),
+    ('N98', 'ACTIVE', 'volt per pascal', 'V/Pa', 1.0),
+    ('N99', 'ACTIVE', 'picovolt', 'pV', 1e-12),
+    ('NA', 'ACTIVE', 'milligram per kilogram', 'mg/kg', 1e-06),
+    ('NAR', 'ACTIVE', 'number of articles', None, None),
+    ('NB', 'MARKED_AS_DELETED', 'barge', None, None),
+    ('NBB', 'MARKED_AS_DELETED', 'number of bobbins', None, None),
+    ('NC', 'MARKED_AS_DELETED', 'car', None, None),
+    ('NCL', 'ACTIVE', 'number of cells', None, None),
+    ('ND', 'MARKED_AS_DELETED', 'net barrel', None, None),
+    ('NE', 'MARKED_AS_DELETED', 'net litre', None, None),
+    ('NEW', 'ACTIVE', 'newton', 'N', 1.0),
+    ('NF', 'ACTIVE', 'message', None, None),
+    ('NG', 'MARKED_AS_DELETED', 'net gallon (us)', None, None),
+    ('NH', 'MARKED_AS_DELETED', 'message hour', None, None),
+    ('NI', 'MARKED_AS_DELETED', 'net imperial gallon', None, None),
+    ('NIL', 'ACTIVE', 'nil', '()', None),
+    ('NIU', 'ACTIVE', 'number of international units', None, None),
+    ('NJ', 'MARKED_AS_DELETED', 'number of screens', None, None),
+    ('NL', 'ACTIVE', 'load', None, None),
+    ('NM3', 'ACTIVE', 'Normalised cubic metre', None, 1),
+    ('NMI', 'ACTIVE', 'nautical mile', 'n mile', 1852),
+    ('NMP', 'ACTIVE', 'number of packs', None, None),
+    ('NN', 'MARKED_AS_DELETED', 'train', None, None),
+    ('NPL', 'MARKED_AS_DELETED', 'number of parcels', None, None),
+    ('NPR', 'DEPRECATED', 'number of pairs', None, None),
+    ('NPT', 'ACTIVE', 'number of parts', None, None),
+    ('NQ', 'DEPRECATED', 'mho', None, 1),
+    ('NR', 'DEPRECATED', 'micromho', None, 1e-06),
+    ('NRL', 'MARKED_AS_DELETED', 'number of rolls', None, None),
+    ('NT', 'ACTIVE', 'net ton', None, None),
+    ('NTT', 'DEPRECATED', 'net register ton', None, None),
+    ('NU', 'ACTIVE', 'newton metre', 'N·m', 1),
+    ('NV', 'MARKED_AS_DELETED', 'vehicle', None, None),
+    ('NX', 'ACTIVE', 'part per thousand', '‰', 0.001),
+    ('NY', 'MARKED_AS_DELETED', 'pound per air dry metric ton', None, None),
+    ('OA', 'ACTIVE', 'panel', None, None),
+    ('ODE', 'ACTIVE', 'ozone depletion equivalent', None, None),
+    ('ODG', 'ACTIVE', 'ODS Grams', None, None),
+    ('ODK', 'ACTIVE', 'ODS Kilograms', None, None),
+    ('ODM', 'ACTIVE', 'ODS Milligrams', None, None),
+    ('OHM', 'ACTIVE', 'ohm', 'Ω', 1),
+    ('ON', 'ACTIVE', 'ounce per square yard', 'oz/yd²', 0.033905750000000005),
+    ('ONZ', 'ACTIVE', 'ounce (avoirdupois)', 'oz', 0.02834952),
+    ('OP', 'MARKED_AS_DELETED', 'two pack', None, None),
+    ('OPM', 'ACTIVE', 'oscillations per minute', 'o/min', 0.01667),
+    ('OT', 'ACTIVE', 'overtime hour', None, None),
+    ('OZ', 'DEPRECATED', 'ounce av', None, None),
+    ('OZA', 'ACTIVE', 'fluid ounce (US)', 'fl oz (US)', 2.9573530000000003e-05),
+    ('OZI', 'ACTIVE', 'fluid ounce (UK)', 'fl oz (UK)', 2.841306e-05),
+    ('P0', 'MARKED_AS_DELETED', 'page  electronic', None, None),
+    ('P1', 'ACTIVE', 'percent', '% or pct', 0.01),
+    ('P10', 'ACTIVE', 'coulomb per metre', 'C/m', 1.0),
+    ('P11', 'ACTIVE', 'kiloweber', 'kWb', 1000),
+    ('P12', 'ACTIVE', 'gamma', 'γ', 1e-09),
+    ('P13', 'ACTIVE', 'kilotesla', 'kT', 1000),
+    ('P14', 'ACTIVE', 'joule per second', 'J/s', 1),
+    ('P15', 'ACTIVE', 'joule per minute', 'J/min', 0.016666700000000003),
+    ('P16', 'ACTIVE', 'joule per hour', 'J/h', 0.000277778),
+    ('P17', 'ACTIVE', 'joule per day', 'J/d', 1.1574100000000002e-05),
+    ('P18', 'ACTIVE', 'kilojoule per second', 'kJ/s', 1000),
+    ('P19', 'ACTIVE', 'kilojoule per minute', 'kJ/min', 16.666700000000002),
+    ('P2', 'ACTIVE', 'pound per foot', 'lb/ft', 1.488164),
+    ('P20', 'ACTIVE', 'kilojoule per hour', 'kJ/h', 0.277778),
+    ('P21', 'ACTIVE', 'kilojoule per day', 'kJ/d', 0.0115741),
+    ('P22', 'ACTIVE', 'nanoohm', 'nΩ', 1e-09),
+    ('P23', 'ACTIVE', 'ohm circularmil per foot', 'Ω·cmil/ft', 1.662426e-09),
+    ('P24', 'ACTIVE', 'kilohenry', 'kH', 1000),
+    ('P25', 'ACTIVE', 'lumen per square foot', 'lm/ft²', 10.763910000000001),
+    ('P26', 'ACTIVE', 'phot', 'ph', 10000.0),
+    ('P27', 'ACTIVE', 'footcandle', 'ftc', 10.763910000000001),
+    ('P28', 'ACTIVE', 'candela per square inch', 'cd/in²', 1550.003),
+    ('P29', 'ACTIVE', 'footlambert', 'ftL', 3.426259),
+    ('P3', 'MARKED_AS_DELETED', 'three pack', None, None),
+    ('P30', 'ACTIVE', 'lambert', 'Lb', 3183.0989999999997),
+    ('P31', 'ACTIVE', 'stilb', 'sb', 10000.0),
+    ('P32', 'ACTIVE', 'candela per square foot', 'cd/ft²', 10.763910000000001),
+    ('P33', 'ACTIVE', 'kilocandela', 'kcd', 1000),
+    ('P34', 'ACTIVE', 'millicandela', 'mcd', 0.001),
+    ('P35', 'ACTIVE', 'HefnerKerze', 'HK', 0.903),
+    ('P36', 'ACTIVE', 'international candle', 'IK', 1.019),
+    ('P37', 'ACTIVE', 'British thermal unit (international table) per square foot', 'BtuIT/ft²', 11356.53),
+    ('P38', 'ACTIVE', 'British thermal unit (thermochemical) per square foot', 'Btuth/ft²', 11348.929999999998),
+    ('P39', 'ACTIVE', 'calorie (thermochemical) per square centimetre', 'calth/cm²', 41840.0),
+    ('P4', 'MARKED_AS_DELETED', 'four pack', None, None),
+    ('P40', 'ACTIVE', 'langley', 'Ly', 41840.0),
+    ('P41', 'ACTIVE', 'decade (logarithmic)', 'dec', 1),
+    ('P42', 'ACTIVE', 'pascal squared second', 'Pa²·s', 1.0),
+    ('P43', 'ACTIVE', 'bel per metre', 'B/m', 1.0),
+    ('P44', 'ACTIVE', 'pound mole', 'lbmol', 453.5924),
+    ('P45', 'ACTIVE', 'pound mole per second', 'lbmol/s', 453.59239999999994),
+    ('P46', 'ACTIVE', 'pound mole per minute', 'lbmol/h', 7.559873),
+    ('P47', 'ACTIVE', 'kilomole per kilogram', 'kmol/kg', 1000.0),
+    ('P48', 'ACTIVE', 'pound mole per pound', 'lbmol/lb', 1000.0),
+    ('P49', 'ACTIVE', 'newton square metre per ampere', 'N·m²/A', 1.0),
+    ('P5', 'ACTIVE', 'five pack', None, None),
+    ('P50', 'ACTIVE', 'weber metre', 'Wb·m', 1.0),
+    ('P51', 'ACTIVE', 'mol per kilogram pascal', '(mol/kg)/Pa', 1.0),
+    ('P52', 'ACTIVE', 'mol per cubic metre pascal', '(mol/m³)/Pa', 1.0),
+    ('P53', 'ACTIVE', 'unit pole', 'unit pole', 1.256637e-07),
+    ('P54', 'ACTIVE', 'milligray per second', 'mGy/s', 0.001),
+    ('P55', 'ACTIVE', 'microgray per second', 'µGy/s', 1e-06),
+    ('P56', 'ACTIVE', 'nanogray per second', 'nGy/s', 1e-09),
+    ('P57', 'ACTIVE', 'gray per minute', 'Gy/min', 0.016666700000000003),
+    ('P58', 'ACTIVE', 'milligray per minute', 'mGy/min', 1.66667e-05),
+    ('P59', 'ACTIVE', 'microgray per minute', 'µGy/min', 1.66667e-08),
+    ('P6', 'MARKED_AS_DELETED', 'six pack', None, None),
+    ('P60', 'ACTIVE', 'nanogray per minute', 'nGy/min', 1.66667e-11),
+    ('P61', 'ACTIVE', 'gray per hour', 'Gy/h', 0.000277778),
+    ('P62', 'ACTIVE', 'milligray per hour', 'mGy/h', 2.77778e-07),
+    ('P63', 'ACTIVE', 'microgray per hour', 'µGy/h', 2.77778e-10),
+    ('P64', 'ACTIVE', 'nanogray per hour', 'nGy/h', 2.77778e-13),
+    ('P65', 'ACTIVE', 'sievert per second', 'Sv/s', 1.0),
+    ('P66', 'ACTIVE', 'millisievert per second', 'mSv/s', 0.001),
+    ('P67', 'ACTIVE', 'microsievert per second', 'µSv/s', 1e-06),
+    ('P68', 'ACTIVE', 'nanosievert per second', 'nSv/s', 1e-09),
+    ('P69', 'ACTIVE', 'rem per second', 'rem/s', 0.01),
+    ('P7', 'MARKED_AS_DELETED', 'seven pack', None, None),
+    ('P70', 'ACTIVE', 'sievert per hour', 'Sv/h', 0.000277778),
+    ('P71', 'ACTIVE', 'millisievert per hour', 'mSv/h', 2.7777777799999998e-08),
+    ('P72', 'ACTIVE', 'microsievert per hour', 'µSv/h', 2.77777778e-11),
+    ('P73', 'ACTIVE', 'nanosievert per hour', 'nSv/h', 2.77777778e-14),
+    ('P74', 'ACTIVE', 'sievert per minute', 'Sv/min', 0.016666),
+    ('P75', 'ACTIVE', 'millisievert per minute', 'mSv/min', 1.6666666670000003e-05),
+    ('P76', 'ACTIVE', 'microsievert per minute', 'µSv/min', 1.666666667e-08),
+    ('P77', 'ACTIVE', 'nanosievert per minute', 'nSv/min', 1.666666667e-11),
+    ('P78', 'ACTIVE', 'reciprocal square inch', '1/in²', 1550.003),
+    ('P79', 'ACTIVE', 'pascal square metre per kilogram', 'Pa/(kg/m²)', 1.0),
+    ('P8', 'MARKED_AS_DELETED', 'eight pack', None, None),
+    ('P80', 'ACTIVE', 'millipascal per metre', 'mPa/m', 0.001),
+    ('P81', 'ACTIVE', 'kilopascal per metre', 'kPa/m', 1000.0),
+    ('P82', 'ACTIVE', 'hectopascal per metre', 'hPa/m', 100.0),
+    ('P83', 'ACTIVE', 'standard atmosphere per metre', 'Atm/m', 101325.0),
+    ('P84', 'ACTIVE', 'technical atmosphere per metre', 'at/m', 98066.5),
+    ('P85', 'ACTIVE', 'torr per metre', 'Torr/m', 133.3224),
+    ('P86', 'ACTIVE', 'psi per inch', 'psi/in', 271447.10000000003),
+    ('P87', 'ACTIVE', 'cubic metre per second square metre', '(m³/s)/m²', 1.0),
+    ('P88', 'ACTIVE', 'rhe', 'rhe', 10.0),
+    ('P89', 'ACTIVE', 'poundforce foot per inch', 'lbf·ft/in', 53.37866),
+    ('P9', 'MARKED_AS_DELETED', 'nine pack', None, None),
+    ('P90', 'ACTIVE', 'poundforce inch per inch', 'lbf·in/in', 4.448222),
+    ('P91', 'ACTIVE', 'perm (0 ºC)', 'perm (0 ºC)', 5.72135e-11),
+    ('P92', 'ACTIVE', 'perm (23 ºC)', 'perm (23 ºC)', 5.74525e-11),
+    ('P93', 'ACTIVE', 'byte per second', 'byte/s', 1.0),
+    ('P94', 'ACTIVE', 'kilobyte per second', 'kbyte/s', 1000.0),
+    ('P95', 'ACTIVE', 'megabyte per second', 'Mbyte/s', 1000000.0),
+    ('P96', 'ACTIVE', 'reciprocal volt', '1/V', 1.0),
+    ('P97', 'ACTIVE', 'reciprocal radian', '1/rad', 1.0),
+    ('P98', 'ACTIVE', 'pascal to the power sum of stoichiometric numbers', 'PaΣνB', None),
+    ('P99', 'ACTIVE', 'mole per cubiv metre to the power sum of stoichiometric numbers', '(mol/m³)∑νB', None),
+    ('PA', 'MARKED_AS_DELETED', 'packet', None, None),
+    ('PAL', 'ACTIVE', 'pascal', 'Pa', 1),
+    ('PB', 'MARKED_AS_DELETED', 'pair inch', None, None),
+    ('PD', 'ACTIVE', 'pad', None, None),
+    ('PE', 'MARKED_AS_DELETED', 'pound equivalent', None, None),
+    ('PF', 'MARKED_AS_DELETED', 'pallet (lift)', None, None),
+    ('PFL', 'ACTIVE', 'proof litre', None, None),
+    ('PG', 'MARKED_AS_DELETED', 'plate', None, None),
+    ('PGL', 'ACTIVE', 'proof gallon', None, None),
+    ('PI', 'ACTIVE', 'pitch', None, None),
+    ('PK', 'MARKED_AS_DELETED', 'pack', None, None),
+    ('PL', 'MARKED_AS_DELETED', 'pail', None, None),
+    ('PLA', 'ACTIVE', 'degree Plato', '°P', None),
+    ('PM', 'MARKED_AS_DELETED', 'pound percentage', None, None),
+    ('PN', 'MARKED_AS_DELETED', 'pound net', None, None),
+    ('PO', 'ACTIVE', 'pound per inch of length', 'lb/in', 17.85797),
+    ('PQ', 'ACTIVE', 'page per inch', 'ppi', None),
+    ('PR', 'ACTIVE', 'pair', None, 2),
+    ('PS', 'ACTIVE', 'poundforce per square inch', 'lbf/in²', 6894.7570000000005),
+    ('PT', 'DEPRECATED', 'pint (US)', 'pt (US)', 0.00047317600000000007),
+    ('PTD', 'ACTIVE', 'dry pint (US)', 'dry pt (US)', 0.0005506105),
+    ('PTI', 'ACTIVE', 'pint (UK)', 'pt (UK)', 0.000568261),
+    ('PTL', 'ACTIVE', 'liquid pint (US)', 'liq pt (US)', 0.0004731765),
+    ('PTN', 'ACTIVE', 'portion', 'PTN', None),
+    ('PU', 'MARKED_AS_DELETED', 'tray / tray pack', None, None),
+    ('PV', 'MARKED_AS_DELETED', 'half pint (US)', None, None),
+    ('PW', 'MARKED_AS_DELETED', 'pound per inch of width', None, None),
+    ('PY', 'MARKED_AS_DELETED', 'peck dry (US)', None, None),
+    ('PZ', 'MARKED_AS_DELETED', 'peck dry (UK)', None, None),
+    ('Q10', 'ACTIVE', 'joule per tesla', 'J/T', 1),
+    ('Q11', 'ACTIVE', 'erlang', 'E', 1),
+    ('Q12', 'ACTIVE', 'octet', 'o', 8),
+    ('Q13', 'ACTIVE', 'octet per second', 'o/s', 8.0),
+    ('Q14', 'ACTIVE', 'shannon', 'Sh', None),
+    ('Q15', 'ACTIVE', 'hartley', 'Hart', None),
+    ('Q16', 'ACTIVE', 'natural unit of information', 'nat', 1),
+    ('Q17', 'ACTIVE', 'shannon per second', 'Sh/s', 1.0),
+    ('Q18', 'ACTIVE', 'hartley per second', 'Hart/s', 1.0),
+    ('Q19', 'ACTIVE', 'natural unit of information per second', 'nat/s', 1.0),
+    ('Q20', 'ACTIVE', 'second per kilogramm', 's/kg', 1.0),
+    ('Q21', 'ACTIVE', 'watt square metre', 'W·m²', 1.0),
+    ('Q22', 'ACTIVE', 'second per radian cubic metre', '1/(Hz·rad·m³)', 1.0),
+    ('Q23', 'ACTIVE', 'weber to the power minus one', '1/Wb', 1.0),
+    ('Q24', 'ACTIVE', 'reciprocal inch', '1/in', 39.37008),
+    ('Q25', 'ACTIVE', 'dioptre', 'dpt', 1.0),
+    ('Q26', 'ACTIVE', 'one per one', '1/1', 1.0),
+    ('Q27', 'ACTIVE', 'newton metre per metre', 'N·m/m²', 1.0),
+    ('Q28', 'ACTIVE', 'kilogram per square metre pascal second', 'kg/(m²·Pa·s)', 1.0),
+    ('Q29', 'ACTIVE', 'microgram per hectogram', 'µg/hg', 1e-08),
+    ('Q30', 'ACTIVE', 'pH (potential of Hydrogen)', 'pH', None),
+    ('Q31', 'ACTIVE', 'kilojoule per gram', 'kJ/g', 1000000.0),
+    ('Q32', 'ACTIVE', 'femtolitre', 'fl', 1e-18),
+    ('Q33', 'ACTIVE', 'picolitre', 'pl', 1e-15),
+    ('Q34', 'ACTIVE', 'nanolitre', 'nl', 1e-12),
+    ('Q35', 'ACTIVE', 'megawatts per minute', 'MW/min', 173.368),
+    ('Q36', 'ACTIVE', 'square metre per cubic metre', 'm2/m3', 1.0),
+    ('Q37', 'ACTIVE', 'Standard cubic metre per day', None, 1.1574100000000002e-05),
+    ('Q38', 'ACTIVE', 'Standard cubic metre per hour', None, 0.000277778),
+    ('Q39', 'ACTIVE', 'Normalized cubic metre per day', None, 1.1574100000000002e-05),
+    ('Q40', 'ACTIVE', 'Normalized cubic metre per hour', None, 0.000277778),
+    ('Q41', 'ACTIVE', 'Joule per normalised cubic metre', None, None),
+    ('Q42', 'ACTIVE', 'Joule per standard cubic metre', None, None),
+    ('MNJ', 'CHANGED_CHARACTERISTICS', 'Mega Joule per Normalised cubic Metre', 'MJ/m³', None),
+    ('Q3', 'ACTIVE', 'meal', None, None),
+    ('QA', 'ACTIVE', 'page  facsimile', None, None),
+    ('QAN', 'ACTIVE', 'quarter (of a year)', None, None),
+    ('QB', 'ACTIVE', 'page  hardcopy', None, None),
+    ('QD', 'MARKED_AS_DELETED', 'quarter dozen', None, 3),
+    ('QH', 'MARKED_AS_DELETED', 'quarter hour', None, 900),
+    ('QK', 'MARKED_AS_DELETED', 'quarter kilogram', None, None),
+    ('QR', 'ACTIVE', 'quire', 'qr', None),
+    ('QT', 'DEPRECATED', 'quart (US)', 'qt (US)', 0.0009463529000000001),
+    ('QTD', 'ACTIVE', 'dry quart (US)', 'dry qt (US)', 0.001101221),
+    ('QTI', 'ACTIVE', 'quart (UK)', 'qt (UK)', 0.0011365225000000002),
+    ('QTL', 'ACTIVE', 'liquid quart (US)', 'liq qt (US)', 0.0009463529),
+    ('QTR', 'ACTIVE', 'quarter (UK)', 'Qr (UK)', 12.70059),
+    ('R1', 'ACTIVE', 'pica', None, 0.004217518),
+    ('R4', 'MARKED_AS_DELETED', 'calorie', 'cal', 4.1868),
+    ('R9', 'ACTIVE', 'thousand cubic metre', None, 1000),
+    ('RA', 'MARKED_AS_DELETED', 'rack', None, None),
+    ('RD', 'MARKED_AS_DELETED', 'rod', None, None),
+    ('RG', 'MARKED_AS_DELETED', 'ring', None, None),
+    ('RH', 'ACTIVE', 'running or operating hour', None, None),
+    ('RK', 'MARKED_AS_DELETED', 'roll metric measure', None, None),
+    ('RL', 'MARKED_AS_DELETED', 'reel', None, None),
+    ('RM', 'ACTIVE', 'ream', None, None),
+    ('RN', 'MARKED_AS_DELETED', 'ream metric measure', None, None),
+    ('RO', 'MARKED_AS_DELETED', 'roll', None, None),
+    ('ROM', 'ACTIVE', 'room', None, None),
+    ('RP', 'ACTIVE', 'pound per ream', None, None),
+    ('RPM', 'ACTIVE', 'revolutions per minute', 'r/min', 0.0167),
+    ('RPS', 'ACTIVE', 'revolutions per second', 'r/s', 1.0),
+    ('RS', 'MARKED_AS_DELETED', 'reset', None, None),
+    ('RT', 'ACTIVE', 'revenue ton mile', None, None),
+    ('RU', 'MARKED_AS_DELETED', 'run', None, None),
+    ('S3', 'ACTIVE', 'square foot per second', 'ft²/s', 0.09290304),
+    ('S4', 'ACTIVE', 'square metre per second', 'm²/s', 1.0),
+    ('S5', 'MARKED_AS_DELETED', 'sixty fourths of an inch', None, None),
+    ('S6', 'MARKED_AS_DELETED', 'session', None, None),
+    ('S7', 'MARKED_AS_DELETED', 'storage unit', None, None),
+    ('S8', 'MARKED_AS_DELETED', 'standard advertising unit', None, None),
+    ('SA', 'MARKED_AS_DELETED', 'sack', None, None),
+    ('SAN', 'ACTIVE', 'half year (6 months)', None, None),
+    ('SCO', 'ACTIVE', 'score', None, 20),
+    ('SCR', 'ACTIVE', 'scruple', None, 1.295982),
+    ('SD', 'MARKED_AS_DELETED', 'solid pound', None, None),
+    ('SE', 'MARKED_AS_DELETED', 'section', None, None),
+    ('SEC', 'ACTIVE', 'second [unit of time]', 's', 1),
+    ('SET', 'ACTIVE', 'set', None, None),
+    ('SG', 'ACTIVE', 'segment', None, None),
+    ('SHT', 'DEPRECATED', 'shipping ton', None, None),
+    ('SIE', 'ACTIVE', 'siemens', 'S', 1.0),
+    ('SK', 'MARKED_AS_DELETED', 'split tank truck', None, None),
+    ('SL', 'MARKED_AS_DELETED', 'slipsheet', None, None),
+    ('SM3', 'ACTIVE', 'Standard cubic metre', None, 1),
+    ('SMI', 'ACTIVE', 'mile (statute mile)', 'mile', 1609.344),
+    ('SN', 'MARKED_AS_DELETED', 'square rod', 'rd²', 25.2929),
+    ('SO', 'MARKED_AS_DELETED', 'spool', None, None),
+    ('SP', 'MARKED_AS_DELETED', 'shelf package', None, None),
+    ('SQ', 'ACTIVE', 'square', None, None),
+    ('SQR', 'ACTIVE', 'square, roofing', None, None),
+    ('SR', 'ACTIVE', 'strip', None, None),
+    ('SS', 'MARKED_AS_DELETED', 'sheet metric measure', None, None),
+    ('SST', 'MARKED_AS_DELETED', 'short standard (7200 matches)', None, None),
+    ('ST', 'MARKED_AS_DELETED', 'sheet', None, None),
+    ('STC', 'ACTIVE', 'stick', None, None),
+    ('STI', 'ACTIVE', 'stone (UK)', 'st', 6.350293),
+    ('STK', 'ACTIVE', 'stick, cigarette', None, None),
+    ('STL', 'ACTIVE', 'standard litre', None, None),
+    ('STN', 'ACTIVE', 'ton (US) or short ton (UK/US)', 'ton (US)', 907.1846999999999),
+    ('STW', 'ACTIVE', 'straw', None, None),
+    ('SV', 'MARKED_AS_DELETED', 'skid', None, None),
+    ('SW', 'ACTIVE', 'skein', None, None),
+    ('SX', 'ACTIVE', 'shipment', None, None),
+    ('SYR', 'ACTIVE', 'syringe', None, None),
+    ('T0', 'ACTIVE', 'telecommunication line in service', None, None),
+    ('T1', 'MARKED_AS_DELETED', 'thousand pound gross', None, None),
+    ('T3', 'ACTIVE', 'thousand piece', None, None),
+    ('T4', 'MARKED_AS_DELETED', 'thousand bag', None, None),
+    ('T5', 'MARKED_AS_DELETED', 'thousand casing', None, None),
+    ('T6', 'MARKED_AS_DELETED', 'thousand gallon (US)', None, 3.785412),
+    ('T7', 'MARKED_AS_DELETED', 'thousand impression', None, None),
+    ('T8', 'MARKED_AS_DELETED', 'thousand linear inch', None, None),
+    ('TA', 'MARKED_AS_DELETED', 'tenth cubic foot', None, None),
+    ('TAH', 'ACTIVE', 'kiloampere hour (thousand ampere hour)', 'kA·h', 3600000.0),
+    ('TAN', 'ACTIVE', 'total acid number', 'TAN', None),
+    ('TC', 'MARKED_AS_DELETED', 'truckload', None, None),
+    ('TD', 'MARKED_AS_DELETED', 'therm', None, 105505600.0),
+    ('TE', 'MARKED_AS_DELETED', 'tote', None, None),
+    ('TF', 'MARKED_AS_DELETED', 'ten square yard', None, None),
+    ('TI', 'ACTIVE', 'thousand square inch', None, None),
+    ('TIC', 'ACTIVE', 'metric ton, including container', None, None),
+    ('TIP', 'ACTIVE', 'metric ton, including inner packaging', None, None),
+    ('TJ', 'MARKED_AS_DELETED', 'thousand square centimetre', None, None),
+    ('TK', 'MARKED_AS_DELETED', 'tank, rectangular', None, None),
+    ('TKM', 'ACTIVE', 'tonne kilometre', 't·km', 1000000),
+    ('TL', 'MARKED_AS_DELETED', 'thousand foot (linear)', None, None),
+    ('TMS', 'ACTIVE', 'kilogram of imported meat, less offal', None, None),
+    ('TN', 'MARKED_AS_DELETED', 'tin', None, None),
+    ('TNE', 'ACTIVE', 'tonne (metric ton)', 't', 1000),
+    ('TP', 'ACTIVE', 'ten pack', None, None),
+    ('TPI', 'ACTIVE', 'teeth per inch', 'TPI', 0.0254),
+    ('TPR', 'ACTIVE', 'ten pair', None, None),
+    ('TQ', 'MARKED_AS_DELETED', 'thousand foot', None, None),
+    ('TQD', 'ACTIVE', 'thousand cubic metre per day', 'km³/d', 0.0115741),
+    ('TR', 'MARKED_AS_DELETED', 'ten square foot', None, None),
+    ('TRL', 'ACTIVE', 'trillion (EUR)', None, 1000000000000000000),
+    ('TS', 'MARKED_AS_DELETED', 'thousand square foot', None, None),
+    ('TSD', 'MARKED_AS_DELETED', 'tonne of substance 90 % dry', None, None),
+    ('TSH', 'MARKED_AS_DELETED', 'ton of steam per hour', None, None),
+    ('TST', 'ACTIVE', 'ten set', None, None),
+    ('TT', 'MARKED_AS_DELETED', 'thousand linear metre', None, None),
+    ('TTS', 'ACTIVE', 'ten thousand sticks', None, None),
+    ('TU', 'MARKED_AS_DELETED', 'tube', None, None),
+    ('TV', 'MARKED_AS_DELETED', 'thousand kilogram', None, 1000),
+    ('TW', 'MARKED_AS_DELETED', 'thousand sheet', None, None),
+    ('TY', 'MARKED_AS_DELETED', 'tank, cylindrical', None, None),
+    ('U1', 'ACTIVE', 'treatment', None, None),
+    ('U2', 'ACTIVE', 'tablet', None, None),
+    ('UA', 'DEPRECATED', 'torr', 'Torr', 133.3224),
+    ('UB', 'ACTIVE', 'telecommunication line in service average', None, None),
+    ('UC', 'ACTIVE', 'telecommunication port', None, None),
+    ('UD', 'MARKED_AS_DELETED', 'tenth minute', None, 6),
+    ('UE', 'MARKED_AS_DELETED', 'tenth hour', None, 360),
+    ('UF', 'MARKED_AS_DELETED', 'usage per telecommunication line average', None, None),
+    ('UH', 'MARKED_AS_DELETED', 'ten thousand yard', None, None),
+    ('UM', 'MARKED_AS_DELETED', 'million unit', None, None),
+    ('VA', 'ACTIVE', 'volt  ampere per kilogram', 'V·A / kg', 1.0),
+    ('VI', 'MARKED_AS_DELETED', 'vial', None, None),
+    ('VLT', 'ACTIVE', 'volt', 'V', 1),
+    ('VP', 'ACTIVE', 'percent volume', None, None),
+    ('VQ', 'MARKED_AS_DELETED', 'bulk', None, None),
+    ('VS', 'MARKED_AS_DELETED', 'visit', None, None),
+    ('W2', 'ACTIVE', 'wet kilo', None, None),
+    ('W4', 'MARKED_AS_DELETED', 'two week', None, None),
+    ('WA', 'ACTIVE', 'watt per kilogram', 'W/kg', 1.0),
+    ('WB', 'ACTIVE', 'wet pound', None, None),
+    ('WCD', 'ACTIVE', 'cord', None, 3.63),
+    ('WE', 'ACTIVE', 'wet ton', None, None),
+    ('WEB', 'ACTIVE', 'weber', 'Wb', 1),
+    ('WEE', 'ACTIVE', 'week', 'wk', 604800.0),
+    ('WG', 'ACTIVE', 'wine gallon', None, None),
+    ('WH', 'MARKED_AS_DELETED', 'wheel', None, None),
+    ('WHR', 'ACTIVE', 'watt hour', 'W·h', 3600.0),
+    ('WI', 'MARKED_AS_DELETED', 'weight per square inch', None, None),
+    ('WM', 'ACTIVE', 'working month', None, None),
+    ('WR', 'MARKED_AS_DELETED', 'wrap', None, None),
+    ('WSD', 'ACTIVE', 'standard', 'std', 4.672),
+    ('WTT', 'ACTIVE', 'watt', 'W', 1),
+    ('WW', 'DEPRECATED', 'millilitre of water', None, None),
+    ('X1', 'ACTIVE', "Gunter's chain", 'ch (UK)', 20.1168),
+    ('YDK', 'ACTIVE', 'square yard', 'yd²', 0.8361274000000001),
+    ('YDQ', 'ACTIVE', 'cubic yard', 'yd³', 0.764555),
+    ('YL', 'MARKED_AS_DELETED', 'hundred linear yard', None, None),
+    ('YRD', 'ACTIVE', 'yard', 'yd', 0.9144),
+    ('YT', 'MARKED_AS_DELETED', 'ten yard', None, None),
+    ('Z1', 'MARKED_AS_DELETED', 'lift van', None, None),
+    ('Z11', 'ACTIVE', 'hanging container', None, None),
+    ('Z2', 'MARKED_AS_DELETED', 'chest', None, None),
+    ('Z3', 'MARKED_AS_DELETED', 'cask', None, None),
+    ('Z4', 'MARKED_AS_DELETED', 'hogshead', None, None),
+    ('Z5', 'MARKED_AS_DELETED', 'lug', None, None),
+    ('Z6', 'MARKED_AS_DELETED', 'conference point', None, None),
+    ('Z8', 'MARKED_AS_DELETED', 'newspage agate line', None, None),
+    ('ZP', 'ACTIVE', 'page', None, None),
+    ('ZZ', 'ACTIVE', 'mutually defined', None, None),
+    ('MRW', 'ACTIVE', 'Metre Week', 'm·wk', None),
+    ('MKW', 'ACTIVE', 'Square Metre Week', 'm²· wk', None),
+    ('MQW', 'ACTIVE', 'Cubic Metre Week', 'm³·wk', None),
+    ('HWE', 'ACTIVE', 'Piece Week', 'piece·k', None),
+    ('MRD', 'ACTIVE', 'Metre Day', 'm·day', None),
+    ('MKD', 'ACTIVE', 'Square Metre Day', 'm²·d', None),
+    ('MQD', 'ACTIVE', 'Cubic Metre Day', 'm³·d', None),
+    ('HAD', 'ACTIVE', 'Piece Day', 'piece·d', None),
+    ('MRM', 'ACTIVE', 'Metre Month', 'm·mo', None),
+    ('MKM', 'ACTIVE', 'Square Metre Month', 'm²·mo', None),
+    ('MQM', 'ACTIVE', 'Cubic Metre Month', 'm³·mo', None),
+    ('HMO', 'ACTIVE', 'Piece Month', 'piece·mo', None),
+    ('DBW', 'ACTIVE', 'Decibel watt', 'dBW', None),
+    ('DBM', 'ACTIVE', 'Decibelmilliwatts', 'dBm', None),
+    ('FNU', 'ACTIVE', 'Formazin nephelometric unit', 'FNU', None),
+    ('NTU', 'ACTIVE', 'Nephelometric turbidity unit', 'NTU', None),
+    ('MTZ', 'ACTIVE', 'millihertz', 'mHz', 0.001),
+    ('Z9', 'ACTIVE', 'nanomole', 'nmol', 1e-09),
+    ('X1A', 'ACTIVE', 'Drum, steel', None, None),
+    ('X1B', 'ACTIVE', 'Drum, aluminium', None, None),
+    ('X1D', 'ACTIVE', 'Drum, plywood', None, None),
+    ('X1F', 'ACTIVE', 'Container, flexible', None, None),
+    ('X1G', 'ACTIVE', 'Drum, fibre', None, None),
+    ('X1W', 'ACTIVE', 'Drum, wooden', None, None),
+    ('X2C', 'ACTIVE', 'Barrel, wooden', None, None),
+    ('X3A', 'ACTIVE', 'Jerrican, steel', None, None),
+    ('X3H', 'ACTIVE', 'Jerrican, plastic', None, None),
+    ('X43', 'ACTIVE', 'Bag, super bulk', None, None),
+    ('X44', 'ACTIVE', 'Bag, polybag', None, None),
+    ('X4A', 'ACTIVE', 'Box, steel', None, None),
+    ('X4B', 'ACTIVE', 'Box, aluminium', None, None),
+    ('X4C', 'ACTIVE', 'Box, natural wood', None, None),
+    ('X4D', 'ACTIVE', 'Box, plywood', None, None),
+    ('X4F', 'ACTIVE', 'Box, reconstituted wood', None, None),
+    ('X4G', 'ACTIVE', 'Box, fibreboard', None, None),
+    ('X4H', 'ACTIVE', 'Box, plastic', None, None),
+    ('X5H', 'ACTIVE', 'Bag, woven plastic', None, None),
+    ('X5L', 'ACTIVE', 'Bag, textile', None, None),
+    ('X5M', 'ACTIVE', 'Bag, paper', None, None),
+    ('X6H', 'ACTIVE', 'Composite packaging, plastic receptacle', None, None),
+    ('X6P', 'ACTIVE', 'Composite packaging, glass receptacle', None, None),
+    ('X7A', 'ACTIVE', 'Case, car', None, None),
+    ('X7B', 'ACTIVE', 'Case, wooden', None, None),
+    ('X8A', 'ACTIVE', 'Pallet, wooden', None, None),
+    ('X8B', 'ACTIVE', 'Crate, wooden', None, None),
+    ('X8C', 'ACTIVE', 'Bundle, wooden', None, None),
+    ('XAA', 'ACTIVE', 'Intermediate bulk container, rigid plastic', None, None),
+    ('XAB', 'ACTIVE', 'Receptacle, fibre', None, None),
+    ('XAC', 'ACTIVE', 'Receptacle, paper', None, None),
+    ('XAD', 'ACTIVE', 'Receptacle, wooden', None, None),
+    ('XAE', 'ACTIVE', 'Aerosol', None, None),
+    ('XAF', 'ACTIVE', 'Pallet, modular, collars 80cms * 60cms', None, None),
+    ('XAG', 'ACTIVE', 'Pallet, shrinkwrapped', None, None),
+    ('XAH', 'ACTIVE', 'Pallet, 100cms * 110cms', None, None),
+    ('XAI', 'ACTIVE', 'Clamshell', None, None),
+    ('XAJ', 'ACTIVE', 'Cone', None, None),
+    ('XAL', 'ACTIVE', 'Ball', None, None),
+    ('XAM', 'ACTIVE', 'Ampoule, nonprotected', None, None),
+    ('XAP', 'ACTIVE', 'Ampoule, protected', None, None),
+    ('XAT', 'ACTIVE', 'Atomizer', None, None),
+    ('XAV', 'ACTIVE', 'Capsule', None, None),
+    ('XB4', 'ACTIVE', 'Belt', None, None),
+    ('XBA', 'ACTIVE', 'Barrel', None, None),
+    ('XBB', 'ACTIVE', 'Bobbin', None, None),
+    ('XBC', 'ACTIVE', 'Bottlecrate / bottlerack', None, None),
+    ('XBD', 'ACTIVE', 'Board', None, None),
+    ('XBE', 'ACTIVE', 'Bundle', None, None),
+    ('XBF', 'ACTIVE', 'Balloon, nonprotected', None, None),
+    ('XBG', 'ACTIVE', 'Bag', None, None),
+    ('XBH', 'ACTIVE', 'Bunch', None, None),
+    ('XBI', 'ACTIVE', 'Bin', None, None),
+    ('XBJ', 'ACTIVE', 'Bucket', None, None),
+    ('XBK', 'ACTIVE', 'Basket', None, None),
+    ('XBL', 'ACTIVE', 'Bale, compressed', None, None),
+    ('XBM', 'ACTIVE', 'Basin', None, None),
+    ('XBN', 'ACTIVE', 'Bale, noncompressed', None, None),
+    ('XBO', 'ACTIVE', 'Bottle, nonprotected, cylindrical', None, None),
+    ('XBP', 'ACTIVE', 'Balloon, protected', None, None),
+    ('XBQ', 'ACTIVE', 'Bottle, protected cylindrical', None, None),
+    ('XBR', 'ACTIVE', 'Bar', None, None),
+    ('XBS', 'ACTIVE', 'Bottle, nonprotected, bulbous', None, None),
+    ('XBT', 'ACTIVE', 'Bolt', None, None),
+    ('XBU', 'ACTIVE', 'Butt', None, None),
+    ('XBV', 'ACTIVE', 'Bottle, protected bulbous', None, None),
+    ('XBW', 'ACTIVE', 'Box, for liquids', None, None),
+    ('XBX', 'ACTIVE', 'Box', None, None),
+    ('XBY', 'ACTIVE', 'Board, in bundle/bunch/truss', None, None),
+    ('XBZ', 'ACTIVE', 'Bars, in bundle/bunch/truss', None, None),
+    ('XCA', 'ACTIVE', 'Can, rectangular', None, None),
+    ('XCB', 'ACTIVE', 'Crate, beer', None, None),
+    ('XCC', 'ACTIVE', 'Churn', None, None),
+    ('XCD', 'ACTIVE', 'Can, with handle and spout', None, None),
+    ('XCE', 'ACTIVE', 'Creel', None, None),
+    ('XCF', 'ACTIVE', 'Coffer', None, None),
+    ('XCG', 'ACTIVE', 'Cage', None, None),
+    ('XCH', 'ACTIVE', 'Chest', None, None),
+    ('XCI', 'ACTIVE', 'Canister', None, None),
+    ('XCJ', 'ACTIVE', 'Coffin', None, None),
+    ('XCK', 'ACTIVE', 'Cask', None, None),
+    ('XCL', 'ACTIVE', 'Coil', None, None),
+    ('XCM', 'ACTIVE', 'Card', None, None),
+    ('XCN', 'ACTIVE', 'Container, not otherwise specified as transport equipment', None, None),
+    ('XCO', 'ACTIVE', 'Carboy, nonprotected', None, None),
+    ('XCP', 'ACTIVE', 'Carboy, protected', None, None),
+    ('XCQ', 'ACTIVE', 'Cartridge', None, None),
+    ('XCR', 'ACTIVE', 'Crate', None, None),
+    ('XCS', 'ACTIVE', 'Case', None, None),
+    ('XCT', 'ACTIVE', 'Carton', None, None),
+    ('XCU', 'ACTIVE', 'Cup', None, None),
+    ('XCV', 'ACTIVE', 'Cover', None, None),
+    ('XCW', 'ACTIVE', 'Cage, roll', None, None),
+    ('XCX', 'ACTIVE', 'Can, cylindrical', None, None),
+    ('XCY', 'ACTIVE', 'Cylinder', None, None),
+    ('XCZ', 'ACTIVE', 'Canvas', None, None),
+    ('XDA', 'ACTIVE', 'Crate, multiple layer, plastic', None, None),
+    ('XDB', 'ACTIVE', 'Crate, multiple layer, wooden', None, None),
+    ('XDC', 'ACTIVE', 'Crate, multiple layer, cardboard', None, None),
+    ('XDG', 'ACTIVE', 'Cage, Commonwealth Handling Equipment Pool  (CHEP)', None, None),
+    ('XDH', 'ACTIVE', 'Box, Commonwealth Handling Equipment Pool (CHEP), Eurobox', None, None),
+    ('XDI', 'ACTIVE', 'Drum, iron', None, None),
+    ('XDJ', 'ACTIVE', 'Demijohn, nonprotected', None, None),
+    ('XDK', 'ACTIVE', 'Crate, bulk, cardboard', None, None),
+    ('XDL', 'ACTIVE', 'Crate, bulk, plastic', None, None),
+    ('XDM', 'ACTIVE', 'Crate, bulk, wooden', None, None),
+    ('XDN', 'ACTIVE', 'Dispenser', None, None),
+    ('XDP', 'ACTIVE', 'Demijohn, protected', None, None),
+    ('XDR', 'ACTIVE', 'Drum', None, None),
+    ('XDS', 'ACTIVE', 'Tray, one layer no cover, plastic', None, None),
+    ('XDT', 'ACTIVE', 'Tray, one layer no cover, wooden', None, None),
+    ('XDU', 'ACTIVE', 'Tray, one layer no cover, polystyrene', None, None),
+    ('XDV', 'ACTIVE', 'Tray, one layer no cover, cardboard', None, None),
+    ('XDW', 'ACTIVE', 'Tray, two layers no cover, plastic tray', None, None),
+    ('XDX', 'ACTIVE', 'Tray, two layers no cover, wooden', None, None),
+    ('XDY', 'ACTIVE', 'Tray, two layers no cover, cardboard', None, None),
+    ('XEC', 'ACTIVE', 'Bag, plastic', None, None),
+    ('XED', 'ACTIVE', 'Case, with pallet base', None, None),
+    ('XEE', 'ACTIVE', 'Case, with pallet base, wooden', None, None),
+    ('XEF', 'ACTIVE', 'Case, with pallet base, cardboard', None, None),
+    ('XEG', 'ACTIVE', 'Case, with pallet base, plastic', None, None),
+    ('XEH', 'ACTIVE', 'Case, with pallet base, metal', None, None),
+    ('XEI', 'ACTIVE', 'Case, isothermic', None, None),
+    ('XEN', 'ACTIVE', 'Envelope', None, None),
+    ('XFB', 'ACTIVE', 'Flexibag', None, None),
+    ('XFC', 'ACTIVE', 'Crate, fruit', None, None),
+    ('XFD', 'ACTIVE', 'Crate, framed', None, None),
+    ('XFE', 'ACTIVE', 'Flexitank', None, None),
+    ('XFI', 'ACTIVE', 'Firkin', None, None),
+    ('XFL', 'ACTIVE', 'Flask', None, None),
+    ('XFO', 'ACTIVE', 'Footlocker', None, None),
+    ('XFP', 'ACTIVE', 'Filmpack', None, None),
+    ('XFR', 'ACTIVE', 'Frame', None, None),
+    ('XFT', 'ACTIVE', 'Foodtainer', None, None),
+    ('XFW', 'ACTIVE', 'Cart, flatbed', None, None),
+    ('XFX', 'ACTIVE', 'Bag, flexible container', None, None),
+    ('XGB', 'ACTIVE', 'Bottle, gas', None, None),
+    ('XGI', 'ACTIVE', 'Girder', None, None),
+    ('XGL', 'ACTIVE', 'Container, gallon', None, None),
+    ('XGR', 'ACTIVE', 'Receptacle, glass', None, None),
+    ('XGU', 'ACTIVE', 'Tray, containing horizontally stacked flat items', None, None),
+    ('XGY', 'ACTIVE', 'Bag, gunny', None, None),
+    ('XGZ', 'ACTIVE', 'Girders, in bundle/bunch/truss', None, None),
+    ('XHA', 'ACTIVE', 'Basket, with handle, plastic', None, None),
+    ('XHB', 'ACTIVE', 'Basket, with handle, wooden', None, None),
+    ('XHC', 'ACTIVE', 'Basket, with handle, cardboard', None, None),
+    ('XHG', 'ACTIVE', 'Hogshead', None, None),
+    ('XHN', 'ACTIVE', 'Hanger', None, None),
+    ('XHR', 'ACTIVE', 'Hamper', None, None),
+    ('XIA', 'ACTIVE', 'Package, display, wooden', None, None),
+    ('XIB', 'ACTIVE', 'Package, display, cardboard', None, None),
+    ('XIC', 'ACTIVE', 'Package, display, plastic', None, None),
+    ('XID', 'ACTIVE', 'Package, display, metal', None, None),
+    ('XIE', 'ACTIVE', 'Package, show', None, None),
+    ('XIF', 'ACTIVE', 'Package, flow', None, None),
+    ('XIG', 'ACTIVE', 'Package, paper wrapped', None, None),
+    ('XIH', 'ACTIVE', 'Drum, plastic', None, None),
+    ('XIK', 'ACTIVE', 'Package, cardboard, with bottle gripholes', None, None),
+    ('XIL', 'ACTIVE', 'Tray, rigid, lidded stackable (CEN TS 14482:2002)', None, None),
+    ('XIN', 'ACTIVE', 'Ingot', None, None),
+    ('XIZ', 'ACTIVE', 'Ingots, in bundle/bunch/truss', None, None),
+    ('XJB', 'ACTIVE', 'Bag, jumbo', None, None),
+    ('XJC', 'ACTIVE', 'Jerrican, rectangular', None, None),
+    ('XJG', 'ACTIVE', 'Jug', None, None),
+    ('XJR', 'ACTIVE', 'Jar', None, None),
+    ('XJT', 'ACTIVE', 'Jutebag', None, None),
+    ('XJY', 'ACTIVE', 'Jerrican, cylindrical', None, None),
+    ('XKG', 'ACTIVE', 'Keg', None, None),
+    ('XKI', 'ACTIVE', 'Kit', None, None),
+    ('XLE', 'ACTIVE', 'Luggage', None, None),
+    ('XLG', 'ACTIVE', 'Log', None, None),
+    ('XLT', 'ACTIVE', 'Lot', None, None),
+    ('XLU', 'ACTIVE', 'Lug', None, None),
+    ('XLV', 'ACTIVE', 'Liftvan', None, None),
+    ('XLZ', 'ACTIVE', 'Logs, in bundle/bunch/truss', None, None),
+    ('XMA', 'ACTIVE', 'Crate, metal', None, None),
+    ('XMB', 'ACTIVE', 'Bag, multiply', None, None),
+    ('XMC', 'ACTIVE', 'Crate, milk', None, None),
+    ('XME', 'ACTIVE', 'Container, metal', None, None),
+    ('XMR', 'ACTIVE', 'Receptacle, metal', None, None),
+    ('XMS', 'ACTIVE', 'Sack, multiwall', None, None),
+    ('XMT', 'ACTIVE', 'Mat', None, None),
+    ('XMW', 'ACTIVE', 'Receptacle, plastic wrapped', None, None),
+    ('XMX', 'ACTIVE', 'Matchbox', None, None),
+    ('XNA', 'ACTIVE', 'Not available', None, None),
+    ('XNE', 'ACTIVE', 'Unpacked or unpackaged', None, None),
+    ('XNF', 'ACTIVE', 'Unpacked or unpackaged, single unit', None, None),
+    ('XNG', 'ACTIVE', 'Unpacked or unpackaged, multiple units', None, None),
+    ('XNS', 'ACTIVE', 'Nest', None, None),
+    ('XNT', 'ACTIVE', 'Net', None, None),
+    ('XNU', 'ACTIVE', 'Net, tube, plastic', None, None),
+    ('XNV', 'ACTIVE', 'Net, tube, textile', None, None),
+    ('XOA', 'ACTIVE', 'Pallet, CHEP 40 cm x 60 cm', None, None),
+    ('XOB', 'ACTIVE', 'Pallet, CHEP 80 cm x 120 cm', None, None),
+    ('XOC', 'ACTIVE', 'Pallet, CHEP 100 cm x 120 cm', None, None),
+    ('XOD', 'CHANGED_CHARACTERISTICS', 'Pallet, AS 40681993', None, None),
+    ('XOE', 'ACTIVE', 'Pallet, ISO T11', None, None),
+    ('XOF', 'ACTIVE', 'Platform, unspecified weight or dimension', None, None),
+    ('XOK', 'ACTIVE', 'Block', None, None),
+    ('XOT', 'ACTIVE', 'Octabin', None, None),
+    ('XOU', 'ACTIVE', 'Container, outer', None, None),
+    ('XOG', 'ACTIVE', 'Pallet ISO 0  1/2 EURO Pallet', None, None),
+    ('XOH', 'ACTIVE', 'Pallet ISO 1  1/1 EURO Pallet', None, None),
+    ('XOI', 'ACTIVE', 'Pallet ISO 2 – 2/1 EURO Pallet', None, None),
+    ('XOJ', 'ACTIVE', '1/4 EURO Pallet', None, None),
+    ('XOL', 'ACTIVE', '1/8 EURO Pallet', None, None),
+    ('XOM', 'ACTIVE', 'Synthetic pallet ISO 1', None, None),
+    ('XON', 'ACTIVE', 'Synthetic pallet ISO 2', None, None),
+    ('XOP', 'ACTIVE', 'Wholesaler pallet', None, None),
+    ('XOQ', 'ACTIVE', 'Pallet 80 X 100 cm', None, None),
+    ('XOR', 'ACTIVE', 'Pallet 60 X 100 cm', None, None),
+    ('XOS', 'ACTIVE', 'Oneway pallet', None, None),
+    ('XOV', 'ACTIVE', 'Returnable pallet', None, None),
+    ('XOW', 'ACTIVE', 'Large bag, pallet sized', None, None),
+    ('XOX', 'ACTIVE', 'A wheeled pallet with raised rim (81 x 67 x 135)', None, None),
+    ('XOY', 'ACTIVE', 'A Wheeled pallet with raised rim (81 x 72 x 135)', None, None),
+    ('XOZ', 'ACTIVE', 'Wheeled pallet with raised rim ( 81 x 60 x 16)', None, None),
+    ('XO1', 'ACTIVE', 'Two sided cage on wheels with fixing strap', None, None),
+    ('XO2', 'ACTIVE', 'Trolley', None, None),
+    ('XO3', 'ACTIVE', 'Oneway pallet ISO 0  1/2 EURO Pallet', None, None),
+    ('XO4', 'ACTIVE', 'Oneway pallet ISO 1  1/1 EURO Pallet', None, None),
+    ('XO5', 'ACTIVE', 'Oneway pallet ISO 2  2/1 EURO Pallet', None, None),
+    ('XO6', 'ACTIVE', 'Pallet with exceptional dimensions', None, None),
+    ('XO7', 'ACTIVE', 'Wooden pallet  40 cm x 80 cm', None, None),
+    ('XO8', 'ACTIVE', 'Plastic pallet SRS 60 cm x 80 cm', None, None),
+    ('XO9', 'ACTIVE', 'Plastic pallet SRS 80 cm x 120 cm', None, None),
+    ('XP1', 'ACTIVE', 'CHEP pallet 60 cm x 80 cm', None, None),
+    ('XP3', 'ACTIVE', 'LPR pallet 60 cm x 80 cm', None, None),
+    ('XP4', 'ACTIVE', 'LPR pallet 80 cm x 120 cm', None, None),
+    ('XP2', 'ACTIVE', 'Pan', None, None),
+    ('XPA', 'ACTIVE', 'Packet', None, None),
+    ('XPB', 'ACTIVE', 'Pallet, box Combined openended box and pallet', None, None),
+    ('XPC', 'ACTIVE', 'Parcel', None, None),
+    ('XPD', 'ACTIVE', 'Pallet, modular, collars 80cms * 100cms', None, None),
+    ('XPE', 'ACTIVE', 'Pallet, modular, collars 80cms * 120cms', None, None),
+    ('XPF', 'ACTIVE', 'Pen', None, None),
+    ('XPG', 'ACTIVE', 'Plate', None, None),
+    ('XPH', 'ACTIVE', 'Pitcher', None, None),
+    ('XPI', 'ACTIVE', 'Pipe', None, None),
+    ('XPJ', 'ACTIVE', 'Punnet', None, None),
+    ('XPK', 'ACTIVE', 'Package', None, None),
+    ('XPL', 'ACTIVE', 'Pail', None, None),
+    ('XPN', 'ACTIVE', 'Plank', None, None),
+    ('XPO', 'ACTIVE', 'Pouch', None, None),
+    ('XPP', 'ACTIVE', 'Piece', None, None),
+    ('XPR', 'ACTIVE', 'Receptacle, plastic', None, None),
+    ('XPT', 'ACTIVE', 'Pot', None, None),
+    ('XPU', 'ACTIVE', 'Tray', None, None),
+    ('XPV', 'ACTIVE', 'Pipes, in bundle/bunch/truss', None, None),
+    ('XPX', 'ACTIVE', 'Pallet', None, None),
+    ('XPY', 'ACTIVE', 'Plates, in bundle/bunch/truss', None, None),
+    ('XPZ', 'ACTIVE', 'Planks, in bundle/bunch/truss', None, None),
+    ('XQA', 'ACTIVE', 'Drum, steel, nonremovable head', None, None),
+    ('XQB', 'ACTIVE', 'Drum, steel, removable head', None, None),
+    ('XQC', 'ACTIVE', 'Drum, aluminium, nonremovable head', None, None),
+    ('XQD', 'ACTIVE', 'Drum, aluminium, removable head', None, None),
+    ('XQF', 'ACTIVE', 'Drum, plastic, nonremovable head', None, None),
+    ('XQG', 'ACTIVE', 'Drum, plastic, removable head', None, None),
+    ('XQH', 'ACTIVE', 'Barrel, wooden, bung type', None, None),
+    ('XQJ', 'ACTIVE', 'Barrel, wooden, removable head', None, None),
+    ('XQK', 'ACTIVE', 'Jerrican, steel, nonremovable head', None, None),
+    ('XQL', 'ACTIVE', 'Jerrican, steel, removable head', None, None),
+    ('XQM', 'ACTIVE', 'Jerrican, plastic, nonremovable head', None, None),
+    ('XQN', 'ACTIVE', 'Jerrican, plastic, removable head', None, None),
+    ('XQP', 'ACTIVE', 'Box, wooden, natural wood, ordinary', None, None),
+    ('XQQ', 'ACTIVE', 'Box, wooden, natural wood, with sift proof walls', None, None),
+    ('XQR', 'ACTIVE', 'Box, plastic, expanded', None, None),
+    ('XQS', 'ACTIVE', 'Box, plastic, solid', None, None),
+    ('XRD', 'ACTIVE', 'Rod', None, None),
+    ('XRG', 'ACTIVE', 'Ring', None, None),
+    ('XRJ', 'ACTIVE', 'Rack, clothing hanger', None, None),
+    ('XRK', 'ACTIVE', 'Rack', None, None),
+    ('XRL', 'ACTIVE', 'Reel', None, None),
+    ('XRO', 'ACTIVE', 'Roll', None, None),
+    ('XRT', 'ACTIVE', 'Rednet', None, None),
+    ('XRZ', 'ACTIVE', 'Rods, in bundle/bunch/truss', None, None),
+    ('XSA', 'ACTIVE', 'Sack', None, None),
+    ('XSB', 'ACTIVE', 'Slab', None, None),
+    ('XSC', 'ACTIVE', 'Crate, shallow', None, None),
+    ('XSD', 'ACTIVE', 'Spindle', None, None),
+    ('XSE', 'ACTIVE', 'Seachest', None, None),
+    ('XSH', 'ACTIVE', 'Sachet', None, None),
+    ('XSI', 'ACTIVE', 'Skid', None, None),
+    ('XSK', 'ACTIVE', 'Case, skeleton', None, None),
+    ('XSL', 'ACTIVE', 'Slipsheet', None, None),
+    ('XSM', 'ACTIVE', 'Sheetmetal', None, None),
+    ('XSO', 'ACTIVE', 'Spool', None, None),
+    ('XSP', 'ACTIVE', 'Sheet, plastic wrapping', None, None),
+    ('XSS', 'ACTIVE', 'Case, steel', None, None),
+    ('XST', 'ACTIVE', 'Sheet', None, None),
+    ('XSU', 'ACTIVE', 'Suitcase', None, None),
+    ('XSV', 'ACTIVE', 'Envelope, steel', None, None),
+    ('XSW', 'ACTIVE', 'Shrinkwrapped', None, None),
+    ('XSX', 'MARKED_AS_DELETED', 'Set', None, None),
+    ('XSY', 'ACTIVE', 'Sleeve', None, None),
+    ('XSZ', 'ACTIVE', 'Sheets, in bundle/bunch/truss', None, None),
+    ('XT1', 'ACTIVE', 'Tablet', None, None),
+    ('XTB', 'ACTIVE', 'Tub', None, None),
+    ('XTC', 'ACTIVE', 'Teachest', None, None),
+    ('XTD', 'ACTIVE', 'Tube, collapsible', None, None),
+    ('XTE', 'ACTIVE', 'Tyre', None, None),
+    ('XTG', 'ACTIVE', 'Tank container, generic', None, None),
+    ('XTI', 'ACTIVE', 'Tierce', None, None),
+    ('XTK', 'ACTIVE', 'Tank, rectangular', None, None),
+    ('XTL', 'ACTIVE', 'Tub, with lid', None, None),
+    ('XTN', 'ACTIVE', 'Tin', None, None),
+    ('XTO', 'ACTIVE', 'Tun', None, None),
+    ('XTR', 'ACTIVE', 'Trunk', None, None),
+    ('XTS', 'ACTIVE', 'Truss', None, None),
+    ('XTT', 'ACTIVE', 'Bag, tote', None, None),
+    ('XTU', 'ACTIVE', 'Tube', None, None),
+    ('XTV', 'ACTIVE', 'Tube, with nozzle', None, None),
+    ('XTW', 'ACTIVE', 'Pallet, triwall', None, None),
+    ('XTY', 'ACTIVE', 'Tank, cylindrical', None, None),
+    ('XTZ', 'ACTIVE', 'Tubes, in bundle/bunch/truss', None, None),
+    ('XUC', 'ACTIVE', 'Uncaged', None, None),
+    ('XUN', 'ACTIVE', 'Unit', None, None),
+    ('XVA', 'ACTIVE', 'Vat', None, None),
+    ('XVG', 'ACTIVE', 'Bulk, gas (at 1031 mbar and 15°C)', None, None),
+    ('XVI', 'ACTIVE', 'Vial', None, None),
+    ('XVK', 'ACTIVE', 'Vanpack', None, None),
+    ('XVL', 'ACTIVE', 'Bulk, liquid', None, None),
+    ('XVO', 'ACTIVE', 'Bulk, solid, large particles (“nodules”)', None, None),
+    ('XVP', 'ACTIVE', 'Vacuumpacked', None, None),
+    ('XVQ', 'ACTIVE', 'Bulk, liquefied gas (at abnormal temperature/pressure)', None, None),
+    ('XVN', 'ACTIVE', 'Vehicle', None, None),
+    ('XVR', 'ACTIVE', 'Bulk, solid, granular particles (“grains”)', None, None),
+    ('XVS', 'ACTIVE', 'Bulk, scrap metal', None, None),
+    ('XVY', 'ACTIVE', 'Bulk, solid, fine particles (“powders”)', None, None),
+    ('XWA', 'ACTIVE', 'Intermediate bulk container', None, None),
+    ('XWB', 'ACTIVE', 'Wickerbottle', None, None),
+    ('XWC', 'ACTIVE', 'Intermediate bulk container, steel', None, None),
+    ('XWD', 'ACTIVE', 'Intermediate bulk container, aluminium', None, None),
+    ('XWF', 'ACTIVE', 'Intermediate bulk container, metal', None, None),
+    ('XWG', 'ACTIVE', 'Intermediate bulk container, steel, pressurised > 10 kpa', None, None),
+    ('XWH', 'ACTIVE', 'Intermediate bulk container, aluminium, pressurised > 10 kpa', None, None),
+    ('XWJ', 'ACTIVE', 'Intermediate bulk container, metal, pressure 10 kpa', None, None),
+    ('XWK', 'ACTIVE', 'Intermediate bulk container, steel, liquid', None, None),
+    ('XWL', 'ACTIVE', 'Intermediate bulk container, aluminium, liquid', None, None),
+    ('XWM', 'ACTIVE', 'Intermediate bulk container, metal, liquid', None, None),
+    ('XWN', 'ACTIVE', 'Intermediate bulk container, woven plastic, without coat/liner', None, None),
+    ('XWP', 'ACTIVE', 'Intermediate bulk container, woven plastic, coated', None, None),
+    ('XWQ', 'ACTIVE', 'Intermediate bulk container, woven plastic, with liner', None, None),
+    ('XWR', 'ACTIVE', 'Intermediate bulk container, woven plastic, coated and liner', None, None),
+    ('XWS', 'ACTIVE', 'Intermediate bulk container, plastic film', None, None),
+    ('XWT', 'ACTIVE', 'Intermediate bulk container, textile with out coat/liner', None, None),
+    ('XWU', 'ACTIVE', 'Intermediate bulk container, natural wood, with inner liner', None, None),
+    ('XWV', 'ACTIVE', 'Intermediate bulk container, textile, coated', None, None),
+    ('XWW', 'ACTIVE', 'Intermediate bulk container, textile, with liner', None, None),
+    ('XWX', 'ACTIVE', 'Intermediate bulk container, textile, coated and liner', None, None),
+    ('XWY', 'ACTIVE', 'Intermediate bulk container, plywood, with inner liner', None, None),
+    ('XWZ', 'ACTIVE', 'Intermediate bulk container, reconstituted wood, with inner liner', None, None),
+    ('XXA', 'ACTIVE', 'Bag, woven plastic, without inner coat/liner', None, None),
+    ('XXB', 'ACTIVE', 'Bag, woven plastic, sift proof', None, None),
+    ('XXC', 'ACTIVE', 'Bag, woven plastic, water resistant', None, None),
+    ('XXD', 'ACTIVE', 'Bag, plastics film', None, None),
+    ('XXF', 'ACTIVE', 'Bag, textile, without inner coat/liner', None, None),
+    ('XXG', 'ACTIVE', 'Bag, textile, sift proof', None, None),
+    ('XXH', 'ACTIVE', 'Bag, textile, water resistant', None, None),
+    ('XXJ', 'ACTIVE', 'Bag, paper, multiwall', None, None),
+    ('XXK', 'ACTIVE', 'Bag, paper, multiwall, water resistant', None, None),
+    ('XYA', 'ACTIVE', 'Composite packaging, plastic receptacle in steel drum', None, None),
+    ('XYB', 'ACTIVE', 'Composite packaging, plastic receptacle in steel crate box', None, None),
+    ('XYC', 'ACTIVE', 'Composite packaging, plastic receptacle in aluminium drum', None, None),
+    ('XYD', 'ACTIVE', 'Composite packaging, plastic receptacle in aluminium crate', None, None),
+    ('XYF', 'ACTIVE', 'Composite packaging, plastic receptacle in wooden box', None, None),
+    ('XYG', 'ACTIVE', 'Composite packaging, plastic receptacle in plywood drum', None, None),
+    ('XYH', 'ACTIVE', 'Composite packaging, plastic receptacle in plywood box', None, None),
+    ('XYJ', 'ACTIVE', 'Composite packaging, plastic receptacle in fibre drum', None, None),
+    ('XYK', 'ACTIVE', 'Composite packaging, plastic receptacle in fibreboard box', None, None),
+    ('XYL', 'ACTIVE', 'Composite packaging, plastic receptacle in plastic drum', None, None),
+    ('XYM', 'ACTIVE', 'Composite packaging, plastic receptacle in solid plastic box', None, None),
+    ('XYN', 'ACTIVE', 'Composite packaging, glass receptacle in steel drum', None, None),
+    ('XYP', 'ACTIVE', 'Composite packaging, glass receptacle in steel crate box', None, None),
+    ('XYQ', 'ACTIVE', 'Composite packaging, glass receptacle in aluminium drum', None, None),
+    ('XYR', 'ACTIVE', 'Composite packaging, glass receptacle in aluminium crate', None, None),
+    ('XYS', 'ACTIVE', 'Composite packaging, glass receptacle in wooden box', None, None),
+    ('XYT', 'ACTIVE', 'Composite packaging, glass receptacle in plywood drum', None, None),
+    ('XYV', 'ACTIVE', 'Composite packaging, glass receptacle in wickerwork hamper', None, None),
+    ('XYW', 'ACTIVE', 'Composite packaging, glass receptacle in fibre drum', None, None),
+    ('XYX', 'ACTIVE', 'Composite packaging, glass receptacle in fibreboard box', None, None),
+    ('XYY', 'ACTIVE', 'Composite packaging, glass receptacle in expandable plastic pack', None, None),
+    ('XYZ', 'ACTIVE', 'Composite packaging, glass receptacle in solid plastic pack', None, None),
+    ('XZA', 'ACTIVE', 'Intermediate bulk container, paper, multiwall', None, None),
+    ('XZB', 'ACTIVE', 'Bag, large', None, None),
+    ('XZC', 'ACTIVE', 'Intermediate bulk container, paper, multiwall, water resistant', None, None),
+    ('XZD', 'ACTIVE', 'Intermediate bulk container, rigid plastic, with structural equipment, solids', None, None),
+    ('XZF', 'ACTIVE', 'Intermediate bulk container, rigid plastic, freestanding, solids', None, None),
+    ('XZG', 'ACTIVE', 'Intermediate bulk container, rigid plastic, with structural equipment, pressurised', None, None),
+    ('XZH', 'ACTIVE', 'Intermediate bulk container, rigid plastic, freestanding, pressurised', None, None),
+    ('XZJ', 'ACTIVE', 'Intermediate bulk container, rigid plastic, with structural equipment, liquids', None, None),
+    ('XZK', 'ACTIVE', 'Intermediate bulk container, rigid plastic, freestanding, liquids', None, None),
+    ('XZL', 'ACTIVE', 'Intermediate bulk container, composite, rigid plastic, solids', None, None),
+    ('XZM', 'ACTIVE', 'Intermediate bulk container, composite, flexible plastic, solids', None, None),
+    ('XZN', 'ACTIVE', 'Intermediate bulk container, composite, rigid plastic, pressurised', None, None),
+    ('XZP', 'ACTIVE', 'Intermediate bulk container, composite, flexible plastic, pressurised', None, None),
+    ('XZQ', 'ACTIVE', 'Intermediate bulk container, composite, rigid plastic, liquids', None, None),
+    ('XZR', 'ACTIVE', 'Intermediate bulk container, composite, flexible plastic, liquids', None, None),
+    ('XZS', 'ACTIVE', 'Intermediate bulk container, composite', None, None),
+    ('XZT', 'ACTIVE', 'Intermediate bulk container, fibreboard', None, None),
+    ('XZU', 'ACTIVE', 'Intermediate bulk container, flexible', None, None),
+    ('XZV', 'ACTIVE', 'Intermediate bulk container, metal, other than steel', None, None),
+    ('XZW', 'ACTIVE', 'Intermediate bulk container, natural wood', None, None),
+    ('XZX', 'ACTIVE', 'Intermediate bulk container, plywood', None, None),
+    ('XZY', 'ACTIVE', 'Intermediate bulk container, reconstituted wood', None, None),
+    ('XZZ', 'ACTIVE', 'Mutually defined', None, None),
+)
@@ -151,3 +151,19 @@ def test_keys_should_not_repeat_within_categories():
     
 
     
+
+
+def test_categories_are_built_once():
+    pac = from_url(valid_base + "-MD/240:B-800/21:12345/-DR/21:VAL")
+    assert pac.categories[0] is pac.categories[0]
+    assert pac.get_category('-DR') is pac.categories[1]
+    
+def test_categories_are_rebuilt_when_identifier_changes():
+    pac = from_url(valid_base + "-MD/240:B-800/21:12345")
+    assert pac.categories[0].serial_number == '12345'
+    pac.identifier[2].value = '999'
+    assert pac.categories[0].serial_number == '999'
+    pac.identifier.append(IDSegment(value='-DR'))
+    assert [c.key for c in pac.categories] == ['-MD', '-DR']
+    pac.identifier = pac.identifier[:3]
+    assert [c.key for c in pac.categories] == ['-MD']
@@ -0,0 +1,42 @@
+import pytest
+from pydantic import ValidationError
+
+from labfreed.pac_id import PAC_ID
+from labfreed.pac_id.id_segment import interned_id_segment
+
+
+valid_base = "HTTPS://PAC.METTORIUS.COM/"
+
+
+def test_identical_segments_are_shared():
+    pac1, pac2 = PAC_ID.from_urls([valid_base + "-MD/240:BAL500/21:1", valid_base + "-MD/240:BAL500/21:2"], intern_segments=True)
+    assert pac1.identifier[0] is pac2.identifier[0]
+    assert pac1.identifier[1] is pac2.identifier[1]
+    assert pac1.identifier[2] is not pac2.identifier[2]
+    assert pac1.get_category('-MD').model_number == 'BAL500'
+    
+def test_interned_segments_give_same_result():
+    url = valid_base + "-MD/240:bal500/21:1*N$N/ABC"
+    interned = PAC_ID.from_url(url, intern_segments=True)
+    plain = PAC_ID.from_url(url)
+    assert interned.to_url() == plain.to_url()
+    assert [m.msg for m in interned.validation_messages()] == [m.msg for m in plain.validation_messages()]
+    
+def test_interned_segments_are_immutable():
+    pac = PAC_ID.from_url(valid_base + "-MD/240:BAL500/21:1", intern_segments=True)
+    with pytest.raises(ValidationError):
+        pac.identifier[1].value = 'X'
+        
+def test_trusted_mode_is_honored():
+    url = valid_base + "-MD/240:BAL500/21:a b"
+    pac = PAC_ID.from_url(url, intern_segments=True, validate=False)
+    assert pac.identifier[2]._validation_skipped
+    assert pac.identifier[2] is not PAC_ID.from_url(url, intern_segments=True, suppress_validation_errors=True).identifier[2]
+    assert not pac.is_valid
+    
+def test_segments_are_interned_by_key_and_value():
+    assert interned_id_segment('240', 'BAL500') is interned_id_segment('240', 'BAL500')
+    assert interned_id_segment(None, '-MD').key is None
+    
+def test_cache_is_bounded():
+    assert interned_id_segment.cache_info().maxsize
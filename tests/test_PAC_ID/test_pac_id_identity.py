@@ -0,0 +1,55 @@
+from labfreed.pac_id import PAC_ID, IDSegment
+
+
+def test_same_pac_ids_are_equal():
+    pac1 = PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:1234*N$N/ABC")
+    pac2 = PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:1234*N$N/ABC")
+    assert pac1 is not pac2
+    assert pac1 == pac2
+    assert hash(pac1) == hash(pac2)
+    
+def test_short_and_long_notation_are_equal():
+    short = PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/-MD/BAL500/1234*ABC")
+    long = PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:1234*N$N/ABC")
+    assert short == long
+    assert len({short, long}) == 1
+    
+def test_case_is_ignored():
+    pac1 = PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:abc", suppress_validation_errors=True)
+    pac2 = PAC_ID.from_url("HTTPS://PAC.mettorius.com/-MD/240:BAL500/21:ABC", suppress_validation_errors=True)
+    assert pac1 == pac2
+    
+def test_different_pac_ids_are_not_equal():
+    pac1 = PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:1234")
+    pac2 = PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:1235")
+    pac3 = PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:1234*N$N/ABC")
+    assert len({pac1, pac2, pac3}) == 3
+    assert pac1 != 'HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:1234'
+    
+def test_key_is_reset_on_assignment():
+    pac = PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/KEY:VAL", suppress_validation_errors=True, try_pac_cat=False)
+    key = pac.canonical_key
+    pac.identifier = [IDSegment(key='KEY', value='OTHER')]
+    assert pac.canonical_key != key
+    
+def test_key_follows_in_place_modification():
+    pac1 = PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/A:1/B:2", try_pac_cat=False)
+    pac2 = PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/A:1/B:2", try_pac_cat=False)
+    assert pac1 == pac2
+    pac1.identifier[1] = IDSegment(key='B', value='3')
+    assert pac1 != pac2
+    pac2.identifier[1].value = '3'
+    assert pac1 == pac2
+    
+def test_pac_id_and_pac_cat_of_the_same_url_are_equal():
+    for url in ("HTTPS://PAC.METTORIUS.COM/-MD/BAL500/1234*ABC", "HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:1234", "HTTPS://PAC.METTORIUS.COM/-XY/A:1"):
+        pac_id = PAC_ID.from_url(url, try_pac_cat=False)
+        pac_cat = PAC_ID.from_url(url, suppress_validation_errors=True)
+        assert type(pac_id) is not type(pac_cat)
+        assert pac_id == pac_cat
+        assert hash(pac_id) == hash(pac_cat)
+        
+def test_segments_before_the_first_category_are_part_of_the_key():
+    pac1 = PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/X:1/-MD/BAL500/1234")
+    pac2 = PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/X:2/-MD/BAL500/1234")
+    assert pac1 != pac2
@@ -0,0 +1,28 @@
+import pytest
+
+from labfreed.labfreed_infrastructure import LabFREED_ValidationError
+from labfreed.pac_id import PAC_ID, PAC_ID_Record
+
+
+url = "HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:1234*ABC*SUM$TREX/A$T.A:ABC"
+
+
+@pytest.mark.parametrize("payload", [url.encode('ascii'), bytearray(url.encode('ascii')), memoryview(url.encode('ascii'))])
+def test_parse_bytes(payload):
+    pac = PAC_ID.from_url(payload)
+    assert pac == PAC_ID.from_url(url)
+    assert pac.to_url() == PAC_ID.from_url(url).to_url()
+    assert PAC_ID_Record.from_url(payload) == PAC_ID_Record.from_url(url)
+    
+def test_parse_many_bytes():
+    results = PAC_ID.from_urls([url.encode('ascii'), b'HTTPS://PAC.METTORIUS.COM/A:B:C', b'\xff/X'])
+    assert isinstance(results[0], PAC_ID)
+    assert isinstance(results[1], LabFREED_ValidationError)
+    assert isinstance(results[2], LabFREED_ValidationError)
+    
+def test_invalid_characters_are_reported():
+    pac = PAC_ID.from_url('HTTPS://PAC.METTORIUS.COM/A#B/%4G/%41'.encode('ascii'), suppress_validation_errors=True)
+    errors = pac.errors()
+    assert len(errors) == 2
+    assert errors[0].highlight_sub_patterns == ['#']
+    assert errors[1].highlight_sub_patterns == ['%']
@@ -0,0 +1,45 @@
+from labfreed.labfreed_infrastructure import LabFREED_ValidationError
+from labfreed.pac_cat import PAC_CAT
+from labfreed.pac_id import PAC_ID
+
+
+valid_base = "HTTPS://PAC.METTORIUS.COM/"
+
+
+def test_results_are_in_input_order():
+    urls = [valid_base + "-MD/240:B-800/21:12345",
+            valid_base + "KEY:VAL",
+            valid_base + "-DR/21:X67678"]
+    pacs = PAC_ID.from_urls(urls)
+    assert [p.to_url() for p in pacs] == urls
+    
+def test_pac_cat_is_applied():
+    pacs = PAC_ID.from_urls([valid_base + "-MD/240:B-800/21:12345", valid_base + "KEY:VAL"])
+    assert isinstance(pacs[0], PAC_CAT)
+    assert type(pacs[1]) is PAC_ID
+    
+def test_invalid_pac_does_not_abort_batch():
+    urls = [valid_base + "-MD/240:B-800/21:12345",
+            "HTTPS://METTORIUS/-MD/240:B-800/21:12345",   # invalid issuer
+            valid_base + "A:B:C",                         # cannot be parsed
+            valid_base + "KEY:VAL"]
+    pacs = PAC_ID.from_urls(urls)
+    assert len(pacs) == 4
+    assert isinstance(pacs[0], PAC_ID)
+    assert isinstance(pacs[1], LabFREED_ValidationError)
+    assert pacs[1].validation_msgs
+    assert isinstance(pacs[2], LabFREED_ValidationError)
+    assert isinstance(pacs[3], PAC_ID)
+    
+def test_suppress_validation_errors_returns_invalid_pacs():
+    pacs = PAC_ID.from_urls(["HTTPS://METTORIUS/-MD/240:B-800/21:12345"], suppress_validation_errors=True)
+    assert isinstance(pacs[0], PAC_ID)
+    assert not pacs[0].is_valid
+    
+def test_accepts_generator():
+    pacs = PAC_ID.from_urls(valid_base + f"-DR/21:X{i}" for i in range(10))
+    assert [p.get_category('-DR').id for p in pacs] == [f'X{i}' for i in range(10)]
+    
+def test_extensions_are_interpreted():
+    pacs = PAC_ID.from_urls([valid_base + "-MD/240:B-800/21:12345*ABC*A$T.A:ABC"])
+    assert pacs[0].get_extension('SUM').type == 'TREX'
@@ -0,0 +1,42 @@
+import pickle
+
+from labfreed.pac_cat import PAC_CAT
+from labfreed.pac_id import PAC_ID, PAC_ID_Record
+from labfreed.well_known_extensions import TREX_Extension
+
+
+url = "HTTPS://PAC.METTORIUS.COM/-MD/BAL500/1234/KEY:VAL*N$N/ABC*SUM$TREX/A$T.A:ABC*FOO$BAR/DATA"
+
+
+def test_record_from_url():
+    r = PAC_ID_Record.from_url(url)
+    assert r.issuer == 'METTORIUS.COM'
+    assert r.identifier == ((None, '-MD'), (None, 'BAL500'), (None, '1234'), ('KEY', 'VAL'))
+    assert r.extensions == (('N', 'N', 'ABC'), ('SUM', 'TREX', 'A$T.A:ABC'), ('FOO', 'BAR', 'DATA'))
+    
+def test_record_is_hashable_and_immutable():
+    r1 = PAC_ID_Record.from_url(url)
+    r2 = PAC_ID.from_url(url).to_record()
+    assert r1 == r2
+    assert len({r1, r2}) == 1
+    assert not hasattr(r1, '__dict__')
+    assert pickle.loads(pickle.dumps(r1)) == r1
+    
+def test_record_to_url():
+    r = PAC_ID_Record.from_url(url)
+    pac = PAC_ID.from_url(url)
+    assert r.to_url() == pac.to_url()
+    assert r.to_url(use_short_notation=False) == pac.to_url(use_short_notation=False)
+    assert r.to_url(uppercase_only=True) == pac.to_url(uppercase_only=True)
+    
+def test_record_to_pac_id():
+    pac = PAC_ID_Record.from_url(url).to_pac_id()
+    assert isinstance(pac, PAC_CAT)
+    assert isinstance(pac.get_extension('SUM'), TREX_Extension)
+    assert pac.to_url() == PAC_ID.from_url(url).to_url()
+    assert pac.is_valid
+    
+def test_record_to_pac_id_without_pac_cat():
+    pac = PAC_ID_Record.from_url(url).to_pac_id(try_pac_cat=False, validate=False)
+    assert type(pac) is PAC_ID
+    assert pac.to_url() == PAC_ID.from_url(url).to_url()
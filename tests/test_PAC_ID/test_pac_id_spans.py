@@ -0,0 +1,67 @@
+import pytest
+
+from labfreed.pac_cat import PAC_CAT
+from labfreed.pac_id import PAC_ID, PAC_ID_Record, PAC_ID_Spans
+
+
+url = "HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:1234*ABC*FOO$BAR/DATA"
+
+
+@pytest.mark.parametrize("u", [url, url.encode('ascii'), bytearray(url.encode('ascii')), memoryview(url.encode('ascii'))])
+def test_comparisons(u):
+    spans = PAC_ID_Spans.from_url(u)
+    assert spans.issuer_equals('METTORIUS.COM')
+    assert not spans.issuer_equals('METTORIUS.CO')
+    assert spans.has_category('-MD')
+    assert not spans.has_category('-MS')
+    assert spans.has_segment('BAL500', key='240')
+    assert not spans.has_segment('BAL500')
+    assert spans.segment_key_equals(1, b'240')
+    assert spans.segment_value_equals(0, '-MD')
+    
+    
+@pytest.mark.parametrize("u", [url, url.encode('ascii'), memoryview(url.encode('ascii'))])
+def test_accessors(u):
+    spans = PAC_ID_Spans(u)
+    assert spans.issuer == 'METTORIUS.COM'
+    assert spans.segment_count == 3
+    assert spans.segment(0) == (None, '-MD')
+    assert spans.segment(2) == ('21', '1234')
+    assert spans.extension_count == 2
+    assert spans.extension(0) == ('N', 'N', 'ABC')
+    assert spans.extension(1) == ('FOO', 'BAR', 'DATA')
+    assert spans.to_record() == PAC_ID_Record.from_url(url)
+    assert isinstance(spans.to_pac_id(), PAC_CAT)
+    
+    
+def test_spans():
+    spans = PAC_ID_Spans(url)
+    assert url[slice(*spans.issuer_span)] == 'METTORIUS.COM'
+    key, value = spans.segment_spans[1]
+    assert (url[slice(*key)], url[slice(*value)]) == ('240', 'BAL500')
+    assert spans.segment_spans[0][0] is None
+    name, type, data = spans.extension_spans[1]
+    assert (url[slice(*name)], url[slice(*type)], url[slice(*data)]) == ('FOO', 'BAR', 'DATA')
+    assert spans.extension_spans[0][:2] == (None, None)
+    
+    
+def test_view_of_bytes_shares_memory():
+    u = bytearray(url.encode('ascii'))
+    spans = PAC_ID_Spans(u)
+    view = spans.view(spans.issuer_span)
+    assert isinstance(view, memoryview)
+    assert view.tobytes() == b'METTORIUS.COM'
+    u[12] = ord('X')
+    assert view.tobytes() == b'XETTORIUS.COM'
+    view.release()
+    
+    
+def test_invalid_structure():
+    with pytest.raises(ValueError):
+        PAC_ID_Spans(b'METTORIUS.COM')
+    
+    
+def test_no_models_are_created(monkeypatch):
+    monkeypatch.setattr(PAC_ID, '__init__', lambda *args, **kwargs: pytest.fail('model created'))
+    spans = PAC_ID_Spans(url)
+    assert spans.has_category('-MD')
@@ -0,0 +1,49 @@
+import pytest
+
+from labfreed.pac_id.url_tokenizer import PAC_SyntaxError, tokenize
+
+
+def test_tokens_and_offsets():
+    url = "HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500*ABC*SUM$TREX/A$T.A:ABC"
+    tokens = tokenize(url)
+    assert tokens.issuer == 'METTORIUS.COM'
+    assert url[tokens.issuer_start:].startswith('METTORIUS.COM/')
+    assert [(key, value) for key, value, _, _ in tokens.segments] == [(None, '-MD'), ('240', 'BAL500')]
+    assert [url[start:end] for _, _, start, end in tokens.segments] == ['-MD', '240:BAL500']
+    assert [e[:3] for e in tokens.extensions] == [('N', 'N', 'ABC'), ('SUM', 'TREX', 'A$T.A:ABC')]
+    assert [url[data_start:end] for *_, data_start, end in tokens.extensions] == ['ABC', 'A$T.A:ABC']
+    
+    
+@pytest.mark.parametrize("url, issuer", [
+    ("HTTPS://PAC.METTORIUS.COM/X", "METTORIUS.COM"),
+    ("PAC.METTORIUS.COM/X", "METTORIUS.COM"),
+    ("METTORIUS.COM/X", "METTORIUS.COM"),
+    ("HTTPS://PAC/X", "PAC"),
+    ("HTTPS:///X", "HTTPS:"),
+])
+def test_prefixes(url, issuer):
+    assert tokenize(url).issuer == issuer
+    
+    
+def test_name_and_type_are_split_at_last_dollar_and_slash():
+    tokens = tokenize("HTTPS://PAC.METTORIUS.COM/X*A$B$C/D/E")
+    assert tokens.extensions[0][:3] == ('A$B', 'C/D', 'E')
+    
+    
+def test_error_positions():
+    with pytest.raises(PAC_SyntaxError) as e:
+        tokenize("HTTPS://PAC.METTORIUS.COM/A:B:C")
+    assert e.value.position == 29
+    
+    with pytest.raises(PAC_SyntaxError) as e:
+        tokenize("HTTPS://PAC.METTORIUS.COM/X*A$B/C*D$E/F*NONAME")
+    assert e.value.position == 40
+    
+    with pytest.raises(ValueError):
+        tokenize("METTORIUS.COM")
+    
+    
+def test_unsupported_type_is_rejected():
+    from labfreed.pac_id.url_tokenizer import scan
+    with pytest.raises(TypeError, match='memoryview'):
+        scan(memoryview(b'HTTPS://PAC.METTORIUS.COM/21:1234'))
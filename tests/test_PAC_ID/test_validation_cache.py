@@ -0,0 +1,132 @@
+from labfreed.pac_id import PAC_ID, IDSegment
+
+
+valid_base = "HTTPS://PAC.METTORIUS.COM/"
+
+
+def test_nested_messages_are_cached():
+    pac = PAC_ID.from_url(valid_base + "-MD/240:B-800/21:12345", suppress_validation_errors=True)
+    msgs = pac.validation_messages()
+    cache = pac._validation_cache
+    assert pac.validation_messages() == msgs
+    assert pac._validation_cache is cache
+    
+def test_cache_is_invalidated_on_assignment():
+    pac = PAC_ID.from_url(valid_base + "KEY:VAL", suppress_validation_errors=True, try_pac_cat=False)
+    assert pac.is_valid
+    pac.identifier[0].value = 'A B'
+    pac.identifier[0].validate()
+    assert not pac.is_valid
+    pac.identifier = [IDSegment(value='AB')]
+    assert pac.is_valid
+    
+def test_returned_list_can_be_modified():
+    pac = PAC_ID.from_url(valid_base + "key:val", suppress_validation_errors=True, try_pac_cat=False)
+    msgs = pac.validation_messages()
+    n = len(msgs)
+    msgs.clear()
+    assert len(pac.validation_messages()) == n
+    
+
+def test_cache_is_invalidated_on_in_place_modification():
+    pac = PAC_ID.from_url(valid_base + "KEY:VAL", suppress_validation_errors=True, try_pac_cat=False)
+    assert pac.is_valid
+    pac.identifier.append(IDSegment(value='x#'))
+    assert not pac.is_valid
+    pac.identifier.pop()
+    assert pac.is_valid
+    pac.identifier[0] = IDSegment(value='A B')
+    assert not pac.is_valid
+    
+def test_cache_is_per_model():
+    pac = PAC_ID.from_url(valid_base + "KEY:VAL", suppress_validation_errors=True, try_pac_cat=False)
+    assert pac.is_valid
+    cache = pac._validation_cache
+    other = PAC_ID.from_url(valid_base + "KEY:VAL", suppress_validation_errors=True, try_pac_cat=False)
+    other.identifier = [IDSegment(value='AB')]
+    assert pac.is_valid
+    assert pac._validation_cache is cache
+    
+def test_repeated_is_valid_does_not_rebuild_categories(monkeypatch):
+    from labfreed.pac_cat import PAC_CAT
+    pac = PAC_CAT.from_url(valid_base + "-MD/240:B-800/21:12345", suppress_validation_errors=True)
+    assert pac.is_valid
+    calls = []
+    original = PAC_CAT._split_segments_by_category
+    monkeypatch.setattr(PAC_CAT, '_split_segments_by_category', staticmethod(lambda s: calls.append(1) or original(s)))
+    for _ in range(3):
+        assert pac.is_valid
+    assert not calls
+    
+def test_shared_models_report_complete_messages():
+    from labfreed.pac_cat import PAC_CAT
+    pac = PAC_CAT.from_url(valid_base + "-XX/a b", suppress_validation_errors=True)
+    n_errors = len(pac.errors())
+    category = pac.categories[0]
+    # the segment is shared between the identifier and the category
+    assert category.segments[0] is pac.identifier[1]
+    assert len(category.errors()) == n_errors
+    
+def test_derived_computed_fields_are_not_evaluated(monkeypatch):
+    from labfreed.well_known_extensions import TREX_Extension
+    pac = PAC_ID.from_url(valid_base + "-MD/240:B-800/21:12345*SUM$TREX/A$T.A:ABC", suppress_validation_errors=True)
+    pac.identifier = list(pac.identifier) # invalidate cache
+    calls = []
+    monkeypatch.setattr(TREX_Extension, 'data', property(lambda self: calls.append(1)))
+    assert pac.is_valid
+    assert not calls
+    
+def test_nested_memo_is_invalidated_on_in_place_modification():
+    from labfreed.trex.value_segments import AlphanumericSegment
+    pac = PAC_ID.from_url(valid_base + "-MD/240:B-800/21:12345*SUM$TREX/A$T.A:ABC", suppress_validation_errors=True)
+    trex = pac.get_extension('SUM').trex
+    assert pac.is_valid and trex.is_valid
+    trex.segments.append(AlphanumericSegment(key='B', value='abc'))
+    # the memoized messages of the nested TREX and of the PAC-ID are both stale
+    assert not trex.is_valid
+    assert not pac.is_valid
+    trex.segments.pop()
+    assert trex.is_valid
+    assert pac.is_valid
+    
+def test_only_modified_models_are_collected_again(monkeypatch):
+    from labfreed.labfreed_infrastructure import LabFREED_BaseModel
+    pac = PAC_ID.from_url(valid_base + "A:1/B:2/C:3", suppress_validation_errors=True, try_pac_cat=False)
+    assert pac.is_valid
+    walked = []
+    original = LabFREED_BaseModel._nested_validation_children
+    monkeypatch.setattr(LabFREED_BaseModel, '_nested_validation_children', lambda self: walked.append(self) or original(self))
+    assert pac.is_valid
+    assert not walked
+    segment = pac.identifier[1]
+    segment.value = 'x y'
+    segment.validate()
+    assert not pac.is_valid
+    assert walked == [pac, segment]
+    
+def test_copies_track_their_own_changes():
+    import copy
+    import pickle
+    pac = PAC_ID.from_url(valid_base + "KEY:VAL", suppress_validation_errors=True, try_pac_cat=False)
+    assert pac.is_valid
+    for other in (copy.deepcopy(pac), pac.model_copy(deep=True), pickle.loads(pickle.dumps(pac))):
+        assert other.is_valid
+        other.identifier.append(IDSegment(value='x#'))
+        assert not other.is_valid
+        assert pac.is_valid
+        
+def test_repeated_validation_results_of_pac_cat_are_cheap():
+    import timeit
+    from labfreed.pac_cat import PAC_CAT
+    url = valid_base + '/'.join(f'-MD/240:B{i}/21:{i}' for i in range(10))
+    pac = PAC_CAT.from_url(url, suppress_validation_errors=True)
+    assert pac.is_valid
+    
+    def collect_again():
+        pac._invalidate_validation_cache()
+        return pac.is_valid and not pac.errors()
+    
+    uncached = min(timeit.repeat(collect_again, number=20, repeat=5))
+    cached = min(timeit.repeat(lambda: pac.is_valid and not pac.errors(), number=20, repeat=5))
+    # a memo hit must not depend on the size of the model tree
+    assert cached * 5 < uncached
@@ -0,0 +1,72 @@
+import pickle
+
+from labfreed.labfreed_infrastructure import ValidationMessage, ValidationMsgLevel, ValidationRecord
+from labfreed.pac_id import IDSegment
+from labfreed.pac_id_resolver.cit_v1 import CIT_v1
+
+
+def test_message_is_formatted_lazily():
+    r = ValidationRecord(source_id=1, source='src', level=ValidationMsgLevel.ERROR, msg='{0:quoted} must not be used in {1}', msg_args=(('#',), 'X#'))
+    assert r._msg is None
+    assert r.msg == "'#' must not be used in X#"
+    assert r.template == '{0:quoted} must not be used in {1}'
+
+
+def test_records_are_compared_by_value():
+    a = ValidationRecord(source_id=1, source='src', level=ValidationMsgLevel.WARNING, msg='{0}', msg_args=('x',), highlight_sub=['x'])
+    b = ValidationRecord(source_id=1, source='src', level=ValidationMsgLevel.WARNING, msg='{0}', msg_args=('x',), highlight_sub='x')
+    c = ValidationRecord(source_id=1, source='src', level=ValidationMsgLevel.ERROR, msg='{0}', msg_args=('x',), highlight_sub='x')
+    assert a == b
+    assert len({a, b, c}) == 2
+
+
+def test_conversion_to_validation_message():
+    r = ValidationRecord(source_id=1, source='src', level=ValidationMsgLevel.ERROR, msg='{0:quoted}', msg_args=(('a',),), highlight='ab', highlight_sub='a')
+    m = r.to_validation_message()
+    assert isinstance(m, ValidationMessage)
+    assert m == ValidationMessage(source_id=1, source='src', level=ValidationMsgLevel.ERROR, msg="'a'", highlight='ab', highlight_sub_patterns=['a'])
+    assert r.highlight_sub_patterns == m.highlight_sub_patterns
+    assert r.to_validation_message() is m
+
+
+def test_pickle():
+    r = ValidationRecord(source_id=1, source='src', level=ValidationMsgLevel.INFO, msg='{0}', msg_args=('x',))
+    assert pickle.loads(pickle.dumps(r)) == r
+
+
+def test_segment_messages():
+    s = IDSegment(key='abc', value='a#b')
+    msgs = s.validation_messages()
+    assert all(isinstance(m, ValidationMessage) for m in msgs)
+    assert "'#' must not be used. The segment key must be a valid hsegment" in [m.msg for m in msgs]
+    assert 'abc is not a well known segment key. It is RECOMMENDED to use well-known keys.' in [m.msg for m in msgs]
+    assert s.format_validation_messages(target='markdown')
+
+
+def test_duplicates_are_added_once():
+    s = IDSegment(value='ABC')
+    for _ in range(3):
+        s._add_validation_message(source='x', level=ValidationMsgLevel.INFO, msg='{0} info', msg_args=('ABC',))
+    assert len(s.validation_messages(nested=False)) == 1
+
+    s.validate()
+    assert len(s.validation_messages(nested=False)) == 0
+    s._add_validation_message(source='x', level=ValidationMsgLevel.INFO, msg='{0} info', msg_args=('ABC',))
+    assert len(s.validation_messages(nested=False)) == 1
+
+
+def test_cit_v1_line_errors():
+    cit = CIT_v1.from_csv('Service Name\tApplication Intent\tService Type\tApplicable If\tTemplate Url\nonly\ttwo')
+    errors = cit.errors()
+    assert errors
+    assert isinstance(errors[0], ValidationMessage)
+    assert errors[0].highlight_sub_patterns == ['only\ttwo']
+    
+    
+def test_public_api_returns_validation_messages():
+    s = IDSegment(key='abc', value='a#b')
+    for msgs in (s.validation_messages(), s.validation_messages(nested=False), s.errors(), s.warnings(), s._get_nested_validation_messages()):
+        assert msgs
+        assert all(isinstance(m, ValidationMessage) for m in msgs)
+    assert s.errors()[0].model_dump()['msg'] == s.errors()[0].msg
+    assert s.errors()[0] is s.errors()[0]
@@ -0,0 +1,33 @@
+import pytest
+
+from labfreed.pac_id import PAC_ID
+from labfreed.pac_id.id_segment import interned_id_segment
+from labfreed.well_known_keys.labfreed import well_known_keys as wkk
+
+
+def _key_recommendations(pac):
+    return [m for m in pac.validation_messages() if 'not a well known segment key' in m.msg]
+
+
+def test_well_known_keys():
+    assert wkk.is_well_known_key('21')
+    assert wkk.is_well_known_key(wkk.WellKnownKeys.VERSION.value)
+    assert not wkk.is_well_known_key('ACME')
+    
+
+@pytest.fixture
+def restore_well_known_keys(monkeypatch):
+    monkeypatch.setattr(wkk, '_well_known_keys', wkk._well_known_keys)
+    yield
+    interned_id_segment.cache_clear()
+    
+
+def test_register_well_known_keys(restore_well_known_keys):
+    url = 'HTTPS://PAC.METTORIUS.COM/ACME:1234'
+    assert _key_recommendations(PAC_ID.from_url(url, try_pac_cat=False))
+    assert _key_recommendations(PAC_ID.from_url(url, try_pac_cat=False, intern_segments=True))
+    
+    wkk.register_well_known_keys('ACME', 'ACME2')
+    assert 'ACME2' in wkk.well_known_keys()
+    assert not _key_recommendations(PAC_ID.from_url(url, try_pac_cat=False))
+    assert not _key_recommendations(PAC_ID.from_url(url, try_pac_cat=False, intern_segments=True))
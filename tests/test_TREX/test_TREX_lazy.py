@@ -0,0 +1,71 @@
+import pytest
+
+from labfreed.trex import TREX, TableSegment
+from labfreed.trex.value_segments import NumericSegment
+
+
+trex_str = 'A$T.A:ABC+B$T.B:T+C$HUR:1+TAB$$C0$T.A:C1$T.B::TRUE:T::FALSE:F'
+
+
+def test_segments_are_parsed_on_access():
+    trex = TREX.deserialize(trex_str, lazy=True)
+    assert trex._lazy_segments.parsed == [None] * 4
+    seg = trex.get_segment('C')
+    assert isinstance(seg, NumericSegment)
+    assert seg.value == '1'
+    assert trex.get_segment('C') is seg
+    assert trex._lazy_segments.parsed.count(None) == 3
+    assert isinstance(trex.get_segment('TAB'), TableSegment)
+    assert trex.get_segment('X') is None
+    
+    
+def test_serialize_without_parsing():
+    trex = TREX.deserialize(trex_str, lazy=True)
+    assert trex.serialize() == trex_str
+    assert trex._lazy_segments.parsed == [None] * 4
+    
+    
+def test_segments_materializes_all():
+    trex = TREX.deserialize(trex_str, lazy=True)
+    b = trex.get_segment('B')
+    assert [s.key for s in trex.segments] == ['A', 'B', 'C', 'TAB']
+    assert trex.segments[1] is b
+    assert trex.get_segment('B') is b
+    assert [s.serialize() for s in trex.segments] == [s.serialize() for s in TREX.deserialize(trex_str).segments]
+    
+    
+def test_validation():
+    assert TREX.deserialize(trex_str, lazy=True).is_valid
+    trex = TREX.deserialize('A$T.A:ABC+B$T.B:X', lazy=True)
+    assert trex.get_segment('A').is_valid
+    assert not trex.is_valid
+    
+    trex = TREX.deserialize('A$T.A:ABC+B$T.B:X', lazy=True, validate=False)
+    assert trex.get_segment('B')._validation_skipped
+    assert not trex.is_valid
+    
+    
+def test_invalid_and_duplicate_segments():
+    with pytest.raises(ValueError):
+        TREX.deserialize('A$T.A:ABC+B', lazy=True)
+    with pytest.raises(ValueError):
+        TREX.deserialize('A$T.A:ABC+A$T.B:T', lazy=True)
+    trex = TREX.deserialize('A$T.A:ABC+A$T.B:T', lazy=True, validate=False)
+    assert trex.get_segment('A').value == 'ABC'
+    
+    
+def test_repr_and_dump_include_lazy_segments():
+    assert 'NumericSegment' in repr(TREX.deserialize(trex_str, lazy=True))
+    assert TREX.deserialize(trex_str, lazy=True).model_dump() == TREX.deserialize(trex_str).model_dump()
+    
+    
+def test_get_segment_after_modification():
+    trex = TREX.deserialize(trex_str)
+    assert trex.get_segment('A').value == 'ABC'
+    trex.segments.append(NumericSegment(key='D', value='2', type='HUR'))
+    assert trex.get_segment('D').value == '2'
+    trex.segments[0] = NumericSegment(key='E', value='3', type='HUR')
+    assert trex.get_segment('E').value == '3'
+    assert trex.get_segment('A') is None
+    trex.segments = trex.segments[:1]
+    assert trex.get_segment('B') is None
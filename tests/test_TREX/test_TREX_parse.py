@@ -295,4 +295,23 @@ def test_type_mismatch():
     trex = trex_deserialization_helper(tab)
     assert not trex.is_valid
         
-            
\ No newline at end of file
+                
+    
+def test_segment_index_is_built_once_per_segment_list(monkeypatch):
+    import labfreed.trex.trex as trex_module
+    from labfreed.trex.value_segments import AlphanumericSegment
+    trex = TREX.deserialize('A$T.A:X+B$T.A:Y')
+    builds = []
+    original = trex_module._segment_positions
+    monkeypatch.setattr(trex_module, '_segment_positions', lambda segments: builds.append(1) or original(segments))
+    assert trex.get_segment('A').value == 'X'
+    assert trex.get_segment('C') is None
+    assert trex.get_segment('C') is None
+    assert trex.get_segment('B').value == 'Y'
+    assert len(builds) == 1
+    
+    trex.segments.append(AlphanumericSegment(key='C', value='Z'))
+    assert trex.get_segment('C').value == 'Z'
+    trex.segments = trex.segments[1:]
+    assert trex.get_segment('A') is None
+    assert len(builds) == 3
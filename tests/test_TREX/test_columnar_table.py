@@ -0,0 +1,185 @@
+import numpy as np
+import pytest
+
+from labfreed.trex import TREX, ColumnHeader, ColumnarTableSegment, TableSegment
+from labfreed.trex.columnar_table import PackedStrings
+
+
+table_str = 'TAB$$C0$T.A:C1$T.B:C2$HUR:C3$T.D:C4$T.D:C5$C62::ABC:T:1.5:20250101T1030:T1030:1::DEF:F:-2E3:20250102T113015:T113015.120:-2'
+
+
+def columnar(trex_str, validate=True):
+    return ColumnarTableSegment.from_table_segment(TREX.deserialize(trex_str).segments[0], validate=validate)
+
+
+def test_from_table_segment():
+    t = columnar(table_str)
+    assert t.is_valid
+    assert t.serialize() == table_str
+    assert t.n_rows() == 2
+    assert t.n_cols() == 6
+    assert t.column_names == ['C0', 'C1', 'C2', 'C3', 'C4', 'C5']
+    
+    
+def test_column_types():
+    t = columnar(table_str)
+    assert t.column_data('C0') == ['ABC', 'DEF']
+    assert t.column_data('C1').dtype == bool
+    assert t.column_data('C1').tolist() == [True, False]
+    assert t.column_data('C2').dtype == np.float64
+    assert t.column_data('C2').tolist() == [1.5, -2000]
+    assert t.column_data('C5').dtype == np.int64
+    assert t.column_data('C3').dtype == np.dtype('datetime64[ms]')
+    assert t.column_data('C3')[1] == np.datetime64('2025-01-02T11:30:15')
+    assert t.column_data('C4').dtype == np.dtype('timedelta64[ms]')
+    assert t.column_data('C4')[1] == np.timedelta64(((11 * 60 + 30) * 60 + 15) * 1000 + 120, 'ms')
+    assert t.row_data(0)[0] == 'ABC'
+    assert t.cell_data(1, 'C5') == -2
+    
+    
+def test_column_data_is_a_read_only_view():
+    t = columnar(table_str)
+    c = t.column_data('C2')
+    assert c is t.column_data(2)
+    assert not c.flags.writeable
+    
+    
+def test_dates_only():
+    t = columnar('TAB$$D$T.D::20250101::20241231')
+    assert t.column_data('D').dtype == np.dtype('datetime64[D]')
+    
+    
+def test_times_and_dates_mixed():
+    from datetime import date, datetime, time
+    from labfreed.trex.python_convenience import pyTREX
+    trex_str = 'TAB$$D$T.D::T1230::20240101::20240101T1230'
+    t = columnar(trex_str)
+    assert t.is_valid
+    assert t.column_data('D').tolist() == [time(12, 30), date(2024, 1, 1), datetime(2024, 1, 1, 12, 30)]
+    assert t.column_data('D').tolist() == [r[0] for r in pyTREX.from_trex(TREX.deserialize(trex_str)).get('TAB').data]
+    assert t.serialize() == trex_str
+    
+    
+@pytest.mark.parametrize("trex_str", [
+    'TAB$$C0$T.A:C1$T.B::aBC:T',
+    'TAB$$C0$T.A:C1$T.B::ABC:TRUE',
+    'TAB$$C0$HUR::1.1.1',
+    'TAB$$C0$T.D::20250230',
+    'TAB$$C0$T.D::T2500',
+    'TAB$$C0$T.D::T1230::20240101::T2500',
+    'TAB$$C0$T.T::abc',
+])
+def test_invalid_cells_are_reported_like_table_segment(trex_str):
+    table = TREX.deserialize(trex_str).segments[0]
+    t = ColumnarTableSegment.from_table_segment(table)
+    assert not t.is_valid
+    assert sorted(m.msg for m in t.errors()) == sorted(m.msg for m in table.errors())
+    
+    
+def test_invalid_values_are_missing_values():
+    t = columnar('TAB$$N$HUR:D$T.D::A:20250230::2:20250101')
+    assert np.isnan(t.column_data('N')[0])
+    assert t.column_data('N')[1] == 2
+    assert np.isnat(t.column_data('D')[0])
+    
+    
+def test_trusted_mode_validates_on_request():
+    t = columnar('TAB$$C0$HUR::X', validate=False)
+    assert t._validation_skipped
+    assert not t.is_valid
+    
+
+def test_from_columns():
+    headers = [ColumnHeader(key='A', type='HUR'), ColumnHeader(key='B', type='T.D'), ColumnHeader(key='C', type='T.B'), 
+               ColumnHeader(key='D', type='T.D'), ColumnHeader(key='E', type='T.A')]
+    t = ColumnarTableSegment.from_columns('T', headers, [
+        np.array([1.5, 1e20, 2.0]), 
+        np.array(['2025-01-01', '2025-01-02', '2025-01-03'], dtype='datetime64[D]'), 
+        [True, False, True], 
+        np.array([90, 91, 0], dtype='timedelta64[m]'), 
+        ['A', 'B', 'C']
+    ])
+    assert t.is_valid
+    assert t.serialize() == 'T$$A$HUR:B$T.D:C$T.B:D$T.D:E$T.A::1.5:20250101:T:T0130:A::1E20:20250102:F:T0131:B::2.0:20250103:T:T0000:C'
+    assert columnar(t.serialize()).column_data('A').tolist() == t.column_data('A').tolist()
+    
+    
+def test_from_columns_checks_sizes():
+    with pytest.raises(ValueError):
+        ColumnarTableSegment.from_columns('T', [ColumnHeader(key='A', type='HUR'), ColumnHeader(key='B', type='HUR')], [[1, 2], [1]])
+    with pytest.raises(ValueError):
+        ColumnarTableSegment.from_columns('T', [ColumnHeader(key='A', type='HUR')], [[1], [1]])
+
+
+def test_to_table_segment():
+    t = columnar(table_str)
+    table = t.to_table_segment()
+    assert table.is_valid
+    assert table.serialize() == table_str
+    
+    
+def test_packed_strings():
+    p = PackedStrings.from_list(['A', '', 'BC'])
+    assert len(p) == 3
+    assert [p[0], p[1], p[2], p[-1]] == ['A', '', 'BC', 'BC']
+    assert list(p) == ['A', '', 'BC']
+    assert len(PackedStrings.from_list([])) == 0
+    assert len(PackedStrings.from_list([''])) == 1
+    with pytest.raises(IndexError):
+        p[3]
+    
+    
+def test_deserialize_columnar():
+    trex = TREX.deserialize(f'A$T.A:ABC+{table_str}', columnar_tables=True)
+    t = trex.get_segment('TAB')
+    assert isinstance(t, ColumnarTableSegment)
+    assert trex.is_valid
+    assert trex.serialize() == f'A$T.A:ABC+{table_str}'
+    assert t.column_data('C2').tolist() == [1.5, -2000]
+    
+    
+@pytest.mark.parametrize("trex_str", [
+    'TAB$$C-0$T.A:C.1$T.B::TRUE:T::FALSE:F',
+    'TAB$$C£0$T.A:C1$T.B::TRUE:T::FALSE:F',
+    'TAB$$A$T.Q::V',
+    'TAB$$C0$T.A:C1$T.B::TRUE:TRUE::FALSE:T',
+    'TAB$$C0$T.A:C1$T.B:C2$C63::TRUE:T::FALSE:T:1',
+    'TAB$$A$HUR::1::2::X',
+    'TAB$$A$HUR::1::\u0661\u0662',
+    'TAB$$A$T.D::20250101::\u0662\u0660\u0662\u0665\u0660\u0661\u0660\u0661',
+    'TAB$$A$T.D::2024',
+    'TAB$$A$T.D::T1230::2024',
+    'TAB$$A$T.D::T1230::20240101::2024',
+])
+def test_deserialize_columnar_validates_like_table_segment(trex_str):
+    trex = TREX.deserialize(trex_str)
+    columnar_trex = TREX.deserialize(trex_str, columnar_tables=True)
+    assert columnar_trex.is_valid == trex.is_valid
+    assert sorted(m.msg for m in columnar_trex.errors()) == sorted(m.msg for m in trex.errors())
+    assert columnar_trex.serialize() == trex_str
+    
+    
+def test_non_ascii_digits_are_missing_values():
+    trex = TREX.deserialize('TAB$$A$HUR:B$HUR::1:1.5::\u0661\u0662:2', columnar_tables=True)
+    t = trex.get_segment('TAB')
+    assert np.isnan(t.column_data('A')[1])
+    assert t.column_data('A')[0] == 1
+    assert t.column_data('B').tolist() == [1.5, 2]
+    
+    
+def test_deserialize_columnar_with_rows_of_different_length():
+    trex = TREX.deserialize('TAB$$C0$T.A:C1$T.B::TRUE:T::FALSE', columnar_tables=True)
+    assert isinstance(trex.segments[0], TableSegment)
+    assert not trex.is_valid
+    
+    
+def test_deserialize_columnar_trusted():
+    trex = TREX.deserialize(table_str, columnar_tables=True, validate=False)
+    assert trex.segments[0]._validation_skipped
+    assert trex.is_valid
+    
+    
+def test_columnar_table_to_python():
+    from labfreed.trex.python_convenience import pyTREX
+    d = pyTREX.from_trex(TREX.deserialize(table_str, columnar_tables=True))
+    assert d['TAB'].get_column('C0') == ['ABC', 'DEF']
@@ -0,0 +1,78 @@
+from datetime import datetime, time
+import io
+
+import pytest
+
+from labfreed.labfreed_infrastructure import LabFREED_ValidationError
+from labfreed.trex import TREX
+from labfreed.trex.python_convenience import DataTable, Quantity, TableBuilder, pyTREX
+
+
+def make_builder():
+    return TableBuilder('TAB', ['DURATION', 'DATE', 'OK', 'COMMENT', 'TEXT'], ['HUR', 'T.D', 'T.B', 'T.A', 'T.T'])
+
+
+def test_append_and_serialize():
+    b = make_builder()
+    b.append([Quantity(value=1.5, unit='hour'), datetime(2024, 5, 5, 13, 6), True, 'FOO', 'x'])
+    b.append([2, time(10, 30, 15), False, 'BAR', 'y'])
+    assert len(b) == 2
+    assert b.serialize() == 'TAB$$DURATION$HUR:DATE$T.D:OK$T.B:COMMENT$T.A:TEXT$T.T::1.5:20240505T1306:T:FOO:3C::2:T103015:F:BAR:3D'
+    sink = io.StringIO()
+    b.serialize_to(sink)
+    assert sink.getvalue() == b.serialize()
+    
+    
+def test_same_as_pytrex():
+    rows = [[Quantity(value=i + 0.5, unit='hour'), datetime(2024, 5, 5, 13, 6, i), i % 2 == 0, f'FOO{i}', f'x{i}'] for i in range(20)]
+    table = DataTable(col_names=['DURATION', 'DATE', 'OK', 'COMMENT', 'TEXT'])
+    for r in rows:
+        table.append(list(r))
+    b = TableBuilder.from_row_template('TAB', table.col_names, rows[0])
+    b.extend(rows)
+    assert b.serialize() == pyTREX({'TAB': table}).to_trex().serialize()
+    
+    
+@pytest.mark.parametrize("row", [
+    [1, datetime(2024, 1, 1), True, 'FOO'],                                 # too short
+    ['1', datetime(2024, 1, 1), True, 'FOO', 'x'],                          # str in numeric column
+    [Quantity(value=1, unit='K'), datetime(2024, 1, 1), True, 'FOO', 'x'],  # wrong unit
+    [float('nan'), datetime(2024, 1, 1), True, 'FOO', 'x'],
+    [True, datetime(2024, 1, 1), True, 'FOO', 'x'],
+    [1, '20240101', True, 'FOO', 'x'],
+    [1, datetime(2024, 1, 1), None, 'FOO', 'x'],
+    [1, datetime(2024, 1, 1), True, 'foo', 'x'],
+    [1, datetime(2024, 1, 1), True, 'FOO', ''],                             # empty str in T.T column
+])
+def test_invalid_rows_are_rejected(row):
+    b = make_builder()
+    with pytest.raises(ValueError):
+        b.append(row)
+    assert len(b) == 0
+    
+    
+def test_invalid_headers():
+    with pytest.raises(LabFREED_ValidationError):
+        TableBuilder('TAB', ['A'], ['HURR'])
+    with pytest.raises(ValueError):
+        TableBuilder('tab', ['A'], ['HUR'])
+    with pytest.raises(ValueError):
+        TableBuilder('TAB', ['A', 'B'], ['HUR'])
+        
+        
+def test_snapshots():
+    b = make_builder()
+    trex = b.to_trex()
+    assert trex.segments[0].n_rows() == 0
+    
+    b.append([1, datetime(2024, 5, 5, 13, 6), True, 'FOO', 'x'])
+    trex = b.to_trex()
+    assert trex.is_valid
+    assert trex.serialize() == b.serialize()
+    
+    b.append([2, datetime(2024, 5, 5, 13, 7), False, 'BAR', 'y'])
+    t = b.to_table_segment()
+    assert not t._validation_skipped
+    assert t.column_data('DURATION').tolist() == [1, 2]
+    assert trex.segments[0].n_rows() == 1
+    assert TREX.deserialize(b.serialize()).is_valid
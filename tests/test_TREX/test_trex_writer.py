@@ -0,0 +1,80 @@
+from datetime import date, datetime, time
+import io
+
+import pytest
+
+from labfreed.trex import TREX
+from labfreed.trex.python_convenience import DataTable, Quantity, pyTREX
+from labfreed.trex.trex_writer import write_table
+
+
+def make_pytrex(n_rows=10):
+    table = DataTable(col_names=['DURATION', 'DATE', 'OK', 'COMMENT', 'TEXT', 'N'])
+    for i in range(n_rows):
+        table.append([Quantity(value=i + 0.5, unit='hour'), datetime(2024, 5, 5, 13, 6, i % 60), i % 2 == 0, f'FOO{i}', f'x{i}', i])
+    return pyTREX({
+        'STOP': datetime(year=2024, month=5, day=5, hour=13, minute=6),
+        'TEMP': Quantity(value=10.15, unit='K'),
+        'OK': False,
+        'COMMENT': 'FOO',
+        'TABLE': table,
+        'DAY': date(2024, 1, 1),
+    })
+
+
+@pytest.mark.parametrize("sink", [io.StringIO(), io.BytesIO(), bytearray()])
+def test_serialize_to_writes_the_same_as_to_trex(sink):
+    d = make_pytrex()
+    d.serialize_to(sink)
+    expected = d.to_trex().serialize()
+    if isinstance(sink, bytearray):
+        assert sink.decode('utf-8') == expected
+    else:
+        out = sink.getvalue()
+        assert (out.decode('utf-8') if isinstance(out, bytes) else out) == expected
+
+
+def test_columnar_to_trex():
+    d = make_pytrex(n_rows=100)
+    trex = d.to_trex(columnar_tables=True)
+    assert trex.is_valid
+    assert trex.serialize() == d.to_trex().serialize()
+    
+    sink = io.StringIO()
+    trex.serialize_to(sink)
+    assert sink.getvalue() == trex.serialize()
+    assert TREX.deserialize(sink.getvalue()).is_valid
+    
+    
+def test_none_and_times_in_table():
+    table = DataTable(col_names=['T', 'N'])
+    table.append([time(10, 30), 1.5])
+    table.append([None, None])
+    d = pyTREX({'TAB': table})
+    sink = io.StringIO()
+    d.serialize_to(sink)
+    assert sink.getvalue() == 'TAB$$T$T.D:N$C63::T1030:1.5::-:-'
+    
+    
+def test_numbers_with_exponent():
+    table = DataTable(col_names=['N'])
+    table.append([1e20])
+    table.append([1.5e-7])
+    sink = io.StringIO()
+    pyTREX({'TAB': table}).serialize_to(sink)
+    assert sink.getvalue() == 'TAB$$N$C63::1E20::1.5E-07'
+    assert TREX.deserialize(sink.getvalue()).is_valid
+    
+    
+def test_scalar_numbers_with_exponent():
+    trex = pyTREX({'A': Quantity(value=1e20, unit='K'), 'B': Quantity(value=1.5e-7, unit='K')}).to_trex()
+    assert trex.serialize() == 'A$KEL:1E20+B$KEL:1.5E-07'
+    assert trex.get_segment('A').is_valid
+    assert trex.get_segment('B').is_valid
+    
+    
+def test_write_table_in_chunks():
+    columns = [[str(i) for i in range(10)], ['A'] * 10]
+    sink = io.StringIO()
+    write_table(sink, 'TAB', ['N', 'S'], ['C63', 'T.A'], columns, chunk_rows=3)
+    assert sink.getvalue() == 'TAB$$N$C63:S$T.A::' + '::'.join(f'{i}:A' for i in range(10))
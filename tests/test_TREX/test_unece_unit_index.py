@@ -0,0 +1,42 @@
+import pytest
+
+from labfreed.trex.python_convenience.quantity import Quantity, unece_unit_code_from_quantity
+from labfreed.well_known_keys.unece.unece_units import unece_unit, unece_unit_codes, unece_unit_index
+
+
+def test_index():
+    index = unece_unit_index()
+    assert index is unece_unit_index()
+    assert index.by_code['KGM']['name'] == 'kilogram'
+    assert 'KGM' in index.codes_by_symbol['kg']
+    assert 'KGM' in index.codes_by_name['kilogram']
+    assert index.active_codes == set(unece_unit_codes())
+    assert unece_unit('NO SUCH UNIT') is None
+    
+def test_unece_unit_returns_the_full_record():
+    from labfreed.well_known_keys.unece.unece_units import unece_units
+    assert unece_unit('KGM') == next(u for u in unece_units() if u['commonCode'] == 'KGM')
+    
+def test_index_is_read_only():
+    with pytest.raises(TypeError):
+        unece_unit_index().by_code['XYZ'] = {}
+    with pytest.raises(TypeError):
+        unece_unit_index().by_code['KGM']['symbol'] = 'x'
+    
+@pytest.mark.parametrize("unit", ['kg', 'kilogram', 'KGM'])
+def test_unit_code_from_quantity(unit):
+    assert unece_unit_code_from_quantity(Quantity(value=1, unit=unit)) == 'KGM'
+    
+def test_unit_code_from_quantity_unknown():
+    with pytest.raises(ValueError):
+        unece_unit_code_from_quantity(Quantity(value=1, unit='no such unit'))
+    
+    
+def test_compact_table_is_up_to_date(monkeypatch):
+    '''If this fails, run build_tools/generate_unece_units_module.py'''
+    from pathlib import Path
+    monkeypatch.syspath_prepend(str(Path(__file__).resolve().parents[2] / 'build_tools'))
+    from generate_unece_units_module import compact_units
+    from labfreed.well_known_keys.unece.unece_units import unece_units
+    from labfreed.well_known_keys.unece.unece_units_compact import units
+    assert tuple(compact_units(unece_units())) == units
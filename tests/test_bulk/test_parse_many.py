@@ -0,0 +1,48 @@
+import pickle
+
+import pytest
+
+from labfreed.bulk import ParseResult, parse_many
+from labfreed.pac_cat import PAC_CAT
+
+
+valid_base = "HTTPS://PAC.METTORIUS.COM/"
+
+urls = [valid_base + f"-MD/240:BAL500/21:{i}" for i in range(50)] \
+        + ["HTTPS://METTORIUS/-MD/240:B-800/21:12345", valid_base + "A:B:C", valid_base + "KEY:VAL*N$N/ABC"]
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_results_in_input_order(workers):
+    results = list(parse_many(urls, workers=workers, chunk_size=7))
+    assert [r.url for r in results] == urls
+    assert all(r.is_valid for r in results[:50])
+    assert [r.identifier[2][1] for r in results[:50]] == [str(i) for i in range(50)]
+    
+def test_invalid_pac_ids_are_reported():
+    results = list(parse_many(urls, workers=1))
+    invalid_issuer, unparsable, plain = results[-3:]
+    assert not invalid_issuer.is_valid
+    assert invalid_issuer.issuer == 'METTORIUS'
+    assert not unparsable.is_valid
+    assert unparsable.issuer is None
+    assert plain.is_valid
+    assert not plain.is_pac_cat
+    assert plain.extensions == (('N', 'N', 'ABC'),)
+    
+def test_result_is_compact_and_picklable():
+    r = next(parse_many(urls, workers=1))
+    assert isinstance(r, ParseResult)
+    assert pickle.loads(pickle.dumps(r)) == r
+    
+def test_result_converts_to_pac_id():
+    r = next(parse_many(urls, workers=1))
+    assert r.is_pac_cat
+    pac = r.to_pac_id()
+    assert isinstance(pac, PAC_CAT)
+    assert pac.to_url() == r.url
+    
+def test_result_converts_to_record():
+    results = list(parse_many(urls, workers=1))
+    assert results[0].record.to_url() == results[0].url
+    assert results[-2].record is None
@@ -0,0 +1,60 @@
+import io
+import json
+import mmap
+
+from labfreed.bulk import read_pac_ids, write_jsonl, write_urls
+from labfreed.labfreed_infrastructure import LabFREED_ValidationError
+from labfreed.pac_id import PAC_ID
+
+
+content = '''HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:1234
+
+HTTPS://METTORIUS/-MD/240:B-800/21:12345
+HTTPS://PAC.METTORIUS.COM/-MD/BAL500/1234*N$N/ABC
+'''
+
+
+def test_read_from_file_object():
+    results = list(read_pac_ids(io.StringIO(content)))
+    assert [line_no for line_no, _ in results] == [1, 3, 4]
+    assert isinstance(results[0][1], PAC_ID)
+    assert isinstance(results[1][1], LabFREED_ValidationError)
+    assert results[2][1].get_extension('N').type == 'N'
+    
+def test_read_is_lazy():
+    def lines():
+        yield 'HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:1234\n'
+        raise AssertionError('read too far')
+    line_no, pac = next(read_pac_ids(lines()))
+    assert line_no == 1
+    
+def test_read_from_path_and_binary_file(tmp_path):
+    p = tmp_path / 'pacs.txt'
+    p.write_text(content)
+    from_path = [(n, str(pac)) for n, pac in read_pac_ids(p)]
+    with open(p, 'rb') as f:
+        from_binary = [(n, str(pac)) for n, pac in read_pac_ids(f)]
+    assert from_path == from_binary
+    
+def test_read_from_mmap(tmp_path):
+    p = tmp_path / 'pacs.txt'
+    p.write_text(content)
+    with open(p, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        results = list(read_pac_ids(mm))
+    assert [line_no for line_no, _ in results] == [1, 3, 4]
+    
+def test_write_urls():
+    out = io.StringIO()
+    n = write_urls(read_pac_ids(io.StringIO(content)), out, use_short_notation=False)
+    assert n == 2
+    assert out.getvalue().splitlines() == ['HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:1234',
+                                           'HTTPS://PAC.METTORIUS.COM/-MD/240:BAL500/21:1234*N$N/ABC']
+    
+def test_write_jsonl():
+    out = io.StringIO()
+    n = write_jsonl(read_pac_ids(io.StringIO(content)), out)
+    assert n == 2
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert lines[0]['issuer'] == 'METTORIUS.COM'
+    assert lines[1]['line_no'] == 3
+    assert lines[1]['errors']
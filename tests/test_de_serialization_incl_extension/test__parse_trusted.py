@@ -0,0 +1,76 @@
+import pytest
+from labfreed.pac_cat import PAC_CAT
+from labfreed.pac_id import PAC_ID
+from labfreed.trex import TREX
+from labfreed.trex.python_convenience.pyTREX import pyTREX
+from labfreed.well_known_extensions.trex_extension import TREX_Extension
+
+
+valid_url = "HTTPS://PAC.METTORIUS.COM/-MD/240:B-800/21:12345*N$N/ABC*SUM$TREX/A$T.A:ABC+D$T.D:20240505+TABLE$$K$KGM:D$T.D::1.5:T1230::2:20240101"
+invalid_url = "HTTPS://METTORIUS/-MD/240:b-800*SUM$TREX/A$T.A:abc"
+
+
+def test_trusted_mode_gives_same_result():
+    trusted = PAC_ID.from_url(valid_url, validate=False)
+    checked = PAC_ID.from_url(valid_url)
+    assert type(trusted) is type(checked) is PAC_CAT
+    assert trusted.to_url() == checked.to_url()
+    assert trusted.get_category('-MD').serial_number == '12345'
+    assert isinstance(trusted.get_extension('SUM'), TREX_Extension)
+    
+def test_trusted_mode_does_not_raise_or_validate():
+    pac = PAC_ID.from_url(invalid_url, validate=False)
+    assert pac.issuer == 'METTORIUS'
+    assert not pac._validation_messages # no validation was run
+    
+def test_trusted_mode_validates_on_first_access():
+    pac = PAC_ID.from_url(invalid_url, validate=False)
+    assert not pac.is_valid
+    
+def test_validation_can_be_run_later():
+    pac = PAC_ID.from_url(invalid_url, validate=False)
+    pac.validate()
+    checked = PAC_ID.from_url(invalid_url, suppress_validation_errors=True)
+    assert not pac.is_valid
+    assert [m.msg for m in pac.errors()] == [m.msg for m in checked.errors()]
+    
+def test_trusted_trex_converts_to_python():
+    trex = TREX.deserialize("A$T.A:ABC+D$T.D:20240505+TABLE$$K$KGM:D$T.D::1.5:T1230::2:20240101", validate=False)
+    d = pyTREX.from_trex(trex)
+    assert d['D'].year == 2024
+    assert d['TABLE'].get_cell(0, 'D').hour == 12
+    
+def test_validate_finds_errors_in_table_cells():
+    trex = TREX.deserialize("TABLE$$K$KGM::1.5::A", validate=False)
+    assert not trex.is_valid
+    
+    
+@pytest.mark.parametrize('trex_str', ['A$T.A:X+A$T.A:Y', 'A$T.A:abc', 'B$T.B:X+C$T.X:x#', 'TAB$$K$KGM:D$T.D::1.5:2024::x:T1230'])
+def test_validate_agrees_with_validation_on_construction(trex_str):
+    try:
+        checked = TREX.deserialize(trex_str)
+    except ValueError:
+        with pytest.raises(ValueError):
+            TREX.deserialize(trex_str, validate=False).validate()
+        return
+    trusted = TREX.deserialize(trex_str, validate=False).validate()
+    assert trusted.is_valid == checked.is_valid
+    assert [m.msg for m in trusted.validation_messages()] == [m.msg for m in checked.validation_messages()]
+    
+def test_validate_runs_field_validators():
+    trex = TREX.deserialize('A$T.A:X+A$T.A:Y', validate=False)
+    with pytest.raises(ValueError):
+        trex.validate()
+    with pytest.raises(ValueError):
+        trex.is_valid
+    
+def test_trusted_mode_is_faster():
+    import timeit
+    PAC_ID.from_url(valid_url, validate=False).is_valid # imports and caches are set up before timing
+    PAC_ID.from_url(valid_url).is_valid
+    # alternating, so that load on the machine affects both alike
+    trusted, checked = [], []
+    for _ in range(7):
+        trusted.append(timeit.timeit(lambda: PAC_ID.from_url(valid_url, validate=False), number=30))
+        checked.append(timeit.timeit(lambda: PAC_ID.from_url(valid_url), number=30))
+    assert min(trusted) < 0.85 * min(checked)
@@ -0,0 +1,67 @@
+'''Guards the lazy loading in labfreed/__init__.py. Imports are checked in a fresh interpreter.'''
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+
+def _modules_loaded_by(code:str, modules:list[str]) -> dict[str, bool]:
+    script = f'import sys, json\n{code}\nprint(json.dumps({{m: m in sys.modules for m in {modules!r}}}))'
+    out = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True, cwd=Path(__file__).resolve().parents[1]).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def test_import_labfreed_loads_nothing():
+    loaded = _modules_loaded_by('import labfreed', ['pydantic', 'labfreed.pac_id', 'labfreed.trex', 'labfreed.pac_id_resolver'])
+    assert not any(loaded.values()), loaded
+    
+    
+@pytest.mark.parametrize("code", [
+    'from labfreed import PAC_ID',
+    'from labfreed import PAC_ID; PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/-MD/BAL500/1234*ABC*SUM$TREX/A$T.A:ABC")',
+])
+def test_parsing_does_not_load_resolver_rich_and_numpy(code):
+    loaded = _modules_loaded_by(code, ['requests', 'requests_cache', 'yaml', 'jsonpath_ng', 'labfreed.pac_id_resolver', 'rich', 'numpy'])
+    assert not any(loaded.values()), loaded
+    
+    
+def test_invalid_pac_id_is_not_rendered():
+    code = '''
+from labfreed import PAC_ID, LabFREED_ValidationError
+try:
+    PAC_ID.from_url("HTTPS://PAC.METTORIUS.COM/A#B")
+except LabFREED_ValidationError as e:
+    assert e.validation_msgs
+'''
+    assert not _modules_loaded_by(code, ['rich'])['rich']
+    
+    
+def test_lazy_attributes():
+    import labfreed
+    from labfreed.pac_cat import PAC_CAT
+    from labfreed.pac_id_resolver import PAC_ID_Resolver
+    assert labfreed.PAC_CAT is PAC_CAT
+    assert labfreed.PAC_ID_Resolver is PAC_ID_Resolver
+    assert labfreed.trex.TREX is labfreed.TREX
+    assert 'TREX' in dir(labfreed)
+    with pytest.raises(AttributeError):
+        labfreed.NoSuchThing
+        
+        
+def test_star_import():
+    namespace = {}
+    exec('from labfreed import *', namespace)
+    assert {'PAC_ID', 'PAC_CAT', 'TREX', 'PAC_ID_Resolver', 'LabFREED_ValidationError', 'pac_id', 'trex', 'cit_v2'} <= namespace.keys()
+    
+    
+@pytest.mark.parametrize("name", ['pac_id', 'pac_cat', 'pac_id_resolver', 'trex', 'well_known_keys', 'labfreed_infrastructure',
+                                  'cit_common', 'cit_v1', 'cit_v2', 'resolver', 'services'])
+def test_submodules_are_attributes(name):
+    import importlib
+    import labfreed
+    module = getattr(labfreed, name)
+    assert module is importlib.import_module(module.__name__)
+    assert module.__name__.rsplit('.', 1)[-1] == name
@@ -0,0 +1,28 @@
+import pytest
+
+from labfreed.utilities.char_class import CharClass, alphanumeric_chars, hsegment_chars
+
+
+def test_valid():
+    assert alphanumeric_chars.is_valid('BAL500-1.2')
+    assert alphanumeric_chars.invalid_chars('BAL500-1.2') == set()
+    assert alphanumeric_chars.is_valid('')
+    
+def test_invalid_chars():
+    assert not alphanumeric_chars.is_valid('bal500#')
+    assert alphanumeric_chars.invalid_chars('bal500#') == {'b', 'a', 'l', '#'}
+    
+@pytest.mark.parametrize("s, invalid", [
+    ('A%41B', set()),
+    ('A%4GB', {'%'}),
+    ('%%41', {'%'}),
+    ('A#', {'#'}),
+])
+def test_escape_sequences(s, invalid):
+    assert hsegment_chars.invalid_chars(s) == invalid
+    assert hsegment_chars.is_valid(s) == (not invalid)
+    
+def test_special_characters_are_literal():
+    c = CharClass('A-Z]^\\')
+    assert c.is_valid('A-Z]^\\')
+    assert c.invalid_chars('B') == {'B'}